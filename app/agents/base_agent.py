@@ -10,8 +10,9 @@ from loguru import logger
 from pydantic import BaseModel
 from pydantic_ai import Agent
 
-from app.core.model_registry import create_agent
+from app.core.model_registry import create_agent, get_chain_version
 from app.pipelines.state import PipelineState
+from app.pipelines.streaming import run_agent
 
 
 @dataclass
@@ -47,6 +48,7 @@ class BaseAgent(ABC):
         self.base_dir = base_dir
         self.skill_content = self._load_skill()
         self.system_prompt = self._load_system_prompt()
+        self._chain_version: int | None = None
         self._agent: Agent | None = self._build_agent()
 
     def _load_skill(self) -> str:
@@ -92,6 +94,7 @@ class BaseAgent(ABC):
         tools = getattr(self.__class__, "tools", None)
 
         try:
+            self._chain_version = get_chain_version()
             return cast(
                 Agent,
                 create_agent(
@@ -106,6 +109,13 @@ class BaseAgent(ABC):
             logger.error(f"Failed to build agent '{self.config.name}': {e}")
             return None
 
+    async def _run_llm(self, prompt: str) -> Any:
+        """Run the LLM agent; partial output is streamed inside a stream session."""
+        if self._chain_version != get_chain_version() and not self._skip_base_agent:
+            # Local providers were probed after this agent was built.
+            self._agent = self._build_agent() or self._agent
+        return await run_agent(self._agent, prompt, label=self.config.name)
+
     async def execute(self, state: PipelineState) -> None:
         """Execute this agent as part of a pipeline.
 
@@ -117,6 +127,36 @@ class BaseAgent(ABC):
         """
         raise NotImplementedError(f"{self.__class__.__name__} must implement execute()")
 
+    def cache_inputs(self, state: PipelineState) -> dict[str, Any] | None:
+        """Inputs that fully determine this agent's pipeline artifact.
+
+        The pipeline engine keys its artifact cache on these (plus prompt and
+        model). Return None — the default — for agents with side effects or
+        live data; they are never served from the cache.
+        """
+        return None
+
+    def cacheable_output(self, output: Any) -> bool:
+        """Whether ``output`` may be cached.
+
+        Agents return an "Error..." fallback instead of raising when the LLM
+        call fails; those must not be replayed from the cache.
+        """
+        if not isinstance(output, BaseModel):
+            return False
+        for value in output.model_dump().values():
+            first = value[0] if isinstance(value, list) and value else value
+            if isinstance(first, str) and first.startswith("Error"):
+                return False
+        return True
+
+    def restore_output(self, payload: Any) -> Any:
+        """Rebuild an artifact from its serialized (cached or persisted) form."""
+        output_type = self._resolve_output_type()
+        if output_type is not None and isinstance(payload, dict):
+            return output_type.model_validate(payload)
+        return payload
+
     @classmethod
     def get_instance(cls, key: str) -> "BaseAgent | None":
         """Get an agent instance from the registry.
@@ -1,6 +1,6 @@
 """Cover Letter Generation Agent."""
 
-from typing import cast
+from typing import Any, cast
 
 from loguru import logger
 from pydantic import BaseModel, Field
@@ -27,6 +27,9 @@ class CoverLetterAgent(BaseAgent):
         result = await self.generate(state.get_resume_text(), state.job_text)
         state.artifacts["cover_letter_generator"] = result
 
+    def cache_inputs(self, state: PipelineState) -> dict[str, Any] | None:
+        return {"resume_text": state.get_resume_text(), "job_text": state.job_text}
+
     async def generate(
         self,
         resume_text: str,
@@ -55,7 +58,7 @@ class CoverLetterAgent(BaseAgent):
         prompt = self._build_prompt(resume_text, job_text, company_name, hiring_manager)
 
         try:
-            result = await self._agent.run(prompt)
+            result = await self._run_llm(prompt)
             return cast(CoverLetterOutput, result.output)
         except Exception as e:
             logger.error(f"Cover letter generation failed: {e}")
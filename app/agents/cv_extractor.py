@@ -1,6 +1,6 @@
 """CV Extractor Agent — extracts and tailors CV content to job descriptions."""
 
-from typing import cast
+from typing import Any, cast
 
 from loguru import logger
 from pydantic import BaseModel, Field
@@ -31,6 +31,9 @@ class CvExtractorAgent(BaseAgent):
         )
         state.artifacts["cv_extractor"] = result
 
+    def cache_inputs(self, state: PipelineState) -> dict[str, Any] | None:
+        return {"cv_text": state.cv_text or state.resume_text, "job_text": state.job_text}
+
     async def extract_and_tailor(
         self,
         cv_text: str,
@@ -58,7 +61,7 @@ class CvExtractorAgent(BaseAgent):
         prompt = self._build_prompt(cv_text, job_text, output_format)
 
         try:
-            result = await self._agent.run(prompt)
+            result = await self._run_llm(prompt)
             return cast(CVExtractorOutput, result.output)
         except Exception as e:
             logger.error(f"CV extraction failed: {e}")
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from loguru import logger
 from pydantic import BaseModel, Field
 
@@ -62,3 +64,7 @@ class DiscoverySyncAgent(BaseAgent):
             )
 
         state.artifacts["discovery_sync"] = output.model_dump()
+
+    def restore_output(self, payload: Any) -> Any:
+        # execute() stores the plain dict, so keep resumed artifacts as dicts too.
+        return payload
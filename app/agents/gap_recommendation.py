@@ -89,7 +89,7 @@ class GapRecommendationAgent(BaseAgent):
         prompt = self._build_prompt(gaps, personal_context or {}, job_context)
 
         try:
-            result = await self._agent.run(prompt)
+            result = await self._run_llm(prompt)
             output = cast(GapRecommendationOutput, result.output)
             if not output.uncovered_gaps and not output.recommendations:
                 # LLM returned nothing useful — surface all gaps as uncovered.
@@ -1,6 +1,6 @@
 """Interview Prep Coach — behavioral questions, technical topics, STAR stories, prep tips."""
 
-from typing import cast
+from typing import Any, cast
 
 from loguru import logger
 from pydantic import BaseModel, Field
@@ -60,6 +60,13 @@ class InterviewCoachAgent(BaseAgent):
         )
         state.artifacts["interview_coach"] = result
 
+    def cache_inputs(self, state: PipelineState) -> dict[str, Any] | None:
+        return {
+            "resume_text": state.get_resume_text(),
+            "job_text": state.job_text,
+            "role_type": state.inputs.get("role_type"),
+        }
+
     async def coach(
         self,
         resume_text: str,
@@ -74,7 +81,7 @@ class InterviewCoachAgent(BaseAgent):
         prompt = self._build_prompt(resume_text, job_description, role_type)
 
         try:
-            result = await self._agent.run(prompt)
+            result = await self._run_llm(prompt)
             return cast(InterviewCoachOutput, result.output)
         except Exception as e:
             logger.error(f"Interview coaching failed: {e}")
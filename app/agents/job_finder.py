@@ -103,7 +103,7 @@ class JobFinderAgent(BaseAgent):
         )
 
         try:
-            result = await self._agent.run(prompt)
+            result = await self._run_llm(prompt)
             return cast(JobFinderOutput, result.output)
         except Exception as e:
             logger.error(f"Job search failed: {e}")
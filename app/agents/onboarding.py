@@ -118,7 +118,7 @@ class OnboardingAgent(BaseAgent):
         )
 
         try:
-            result = await self._agent.run(prompt)
+            result = await self._run_llm(prompt)
             return cast(PersonalProfileOutput, result.output)
         except Exception as e:
             logger.error(f"Onboarding finalize failed: {e}")
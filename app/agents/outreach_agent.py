@@ -1,6 +1,6 @@
 """Post-Application Outreach Agent — follow-ups, thank-you notes, cold outreach."""
 
-from typing import cast
+from typing import Any, cast
 
 from loguru import logger
 from pydantic import BaseModel, Field
@@ -56,6 +56,14 @@ class OutreachAgent(BaseAgent):
         )
         state.artifacts["outreach_agent"] = result
 
+    def cache_inputs(self, state: PipelineState) -> dict[str, Any] | None:
+        keys = ("company_name", "hiring_manager", "days_since_application", "interview_stage")
+        return {
+            "resume_text": state.get_resume_text(),
+            "job_text": state.job_text,
+            **{key: state.inputs.get(key) for key in keys},
+        }
+
     async def generate(
         self,
         resume_text: str,
@@ -80,7 +88,7 @@ class OutreachAgent(BaseAgent):
         )
 
         try:
-            result = await self._agent.run(prompt)
+            result = await self._run_llm(prompt)
             return cast(OutreachOutput, result.output)
         except Exception as e:
             logger.error(f"Outreach generation failed: {e}")
@@ -1,6 +1,6 @@
 """Resume Reviewer Agent — reviews and rewrites resume bullets using XYZ formula."""
 
-from typing import cast
+from typing import Any, cast
 
 from loguru import logger
 from pydantic import BaseModel, Field
@@ -48,6 +48,9 @@ class ResumeReviewerAgent(BaseAgent):
         )
         state.artifacts["resume_reviewer"] = result
 
+    def cache_inputs(self, state: PipelineState) -> dict[str, Any] | None:
+        return {"resume_text": state.get_resume_text(), "job_text": state.job_text}
+
     async def review(
         self,
         resume_text: str,
@@ -73,7 +76,7 @@ class ResumeReviewerAgent(BaseAgent):
         prompt = self._build_prompt(resume_text, job_description)
 
         try:
-            result = await self._agent.run(prompt)
+            result = await self._run_llm(prompt)
             return cast(ResumeReviewerOutput, result.output)
         except Exception as e:
             logger.error(f"Resume review failed: {e}")
@@ -1,6 +1,6 @@
 """Resume Tailor Agent — tailors resumes to specific job descriptions."""
 
-from typing import cast
+from typing import Any, cast
 
 from loguru import logger
 from pydantic import BaseModel, Field
@@ -27,6 +27,9 @@ class ResumeTailorAgent(BaseAgent):
         result = await self.tailor(state.resume_text, state.job_text)
         state.artifacts["resume_tailor"] = result
 
+    def cache_inputs(self, state: PipelineState) -> dict[str, Any] | None:
+        return {"resume_text": state.resume_text, "job_text": state.job_text}
+
     async def tailor(
         self,
         resume_text: str,
@@ -53,7 +56,7 @@ class ResumeTailorAgent(BaseAgent):
         prompt = self._build_prompt(resume_text, job_text, format_type)
 
         try:
-            result = await self._agent.run(prompt)
+            result = await self._run_llm(prompt)
             output = cast(TailoredResumeOutput, result.output)
             output.format_type = format_type
             return output
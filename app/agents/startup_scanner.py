@@ -2,6 +2,7 @@
 
 import asyncio
 import json
+import threading
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, cast
@@ -17,6 +18,7 @@ except ImportError:
     logger.warning("Pydantic AI not installed. Run: pip install pydantic-ai")
 
 from app.agents.base_agent import AgentConfig, BaseAgent
+from app.core.config import settings
 from app.core.model_registry import init_ai_stack
 from app.models.startup_model import JobOpening, ScannerState, Startup, UserProfile
 from app.pipelines.state import PipelineState
@@ -26,6 +28,7 @@ from app.services.bigset_import_service import (
     should_skip_scrape,
 )
 from app.services.db_service import get_db_session
+from app.services.host_limiter import HostLimiter
 from app.services.job_fit_service import jobs_for_company
 from app.services.scraper_service import get_scraper
 from app.services.startup_parser import parse_startups_file
@@ -70,6 +73,12 @@ class StartupScannerAgent(BaseAgent):
         self.state_file = state_file or Path("scanner_state.json")
         self.scraper = get_scraper()
         self.state = self._load_state()
+        # Guards ScannerState mutation + save while startups complete concurrently.
+        self._state_lock = threading.Lock()
+        self._host_limiter = HostLimiter(
+            per_host=settings.SCANNER_PER_HOST_CONCURRENCY,
+            min_interval=settings.SCANNER_HOST_MIN_INTERVAL_SECONDS,
+        )
         self._merged_startups_cache: list[Startup] | None = None
         self._city_map_cache: dict[str, str] | None = None
 
@@ -202,7 +211,8 @@ class StartupScannerAgent(BaseAgent):
             finally:
                 db_hint.close()
 
-            content = await self.scraper.scrape_careers(startup.website)
+            async with self._host_limiter.slot(startup.website):
+                content = await self.scraper.scrape_careers(startup.website)
 
             if not content:
                 logger.debug(f"No career page found for {startup.name}")
@@ -232,8 +242,13 @@ class StartupScannerAgent(BaseAgent):
         self,
         batch_size: int = 10,
         startups: list[Startup] | None = None,
+        concurrency: int | None = None,
     ) -> list[JobOpening]:
-        """Process a batch of startups."""
+        """Process a batch of startups, scanning up to ``concurrency`` at once.
+
+        Each startup's roles are saved to ``ScannerState`` and persisted as soon as
+        its scan finishes; returned jobs keep batch order.
+        """
         if startups is None:
             file_startups = parse_startups_file()
             db = get_db_session()
@@ -252,22 +267,36 @@ class StartupScannerAgent(BaseAgent):
         batch = startups[:batch_size]
 
         if not batch:
-            self.state.status = "complete"
-            self._save_state()
+            with self._state_lock:
+                self.state.status = "complete"
+                self._save_state()
             return []
 
-        with _trace("process_batch", batch_size=len(batch), batch_number=self.state.batch_number):
-            all_jobs: list[JobOpening] = []
-
-            for startup in batch:
-                jobs = await self.scan_startup(startup)
-                all_jobs.extend(jobs)
-
-            self.state.batch_number += 1
-            self.state.add_roles(all_jobs)
-            self._save_state()
-
-            await self._persist_jobs(all_jobs)
+        workers = max(1, concurrency or settings.SCANNER_CONCURRENCY)
+        with _trace(
+            "process_batch",
+            batch_size=len(batch),
+            batch_number=self.state.batch_number,
+            concurrency=workers,
+        ):
+            semaphore = asyncio.Semaphore(workers)
+
+            async def _scan(startup: Startup) -> list[JobOpening]:
+                async with semaphore:
+                    try:
+                        jobs = await self.scan_startup(startup)
+                    except Exception as e:
+                        logger.error(f"Scan failed for {startup.name}: {e}")
+                        return []
+                    await self._record_result(jobs)
+                    return jobs
+
+            results = await asyncio.gather(*(_scan(s) for s in batch))
+            all_jobs = [job for jobs in results for job in jobs]
+
+            with self._state_lock:
+                self.state.batch_number += 1
+                self._save_state()
             self._invalidate_startup_caches()
 
             if logfire:
@@ -281,6 +310,13 @@ class StartupScannerAgent(BaseAgent):
 
             return all_jobs
 
+    async def _record_result(self, jobs: list[JobOpening]) -> None:
+        """Fold one startup's roles into scanner state and persist them immediately."""
+        with self._state_lock:
+            self.state.add_roles(jobs)
+            self._save_state()
+        await self._persist_jobs(jobs)
+
     async def _persist_jobs(self, jobs: list[JobOpening]) -> None:
         """Store extracted jobs in DB and index to vector store."""
         if not jobs:
@@ -310,22 +346,24 @@ class StartupScannerAgent(BaseAgent):
             try:
                 vs = get_vector_store()
                 if vs.is_available and inserted_ids:
-                    search_svc = SearchService(vector_store=vs)
-                    for job_opening, job_id in zip(jobs, inserted_ids):
-                        if job_id is None:
-                            continue
-                        text = (
-                            f"{job_opening.title} {job_opening.startup_name} "
-                            f"{' '.join(job_opening.requirements)}"
-                        )
-                        await search_svc.index_job(
-                            job_id,
-                            text,
-                            metadata={
-                                "startup_name": job_opening.startup_name,
-                                "relevance_score": job_opening.relevance_score,
-                            },
-                        )
+                    search_svc = SearchService(vector_store=vs, db_service=db_svc)
+                    await search_svc.index_jobs(
+                        [
+                            {
+                                "job_id": job_id,
+                                "text": (
+                                    f"{job_opening.title} {job_opening.startup_name} "
+                                    f"{' '.join(job_opening.requirements)}"
+                                ),
+                                "metadata": {
+                                    "startup_name": job_opening.startup_name,
+                                    "relevance_score": job_opening.relevance_score,
+                                },
+                            }
+                            for job_opening, job_id in zip(jobs, inserted_ids)
+                            if job_id is not None
+                        ]
+                    )
             except Exception as idx_err:
                 logger.warning(f"Vector indexing failed (non-fatal): {idx_err}")
 
@@ -23,6 +23,7 @@ from app.services.db_service import (
     get_db_session,
 )
 from app.services.discovery_query_service import search_imported_jobs
+from app.services.http_cache import get_http_cache
 from app.services.job_board_scraper import (
     get_available_sources,
     search_all_sources,
@@ -83,6 +84,15 @@ async def list_sources():
     return {"success": True, "sources": sources}
 
 
+@router.get("/cache/stats")
+async def http_cache_stats():
+    """Hit rates of the job-board / career-page response cache."""
+    cache = get_http_cache()
+    if cache is None:
+        return {"success": True, "enabled": False}
+    return {"success": True, "enabled": True, "stats": cache.stats()}
+
+
 @router.post("/index")
 async def index_discovered_jobs(request: IndexJobsRequest):
     """Index discovered jobs into the DB and vector store."""
@@ -112,12 +122,21 @@ async def index_discovered_jobs(request: IndexJobsRequest):
         try:
             vs = get_vector_store()
             if vs.is_available and inserted_ids:
-                search_svc = SearchService(vector_store=vs)
-                for job_data, job_id in zip(job_dicts, inserted_ids):
-                    if job_id is None:
-                        continue
-                    await search_svc.index_job(job_id, job_data["raw_text"][:5000])
-                    indexed += 1
+                search_svc = SearchService(vector_store=vs, db_service=db_svc)
+                indexed = await search_svc.index_jobs(
+                    [
+                        {
+                            "job_id": job_id,
+                            "text": job_data["raw_text"][:5000],
+                            "metadata": {
+                                "company": job_data["company"],
+                                "location": job_data["location"],
+                            },
+                        }
+                        for job_data, job_id in zip(job_dicts, inserted_ids)
+                        if job_id is not None
+                    ]
+                )
         except Exception as e:
             logger.warning(f"Vector indexing for discovered jobs failed: {e}")
 
@@ -2,14 +2,13 @@
 
 from __future__ import annotations
 
-import time
-import uuid
-from dataclasses import asdict, is_dataclass
+import asyncio
+import json
+from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Any
 
 from fastapi import (
     APIRouter,
-    BackgroundTasks,
     Depends,
     File,
     Form,
@@ -17,6 +16,7 @@ from fastapi import (
     Query,
     UploadFile,
 )
+from fastapi.responses import StreamingResponse
 from loguru import logger
 from pydantic import BaseModel, Field
 
@@ -25,7 +25,16 @@ from app.core.upload_validation import RESUME_EXTENSIONS, validate_upload, valid
 from app.middleware.auth_middleware import get_current_user_dependency
 from app.models.db_models import User
 from app.pipelines.engine import load_pipeline_configs, run_pipeline
-from app.pipelines.state import PipelineState
+from app.pipelines.events import EventBus
+from app.pipelines.job_queue import (
+    FINISHED_STATUSES,
+    enqueue_run,
+    get_run,
+    resume_run,
+    run_status_payload,
+)
+from app.pipelines.state import PipelineState, serialize_pipeline_state
+from app.pipelines.streaming import stream_session
 from app.services.apply_service import ApplyService
 from app.services.db_service import DatabaseService, get_db_session
 
@@ -43,42 +52,6 @@ _BACKGROUND_PIPELINE_KEYS = frozenset(
     }
 )
 
-_background_jobs: dict[str, dict[str, Any]] = {}
-
-
-def _prune_background_jobs() -> None:
-    """Drop expired entries and cap in-memory job history."""
-    now = time.time()
-    ttl = settings.PIPELINE_BACKGROUND_JOB_TTL_SECONDS
-    max_entries = settings.PIPELINE_BACKGROUND_JOB_MAX_ENTRIES
-
-    expired = [
-        job_id
-        for job_id, job in _background_jobs.items()
-        if now - float(job.get("_updated_at", job.get("_created_at", now))) > ttl
-    ]
-    for job_id in expired:
-        del _background_jobs[job_id]
-
-    if len(_background_jobs) <= max_entries:
-        return
-    ordered = sorted(
-        _background_jobs.items(),
-        key=lambda item: float(item[1].get("_updated_at", item[1].get("_created_at", 0))),
-    )
-    for job_id, _ in ordered[: len(_background_jobs) - max_entries]:
-        del _background_jobs[job_id]
-
-
-def _set_background_job(job_id: str, payload: dict[str, Any]) -> None:
-    """Store or update a background job record with timestamps."""
-    _prune_background_jobs()
-    now = time.time()
-    existing = _background_jobs.get(job_id, {})
-    payload["_created_at"] = existing.get("_created_at", now)
-    payload["_updated_at"] = now
-    _background_jobs[job_id] = payload
-
 
 class PipelineRunRequest(BaseModel):
     """Run a named agent pipeline."""
@@ -102,6 +75,16 @@ class PipelineApplyRequest(BaseModel):
     user_id: int | None = None
 
 
+class PipelineBatchApplyRequest(BaseModel):
+    """Apply one stored resume to many stored job postings."""
+
+    resume_id: int
+    job_ids: list[int] = Field(min_length=1)
+    hiring_manager: str | None = None
+    format_type: str = "text"
+    user_id: int | None = None
+
+
 class PipelineResult(BaseModel):
     """Result of the unified apply pipeline."""
 
@@ -117,26 +100,7 @@ class PipelineResult(BaseModel):
     application_id: int | None = None
     resume_id: int | None = None
     job_id: int | None = None
-
-
-def _serialize_artifact(value: Any) -> Any:
-    if hasattr(value, "model_dump"):
-        return value.model_dump()
-    if is_dataclass(value) and not isinstance(value, type):
-        return asdict(value)
-    return value
-
-
-def serialize_pipeline_state(state: PipelineState) -> dict[str, Any]:
-    """Convert PipelineState to a JSON-serializable dict."""
-    artifacts = {key: _serialize_artifact(val) for key, val in state.artifacts.items()}
-    return {
-        "pipeline_name": state.pipeline_name,
-        "artifacts": artifacts,
-        "errors": state.errors,
-        "current_step": state.current_step,
-        "steps_completed": state.current_step + 1 if not state.errors else state.current_step,
-    }
+    timings_ms: dict[str, float] = {}
 
 
 async def _execute_pipeline(request: PipelineRunRequest) -> PipelineState:
@@ -152,6 +116,54 @@ async def _execute_pipeline(request: PipelineRunRequest) -> PipelineState:
     )
 
 
+def _sse(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+async def _sse_stream(
+    work: Callable[[], Awaitable[Any]],
+    on_close: Callable[[], None] | None = None,
+) -> AsyncIterator[str]:
+    """Run ``work`` inside a stream session and relay its events as SSE frames.
+
+    Step events and partial LLM output are sent as they happen; the return
+    value of ``work`` is sent last as a ``result`` event (or ``error``). The
+    work is cancelled if the client disconnects.
+    """
+    queue: asyncio.Queue[tuple[str, dict[str, Any]]] = asyncio.Queue()
+
+    async def run() -> Any:
+        with stream_session(queue):
+            return await work()
+
+    task = asyncio.create_task(run())
+    getter: asyncio.Future | None = None
+    try:
+        while True:
+            getter = asyncio.ensure_future(queue.get())
+            done, _ = await asyncio.wait({task, getter}, return_when=asyncio.FIRST_COMPLETED)
+            if getter not in done:
+                break
+            yield _sse(*getter.result())
+        while not queue.empty():
+            yield _sse(*queue.get_nowait())
+        try:
+            yield _sse("result", task.result())
+        except HTTPException as e:
+            yield _sse("error", {"status_code": e.status_code, "detail": e.detail})
+        except Exception as e:
+            logger.error(f"Pipeline stream error: {e}")
+            yield _sse("error", {"status_code": 500, "detail": "Internal server error"})
+    finally:
+        if getter is not None:
+            getter.cancel()
+        if not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        if on_close is not None:
+            on_close()
+
+
 @router.get("/list")
 async def pipeline_list():
     """List available pipelines from pipelines.yaml."""
@@ -169,80 +181,117 @@ async def pipeline_list():
     return {"success": True, "pipelines": pipelines}
 
 
+@router.get("/events")
+async def pipeline_events(
+    types: list[str] | None = Query(None, description="Event types to receive (default: all)"),
+    replay: int = Query(0, ge=0, le=1000, description="Recent events to send first"),
+    _user: User = Depends(get_current_user_dependency),
+):
+    """Live feed of pipeline events from this API process, as Server-Sent Events.
+
+    A slow client only loses its own oldest events; emitters never wait on it.
+    """
+    subscription = EventBus.subscribe(types)
+
+    async def stream() -> AsyncIterator[str]:
+        async with subscription:
+            for event in EventBus.history(replay) if replay else []:
+                if subscription.wants(event.event_type):
+                    yield _sse(event.event_type, event.data)
+            async for event in subscription:
+                yield _sse(event.event_type, event.data)
+
+    return StreamingResponse(stream(), media_type="text/event-stream")
+
+
 @router.get("/run/{job_id}")
 async def pipeline_run_status(
     job_id: str,
     _user: User = Depends(get_current_user_dependency),
 ):
-    """Poll a background pipeline run."""
-    _prune_background_jobs()
-    job = _background_jobs.get(job_id)
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found or expired")
+    """Poll a background pipeline run (any API worker can answer)."""
+    db = get_db_session()
+    try:
+        run = get_run(db, job_id)
+        if run is None:
+            raise HTTPException(status_code=404, detail="Job not found or expired")
+        return {"success": True, **run_status_payload(run)}
+    finally:
+        db.close()
+
+
+@router.post("/run/{job_id}/resume")
+async def pipeline_run_resume(
+    job_id: str,
+    _user: User = Depends(get_current_user_dependency),
+):
+    """Queue a new background run that resumes a finished one.
+
+    Steps whose artifacts were persisted are restored instead of re-running
+    their LLM calls; execution picks up at the first step without one.
+    """
+    db = get_db_session()
+    try:
+        run = get_run(db, job_id)
+        if run is None:
+            raise HTTPException(status_code=404, detail="Job not found or expired")
+        if run.status not in FINISHED_STATUSES:
+            raise HTTPException(status_code=409, detail=f"Job is still {run.status}")
+        new_job_id = resume_run(db, run, user_id=_user.id)
+    finally:
+        db.close()
+
     return {
         "success": True,
-        **{k: v for k, v in job.items() if not str(k).startswith("_")},
+        "status": "accepted",
+        "job_id": new_job_id,
+        "resumed_from": job_id,
+        "message": "Pipeline queued for background run. Poll GET /api/pipeline/run/{job_id}.",
     }
 
 
 @router.post("/run")
 async def pipeline_run(
     request: PipelineRunRequest,
-    background_tasks: BackgroundTasks,
     background: bool = Query(False, description="Run in background for long LLM pipelines"),
     _user: User = Depends(get_current_user_dependency),
 ):
-    """Execute a named pipeline and return artifacts and errors."""
+    """Execute a named pipeline and return artifacts and errors.
+
+    Background runs are persisted to the durable pipeline queue and executed by
+    whichever worker process claims them first.
+    """
     if background:
         if request.pipeline_key not in _BACKGROUND_PIPELINE_KEYS:
             logger.warning(
                 "Background run requested for short pipeline '{}'",
                 request.pipeline_key,
             )
-        job_id = str(uuid.uuid4())
-        _set_background_job(
-            job_id,
-            {"status": "running", "pipeline_key": request.pipeline_key},
-        )
-
-        async def _run_bg():
-            try:
-                state = await _execute_pipeline(request)
-                _set_background_job(
-                    job_id,
-                    {
-                        "status": "completed",
-                        "pipeline_key": request.pipeline_key,
-                        "result": serialize_pipeline_state(state),
-                    },
-                )
-            except HTTPException as e:
-                _set_background_job(
-                    job_id,
-                    {
-                        "status": "failed",
-                        "pipeline_key": request.pipeline_key,
-                        "error": e.detail,
-                    },
-                )
-            except Exception as e:
-                logger.error("Background pipeline failed: {}", e)
-                _set_background_job(
-                    job_id,
-                    {
-                        "status": "failed",
-                        "pipeline_key": request.pipeline_key,
-                        "error": "Background pipeline failed",
-                    },
-                )
-
-        background_tasks.add_task(_run_bg)
+        configs = load_pipeline_configs()
+        config = configs.get(request.pipeline_key)
+        if config is None:
+            raise HTTPException(status_code=404, detail=f"Unknown pipeline: {request.pipeline_key}")
+        db = get_db_session()
+        try:
+            job_id = enqueue_run(
+                db,
+                request.pipeline_key,
+                config.name,
+                resume_text=request.resume_text,
+                job_text=request.job_text,
+                cv_text=request.cv_text,
+                inputs=request.inputs,
+                total_steps=len(config.steps),
+                user_id=_user.id,
+            )
+        finally:
+            db.close()
 
         return {
             "success": True,
             "status": "accepted",
             "job_id": job_id,
-            "message": "Pipeline running in background. Poll GET /api/pipeline/run/{job_id}.",
+            "message": "Pipeline queued for background run. Poll GET /api/pipeline/run/{job_id}.",
         }
 
     state = await _execute_pipeline(request)
@@ -253,6 +302,27 @@ async def pipeline_run(
     }
 
 
+@router.post("/run/stream")
+async def pipeline_run_stream(
+    request: PipelineRunRequest,
+    _user: User = Depends(get_current_user_dependency),
+):
+    """Execute a named pipeline, streaming progress as Server-Sent Events.
+
+    Events: ``pipeline_started``/``step_complete``/``pipeline_completed`` from
+    the engine, ``token`` (text deltas) and ``partial`` (structured output
+    parsed so far) from each agent, then a final ``result`` with the same
+    payload as ``POST /run``.
+    """
+    if request.pipeline_key not in load_pipeline_configs():
+        raise HTTPException(status_code=404, detail=f"Unknown pipeline: {request.pipeline_key}")
+
+    async def work() -> dict[str, Any]:
+        return serialize_pipeline_state(await _execute_pipeline(request))
+
+    return StreamingResponse(_sse_stream(work), media_type="text/event-stream")
+
+
 @router.post("/apply")
 async def pipeline_apply(request: PipelineApplyRequest):
     """Unified application package: tailor + cover letter + analysis + auto-track.
@@ -297,6 +367,94 @@ async def pipeline_apply(request: PipelineApplyRequest):
         db.close()
 
 
+@router.post("/apply/stream")
+async def pipeline_apply_stream(request: PipelineApplyRequest):
+    """Unified apply pipeline streamed as Server-Sent Events.
+
+    Sends ``token``/``partial`` events while the tailored resume and cover
+    letter are generated, then a final ``result`` with the application package.
+    """
+    db = get_db_session()
+    svc = ApplyService(DatabaseService(db))
+    try:
+        resume_text, resume_id, resume_record = await svc.resolve_resume_text(request.resume_id)
+        job_text, _job_id, company_name = await svc.resolve_job_text(
+            request.job_text or "",
+            request.job_id,
+            request.company_name or "",
+        )
+    except ValueError as e:
+        db.close()
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        db.close()
+        logger.error(f"Pipeline apply stream error: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    async def work() -> dict[str, Any]:
+        result = await svc.run(
+            resume_id=resume_id,
+            job_text=job_text,
+            company_name=company_name,
+            hiring_manager=request.hiring_manager or "",
+            format_type=request.format_type,
+            user_id=request.user_id,
+            resume_record=resume_record,
+        )
+        return PipelineResult(**result).model_dump()
+
+    return StreamingResponse(_sse_stream(work, on_close=db.close), media_type="text/event-stream")
+
+
+@router.post("/apply/batch")
+async def pipeline_apply_batch(request: PipelineBatchApplyRequest):
+    """Fan one resume out to many job postings, streaming progress as NDJSON.
+
+    Each line is a JSON event: ``started``, one ``job`` per posting as it
+    finishes (with its application package), ``saved`` after each bulk write
+    (job id -> application id), and a final ``done`` summary.
+    """
+    if len(request.job_ids) > settings.APPLY_BATCH_MAX_JOBS:
+        raise HTTPException(
+            status_code=422,
+            detail=f"At most {settings.APPLY_BATCH_MAX_JOBS} jobs per batch",
+        )
+
+    db = get_db_session()
+    svc = ApplyService(DatabaseService(db))
+    events = svc.run_batch(
+        resume_id=request.resume_id,
+        job_ids=request.job_ids,
+        hiring_manager=request.hiring_manager or "",
+        format_type=request.format_type,
+        user_id=request.user_id,
+    )
+    # Resolve the resume before streaming so a bad resume_id is a plain 404.
+    try:
+        first = await anext(events)
+    except ValueError as e:
+        db.close()
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        db.close()
+        logger.error(f"Pipeline batch apply error: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    async def stream() -> AsyncIterator[str]:
+        try:
+            yield json.dumps(first) + "\n"
+            async for event in events:
+                yield json.dumps(event, default=str) + "\n"
+        except Exception as e:
+            logger.error(f"Pipeline batch apply error: {e}")
+            yield json.dumps({"event": "error", "error": "Internal server error"}) + "\n"
+        finally:
+            await events.aclose()
+            db.close()
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
 @router.post("/apply/file")
 async def pipeline_apply_file(
     file: UploadFile = File(...),
@@ -12,8 +12,23 @@ router = APIRouter(prefix="/recommendations", tags=["Recommendations"])
 
 
 @router.get("/jobs/{resume_id}")
-async def recommend_jobs(resume_id: int, limit: int = Query(10, ge=1, le=100)):
-    """Recommend jobs for a given resume using vector similarity."""
+async def recommend_jobs(
+    resume_id: int,
+    limit: int = Query(10, ge=1, le=100),
+    source: list[str] | None = Query(None),
+    company: list[str] | None = Query(None),
+    location: list[str] | None = Query(None),
+):
+    """Recommend jobs for a given resume using vector similarity.
+
+    Repeatable ``source``/``company``/``location`` parameters restrict results
+    to any of the given values; they are applied inside the vector search.
+    """
+    filters = {
+        key: values
+        for key, values in (("source", source), ("company", company), ("location", location))
+        if values
+    }
     db = get_db_session()
     try:
         vs = get_vector_store()
@@ -24,7 +39,9 @@ async def recommend_jobs(resume_id: int, limit: int = Query(10, ge=1, le=100)):
         search_svc = SearchService(vector_store=vs)
         db_svc = DatabaseService(db)
         service = RecommendationService(search_service=search_svc, db_service=db_svc)
-        results = await service.recommend_jobs_for_resume(resume_id, limit=limit)
+        results = await service.recommend_jobs_for_resume(
+            resume_id, limit=limit, filters=filters or None
+        )
         return {"success": True, "count": len(results), "results": results}
     except HTTPException:
         raise
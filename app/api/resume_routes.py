@@ -6,6 +6,7 @@ from loguru import logger
 
 from app.agents.cover_letter import generate_cover_letter
 from app.agents.resume_tailor import tailor_resume
+from app.core.config import settings
 from app.core.upload_validation import RESUME_EXTENSIONS, validate_upload, validate_upload_size
 from app.models.api_models import (
     AnalysisData,
@@ -27,8 +28,10 @@ from app.services.db_service import (
     ResumeCreateData,
     get_db_session,
 )
+from app.services.document_cache import extract_text_cached
 from app.services.export_service import export_content
-from app.services.parsing_service import JobParser, ParserLLM, ResumeParser, extract_text
+from app.services.extraction_pool import extract_texts_async, extraction_stats
+from app.services.parsing_service import JobParser, ParserLLM, ResumeParser
 from app.services.search_service import SearchService
 from app.services.vector_store import get_vector_store
 
@@ -223,7 +226,7 @@ async def tailor_resume_endpoint(
             return TailoredResumeResponse(success=False, message="Empty file")
 
         # Extract resume text
-        resume_text = extract_text(content, _upload_filename(file))
+        resume_text = await extract_text_cached(content, _upload_filename(file))
         if not resume_text.strip():
             return TailoredResumeResponse(success=False, message="Could not extract text from file")
 
@@ -259,7 +262,7 @@ async def generate_cover_letter_endpoint(
         if not content:
             return CoverLetterResponse(success=False, message="Empty file")
 
-        resume_text = extract_text(content, _upload_filename(file))
+        resume_text = await extract_text_cached(content, _upload_filename(file))
         if not resume_text.strip():
             return CoverLetterResponse(success=False, message="Could not extract text from file")
 
@@ -308,12 +311,14 @@ async def tailor_to_template(
             return Response(content="Empty file", status_code=400)
 
         # Parse resume into structured model
-        resume_text = extract_text(content, _upload_filename(file))
+        resume_text = await extract_text_cached(content, _upload_filename(file))
         if not resume_text.strip():
             return Response(content="Could not extract text", status_code=400)
 
         parser = ParserLLM()
-        resume = await parser.parse_resume(resume_text)
+        resume = await ResumeParser(parser).parse_resume_file_content(
+            content, _upload_filename(file)
+        )
 
         # Parse job for title/company
         job = await parser.parse_job(job_text)
@@ -347,6 +352,47 @@ async def tailor_to_template(
         return Response(content=f"Error: {e}", status_code=500)
 
 
+@router.post("/extract/batch")
+async def extract_batch(files: list[UploadFile] = File(...)):
+    """Extract text from many uploaded documents at once (bulk resume uploads).
+
+    Files are extracted concurrently in the extraction pool; each result
+    carries either the text or a per-file error, in upload order.
+    """
+    if len(files) > settings.EXTRACTION_BATCH_MAX_FILES:
+        raise HTTPException(
+            status_code=422,
+            detail=f"At most {settings.EXTRACTION_BATCH_MAX_FILES} files per batch",
+        )
+    uploads = []
+    for file in files:
+        validate_upload(file, allowed_extensions=RESUME_EXTENSIONS)
+        content = await file.read()
+        validate_upload_size(content)
+        uploads.append((content, _upload_filename(file)))
+
+    results = await extract_texts_async(uploads)
+    return {
+        "success": all(r.error is None for r in results),
+        "results": [
+            {
+                "filename": r.filename,
+                "text": r.text,
+                "chars": len(r.text),
+                "error": r.error,
+                "seconds": round(r.seconds, 3),
+            }
+            for r in results
+        ],
+    }
+
+
+@router.get("/extract/stats")
+async def extract_stats():
+    """Per-format document extraction throughput since startup."""
+    return {"success": True, "stats": extraction_stats()}
+
+
 @router.post("/export")
 async def export_tailored_resume(
     content: str = Form(...),
@@ -101,15 +101,19 @@ async def get_progress():
 @router.post("/scan/batch", response_model=ScanBatchResponse)
 async def scan_batch(
     batch_size: int = Query(10, ge=1, le=50, description="Number of startups to scan"),
+    concurrency: int | None = Query(
+        None, ge=1, le=16, description="Startups scanned at once (default: SCANNER_CONCURRENCY)"
+    ),
 ):
     """
     Scan a batch of startups for job openings.
 
-    This processes startups sequentially and returns found jobs.
+    Startups are scanned concurrently under per-host politeness limits; each
+    startup's jobs are persisted as soon as its scan completes.
     """
     agent = get_agent()
 
-    jobs = await agent.process_batch(batch_size=batch_size)
+    jobs = await agent.process_batch(batch_size=batch_size, concurrency=concurrency)
     progress = agent.get_progress()
 
     return ScanBatchResponse(
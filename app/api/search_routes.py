@@ -7,6 +7,7 @@ from loguru import logger
 from pydantic import BaseModel, Field
 
 from app.services.db_service import DatabaseService, get_db_session
+from app.services.embedding_service import get_embedding_service
 from app.services.search_service import SearchService
 from app.services.vector_store import get_vector_store
 
@@ -130,10 +131,14 @@ async def index_job(job_id: int, request: IndexDocumentRequest):
 
 @router.get("/stats")
 async def get_stats():
-    """Get vector store collection statistics."""
+    """Get vector store collection and embedding cache statistics."""
     try:
         vs = get_vector_store()
-        return {"success": True, "stats": vs.get_all_stats()}
+        return {
+            "success": True,
+            "stats": vs.get_all_stats(),
+            "embedding_cache": get_embedding_service().cache_stats(),
+        }
     except Exception as e:
         logger.error(f"Stats error: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -49,15 +49,115 @@ class Settings(BaseSettings):
     BIGSET_FOLDER_WATCH_CRON: str = "0 */6 * * *"
     BIGSET_FOLDER_WATCH_ENABLED: bool = True
     BIGSET_MAX_UPLOAD_BYTES: int = 52_428_800
+    BIGSET_IMPORT_CHUNK_SIZE: int = 5000
     BIGSET_REMOTE_ENABLED: bool = False
     BIGSET_APP_URL: str = "http://localhost:3500"
     BIGSET_AUTO_SYNC_ON_PIPELINE: bool = True
 
+    # Local embeddings used when no provider is reachable: "hash" (exact-match
+    # digest vectors) or "ngram" (feature-hashed character n-grams, semantic-ish).
+    EMBEDDING_FALLBACK_MODE: str = "hash"
+
+    # Provider embeddings cached on disk by (model, sha256(text)); LRU-evicted
+    # once stored vectors exceed EMBEDDING_CACHE_MAX_BYTES.
+    EMBEDDING_CACHE_ENABLED: bool = True
+    EMBEDDING_CACHE_PATH: str = "data/embedding_cache.sqlite"
+    EMBEDDING_CACHE_MAX_BYTES: int = 268_435_456
+
+    # Startup scanner: startups scanned concurrently per batch, and politeness
+    # limits applied per career-site host.
+    SCANNER_CONCURRENCY: int = 4
+    SCANNER_PER_HOST_CONCURRENCY: int = 1
+    SCANNER_HOST_MIN_INTERVAL_SECONDS: float = 1.0
+    # Career paths probed in parallel per site, seconds between probe starts on
+    # one site, and the per-domain memory of which path matched last time.
+    SCRAPER_PROBE_CONCURRENCY: int = 3
+    SCRAPER_PROBE_MIN_INTERVAL_SECONDS: float = 0.2
+    CAREER_PATH_CACHE_PATH: str = "data/career_path_cache.json"
+
+    # Shared outbound HTTP client (scrapers, profile runtimes). HTTP/2 is used
+    # when the optional ``h2`` package is installed.
+    HTTP_TIMEOUT_SECONDS: float = 30.0
+    HTTP_CONNECT_TIMEOUT_SECONDS: float = 10.0
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_MAX_CONNECTIONS_PER_HOST: int = 8
+    HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    HTTP_RETRIES: int = 2
+    HTTP_RETRY_BACKOFF_SECONDS: float = 0.5
+    HTTP2_ENABLED: bool = True
+    # On-disk conditional-GET cache for job boards and career pages. Entries are
+    # served without a request inside the per-source TTL, then revalidated with
+    # ETag / Last-Modified.
+    HTTP_CACHE_ENABLED: bool = True
+    HTTP_CACHE_PATH: str = "data/http_cache.sqlite"
+    HTTP_CACHE_MAX_BYTES: int = 134_217_728
+    HTTP_CACHE_TTL_SECONDS: int = 900
+    HTTP_CACHE_SOURCE_TTLS: dict[str, int] = {
+        "remoteok": 1800,
+        "adzuna": 3600,
+        "linkedin": 600,
+        "indeed": 600,
+        "wuzzuf": 1800,
+        "career_page": 21_600,
+    }
+
     AX_MCPS_DIR: str = "mcps"
     AX_MERGE_INBOUND_MCPS: bool = True
 
+    # Issue the tailor / cover-letter / job-parse LLM calls of one apply
+    # concurrently (false = one after another, e.g. for a local model server).
+    APPLY_CONCURRENT_LLM_CALLS: bool = True
+    # Batch apply (POST /pipeline/apply/batch): jobs per request, process-wide
+    # cap on concurrent per-job LLM work, and packages per bulk DB write.
+    APPLY_BATCH_MAX_JOBS: int = 50
+    APPLY_BATCH_CONCURRENCY: int = 4
+    APPLY_BATCH_FLUSH_SIZE: int = 10
+
+    # Finished background runs kept in pipeline_runs (age and count caps).
     PIPELINE_BACKGROUND_JOB_TTL_SECONDS: int = 86_400
     PIPELINE_BACKGROUND_JOB_MAX_ENTRIES: int = 200
+    # Durable background queue: workers per API process, lease length renewed
+    # while a run executes, and retry policy for failed runs.
+    PIPELINE_QUEUE_WORKERS: int = 2
+    PIPELINE_QUEUE_POLL_SECONDS: float = 1.0
+    PIPELINE_QUEUE_LEASE_SECONDS: int = 60
+    PIPELINE_QUEUE_MAX_ATTEMPTS: int = 3
+    PIPELINE_QUEUE_RETRY_BACKOFF_SECONDS: float = 10.0
+    # Run independent pipeline steps concurrently (false = strict YAML order,
+    # e.g. for a local model server that cannot serve parallel requests).
+    PIPELINE_PARALLEL_STEPS: bool = True
+    # Content-addressed cache of step artifacts keyed by agent, prompt hash,
+    # model and the inputs the agent declares (see BaseAgent.cache_inputs).
+    PIPELINE_ARTIFACT_CACHE_ENABLED: bool = True
+    PIPELINE_ARTIFACT_CACHE_PATH: str = "data/pipeline_artifacts.sqlite"
+    PIPELINE_ARTIFACT_CACHE_MAX_BYTES: int = 67_108_864
+    PIPELINE_ARTIFACT_CACHE_TTL_SECONDS: int = 604_800
+    # Resume/document text extraction runs in a process pool off the event
+    # loop (0 workers = a thread instead); jobs over the timeout are killed.
+    EXTRACTION_POOL_WORKERS: int = 2
+    EXTRACTION_TIMEOUT_SECONDS: float = 120.0
+    EXTRACTION_BATCH_MAX_FILES: int = 20
+    # Reuse extracted text and parsed resumes of re-uploaded files (sha256 of
+    # the bytes + parser version), stored in the parsed_documents table.
+    DOCUMENT_CACHE_ENABLED: bool = True
+    DOCUMENT_CACHE_MAX_ENTRIES: int = 5000
+    # Vector store backend: "qdrant" (embedded), "flat" (exact search over
+    # memory-mapped NumPy files in FLAT_VECTOR_PATH) or "auto" (qdrant, else flat).
+    VECTOR_STORE_BACKEND: str = "auto"
+    FLAT_VECTOR_PATH: str = "data/vectors"
+    # Keyword (FTS5/BM25) queries matching more rows than this are ranked over
+    # the newest this-many matches only, which bounds their latency.
+    KEYWORD_SEARCH_CANDIDATE_POOL: int = 1000
+    # Hybrid search rank fusion: "rrf" (reciprocal rank, k below) or "weighted"
+    # (min-max normalized scores). Weights apply per signal in either method.
+    SEARCH_FUSION_METHOD: str = "rrf"
+    SEARCH_RRF_K: int = 60
+    SEARCH_FUSION_WEIGHTS: dict[str, float] = {"vector": 1.0, "keyword": 1.0, "fit": 1.0}
+    # Pipeline event bus: ring-buffer history length and the per-subscriber
+    # queue bound (async handlers and SSE subscribers) before events are dropped.
+    EVENT_BUS_HISTORY_SIZE: int = 1000
+    EVENT_BUS_SUBSCRIBER_QUEUE_SIZE: int = 256
     PIPELINE_UI_POLL_INTERVAL_SECONDS: float = 2.0
     PIPELINE_UI_POLL_MAX_ATTEMPTS: int = 60
 
@@ -4,7 +4,10 @@ Auto-detects available providers, builds fallback chains, creates agents.
 Every agent and service in the app gets its model from here.
 """
 
+import hashlib
 import os
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
 from functools import lru_cache
@@ -238,6 +241,21 @@ class ModelChain:
     all_providers: list[ProviderInfo] = field(default_factory=list)
 
 
+# pydantic-ai Agents keep no per-run state, so one instance per configuration
+# is shared by every request. Bounded in case callers build dynamic prompts.
+_AGENT_CACHE_SIZE = 128
+
+
+def _freeze(value: Any) -> Any:
+    """Hashable form of an agent kwarg; raises TypeError if it has none."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    hash(value)
+    return value
+
+
 class ModelRegistry:
     """Central registry. Call `get_registry()` to get the singleton."""
 
@@ -246,7 +264,12 @@ class ModelRegistry:
         # Phase 1: detect cloud providers from env vars (no network I/O)
         self.providers = _detect_env_providers()
         self._chain: ModelChain | None = None
+        self._chain_version = 0
         self._local_probed = False
+        self._agents: OrderedDict[tuple, Any] = OrderedDict()
+        self._agents_lock = threading.Lock()
+        self.agent_cache_hits = 0
+        self.agent_cache_misses = 0
         self._configure_env()
         self._configure_litellm()
         self._log_status()
@@ -259,11 +282,29 @@ class ModelRegistry:
         if self._local_probed:
             return
         local = await _detect_local_providers_async()
+        before = self._chain_signature()
         self.providers.extend(local)
         self._local_probed = True
         self._chain = None  # invalidate cached chain
+        if self._chain_signature() != before:
+            self._invalidate_agents()
         self._log_status()
 
+    def _chain_signature(self) -> tuple[str, tuple[str, ...]]:
+        chain = self.resolve_chain()
+        return chain.primary_model_string, tuple(chain.fallback_model_strings)
+
+    @property
+    def chain_version(self) -> int:
+        """Bumped whenever the model chain changes; cached agents are dropped then."""
+        return self._chain_version
+
+    def _invalidate_agents(self) -> None:
+        with self._agents_lock:
+            self._chain_version += 1
+            self._agents.clear()
+        logger.info("Model chain changed; cleared cached agents")
+
     def _configure_env(self):
         """Propagate settings to environment variables."""
         s = self.settings
@@ -499,6 +540,7 @@ class ModelRegistry:
         system_prompt: str = "",
         retries: int = 2,
         name: str | None = None,
+        cache: bool = True,
         **kwargs,
     ):
         """Create a Pydantic AI Agent with the configured model + fallbacks.
@@ -508,16 +550,66 @@ class ModelRegistry:
         pydantic-ai are attributed to the right agent instead of appearing as
         anonymous LLM calls.
 
+        Agents are memoized per (output type, prompt hash, retries, name, tools
+        and other kwargs, chain version): building one resolves the model chain
+        and compiles the output schema, which is wasted work per request.
+
         Args:
             output_type: Pydantic model for structured output (or None for plain text).
             system_prompt: System prompt / instructions.
             retries: Number of retries on failure.
             name: Agent name used for trace attribution (Langfuse/Logfire).
+            cache: Reuse an identical agent built earlier (False = always build).
             **kwargs: Additional kwargs passed to Agent().
 
         Returns:
             Configured Agent instance.
         """
+        if not cache:
+            return self._build_agent(output_type, system_prompt, retries, name, kwargs)
+        try:
+            key = (
+                output_type,
+                hashlib.sha256(system_prompt.encode("utf-8")).hexdigest(),
+                retries,
+                name,
+                _freeze(kwargs),
+                self._chain_version,
+            )
+        except TypeError:
+            return self._build_agent(output_type, system_prompt, retries, name, kwargs)
+
+        with self._agents_lock:
+            agent = self._agents.get(key)
+            if agent is not None:
+                self._agents.move_to_end(key)
+                self.agent_cache_hits += 1
+                return agent
+        agent = self._build_agent(output_type, system_prompt, retries, name, kwargs)
+        with self._agents_lock:
+            self.agent_cache_misses += 1
+            if key[-1] == self._chain_version:
+                self._agents[key] = agent
+                while len(self._agents) > _AGENT_CACHE_SIZE:
+                    self._agents.popitem(last=False)
+        return agent
+
+    def agent_cache_info(self) -> dict[str, int]:
+        return {
+            "size": len(self._agents),
+            "hits": self.agent_cache_hits,
+            "misses": self.agent_cache_misses,
+            "chain_version": self._chain_version,
+        }
+
+    def _build_agent(
+        self,
+        output_type: type[BaseModel] | type | None,
+        system_prompt: str,
+        retries: int,
+        name: str | None,
+        kwargs: dict[str, Any],
+    ):
         from pydantic_ai import Agent
 
         model = self.get_model()
@@ -577,6 +669,7 @@ class ModelRegistry:
                 for p in self.providers
             },
             "prefer_local": self.settings.prefer_local,
+            "agent_cache": self.agent_cache_info(),
         }
 
 
@@ -620,9 +713,10 @@ def create_agent(
     system_prompt: str = "",
     retries: int = 2,
     name: str | None = None,
+    cache: bool = True,
     **kwargs,
 ):
-    """Create a configured Pydantic AI Agent. THE factory function.
+    """Create (or reuse) a configured Pydantic AI Agent. THE factory function.
 
     Forwards ``name`` to the Agent so Langfuse and Logfire traces are
     attributed to the calling agent.
@@ -632,10 +726,16 @@ def create_agent(
         system_prompt=system_prompt,
         retries=retries,
         name=name,
+        cache=cache,
         **kwargs,
     )
 
 
+def get_chain_version() -> int:
+    """Current model chain version (see ``ModelRegistry.chain_version``)."""
+    return get_registry().chain_version
+
+
 async def health_check() -> dict[str, Any]:
     """Run health check on all providers."""
     return await get_registry().health_check()
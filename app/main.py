@@ -24,7 +24,10 @@ from app.api.settings_routes import router as settings_router
 from app.api.tracking_routes import router as tracking_router
 from app.core.config import settings
 from app.core.model_registry import get_registry, init_ai_stack
+from app.pipelines.job_queue import start_worker_pool, stop_worker_pool
 from app.services.db_service import initialize_database_tables
+from app.services.extraction_pool import shutdown_extraction_pool
+from app.services.http_client import close_http_client
 
 
 @asynccontextmanager
@@ -46,6 +49,7 @@ async def lifespan(app: FastAPI):
         start_scheduler()
     except Exception as e:
         logger.warning("Scheduler start failed (non-fatal): {}", e)
+    start_worker_pool()
     logger.info("Job_Booster API ready")
     yield
     # Shutdown
@@ -55,6 +59,9 @@ async def lifespan(app: FastAPI):
         stop_scheduler()
     except Exception:
         pass
+    await stop_worker_pool()
+    await close_http_client()
+    shutdown_extraction_pool()
     logger.info("Shutting down Job_Booster API")
 
 
@@ -3,15 +3,18 @@
 from datetime import datetime, timezone
 from typing import Any
 
+from loguru import logger
 from sqlalchemy import (
     Boolean,
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     create_engine,
+    inspect,
 )
 from sqlalchemy.dialects.sqlite import JSON
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
@@ -54,6 +57,36 @@ class ResumeDB(Base):
     )
 
 
+class ParsedDocumentDB(Base):
+    """Extracted text and parsed Resume of an uploaded file, keyed by content hash.
+
+    Re-uploading identical bytes skips extraction; ``resume_json`` is reused
+    while ``resume_parser_version`` (prompt hash + model) still matches.
+    """
+
+    __tablename__ = "parsed_documents"
+    __table_args__ = (
+        Index(
+            "ux_parsed_documents_key",
+            "content_sha256",
+            "file_format",
+            "extractor_version",
+            unique=True,
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    content_sha256: Mapped[str] = mapped_column(String(64))
+    file_format: Mapped[str] = mapped_column(String(10))
+    extractor_version: Mapped[str] = mapped_column(String(32))
+    extracted_text: Mapped[str] = mapped_column(Text)
+    resume_json: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+    resume_parser_version: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    hits: Mapped[int] = mapped_column(Integer, default=0)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=_utcnow)
+    last_used_at: Mapped[datetime] = mapped_column(DateTime, default=_utcnow, index=True)
+
+
 class ResumeVersionDB(Base):
     """Resume version table for tracking multiple file versions."""
 
@@ -83,9 +116,42 @@ class JobPostingDB(Base):
     content_json: Mapped[dict[str, Any] | None] = mapped_column(JSON)
     raw_text: Mapped[str | None] = mapped_column(Text, nullable=True)
     source_url: Mapped[str | None] = mapped_column(String(512), nullable=True)
+    # Normalized key from ``app.services.job_dedupe.job_dedupe_key``; only set by
+    # dedupe-aware writers (imports/scrapes). NULL rows are matched by the legacy
+    # company/title/url fallback.
+    dedupe_key: Mapped[str | None] = mapped_column(
+        String(1024), nullable=True, unique=True, index=True
+    )
     created_at: Mapped[datetime] = mapped_column(DateTime, default=_utcnow)
 
 
+class JobFitDocDB(Base):
+    """Marks a job posting as tokenized for profile-fit ranking.
+
+    Every posting gets a row (``source`` is NULL when it has no import source),
+    so postings without one are the ones still to be indexed.
+    """
+
+    __tablename__ = "job_fit_docs"
+
+    job_id: Mapped[int] = mapped_column(Integer, ForeignKey("job_postings.id"), primary_key=True)
+    source: Mapped[str | None] = mapped_column(String(50), nullable=True, index=True)
+    indexed_at: Mapped[datetime] = mapped_column(DateTime, default=_utcnow)
+
+
+class JobFitTermDB(Base):
+    """Inverted index of normalized tokens per imported job posting."""
+
+    __tablename__ = "job_fit_terms"
+    # Covering index: ranking reads (source, term) -> job_id without touching the table.
+    __table_args__ = (Index("ix_job_fit_terms_source_term", "source", "term", "job_id"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    job_id: Mapped[int] = mapped_column(Integer, ForeignKey("job_postings.id"), index=True)
+    source: Mapped[str] = mapped_column(String(50))
+    term: Mapped[str] = mapped_column(String(100))
+
+
 class TailoredResumeDB(Base):
     """Tailored Resume table for storing generated tailored resumes."""
 
@@ -218,6 +284,20 @@ class PipelineRun(Base):
     started_at: Mapped[datetime] = mapped_column(DateTime, default=_utcnow)
     completed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
+    # Durable background queue (app.pipelines.job_queue). Queued runs carry a
+    # public job_id; workers in any process claim them under a time-limited lease.
+    job_id: Mapped[str | None] = mapped_column(String(36), nullable=True, unique=True, index=True)
+    cv_text: Mapped[str | None] = mapped_column(Text, nullable=True)
+    inputs_json: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+    attempts: Mapped[int | None] = mapped_column(Integer, nullable=True, default=0)
+    max_attempts: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    available_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    lease_owner: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    lease_expires_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    __table_args__ = (Index("ix_pipeline_runs_status_available", "status", "available_at"),)
+
 
 def create_tables(engine_or_url):
     """Creates all tables in the database.
@@ -230,3 +310,82 @@ def create_tables(engine_or_url):
     else:
         engine = engine_or_url
     Base.metadata.create_all(engine)
+    _add_missing_columns(engine)
+    _create_fts_indexes(engine)
+
+
+def _add_missing_columns(engine) -> None:
+    """Add nullable columns introduced after a table was first created.
+
+    ``create_all`` never alters existing tables, so older SQLite files would
+    otherwise miss new columns such as ``job_postings.dedupe_key``.
+    """
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            present = {c["name"] for c in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in present or not column.nullable:
+                    continue
+                col_type = column.type.compile(dialect=engine.dialect)
+                conn.exec_driver_sql(
+                    f"ALTER TABLE {table.name} ADD COLUMN {column.name} {col_type}"
+                )
+                for index in table.indexes:
+                    if column in index.columns.values():
+                        index.create(conn, checkfirst=True)
+
+
+# Full-text (FTS5) indexes over searchable text columns, keyed by source table.
+# They are external-content tables kept current by triggers, so bulk
+# ``insert()`` statements that bypass the ORM are indexed as well.
+FTS_COLUMNS: dict[str, tuple[str, ...]] = {
+    "job_postings": ("title", "company", "raw_text"),
+    "resumes": ("filename", "raw_text"),
+}
+
+
+def fts_table(table_name: str) -> str:
+    return f"{table_name}_fts"
+
+
+def _create_fts_indexes(engine) -> None:
+    """Create FTS5 tables and sync triggers; backfill rows that predate them."""
+    if engine.dialect.name != "sqlite":
+        return
+    existing_tables = set(inspect(engine).get_table_names())
+    try:
+        with engine.begin() as conn:
+            for table, columns in FTS_COLUMNS.items():
+                fts = fts_table(table)
+                cols = ", ".join(columns)
+                new_cols = ", ".join(f"new.{c}" for c in columns)
+                old_cols = ", ".join(f"old.{c}" for c in columns)
+                conn.exec_driver_sql(
+                    f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+                    f"{cols}, content='{table}', content_rowid='id', "
+                    "tokenize='porter unicode61')"
+                )
+                conn.exec_driver_sql(
+                    f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN "
+                    f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_cols}); END"
+                )
+                conn.exec_driver_sql(
+                    f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN "
+                    f"INSERT INTO {fts}({fts}, rowid, {cols}) "
+                    f"VALUES ('delete', old.id, {old_cols}); END"
+                )
+                conn.exec_driver_sql(
+                    f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {cols} ON {table} "
+                    f"BEGIN INSERT INTO {fts}({fts}, rowid, {cols}) "
+                    f"VALUES ('delete', old.id, {old_cols}); "
+                    f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_cols}); END"
+                )
+                if fts not in existing_tables:
+                    conn.exec_driver_sql(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+    except Exception as e:
+        # SQLite builds without FTS5 fall back to LIKE scans in keyword_search.
+        logger.warning(f"Full-text indexes unavailable: {e}")
@@ -0,0 +1,172 @@
+"""Content-addressed cache of pipeline step artifacts.
+
+An artifact is keyed by the agent key, a hash of the agent's prompt/skill
+text, the model string and the inputs the agent declares through
+``BaseAgent.cache_inputs``. Identical requests therefore reuse the stored
+output instead of repeating the LLM call, and any prompt or model change
+naturally misses. Entries live in a standalone SQLite file, expire after a
+TTL and are evicted least-recently-used over a size budget.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from app.core.config import settings
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS artifacts (
+    key TEXT PRIMARY KEY,
+    agent_key TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_artifacts_last_used ON artifacts (last_used);
+"""
+
+# Evict down to this fraction of the budget so eviction does not run on every put.
+_EVICT_TARGET_RATIO = 0.9
+
+
+def artifact_cache_key(
+    agent_key: str,
+    prompt: str,
+    model: str,
+    inputs: dict[str, Any],
+) -> str:
+    """Content address of one step execution."""
+    material = json.dumps(
+        {
+            "agent": agent_key,
+            "prompt": hashlib.sha256(prompt.encode("utf-8")).hexdigest(),
+            "model": model,
+            "inputs": inputs,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class ArtifactCache:
+    """SQLite-backed LRU cache of serialized step artifacts."""
+
+    def __init__(self, path: Path, max_bytes: int, ttl_seconds: float):
+        self._path = path
+        self._max_bytes = max_bytes
+        self._ttl = ttl_seconds
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        row = self._conn.execute(
+            "SELECT COALESCE(SUM(LENGTH(payload)), 0) FROM artifacts"
+        ).fetchone()
+        self._total_bytes = int(row[0])
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Any | None:
+        """Return the stored artifact payload, or None on a miss or expiry."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, created_at FROM artifacts WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self._ttl:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE artifacts SET last_used = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, agent_key: str, payload: Any) -> None:
+        """Store a JSON-serializable artifact payload."""
+        blob = json.dumps(payload, default=str)
+        now = time.time()
+        with self._lock:
+            old = self._conn.execute(
+                "SELECT LENGTH(payload) FROM artifacts WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO artifacts (key, agent_key, payload, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, agent_key, blob, now, now),
+            )
+            self._total_bytes += len(blob) - (int(old[0]) if old else 0)
+            if self._total_bytes > self._max_bytes:
+                self._evict(int(self._max_bytes * _EVICT_TARGET_RATIO))
+            self._conn.commit()
+
+    def _evict(self, target_bytes: int) -> None:
+        cursor = self._conn.execute(
+            "SELECT key, LENGTH(payload) FROM artifacts ORDER BY last_used ASC"
+        )
+        doomed: list[tuple[str]] = []
+        freed = 0
+        for key, size in cursor:
+            if self._total_bytes - freed <= target_bytes:
+                break
+            doomed.append((key,))
+            freed += size
+        self._conn.executemany("DELETE FROM artifacts WHERE key = ?", doomed)
+        self._total_bytes -= freed
+        logger.debug(f"ArtifactCache: evicted {len(doomed)} entries ({freed} bytes)")
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters for this process plus on-disk size."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM artifacts").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "path": str(self._path),
+            "entries": entries,
+            "bytes": self._total_bytes,
+            "max_bytes": self._max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        """Drop every cached artifact and reset counters."""
+        with self._lock:
+            self._conn.execute("DELETE FROM artifacts")
+            self._conn.commit()
+            self._total_bytes = 0
+        self.hits = self.misses = 0
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+_cache: ArtifactCache | None = None
+_cache_failed = False
+
+
+def get_artifact_cache() -> ArtifactCache | None:
+    """Process-wide artifact cache, or None when disabled or unavailable."""
+    global _cache, _cache_failed
+    if not settings.PIPELINE_ARTIFACT_CACHE_ENABLED or _cache_failed:
+        return None
+    if _cache is None:
+        try:
+            _cache = ArtifactCache(
+                Path(settings.PIPELINE_ARTIFACT_CACHE_PATH),
+                max_bytes=settings.PIPELINE_ARTIFACT_CACHE_MAX_BYTES,
+                ttl_seconds=settings.PIPELINE_ARTIFACT_CACHE_TTL_SECONDS,
+            )
+        except Exception as e:
+            logger.warning(f"Pipeline artifact cache unavailable, running without it: {e}")
+            _cache_failed = True
+            return None
+    return _cache
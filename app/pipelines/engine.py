@@ -1,24 +1,40 @@
 """Pipeline engine — orchestrates multi-agent workflows.
 
 Loads pipeline definitions from pipelines.yaml and executes them
-as sequential agent calls with shared state.
+as agent calls with shared state. Steps form a dependency graph: a step
+starts as soon as the steps it depends on have finished, so independent
+steps run concurrently and a run takes roughly its critical path.
 """
 
+import asyncio
+import time
+from collections import Counter
 from pathlib import Path
+from typing import Any
 
 import yaml
 from loguru import logger
+from pydantic import BaseModel
 
+from app.core.config import settings
+from app.pipelines.artifact_cache import artifact_cache_key, get_artifact_cache
 from app.pipelines.events import EventBus
-from app.pipelines.state import PipelineState
+from app.pipelines.state import PipelineState, serialize_artifact
 
 
 class PipelineStep:
     """A single step in a pipeline, bound to a config-driven agent."""
 
-    def __init__(self, agent_key: str, description: str = ""):
+    def __init__(
+        self,
+        agent_key: str,
+        description: str = "",
+        depends_on: list[str] | None = None,
+    ):
         self.agent_key = agent_key
         self.description = description
+        # None means "infer from what the agent reads" (see _AGENT_READS).
+        self.depends_on = depends_on
 
 
 class PipelineConfig:
@@ -42,6 +58,67 @@ class PipelineConfig:
 _PIPELINES_YAML = Path(__file__).resolve().parent / "pipelines.yaml"
 _configs: dict[str, PipelineConfig] = {}
 
+# Artifacts (or side effects) each agent consumes from earlier steps. Used to
+# infer step dependencies when a pipeline step does not declare `depends_on`.
+# Agents missing from this table conservatively depend on every earlier step.
+_RESUME_ARTIFACTS = ("resume_reviewer", "cv_extractor", "resume_tailor")
+_AGENT_READS: dict[str, tuple[str, ...]] = {
+    "cv_extractor": (),
+    "resume_tailor": (),
+    "discovery_sync": (),
+    "onboarding_agent": (),
+    "resume_reviewer": _RESUME_ARTIFACTS,
+    "cover_letter_generator": _RESUME_ARTIFACTS,
+    "outreach_agent": _RESUME_ARTIFACTS,
+    "interview_coach": _RESUME_ARTIFACTS,
+    "gap_recommendation_agent": ("onboarding_agent",),
+    # job_finder and startup_scanner read the jobs/startups that
+    # discovery_sync imports into the database.
+    "job_finder": (*_RESUME_ARTIFACTS, "discovery_sync"),
+    "startup_scanner": ("discovery_sync",),
+}
+
+
+def resolve_dependencies(steps: list[PipelineStep]) -> dict[str, tuple[str, ...]]:
+    """Map each step's agent key to the agent keys it must wait for.
+
+    Explicit ``depends_on`` lists win; otherwise dependencies are inferred
+    from ``_AGENT_READS``. Dependencies may only point at earlier steps, so
+    the YAML order is always a valid topological order.
+
+    Raises:
+        ValueError: On duplicate steps or a dependency that is not an
+            earlier step of the same pipeline.
+    """
+    deps: dict[str, tuple[str, ...]] = {}
+    for step in steps:
+        key = step.agent_key
+        if key in deps:
+            raise ValueError(f"Duplicate step '{key}'")
+        earlier = list(deps)
+        if step.depends_on is not None:
+            unknown = [d for d in step.depends_on if d not in deps]
+            if unknown:
+                raise ValueError(f"Step '{key}' depends on unknown or later steps: {unknown}")
+            deps[key] = tuple(step.depends_on)
+        elif key in _AGENT_READS:
+            deps[key] = tuple(k for k in earlier if k in _AGENT_READS[key])
+        else:
+            deps[key] = tuple(earlier)
+    return deps
+
+
+def execution_waves(steps: list[PipelineStep]) -> list[list[str]]:
+    """Group step keys into waves whose members can run concurrently."""
+    deps = resolve_dependencies(steps)
+    level: dict[str, int] = {}
+    for key, parents in deps.items():
+        level[key] = 1 + max((level[p] for p in parents), default=-1)
+    waves: list[list[str]] = [[] for _ in range(max(level.values(), default=-1) + 1)]
+    for key, lvl in level.items():
+        waves[lvl].append(key)
+    return waves
+
 
 def load_pipeline_configs(yaml_path: Path | None = None) -> dict[str, PipelineConfig]:
     """Load pipeline definitions from YAML."""
@@ -64,9 +141,15 @@ def load_pipeline_configs(yaml_path: Path | None = None) -> dict[str, PipelineCo
             PipelineStep(
                 agent_key=s["agent"],
                 description=s.get("description", ""),
+                depends_on=s.get("depends_on"),
             )
             for s in cfg.get("steps", [])
         ]
+        try:
+            resolve_dependencies(steps)
+        except ValueError as e:
+            logger.error(f"Invalid pipeline '{key}': {e}")
+            continue
 
         configs[key] = PipelineConfig(
             name=cfg.get("name", key),
@@ -140,10 +223,13 @@ class PipelineEngine:
         job_text: str = "",
         cv_text: str = "",
         inputs: dict[str, str | int | None] | None = None,
+        resume_artifacts: dict[str, Any] | None = None,
     ) -> PipelineState:
         """Execute a pipeline end-to-end.
 
         See PipelineInputs Contract above for required inputs per pipeline.
+        Cacheable steps (see ``BaseAgent.cache_inputs``) are served from the
+        artifact cache when an identical execution was stored before.
 
         Args:
             pipeline_key: Pipeline key from pipelines.yaml
@@ -153,6 +239,9 @@ class PipelineEngine:
             inputs: Extra inputs per pipeline contract (company_name,
                     hiring_manager, days_since_application, interview_stage,
                     role_type).
+            resume_artifacts: Serialized artifacts of an earlier run (e.g.
+                    ``PipelineRun.artifacts_json``); steps that already
+                    produced one are restored instead of re-executed.
 
         Returns:
             PipelineState with accumulated artifacts and errors
@@ -169,7 +258,7 @@ class PipelineEngine:
             inputs=inputs or {},
         )
 
-        EventBus.emit(
+        await EventBus.emit_async(
             "pipeline_started",
             {
                 "pipeline": config.name,
@@ -181,44 +270,165 @@ class PipelineEngine:
 
         load_agents()
 
-        for i, step in enumerate(config.steps):
-            state.current_step = i
-
-            agent = get_agent(step.agent_key)
-            if agent is None:
-                msg = f"Agent '{step.agent_key}' not found"
-                logger.error(msg)
-                state.errors.append(msg)
-                break
-
-            try:
-                await agent.execute(state)
-            except Exception as e:
-                msg = f"Step '{step.agent_key}' failed: {e}"
-                logger.error(msg)
-                state.errors.append(msg)
-                break
-
-            EventBus.emit(
-                "step_complete",
-                {
-                    "pipeline": config.name,
-                    "step": step.agent_key,
-                    "step_index": i,
-                },
-            )
-
-        EventBus.emit(
+        deps = resolve_dependencies(config.steps)
+        pending = {step.agent_key: (i, step) for i, step in enumerate(config.steps)}
+        completed: set[str] = set()
+        running: dict[asyncio.Task[bool], str] = {}
+        stats: Counter[str] = Counter()
+        try:
+            while pending or running:
+                # Stop scheduling new work after a failure; in-flight steps finish.
+                if not state.errors:
+                    for key in list(pending):
+                        if running and not settings.PIPELINE_PARALLEL_STEPS:
+                            break
+                        if set(deps[key]) <= completed:
+                            i, step = pending.pop(key)
+                            task = asyncio.create_task(
+                                self._run_step(
+                                    config, state, i, step, get_agent, stats, resume_artifacts
+                                )
+                            )
+                            running[task] = key
+                if not running:
+                    break
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    key = running.pop(task)
+                    if task.result():
+                        completed.add(key)
+        finally:
+            for task in running:
+                task.cancel()
+
+        # Preserve the sequential engine's contract: current_step is the index
+        # of the last step on success, or the number of finished steps on error.
+        state.current_step = len(completed) if state.errors else max(len(completed) - 1, 0)
+
+        await EventBus.emit_async(
             "pipeline_completed",
             {
                 "pipeline": config.name,
                 "steps_completed": state.current_step + 1,
                 "errors": state.errors,
+                "resumed_steps": stats["resumed"],
+                **_cache_summary(stats),
             },
         )
 
         return state
 
+    async def _run_step(
+        self,
+        config: PipelineConfig,
+        state: PipelineState,
+        index: int,
+        step: PipelineStep,
+        get_agent,
+        stats: Counter[str],
+        resume_artifacts: dict[str, Any] | None = None,
+    ) -> bool:
+        """Run one step against the shared state; return True on success.
+
+        The step is satisfied, in order of preference, from ``resume_artifacts``,
+        from the artifact cache, or by executing the agent.
+        """
+        key = step.agent_key
+        agent = get_agent(key)
+        if agent is None:
+            msg = f"Agent '{key}' not found"
+            logger.error(msg)
+            state.errors.append(msg)
+            return False
+
+        started = time.perf_counter()
+        source = "executed"
+        cache_key = None
+        if (
+            resume_artifacts
+            and key in resume_artifacts
+            and _restore(agent, key, state, resume_artifacts[key])
+        ):
+            source = "resumed"
+        else:
+            cache = get_artifact_cache()
+            cache_key = _step_cache_key(agent, key, state) if cache is not None else None
+            if cache_key is not None:
+                stats["lookups"] += 1
+                payload = cache.get(cache_key)  # type: ignore[union-attr]
+                if payload is not None and _restore(agent, key, state, payload):
+                    stats["hits"] += 1
+                    source = "cache"
+            if source == "executed":
+                try:
+                    await agent.execute(state)
+                except Exception as e:
+                    msg = f"Step '{key}' failed: {e}"
+                    logger.error(msg)
+                    state.errors.append(msg)
+                    return False
+                output = state.artifacts.get(key)
+                if cache_key is not None and agent.cacheable_output(output):
+                    cache.put(cache_key, key, serialize_artifact(output))  # type: ignore[union-attr]
+        stats[source] += 1
+
+        await EventBus.emit_async(
+            "step_complete",
+            {
+                "pipeline": config.name,
+                "step": key,
+                "step_index": index,
+                "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+                "source": source,
+                "cache_hit": source == "cache" if cache_key is not None else None,
+                **_cache_summary(stats),
+            },
+        )
+        return True
+
+
+def _step_cache_key(agent, agent_key: str, state: PipelineState) -> str | None:
+    """Artifact cache key for this step, or None if the agent is not cacheable."""
+    cache_inputs = getattr(agent, "cache_inputs", None)
+    inputs = cache_inputs(state) if cache_inputs is not None else None
+    if not isinstance(inputs, dict):
+        return None
+    from app.core.model_registry import get_model_string
+
+    try:
+        model = get_model_string()
+    except Exception as e:
+        logger.debug(f"Artifact cache skipped for '{agent_key}': no model string ({e})")
+        return None
+    prompt = f"{getattr(agent, 'system_prompt', '')}\n{getattr(agent, 'skill_content', '')}"
+    return artifact_cache_key(agent_key, prompt, model, inputs)
+
+
+def _restore(agent, agent_key: str, state: PipelineState, payload: Any) -> bool:
+    """Put a serialized artifact back into ``state``.
+
+    Returns False (so the step executes) when the payload no longer validates
+    or is an agent's error fallback.
+    """
+    try:
+        value = agent.restore_output(payload)
+    except Exception as e:
+        logger.warning(f"Discarding stored artifact for '{agent_key}': {e}")
+        return False
+    if isinstance(value, BaseModel) and not agent.cacheable_output(value):
+        return False
+    state.artifacts[agent_key] = value
+    return True
+
+
+def _cache_summary(stats: Counter[str]) -> dict[str, Any]:
+    lookups = stats["lookups"]
+    return {
+        "cache_hits": stats["hits"],
+        "cache_lookups": lookups,
+        "cache_hit_rate": round(stats["hits"] / lookups, 4) if lookups else 0.0,
+    }
+
 
 _engine: PipelineEngine | None = None
 
@@ -237,6 +447,7 @@ async def run_pipeline(
     job_text: str = "",
     cv_text: str = "",
     inputs: dict[str, str | int | None] | None = None,
+    resume_artifacts: dict[str, Any] | None = None,
 ) -> PipelineState:
     """Convenience function: run a pipeline by key.
 
@@ -246,8 +457,16 @@ async def run_pipeline(
         job_text: Job description text
         cv_text: Raw CV text
         inputs: Optional extra inputs for pipeline steps
+        resume_artifacts: Serialized artifacts of an earlier run to resume from
 
     Returns:
         PipelineState with accumulated artifacts and errors
     """
-    return await get_engine().run(pipeline_key, resume_text, job_text, cv_text, inputs=inputs)
+    return await get_engine().run(
+        pipeline_key,
+        resume_text,
+        job_text,
+        cv_text,
+        inputs=inputs,
+        resume_artifacts=resume_artifacts,
+    )
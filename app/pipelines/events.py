@@ -1,11 +1,17 @@
 """Event bus for pipeline lifecycle notifications."""
 
-from collections.abc import Callable
+import asyncio
+import inspect
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass, field
-from typing import Any
+from itertools import islice
+from typing import Any, Literal, cast
 
 from loguru import logger
 
+from app.core.config import settings
+
 
 @dataclass
 class PipelineEvent:
@@ -16,54 +22,258 @@ class PipelineEvent:
 
 
 EventHandler = Callable[[PipelineEvent], None]
+AsyncEventHandler = Callable[[PipelineEvent], Awaitable[None]]
+
+# What a full subscriber queue does with a new event: discard the oldest queued
+# event, discard the new one, or (for ``emit_async``) wait for the consumer.
+OverflowPolicy = Literal["drop_oldest", "drop_newest", "block"]
+
+_CLOSED = object()
+
+
+class Subscription:
+    """A bounded, async-iterable feed of bus events for one consumer.
+
+    Created by :meth:`EventBus.subscribe`. Iterate it with ``async for`` and
+    close it (or use ``async with``) when done. Events that do not fit in the
+    queue are handled according to the overflow policy and counted in
+    ``dropped``.
+    """
+
+    def __init__(
+        self,
+        event_types: Iterable[str] | None,
+        maxsize: int,
+        policy: OverflowPolicy,
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        types = frozenset(event_types or ("*",))
+        self._event_types = None if "*" in types else types
+        # Unbounded underneath so close() can always enqueue its sentinel; the
+        # bound is enforced in _offer / deliver_wait.
+        self._queue: asyncio.Queue[Any] = asyncio.Queue()
+        self._maxsize = maxsize
+        self._space = asyncio.Event()
+        self._policy = policy
+        self._loop = loop
+        self._closed = False
+        self.dropped = 0
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def wants(self, event_type: str) -> bool:
+        return not self._closed and (self._event_types is None or event_type in self._event_types)
+
+    def deliver(self, event: PipelineEvent) -> bool:
+        """Queue without waiting; returns False if a ``block`` consumer is full."""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is not self._loop:
+            # Emitted from another thread or loop: hand over to the owner loop.
+            if not self._loop.is_closed():
+                self._loop.call_soon_threadsafe(self._offer, event)
+            return True
+        if self._policy == "block" and self._full():
+            return False
+        self._offer(event)
+        return True
+
+    async def deliver_wait(self, event: PipelineEvent) -> None:
+        """Queue, waiting for room when the consumer is behind (``block`` policy)."""
+        while self._full() and not self._closed:
+            self._space.clear()
+            await self._space.wait()
+        if not self._closed:
+            self._queue.put_nowait(event)
+
+    def _full(self) -> bool:
+        return self._queue.qsize() >= self._maxsize
+
+    def _offer(self, event: PipelineEvent) -> None:
+        if self._closed:
+            return
+        if self._full():
+            self.dropped += 1
+            if self._policy == "drop_newest" or self._policy == "block":
+                return
+            self._queue.get_nowait()
+        self._queue.put_nowait(event)
+
+    def close(self) -> None:
+        """Stop receiving events; a pending ``async for`` finishes after draining."""
+        if self._closed:
+            return
+        self._closed = True
+        EventBus._unsubscribe(self)
+        self._queue.put_nowait(_CLOSED)
+        self._space.set()
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> PipelineEvent:
+        item = await self._queue.get()
+        self._space.set()
+        if item is _CLOSED:
+            raise StopAsyncIteration
+        return cast(PipelineEvent, item)
+
+    async def __aenter__(self) -> "Subscription":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        self.close()
+
+
+class _AsyncHandlerWorker:
+    """Runs an async handler off the emit path, fed by a bounded queue."""
+
+    def __init__(self, event_type: str, handler: AsyncEventHandler) -> None:
+        self.event_type = event_type
+        self.handler = handler
+        self._subscription: Subscription | None = None
+        self._task: asyncio.Task | None = None
+
+    def deliver(self, event: PipelineEvent) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        sub = self._subscription
+        if loop is not None and (sub is None or sub._loop is not loop or sub._loop.is_closed()):
+            # First event on this loop (the previous one, e.g. a test's, is gone).
+            self.stop()
+            sub = self._subscription = Subscription(
+                None, settings.EVENT_BUS_SUBSCRIBER_QUEUE_SIZE, "drop_oldest", loop
+            )
+            self._task = loop.create_task(self._consume(sub))
+        if sub is None:
+            logger.warning(f"No event loop to run async handler for '{event.event_type}'")
+            return
+        sub.deliver(event)
+
+    async def _consume(self, sub: Subscription) -> None:
+        async for event in sub:
+            try:
+                await self.handler(event)
+            except Exception as e:
+                logger.error(f"Async event handler failed for '{event.event_type}': {e}")
+
+    def stop(self) -> None:
+        if self._subscription is not None:
+            self._subscription._closed = True
+        if self._task is not None and not self._task.done():
+            try:
+                self._task.cancel()
+            except RuntimeError:
+                pass  # owning loop already closed
+        self._subscription = self._task = None
 
 
 class EventBus:
-    """Simple in-memory event bus for pipeline events.
+    """Process-wide event bus for pipeline events.
 
-    Supports registering handlers for specific event types or wildcards.
-    Handlers are called synchronously when events are emitted.
+    Three ways to listen:
 
+    - ``on(type, handler)`` with a plain function: called inline by ``emit``.
+      Keep these cheap (logging, appending to a queue).
+    - ``on(type, handler)`` with an ``async def`` handler: run by a background
+      task fed through a bounded queue, so slow I/O never stalls the emitter.
+    - ``subscribe(...)``: an async-iterable ``Subscription`` with its own
+      bounded queue, for SSE/websocket endpoints.
+
+    History is a ring buffer of the last ``EVENT_BUS_HISTORY_SIZE`` events.
     State is held at the class level so any import of EventBus shares the
     same bus across the process. Call ``clear()`` in test teardown to avoid
     cross-test leakage.
     """
 
     _handlers: dict[str, list[EventHandler]] = {}
-    _history: list[PipelineEvent] = []
-    _max_history: int = 1000
+    _async_handlers: list[_AsyncHandlerWorker] = []
+    _subscriptions: list[Subscription] = []
+    _history: deque[PipelineEvent] = deque(maxlen=settings.EVENT_BUS_HISTORY_SIZE)
 
     @classmethod
-    def on(cls, event_type: str, handler: EventHandler) -> None:
+    def on(cls, event_type: str, handler: EventHandler | AsyncEventHandler) -> None:
         """Register a handler for an event type.
 
         Args:
             event_type: Event type to handle, or "*" for all events
-            handler: Callback function receiving PipelineEvent
+            handler: Callback receiving PipelineEvent; ``async def`` handlers
+                run in the background instead of inline
         """
+        if inspect.iscoroutinefunction(handler):
+            cls._async_handlers.append(_AsyncHandlerWorker(event_type, handler))
+            return
         if event_type not in cls._handlers:
             cls._handlers[event_type] = []
-        cls._handlers[event_type].append(handler)
+        cls._handlers[event_type].append(handler)  # type: ignore[arg-type]
+
+    @classmethod
+    def subscribe(
+        cls,
+        event_types: Iterable[str] | None = None,
+        *,
+        maxsize: int | None = None,
+        policy: OverflowPolicy = "drop_oldest",
+    ) -> Subscription:
+        """Open an async subscription; must be called from a running event loop.
+
+        Args:
+            event_types: Event types to receive (None or "*" for all)
+            maxsize: Queue bound (defaults to EVENT_BUS_SUBSCRIBER_QUEUE_SIZE)
+            policy: What to do when the consumer falls behind
+        """
+        sub = Subscription(
+            event_types,
+            maxsize or settings.EVENT_BUS_SUBSCRIBER_QUEUE_SIZE,
+            policy,
+            asyncio.get_running_loop(),
+        )
+        cls._subscriptions.append(sub)
+        return sub
+
+    @classmethod
+    def _unsubscribe(cls, sub: Subscription) -> None:
+        if sub in cls._subscriptions:
+            cls._subscriptions.remove(sub)
 
     @classmethod
     def emit(cls, event_type: str, data: dict[str, Any] | None = None) -> None:
-        """Emit an event to all registered handlers.
+        """Emit an event without waiting on any consumer.
+
+        ``block``-policy subscribers that are full miss the event; use
+        ``emit_async`` from async code to apply backpressure instead.
 
         Args:
             event_type: Event type being emitted
             data: Optional event data dict
         """
+        for sub in cls._dispatch(PipelineEvent(event_type=event_type, data=data or {})):
+            sub.dropped += 1
+
+    @classmethod
+    async def emit_async(cls, event_type: str, data: dict[str, Any] | None = None) -> None:
+        """Emit an event, waiting for room in full ``block``-policy subscribers."""
         event = PipelineEvent(event_type=event_type, data=data or {})
+        for sub in cls._dispatch(event):
+            await sub.deliver_wait(event)
+
+    @classmethod
+    def _dispatch(cls, event: PipelineEvent) -> list[Subscription]:
+        """Deliver to every listener; returns full ``block`` subscribers."""
         cls._history.append(event)
-        if len(cls._history) > cls._max_history:
-            cls._history = cls._history[-cls._max_history :]
 
         # Call specific handlers
-        for handler in cls._handlers.get(event_type, []):
+        for handler in cls._handlers.get(event.event_type, []):
             try:
                 handler(event)
             except Exception as e:
-                logger.error(f"Event handler failed for '{event_type}': {e}")
+                logger.error(f"Event handler failed for '{event.event_type}': {e}")
 
         # Call wildcard handlers
         for handler in cls._handlers.get("*", []):
@@ -72,6 +282,16 @@ class EventBus:
             except Exception as e:
                 logger.error(f"Wildcard handler failed: {e}")
 
+        for worker in cls._async_handlers:
+            if worker.event_type in ("*", event.event_type):
+                worker.deliver(event)
+
+        return [
+            sub
+            for sub in list(cls._subscriptions)
+            if sub.wants(event.event_type) and not sub.deliver(event)
+        ]
+
     @classmethod
     def history(cls, limit: int = 50) -> list[PipelineEvent]:
         """Get recent event history.
@@ -80,17 +300,23 @@ class EventBus:
             limit: Maximum number of events to return
 
         Returns:
-            List of recent PipelineEvent objects
+            List of recent PipelineEvent objects, oldest first
         """
-        return cls._history[-limit:]
+        return list(islice(reversed(cls._history), limit))[::-1]
 
     @classmethod
     def clear(cls) -> None:
-        """Clear all handlers and history.
+        """Clear all handlers, subscriptions and history.
 
         Call in test teardown to prevent cross-test state leakage.
         """
+        for worker in cls._async_handlers:
+            worker.stop()
+        for sub in list(cls._subscriptions):
+            sub.close()
         cls._handlers.clear()
+        cls._async_handlers.clear()
+        cls._subscriptions.clear()
         cls._history.clear()
 
 
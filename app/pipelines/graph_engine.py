@@ -1,12 +1,13 @@
 """Pydantic Graph pipeline engine — pydantic-graph backend for PipelineEngine.
 
-This module mirrors the existing sequential ``PipelineEngine`` but expresses
+This module mirrors ``PipelineEngine`` but expresses
 pipelines as a ``pydantic_graph.Graph`` of typed nodes. It is the "Pydantic
 stack" counterpart to the plain async engine and the LangGraph layer.
 """
 
 from __future__ import annotations
 
+import asyncio
 from contextlib import nullcontext
 from dataclasses import dataclass
 from typing import Any, ClassVar
@@ -19,8 +20,8 @@ try:
 except ImportError:  # pragma: no cover — logfire is optional at runtime
     logfire = None  # type: ignore[assignment]
 
-from app.agents.base_agent import BaseAgent, load_agents
-from app.pipelines.engine import get_pipeline_config
+from app.agents.base_agent import load_agents
+from app.pipelines.engine import PipelineStep, execution_waves, get_pipeline_config
 from app.pipelines.state import PipelineState
 
 
@@ -33,53 +34,72 @@ def _span(name: str, **kwargs: Any):
 
 @dataclass
 class AgentNode(BaseNode[PipelineState, None, PipelineState]):
-    """A pydantic-graph node that executes one pipeline step at a time.
-
-    The node mutates the shared ``PipelineState`` and routes back to itself
-    until every configured step has run, then returns ``End`` with the final
-    state. A single base class is used because the pipeline is purely linear;
-    the concrete step list and node identity are supplied per-pipeline via a
-    dynamically created subclass (see :func:`build_pydantic_graph`).
+    """A pydantic-graph node that executes one wave of pipeline steps.
+
+    A wave is the set of steps whose dependencies have all finished; its
+    agents run concurrently against the shared ``PipelineState``. The node
+    routes back to itself until every wave has run, then returns ``End``
+    with the final state. The concrete step list and node identity are
+    supplied per-pipeline via a dynamically created subclass (see
+    :func:`build_pydantic_graph`).
     """
 
     step_keys: ClassVar[list[str]] = []
+    # Explicit waves from the pipeline config; inferred from step_keys if empty.
+    step_waves: ClassVar[list[list[str]]] = []
+
+    def _waves(self) -> list[list[str]]:
+        if self.step_waves:
+            return self.step_waves
+        return execution_waves([PipelineStep(key) for key in self.step_keys])
 
     async def _execute_current_step(
         self,
         ctx: GraphRunContext[PipelineState, None],
     ) -> bool:
-        """Execute the agent for ``ctx.state.current_step``.
+        """Execute the wave starting at ``ctx.state.current_step``.
+
+        ``current_step`` counts completed steps, so it always lands on a
+        wave boundary.
 
         Returns:
             ``True`` if execution should stop (error or past last step),
             ``False`` if more steps remain.
         """
-        step_index = ctx.state.current_step
-        step_keys = self.step_keys
-
-        if step_index >= len(step_keys):
+        total = len(self.step_keys)
+        if ctx.state.current_step >= total:
             return True
 
-        key = step_keys[step_index]
-        agents = load_agents()
-        agent: BaseAgent | None = agents.get(key)
+        offset = 0
+        wave: list[str] = []
+        for wave in self._waves():
+            if offset >= ctx.state.current_step:
+                break
+            offset += len(wave)
 
-        if agent is None:
-            msg = f"Agent '{key}' not found"
-            logger.error(msg)
-            ctx.state.errors.append(msg)
-            return True
-
-        try:
-            await agent.execute(ctx.state)
-        except Exception as exc:
-            msg = f"Step '{key}' failed: {exc}"
-            logger.error(msg)
-            ctx.state.errors.append(msg)
+        agents = load_agents()
+        missing = [key for key in wave if agents.get(key) is None]
+        if missing:
+            for key in missing:
+                msg = f"Agent '{key}' not found"
+                logger.error(msg)
+                ctx.state.errors.append(msg)
             return True
 
-        ctx.state.current_step += 1
-        return ctx.state.current_step >= len(step_keys)
+        results = await asyncio.gather(
+            *(agents[key].execute(ctx.state) for key in wave),
+            return_exceptions=True,
+        )
+        failed = False
+        for key, result in zip(wave, results, strict=True):
+            if isinstance(result, BaseException):
+                msg = f"Step '{key}' failed: {result}"
+                logger.error(msg)
+                ctx.state.errors.append(msg)
+                failed = True
+            else:
+                ctx.state.current_step += 1
+        return failed or ctx.state.current_step >= total
 
     async def run(
         self,
@@ -114,7 +134,7 @@ def build_pydantic_graph(
     node_class = type(
         f"AgentNode_{pipeline_key}",
         (AgentNode,),
-        {"step_keys": step_keys},
+        {"step_keys": step_keys, "step_waves": execution_waves(config.steps)},
     )
 
     async def run(self, ctx: GraphRunContext[PipelineState, None]):
@@ -139,7 +159,7 @@ class PydanticGraphPipelineEngine:
     """High-level runner for pydantic-graph pipelines.
 
     Mirrors ``PipelineEngine`` from ``app.pipelines.engine`` so callers can swap
-    between the sequential engine, pydantic-graph, and LangGraph backends.
+    between the plain async engine, pydantic-graph, and LangGraph backends.
     """
 
     async def run(
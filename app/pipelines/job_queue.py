@@ -0,0 +1,457 @@
+"""Durable, DB-backed queue for background pipeline runs.
+
+Runs are ``PipelineRun`` rows with a public ``job_id``. Any worker in any
+process claims the oldest due run with a compare-and-set UPDATE and holds it
+under a lease that it renews while the pipeline executes. A run whose lease
+expires (worker crashed, process restarted) becomes claimable again, so
+in-flight work survives restarts. Failures are retried with exponential
+backoff until ``max_attempts`` is reached; a run that finishes with step
+errors counts as a failure, and its partial artifacts are kept so the retry
+resumes at the failed step.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import and_, delete, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.db_models import PipelineRun
+from app.pipelines.state import serialize_pipeline_state
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+FINISHED_STATUSES = (COMPLETED, FAILED)
+
+# Candidate rows examined per claim attempt before giving up for this poll.
+_CLAIM_CANDIDATES = 5
+
+
+class NonRetryableError(Exception):
+    """A run failure that retrying cannot fix (e.g. unknown pipeline key)."""
+
+
+class PipelineStepError(Exception):
+    """The engine finished but recorded step errors; ``result`` is the partial state."""
+
+    def __init__(self, result: dict[str, Any]):
+        self.result = result
+        super().__init__("; ".join(map(str, result.get("errors") or [])) or "Pipeline step failed")
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _lease_expired(now: datetime):
+    return and_(PipelineRun.status == RUNNING, PipelineRun.lease_expires_at < now)
+
+
+def _claimable(now: datetime):
+    return or_(
+        and_(PipelineRun.status == QUEUED, PipelineRun.available_at <= now),
+        and_(_lease_expired(now), PipelineRun.attempts < PipelineRun.max_attempts),
+    )
+
+
+def enqueue_run(
+    db: Session,
+    pipeline_key: str,
+    pipeline_name: str,
+    *,
+    resume_text: str = "",
+    job_text: str = "",
+    cv_text: str = "",
+    inputs: dict[str, Any] | None = None,
+    total_steps: int = 0,
+    user_id: int | None = None,
+    max_attempts: int | None = None,
+    resume_artifacts: dict[str, Any] | None = None,
+) -> str:
+    """Persist a queued run and return its public job id.
+
+    ``resume_artifacts`` pre-seeds ``artifacts_json``; the worker restores those
+    steps instead of re-running them (see :func:`resume_run`).
+    """
+    prune_finished_runs(db)
+    job_id = str(uuid.uuid4())
+    db.add(
+        PipelineRun(
+            job_id=job_id,
+            user_id=user_id,
+            pipeline_key=pipeline_key,
+            pipeline_name=pipeline_name,
+            status=QUEUED,
+            total_steps=total_steps,
+            resume_text=resume_text,
+            job_text=job_text,
+            cv_text=cv_text,
+            inputs_json=inputs or {},
+            artifacts_json=resume_artifacts or None,
+            attempts=0,
+            max_attempts=max_attempts or settings.PIPELINE_QUEUE_MAX_ATTEMPTS,
+            available_at=_now(),
+        )
+    )
+    db.commit()
+    return job_id
+
+
+def claim_next_run(db: Session, worker_id: str) -> PipelineRun | None:
+    """Atomically lease the oldest due run to ``worker_id``.
+
+    The UPDATE re-checks claimability, so two workers racing for the same row
+    cannot both win: the loser sees ``rowcount == 0`` and tries the next one.
+    Runs whose lease expired on their last attempt are marked failed first.
+    """
+    now = _now()
+    fail_expired_runs(db, now)
+    candidates = db.scalars(
+        select(PipelineRun.id)
+        .where(PipelineRun.job_id.is_not(None), _claimable(now))
+        .order_by(PipelineRun.available_at, PipelineRun.id)
+        .limit(_CLAIM_CANDIDATES)
+    ).all()
+    lease_until = now + timedelta(seconds=settings.PIPELINE_QUEUE_LEASE_SECONDS)
+    for run_id in candidates:
+        result = db.execute(
+            update(PipelineRun)
+            .where(PipelineRun.id == run_id, _claimable(now))
+            .values(
+                status=RUNNING,
+                lease_owner=worker_id,
+                lease_expires_at=lease_until,
+                attempts=PipelineRun.attempts + 1,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        if result.rowcount == 1:  # type: ignore[attr-defined]
+            return db.get(PipelineRun, run_id, populate_existing=True)
+    return None
+
+
+def fail_expired_runs(db: Session, now: datetime | None = None) -> int:
+    """Mark runs whose lease expired with no attempts left as failed."""
+    now = now or _now()
+    result = db.execute(
+        update(PipelineRun)
+        .where(
+            PipelineRun.job_id.is_not(None),
+            _lease_expired(now),
+            PipelineRun.attempts >= PipelineRun.max_attempts,
+        )
+        .values(
+            status=FAILED,
+            completed_at=now,
+            lease_owner=None,
+            lease_expires_at=None,
+            error="Worker lease expired on the final attempt",
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return int(result.rowcount)  # type: ignore[attr-defined]
+
+
+def renew_lease(db: Session, run_id: int, worker_id: str) -> bool:
+    """Extend a held lease; False means the run was reclaimed by someone else."""
+    result = db.execute(
+        update(PipelineRun)
+        .where(
+            PipelineRun.id == run_id,
+            PipelineRun.status == RUNNING,
+            PipelineRun.lease_owner == worker_id,
+        )
+        .values(lease_expires_at=_now() + timedelta(seconds=settings.PIPELINE_QUEUE_LEASE_SECONDS))
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return bool(result.rowcount == 1)  # type: ignore[attr-defined]
+
+
+def complete_run(
+    db: Session,
+    run_id: int,
+    worker_id: str,
+    result: dict[str, Any],
+) -> bool:
+    """Record a finished run if ``worker_id`` still holds its lease."""
+    # Artifacts may hold datetimes etc.; store their JSON rendering.
+    result = json.loads(json.dumps(result, default=str))
+    outcome = db.execute(
+        update(PipelineRun)
+        .where(PipelineRun.id == run_id, PipelineRun.lease_owner == worker_id)
+        .values(
+            status=COMPLETED,
+            artifacts_json=result.get("artifacts") or {},
+            errors_json=result.get("errors") or [],
+            steps_completed=int(result.get("steps_completed") or 0),
+            completed_at=_now(),
+            lease_owner=None,
+            lease_expires_at=None,
+            error=None,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return bool(outcome.rowcount == 1)  # type: ignore[attr-defined]
+
+
+def fail_run(
+    db: Session,
+    run: PipelineRun,
+    worker_id: str,
+    error: str,
+    *,
+    retryable: bool = True,
+    result: dict[str, Any] | None = None,
+) -> str:
+    """Requeue with backoff, or mark failed once attempts are exhausted.
+
+    ``result`` is the partial pipeline state of a run that failed in a step;
+    its artifacts are stored so the retry (or a later resume) restores them.
+    Returns the resulting status.
+    """
+    attempts = run.attempts or 1
+    exhausted = attempts >= (run.max_attempts or settings.PIPELINE_QUEUE_MAX_ATTEMPTS)
+    if retryable and not exhausted:
+        delay = settings.PIPELINE_QUEUE_RETRY_BACKOFF_SECONDS * (2 ** (attempts - 1))
+        values: dict[str, Any] = {
+            "status": QUEUED,
+            "available_at": _now() + timedelta(seconds=delay),
+        }
+    else:
+        values = {"status": FAILED, "completed_at": _now()}
+    if result is not None:
+        result = json.loads(json.dumps(result, default=str))
+        values.update(
+            artifacts_json=result.get("artifacts") or {},
+            errors_json=result.get("errors") or [],
+            steps_completed=int(result.get("steps_completed") or 0),
+        )
+    db.execute(
+        update(PipelineRun)
+        .where(PipelineRun.id == run.id, PipelineRun.lease_owner == worker_id)
+        .values(lease_owner=None, lease_expires_at=None, error=error, **values)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return str(values["status"])
+
+
+def get_run(db: Session, job_id: str) -> PipelineRun | None:
+    return db.scalars(select(PipelineRun).where(PipelineRun.job_id == job_id)).first()
+
+
+def resume_run(db: Session, run: PipelineRun, *, user_id: int | None = None) -> str:
+    """Queue a new run that continues ``run`` from the artifacts it persisted.
+
+    Steps that already produced an artifact are restored; the failed step and
+    everything after it execute again.
+    """
+    return enqueue_run(
+        db,
+        run.pipeline_key,
+        run.pipeline_name,
+        resume_text=run.resume_text or "",
+        job_text=run.job_text or "",
+        cv_text=run.cv_text or "",
+        inputs=run.inputs_json or {},
+        total_steps=run.total_steps or 0,
+        user_id=user_id,
+        resume_artifacts=run.artifacts_json or {},
+    )
+
+
+def run_status_payload(run: PipelineRun) -> dict[str, Any]:
+    """Public view of a queued run for ``GET /pipeline/run/{job_id}``."""
+    payload: dict[str, Any] = {
+        "job_id": run.job_id,
+        "status": run.status,
+        "pipeline_key": run.pipeline_key,
+        "attempts": run.attempts or 0,
+    }
+    if run.status == COMPLETED:
+        payload["result"] = {
+            "pipeline_name": run.pipeline_name,
+            "artifacts": run.artifacts_json or {},
+            "errors": run.errors_json or [],
+            "steps_completed": run.steps_completed,
+        }
+    elif run.error:
+        payload["error"] = run.error
+        if run.errors_json:
+            payload["errors"] = run.errors_json
+    return payload
+
+
+def prune_finished_runs(db: Session) -> int:
+    """Drop finished queue runs past the TTL and cap how many are retained."""
+    cutoff = _now() - timedelta(seconds=settings.PIPELINE_BACKGROUND_JOB_TTL_SECONDS)
+    finished = and_(PipelineRun.job_id.is_not(None), PipelineRun.status.in_(FINISHED_STATUSES))
+    removed = db.execute(
+        delete(PipelineRun)
+        .where(finished, PipelineRun.completed_at < cutoff)
+        .execution_options(synchronize_session=False)
+    ).rowcount  # type: ignore[attr-defined]
+    keep = db.scalars(
+        select(PipelineRun.id)
+        .where(finished)
+        .order_by(PipelineRun.completed_at.desc(), PipelineRun.id.desc())
+        .limit(settings.PIPELINE_BACKGROUND_JOB_MAX_ENTRIES)
+    ).all()
+    removed += db.execute(
+        delete(PipelineRun)
+        .where(finished, PipelineRun.id.not_in(keep))
+        .execution_options(synchronize_session=False)
+    ).rowcount  # type: ignore[attr-defined]
+    db.commit()
+    return int(removed)
+
+
+async def _execute(run: PipelineRun) -> dict[str, Any]:
+    from app.pipelines.engine import load_pipeline_configs, run_pipeline
+
+    if run.pipeline_key not in load_pipeline_configs():
+        raise NonRetryableError(f"Unknown pipeline: {run.pipeline_key}")
+    state = await run_pipeline(
+        pipeline_key=run.pipeline_key,
+        resume_text=run.resume_text or "",
+        job_text=run.job_text or "",
+        cv_text=run.cv_text or "",
+        inputs=run.inputs_json or {},
+        resume_artifacts=run.artifacts_json or None,
+    )
+    result = serialize_pipeline_state(state)
+    if state.errors:
+        raise PipelineStepError(result)
+    return result
+
+
+class PipelineWorkerPool:
+    """Asyncio workers that drain the queue inside one process.
+
+    Start one pool per API process; throughput scales with processes x workers
+    because every worker claims from the shared table.
+    """
+
+    def __init__(self, workers: int | None = None, poll_interval: float | None = None):
+        self.workers = max(1, workers or settings.PIPELINE_QUEUE_WORKERS)
+        self.poll_interval = poll_interval or settings.PIPELINE_QUEUE_POLL_SECONDS
+        self._prefix = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self._tasks: list[asyncio.Task] = []
+        self._stopping = asyncio.Event()
+
+    def start(self) -> None:
+        self._stopping.clear()
+        self._tasks = [
+            asyncio.create_task(self._worker(f"{self._prefix}:{i}"), name=f"pipeline-worker-{i}")
+            for i in range(self.workers)
+        ]
+        logger.info(f"Pipeline queue: started {self.workers} worker(s) as {self._prefix}")
+
+    async def stop(self) -> None:
+        """Stop polling; in-flight runs are cancelled and their leases simply expire."""
+        self._stopping.set()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _worker(self, worker_id: str) -> None:
+        while not self._stopping.is_set():
+            try:
+                ran = await self.run_once(worker_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Pipeline worker {worker_id} error: {e}")
+                ran = False
+            if not ran:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def run_once(self, worker_id: str) -> bool:
+        """Claim and execute at most one run. Returns True if a run was processed."""
+        from app.services.db_service import get_db_session
+
+        db = get_db_session()
+        try:
+            run = claim_next_run(db, worker_id)
+            if run is None:
+                return False
+            logger.info(
+                f"Pipeline run {run.job_id} ({run.pipeline_key}) claimed by {worker_id}, "
+                f"attempt {run.attempts}/{run.max_attempts}"
+            )
+            heartbeat = asyncio.create_task(self._heartbeat(run.id, worker_id))
+            try:
+                result = await _execute(run)
+            except NonRetryableError as e:
+                fail_run(db, run, worker_id, str(e), retryable=False)
+            except PipelineStepError as e:
+                status = fail_run(db, run, worker_id, str(e), result=e.result)
+                logger.info(f"Pipeline run {run.job_id} step failed -> {status}")
+            except Exception as e:
+                logger.error(f"Pipeline run {run.job_id} failed: {e}")
+                status = fail_run(db, run, worker_id, "Background pipeline failed")
+                logger.info(f"Pipeline run {run.job_id} -> {status}")
+            else:
+                if not complete_run(db, run.id, worker_id, result):
+                    logger.warning(f"Pipeline run {run.job_id} lost its lease before completing")
+            finally:
+                heartbeat.cancel()
+                await asyncio.gather(heartbeat, return_exceptions=True)
+            return True
+        finally:
+            db.close()
+
+    async def _heartbeat(self, run_id: int, worker_id: str) -> None:
+        from app.services.db_service import get_db_session
+
+        interval = max(1.0, settings.PIPELINE_QUEUE_LEASE_SECONDS / 3)
+        while True:
+            await asyncio.sleep(interval)
+            db = get_db_session()
+            try:
+                if not renew_lease(db, run_id, worker_id):
+                    logger.warning(f"Lease on pipeline run {run_id} lost by {worker_id}")
+                    return
+            finally:
+                db.close()
+
+
+_pool: PipelineWorkerPool | None = None
+
+
+def start_worker_pool() -> PipelineWorkerPool | None:
+    """Start this process's worker pool (FastAPI lifespan)."""
+    global _pool
+    if settings.PIPELINE_QUEUE_WORKERS <= 0:
+        logger.info("Pipeline queue workers disabled (PIPELINE_QUEUE_WORKERS=0)")
+        return None
+    if _pool is None:
+        _pool = PipelineWorkerPool()
+        _pool.start()
+    return _pool
+
+
+async def stop_worker_pool() -> None:
+    global _pool
+    if _pool is not None:
+        await _pool.stop()
+        _pool = None
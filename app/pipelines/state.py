@@ -1,6 +1,6 @@
 """Pipeline state management."""
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field, is_dataclass
 from typing import Any
 
 
@@ -46,3 +46,24 @@ class PipelineState:
 
         # Fall back to raw input
         return self.cv_text or self.resume_text
+
+
+def serialize_artifact(value: Any) -> Any:
+    """JSON-friendly form of one artifact (pydantic model or dataclass)."""
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    return value
+
+
+def serialize_pipeline_state(state: PipelineState) -> dict[str, Any]:
+    """Convert PipelineState to a JSON-serializable dict."""
+    artifacts = {key: serialize_artifact(val) for key, val in state.artifacts.items()}
+    return {
+        "pipeline_name": state.pipeline_name,
+        "artifacts": artifacts,
+        "errors": state.errors,
+        "current_step": state.current_step,
+        "steps_completed": state.current_step + 1 if not state.errors else state.current_step,
+    }
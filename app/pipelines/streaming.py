@@ -0,0 +1,86 @@
+"""Live streaming of pipeline events and partial LLM output.
+
+A streaming endpoint opens a :func:`stream_session`; everything that runs
+inside it (including tasks it spawns, which inherit the context) forwards
+``EventBus`` events and partial agent output to that session's queue. Code
+outside a session is unaffected: agents fall back to a plain ``run`` call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from loguru import logger
+from pydantic import BaseModel
+
+from app.pipelines.events import EventBus, PipelineEvent
+
+# Seconds between partial structured-output snapshots (text streams every delta).
+_PARTIAL_DEBOUNCE_SECONDS = 0.1
+
+_session: ContextVar[asyncio.Queue[tuple[str, dict[str, Any]]] | None] = ContextVar(
+    "pipeline_stream_session", default=None
+)
+
+
+@contextmanager
+def stream_session(
+    queue: asyncio.Queue[tuple[str, dict[str, Any]]],
+) -> Iterator[None]:
+    """Route events and partial output produced in this context to ``queue``."""
+    # Registered lazily so EventBus.clear() in tests cannot silently drop it.
+    if _forward_bus_event not in EventBus._handlers.get("*", []):
+        EventBus.on("*", _forward_bus_event)
+    token = _session.set(queue)
+    try:
+        yield
+    finally:
+        _session.reset(token)
+
+
+def publish(event: str, data: dict[str, Any]) -> None:
+    """Send an event to the current stream session, if any."""
+    queue = _session.get()
+    if queue is not None:
+        queue.put_nowait((event, data))
+
+
+def _forward_bus_event(event: PipelineEvent) -> None:
+    publish(event.event_type, event.data)
+
+
+@dataclass
+class StreamedResult:
+    """Minimal stand-in for pydantic-ai's run result when output was streamed."""
+
+    output: Any
+
+
+async def run_agent(agent: Any, prompt: str, *, label: str) -> Any:
+    """Run a pydantic-ai agent, streaming partial output inside a session.
+
+    Text output is published as ``token`` events carrying the delta; structured
+    output as ``partial`` events carrying a snapshot of the fields parsed so
+    far. Returns an object exposing ``.output`` either way.
+    """
+    if _session.get() is None:
+        return await agent.run(prompt)
+
+    async with agent.run_stream(prompt) as result:
+        try:
+            if agent.output_type is str:
+                async for delta in result.stream_text(delta=True):
+                    publish("token", {"agent": label, "delta": delta})
+            else:
+                async for partial in result.stream_output(debounce_by=_PARTIAL_DEBOUNCE_SECONDS):
+                    snapshot = partial.model_dump() if isinstance(partial, BaseModel) else partial
+                    publish("partial", {"agent": label, "output": snapshot})
+        except Exception as e:
+            # Partial validation can fail mid-stream; the final output still validates.
+            logger.debug(f"Streaming partial output for '{label}' stopped: {e}")
+        return StreamedResult(output=await result.get_output())
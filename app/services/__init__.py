@@ -3,11 +3,18 @@
 from .analytics_service import AnalyticsService, get_analytics_service
 from .db_service import DatabaseService, get_db_session, initialize_database_tables
 from .embedding_service import EmbeddingService, get_embedding_service
-from .parsing_service import JobParser, ParserLLM, ResumeParser, extract_text
+from .extraction_pool import extract_text_async, extract_texts_async
+from .parsing_service import (
+    JobParser,
+    ParserLLM,
+    ResumeParseError,
+    ResumeParser,
+    extract_text,
+)
 from .recommendation_service import RecommendationService, get_recommendation_service
 from .search_service import SearchService, get_search_service
 from .tracking_service import ApplicationTracker, get_application_tracker
-from .vector_store import VectorStore, get_vector_store
+from .vector_store import VectorBackend, VectorStore, get_vector_store
 
 __all__ = [
     "DatabaseService",
@@ -15,10 +22,14 @@ __all__ = [
     "initialize_database_tables",
     "ParserLLM",
     "ResumeParser",
+    "ResumeParseError",
     "JobParser",
     "extract_text",
+    "extract_text_async",
+    "extract_texts_async",
     "EmbeddingService",
     "get_embedding_service",
+    "VectorBackend",
     "VectorStore",
     "get_vector_store",
     "SearchService",
@@ -4,16 +4,25 @@ Encapsulates the full application workflow: resume resolution, job parsing,
 skill matching, LLM calls, persistence, indexing, and tracking.
 """
 
+import asyncio
 import json
-from typing import Any
+import time
+from collections.abc import AsyncGenerator, Awaitable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
 
 from loguru import logger
+from sqlalchemy import select
 
-from app.agents.cover_letter import generate_cover_letter
-from app.agents.resume_tailor import tailor_resume
+from app.agents.cover_letter import CoverLetterOutput, generate_cover_letter
+from app.agents.resume_tailor import TailoredResumeOutput, tailor_resume
+from app.core.config import settings
 from app.models.api_models import AnalysisData, SkillMatch
+from app.models.db_models import JobPostingDB
+from app.models.job_model import JobPosting
 from app.services.db_service import (
     AnalysisResultCreateData,
+    ApplicationPackageCreateData,
     CoverLetterCreateData,
     DatabaseService,
     JobPostingCreateData,
@@ -25,6 +34,8 @@ from app.services.search_service import SearchService
 from app.services.tracking_service import ApplicationTracker
 from app.services.vector_store import get_vector_store
 
+T = TypeVar("T")
+
 
 def _extract_resume_text(resume_record: dict) -> str:
     """Extract readable text from a resume DB record."""
@@ -94,13 +105,179 @@ def _run_skill_analysis(
     return skill_matches, matched, unmatched, suggestions, overall_score
 
 
+@dataclass
+class _Package:
+    """LLM output and skill analysis for one resume/job pair."""
+
+    tailor: TailoredResumeOutput
+    cover_letter: CoverLetterOutput
+    parsed_job: JobPosting
+    skill_matches: list[dict[str, Any]]
+    matched: set[str]
+    unmatched: set[str]
+    suggestions: list[str]
+    overall_score: float
+    timings_ms: dict[str, float] = field(default_factory=dict)
+
+    def analysis(self) -> AnalysisData:
+        return AnalysisData(
+            overall_score=round(self.overall_score, 1),
+            skill_matches=[
+                SkillMatch(
+                    skill=s["skill"],
+                    matched=s["matched"],
+                    confidence=s["confidence"],
+                    source="resume" if s["matched"] else "job",
+                )
+                for s in self.skill_matches
+            ],
+            strengths=list(self.matched),
+            gaps=list(self.unmatched),
+            suggestions=self.suggestions,
+        )
+
+    def result(
+        self,
+        resume_id: int,
+        job_id: int | None,
+        application_id: int | None,
+    ) -> dict[str, Any]:
+        """Pipeline result dict matching the PipelineResult schema."""
+        return {
+            "tailored_content": self.tailor.tailored_content,
+            "improvements": self.tailor.improvements,
+            "cover_letter": self.cover_letter.cover_letter,
+            "key_highlights": self.cover_letter.key_highlights,
+            "overall_score": round(self.overall_score, 1),
+            "skill_matches": self.skill_matches,
+            "strengths": list(self.matched),
+            "gaps": list(self.unmatched),
+            "suggestions": self.suggestions,
+            "application_id": application_id,
+            "resume_id": resume_id,
+            "job_id": job_id,
+            "timings_ms": self.timings_ms,
+        }
+
+
+async def _timed(name: str, timings: dict[str, float], coro: Awaitable[T]) -> T:
+    """Await ``coro`` and record its wall time in milliseconds under ``name``."""
+    started = time.perf_counter()
+    try:
+        return await coro
+    finally:
+        timings[name] = round((time.perf_counter() - started) * 1000, 1)
+
+
+async def _run_together(*coros: Awaitable[Any]) -> list[Any]:
+    """Run coroutines concurrently with structured cancellation.
+
+    The first failure cancels the siblings, waits for them to unwind and is
+    re-raised; cancelling the caller cancels every child as well.
+    """
+    tasks = [asyncio.ensure_future(c) for c in coros]
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in tasks:
+            if task.done() and not task.cancelled() and task.exception() is not None:
+                raise task.exception()  # type: ignore[misc]
+        return [task.result() for task in tasks]
+    finally:
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def _build_package(
+    resume_text: str,
+    resume_skills: set[str],
+    job_text: str,
+    company_name: str = "",
+    hiring_manager: str = "",
+    format_type: str = "text",
+    parsed_job: JobPosting | None = None,
+    concurrent: bool | None = None,
+) -> _Package:
+    """Run the per-job LLM work (tailor, cover letter, job parse) and skill analysis.
+
+    The three LLM calls are independent, so by default
+    (``APPLY_CONCURRENT_LLM_CALLS``) they are issued together and the slowest
+    one sets the latency. Per-call wall times are kept in ``timings_ms``.
+    """
+    if concurrent is None:
+        concurrent = settings.APPLY_CONCURRENT_LLM_CALLS
+    timings: dict[str, float] = {}
+    started = time.perf_counter()
+    calls: list[Awaitable[Any]] = [
+        _timed("tailor_resume", timings, tailor_resume(resume_text, job_text, format_type)),
+        _timed(
+            "cover_letter",
+            timings,
+            generate_cover_letter(resume_text, job_text, company_name, hiring_manager),
+        ),
+    ]
+    if parsed_job is None:
+        calls.append(_timed("parse_job", timings, JobParser().parse_job_text(job_text)))
+
+    if concurrent:
+        results = await _run_together(*calls)
+    else:
+        results = [await call for call in calls]
+    tailor_result, cl_result = results[0], results[1]
+    if parsed_job is None:
+        parsed_job = results[2]
+    timings["total"] = round((time.perf_counter() - started) * 1000, 1)
+
+    all_job_skills = {s.lower() for s in parsed_job.required_skills + parsed_job.preferred_skills}
+    skill_matches, matched, unmatched, suggestions, overall_score = _run_skill_analysis(
+        resume_skills, all_job_skills
+    )
+    return _Package(
+        tailor=tailor_result,
+        cover_letter=cl_result,
+        parsed_job=parsed_job,
+        skill_matches=skill_matches,
+        matched=matched,
+        unmatched=unmatched,
+        suggestions=suggestions,
+        overall_score=overall_score,
+        timings_ms=timings,
+    )
+
+
+def _stored_parse(job: JobPostingDB) -> JobPosting | None:
+    """Reuse a job's stored structured parse instead of calling the LLM again."""
+    data = job.content_json
+    if not isinstance(data, dict) or "required_skills" not in data:
+        return None
+    try:
+        return JobPosting.model_validate({"title": job.title or "", **data})
+    except Exception:
+        return None
+
+
+# Process-wide cap on concurrent per-job apply work across all batch requests.
+_apply_slots: asyncio.Semaphore | None = None
+_apply_slots_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_apply_slots() -> asyncio.Semaphore:
+    global _apply_slots, _apply_slots_loop
+    loop = asyncio.get_running_loop()
+    if _apply_slots is None or _apply_slots_loop is not loop:
+        _apply_slots = asyncio.Semaphore(max(1, settings.APPLY_BATCH_CONCURRENCY))
+        _apply_slots_loop = loop
+    return _apply_slots
+
+
 async def _auto_index_job(job_id: int, text: str) -> None:
     """Index a job posting into the vector store (best-effort)."""
     try:
         vs = get_vector_store()
         if vs.is_available:
             search_svc = SearchService(vector_store=vs)
-            await search_svc.index_job(job_id, text[:5000])
+            await search_svc.index_jobs([{"job_id": job_id, "text": text[:5000]}])
     except Exception as e:
         logger.warning(f"Auto-index job failed: {e}")
 
@@ -214,21 +391,11 @@ class ApplyService:
         if not resume_text:
             raise ValueError("Resume has no text content")
 
-        # Run LLM steps
-        tailor_result = await tailor_resume(resume_text, job_text, format_type)
-        cl_result = await generate_cover_letter(resume_text, job_text, company_name, hiring_manager)
-
-        # Parse job and run skill analysis
         resume_skills = _extract_resume_skills(resume_record)
-        job_parser = JobParser()
-        parsed_job = await job_parser.parse_job_text(job_text)
-
-        all_job_skills = {
-            s.lower() for s in parsed_job.required_skills + parsed_job.preferred_skills
-        }
-        skill_matches, matched, unmatched, suggestions, overall_score = _run_skill_analysis(
-            resume_skills, all_job_skills
+        package = await _build_package(
+            resume_text, resume_skills, job_text, company_name, hiring_manager, format_type
         )
+        parsed_job = package.parsed_job
 
         # Store job if new
         stored_job_id = None
@@ -250,40 +417,23 @@ class ApplyService:
                 TailoredResumeCreateData(
                     resume_id=resume_id,
                     job_id=stored_job_id,
-                    tailored_content=tailor_result.tailored_content,
-                    match_score=round(overall_score, 1),
+                    tailored_content=package.tailor.tailored_content,
+                    match_score=round(package.overall_score, 1),
                 )
             )
-
-            analysis = AnalysisData(
-                overall_score=round(overall_score, 1),
-                skill_matches=[
-                    SkillMatch(
-                        skill=s["skill"],
-                        matched=s["matched"],
-                        confidence=s["confidence"],
-                        source="resume" if s["matched"] else "job",
-                    )
-                    for s in skill_matches
-                ],
-                strengths=list(matched),
-                gaps=list(unmatched),
-                suggestions=suggestions,
-            )
             self.db_svc.store_analysis_result(
                 AnalysisResultCreateData(
                     resume_id=resume_id,
                     job_id=stored_job_id,
-                    analysis_data=analysis.model_dump(),
+                    analysis_data=package.analysis().model_dump(),
                 )
             )
-
             self.db_svc.store_cover_letter(
                 CoverLetterCreateData(
                     resume_id=resume_id,
                     job_id=stored_job_id,
-                    cover_letter_text=cl_result.cover_letter,
-                    key_highlights=cl_result.key_highlights,
+                    cover_letter_text=package.cover_letter.cover_letter,
+                    key_highlights=package.cover_letter.key_highlights,
                     company_name=company_name,
                 )
             )
@@ -303,19 +453,147 @@ class ApplyService:
                 }
             )
 
-        return {
-            "tailored_content": tailor_result.tailored_content,
-            "improvements": tailor_result.improvements,
-            "cover_letter": cl_result.cover_letter,
-            "key_highlights": cl_result.key_highlights,
-            "overall_score": round(overall_score, 1),
-            "skill_matches": skill_matches,
-            "strengths": list(matched),
-            "gaps": list(unmatched),
-            "suggestions": suggestions,
-            "application_id": application_id,
+        return package.result(resume_id, stored_job_id, application_id)
+
+    async def run_batch(
+        self,
+        resume_id: int,
+        job_ids: list[int],
+        hiring_manager: str = "",
+        format_type: str = "text",
+        user_id: int | None = None,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Apply one stored resume to many stored job postings.
+
+        The resume is resolved once; per-job LLM work runs concurrently under
+        the process-wide ``APPLY_BATCH_CONCURRENCY`` cap, and finished packages
+        are persisted in bulk every ``APPLY_BATCH_FLUSH_SIZE`` jobs.
+
+        Yields progress events: ``started``, one ``job`` per posting (as it
+        finishes), ``saved`` after each bulk write (job id -> application id)
+        and a final ``done``.
+
+        Raises:
+            ValueError: If the resume is missing or has no text.
+        """
+        started = time.perf_counter()
+        resume_text, resume_id, resume_record = await self.resolve_resume_text(resume_id)
+        if not resume_text:
+            raise ValueError("Resume is required for batch apply")
+        resume_skills = _extract_resume_skills(resume_record)
+
+        unique_ids = list(dict.fromkeys(job_ids))
+        jobs = {
+            job.id: job
+            for job in self.db_svc.db.scalars(
+                select(JobPostingDB).where(JobPostingDB.id.in_(unique_ids))
+            )
+        }
+        total = len(unique_ids)
+        yield {"event": "started", "resume_id": resume_id, "total": total}
+
+        async def apply_one(job_id: int) -> tuple[int, _Package | Exception]:
+            job = jobs.get(job_id)
+            try:
+                if job is None:
+                    raise ValueError(f"Job {job_id} not found")
+                if not job.raw_text:
+                    raise ValueError(f"Job {job_id} has no description text")
+                async with _get_apply_slots():
+                    package = await _build_package(
+                        resume_text,
+                        resume_skills,
+                        job.raw_text,
+                        job.company or "",
+                        hiring_manager,
+                        format_type,
+                        parsed_job=_stored_parse(job),
+                    )
+            except Exception as e:
+                logger.warning(f"Batch apply failed for job {job_id}: {e}")
+                return job_id, e
+            return job_id, package
+
+        tasks = [asyncio.ensure_future(apply_one(job_id)) for job_id in unique_ids]
+        pending: list[tuple[int, _Package]] = []
+        done = failed = 0
+        flush_size = max(1, settings.APPLY_BATCH_FLUSH_SIZE)
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                job_id, package = await next_done
+                if isinstance(package, Exception):
+                    failed += 1
+                    yield {
+                        "event": "job",
+                        "status": "failed",
+                        "job_id": job_id,
+                        "error": str(package),
+                        "completed": done + failed,
+                        "total": total,
+                    }
+                    continue
+                done += 1
+                pending.append((job_id, package))
+                yield {
+                    "event": "job",
+                    "status": "completed",
+                    "job_id": job_id,
+                    "completed": done + failed,
+                    "total": total,
+                    "data": package.result(resume_id, job_id, None),
+                }
+                if len(pending) >= flush_size:
+                    yield self._persist_batch(pending, jobs, resume_id, user_id)
+                    pending = []
+            if pending:
+                yield self._persist_batch(pending, jobs, resume_id, user_id)
+        finally:
+            unfinished = [task for task in tasks if not task.done()]
+            for task in unfinished:
+                task.cancel()
+            await asyncio.gather(*unfinished, return_exceptions=True)
+
+        yield {
+            "event": "done",
             "resume_id": resume_id,
-            "job_id": stored_job_id,
+            "total": total,
+            "completed": done,
+            "failed": failed,
+            "elapsed_seconds": round(time.perf_counter() - started, 2),
+        }
+
+    def _persist_batch(
+        self,
+        finished: list[tuple[int, _Package]],
+        jobs: dict[int, JobPostingDB],
+        resume_id: int,
+        user_id: int | None,
+    ) -> dict[str, Any]:
+        """Bulk-store a chunk of finished packages and report their application ids."""
+        rows = []
+        for job_id, package in finished:
+            job = jobs[job_id]
+            title = job.title or package.parsed_job.title
+            rows.append(
+                ApplicationPackageCreateData(
+                    resume_id=resume_id,
+                    job_id=job_id,
+                    user_id=user_id,
+                    tailored_content=package.tailor.tailored_content,
+                    match_score=round(package.overall_score, 1),
+                    analysis_data=package.analysis().model_dump(),
+                    cover_letter_text=package.cover_letter.cover_letter,
+                    key_highlights=package.cover_letter.key_highlights,
+                    company_name=job.company or title,
+                    position_title=title,
+                )
+            )
+        app_ids = self.db_svc.store_application_packages(rows)
+        return {
+            "event": "saved",
+            "applications": {
+                str(job_id): app_id for (job_id, _), app_id in zip(finished, app_ids, strict=True)
+            },
         }
 
     async def run_with_file(
@@ -5,7 +5,9 @@ from __future__ import annotations
 import contextlib
 import csv
 import io
+import itertools
 import os
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -20,7 +22,7 @@ from app.core.config import settings
 from app.models.db_models import JobPostingDB, StartupDB
 from app.models.startup_model import Startup
 from app.services.db_service import DatabaseService
-from app.services.job_dedupe import find_existing_job, job_dedupe_key, load_dedupe_keys
+from app.services.job_dedupe import dedupe_key_for_job, find_existing_jobs
 from app.services.search_service import SearchService
 from app.services.vector_store import get_vector_store
 
@@ -38,6 +40,8 @@ class BigSetImportResult(BaseModel):
     startups_upserted: int = 0
     skipped_duplicates: int = 0
     indexed: int = 0
+    rows_read: int = 0
+    chunks: int = 0
     errors: list[str] = Field(default_factory=list)
 
 
@@ -104,8 +108,13 @@ def preview_import(
         }
 
     profile = mappings[mid]
+    sample_rows: list[dict[str, str]] = []
+    row_count = 0
     try:
-        rows = parse_tabular_file(content, filename)
+        for row in iter_tabular_rows(content, filename):
+            if row_count < 5:
+                sample_rows.append(row)
+            row_count += 1
     except Exception as e:
         return {
             "success": False,
@@ -113,14 +122,14 @@ def preview_import(
             "errors": [str(e)],
         }
 
-    if not rows:
+    if not row_count:
         return {
             "success": False,
             "resolved_mapping": mid,
             "errors": ["No rows found in file"],
         }
 
-    file_headers = list(rows[0].keys())
+    file_headers = list(sample_rows[0].keys())
     expected = list(profile.columns.values())
     if profile.open_roles_column:
         expected.append(profile.open_roles_column)
@@ -135,14 +144,14 @@ def preview_import(
         "success": True,
         "resolved_mapping": mid,
         "level": profile.level,
-        "row_count": len(rows),
+        "row_count": row_count,
         "file_headers": file_headers,
         "expected_columns": expected,
         "matched": matched,
         "missing": missing,
         "extra": extra,
         "can_import": can_import,
-        "sample_rows": rows[:5],
+        "sample_rows": sample_rows,
     }
 
 
@@ -176,8 +185,12 @@ def normalize_url(url: str | None) -> str:
     return f"https://{u}"
 
 
-def parse_tabular_file(content: bytes, filename: str) -> list[dict[str, str]]:
-    """Parse CSV (and XLSX when openpyxl is installed) into row dicts."""
+def iter_tabular_rows(source: bytes | Path, filename: str) -> Iterator[dict[str, str]]:
+    """Stream CSV (and XLSX when openpyxl is installed) rows as dicts.
+
+    ``source`` may be the raw bytes or a path; paths are read incrementally so
+    large exports never have to be fully materialized.
+    """
     lower = filename.lower()
     if lower.endswith(".xlsx") or lower.endswith(".xlsm"):
         try:
@@ -186,26 +199,36 @@ def parse_tabular_file(content: bytes, filename: str) -> list[dict[str, str]]:
             raise ValueError(
                 "XLSX import requires openpyxl. Install it or export CSV from BigSet."
             ) from e
-        wb = openpyxl.load_workbook(io.BytesIO(content), read_only=True, data_only=True)
-        ws = wb.active
-        if ws is None:
-            raise ValueError("Workbook has no active worksheet")
-        rows_iter = ws.iter_rows(values_only=True)
-        headers = [str(c or "").strip() for c in next(rows_iter, [])]
-        rows: list[dict[str, str]] = []
-        for row in rows_iter:
-            rows.append(
-                {
-                    headers[i]: str(row[i] if i < len(row) and row[i] is not None else "")
+        workbook_src = source if isinstance(source, Path) else io.BytesIO(source)
+        wb = openpyxl.load_workbook(workbook_src, read_only=True, data_only=True)
+        try:
+            ws = wb.active
+            if ws is None:
+                raise ValueError("Workbook has no active worksheet")
+            rows_iter = ws.iter_rows(values_only=True)
+            headers = [str(c or "").strip() for c in next(rows_iter, [])]
+            for values in rows_iter:
+                yield {
+                    headers[i]: str(values[i] if i < len(values) and values[i] is not None else "")
                     for i in range(len(headers))
                 }
-            )
-        wb.close()
-        return rows
+        finally:
+            wb.close()
+        return
+
+    if isinstance(source, Path):
+        with source.open(encoding="utf-8-sig", newline="") as fh:
+            for record in csv.DictReader(fh):
+                yield {k: (v or "").strip() for k, v in record.items()}
+        return
+    with io.TextIOWrapper(io.BytesIO(source), encoding="utf-8-sig", newline="") as fh:
+        for record in csv.DictReader(fh):
+            yield {k: (v or "").strip() for k, v in record.items()}
+
 
-    text = content.decode("utf-8-sig")
-    reader = csv.DictReader(io.StringIO(text))
-    return [{k: (v or "").strip() for k, v in row.items()} for row in reader]
+def parse_tabular_file(content: bytes, filename: str) -> list[dict[str, str]]:
+    """Parse CSV (and XLSX when openpyxl is installed) into row dicts."""
+    return list(iter_tabular_rows(content, filename))
 
 
 def _row_value(row: dict[str, str], header: str | None) -> str:
@@ -297,13 +320,57 @@ class BigSetImportService:
         existing.raw_text = raw_text
         existing.content_json = parsed_data
 
+    def _update_fit_index(self, refreshed: list[JobPostingDB], new_ids: list[int]) -> None:
+        """Keep the profile-fit token index in step with inserted/refreshed rows."""
+        from app.services.job_fit_service import index_jobs_for_fit
+
+        try:
+            touched = list(refreshed)
+            for start in range(0, len(new_ids), 500):
+                chunk = new_ids[start : start + 500]
+                touched.extend(self.db.query(JobPostingDB).filter(JobPostingDB.id.in_(chunk)))
+            index_jobs_for_fit(self.db, touched)
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.warning("BigSet fit indexing failed (non-fatal): {}", e)
+
     async def import_file(
         self,
         content: bytes,
         filename: str,
         mapping_id: str | None = None,
+        *,
+        chunk_size: int | None = None,
+        on_progress: Callable[[BigSetImportResult], None] | None = None,
+    ) -> BigSetImportResult:
+        """Import one BigSet export file from in-memory bytes."""
+        return await self._import_source(content, filename, mapping_id, chunk_size, on_progress)
+
+    async def import_path(
+        self,
+        path: Path,
+        mapping_id: str | None = None,
+        *,
+        chunk_size: int | None = None,
+        on_progress: Callable[[BigSetImportResult], None] | None = None,
     ) -> BigSetImportResult:
-        """Import one BigSet export file."""
+        """Stream-import a BigSet export from disk without reading it into memory."""
+        return await self._import_source(path, path.name, mapping_id, chunk_size, on_progress)
+
+    async def _import_source(
+        self,
+        source: bytes | Path,
+        filename: str,
+        mapping_id: str | None,
+        chunk_size: int | None,
+        on_progress: Callable[[BigSetImportResult], None] | None,
+    ) -> BigSetImportResult:
+        """Read rows lazily and dedupe/insert/commit them one chunk at a time.
+
+        ``on_progress`` receives the running totals after every committed chunk.
+        A read error mid-file keeps earlier chunks and reports ``success=False``.
+        """
         mappings = load_mappings()
         mid = resolve_mapping_id(filename, mapping_id, mappings)
         if mid not in mappings:
@@ -313,34 +380,51 @@ class BigSetImportService:
                 errors=[f"Unknown mapping_id: {mid}"],
             )
         profile = mappings[mid]
+        size = max(1, chunk_size or settings.BIGSET_IMPORT_CHUNK_SIZE)
+        result = BigSetImportResult(mapping_id=mid)
 
-        try:
-            rows = parse_tabular_file(content, filename)
-        except Exception as e:
-            return BigSetImportResult(
-                success=False,
-                mapping_id=mid,
-                errors=[str(e)],
-            )
-
-        if not rows:
-            return BigSetImportResult(
-                success=False,
-                mapping_id=mid,
-                errors=["No rows found in file"],
+        rows_iter = iter_tabular_rows(source, filename)
+        while True:
+            try:
+                chunk = list(itertools.islice(rows_iter, size))
+            except Exception as e:
+                result.success = False
+                result.errors.append(str(e))
+                break
+            if not chunk:
+                break
+            await self._import_chunk(chunk, profile, result)
+            result.rows_read += len(chunk)
+            result.chunks += 1
+            logger.info(
+                "BigSet import {} chunk {}: rows={} stored={} skipped={}",
+                filename,
+                result.chunks,
+                result.rows_read,
+                result.stored,
+                result.skipped_duplicates,
             )
+            if on_progress is not None:
+                on_progress(result.model_copy(deep=True))
 
-        companies_in_file: set[str] = set()
-        for row in rows:
-            fields = _mapped_fields(row, profile)
-            if profile.level == "company":
-                if fields.get("company"):
-                    companies_in_file.add(fields["company"])
-            elif fields.get("company"):
-                companies_in_file.add(fields["company"])
+        if not result.rows_read and result.success:
+            result.success = False
+            result.errors.append("No rows found in file")
+        return result
 
-        seen_jobs = load_dedupe_keys(self.db, companies_in_file or None)
+    async def _import_chunk(
+        self,
+        rows: list[dict[str, str]],
+        profile: MappingProfile,
+        result: BigSetImportResult,
+    ) -> None:
+        """Dedupe, insert, commit and index one chunk, accumulating into ``result``."""
+        mid = profile.mapping_id
+        candidates: list[dict[str, Any]] = []
+        batch_keys: set[str] = set()
         job_dicts: list[dict[str, Any]] = []
+        refreshed: list[JobPostingDB] = []
+        reindex: list[tuple[dict[str, Any], int]] = []
         startups_upserted = 0
         skipped = 0
         updated = 0
@@ -375,39 +459,15 @@ class BigSetImportService:
                         f"{desc}. Stage: {funding or 'n/a'}. "
                         f"Open roles: {open_roles or 'n/a'}. source:{BIGSET_SOURCE}"
                     )
-                    key = job_dedupe_key(company, stub, website, company_stub=True)
-                    parsed = {"source": BIGSET_SOURCE, "mapping_id": mid}
-                    if key in seen_jobs:
-                        existing = find_existing_job(
-                            self.db,
-                            company,
-                            stub,
-                            website,
-                            company_stub=True,
-                        )
-                        if existing:
-                            self._refresh_existing_job(
-                                existing,
-                                display_title=display_title,
-                                location=location,
-                                raw_text=f"{display_title} at {company}. {raw}",
-                                parsed_data=parsed,
-                            )
-                            updated += 1
-                        else:
-                            skipped += 1
-                        continue
-                    seen_jobs.add(key)
-                    job_dicts.append(
-                        {
-                            "title": display_title,
-                            "company": company,
-                            "location": location,
-                            "raw_text": f"{display_title} at {company}. {raw}",
-                            "source_url": website or None,
-                            "parsed_data": parsed,
-                        }
-                    )
+                    job_data: dict[str, Any] = {
+                        "title": display_title,
+                        "company": company,
+                        "location": location,
+                        "raw_text": f"{display_title} at {company}. {raw}",
+                        "source_url": website or None,
+                        "parsed_data": {"source": BIGSET_SOURCE, "mapping_id": mid},
+                        "stub_title": stub,
+                    }
                 else:
                     title = fields.get("title", "")
                     company = fields.get("company", "")
@@ -415,40 +475,41 @@ class BigSetImportService:
                         skipped += 1
                         continue
                     url = normalize_url(fields.get("url"))
-                    location = fields.get("location", "")
                     desc = fields.get("description", "")
-                    key = job_dedupe_key(company, title, url)
-                    if key in seen_jobs:
-                        existing = find_existing_job(self.db, company, title, url)
-                        if existing:
-                            self._refresh_existing_job(
-                                existing,
-                                display_title=title,
-                                location=location,
-                                raw_text=(f"{title} at {company}. {desc} source:{BIGSET_SOURCE}"),
-                                parsed_data={
-                                    "source": BIGSET_SOURCE,
-                                    "mapping_id": mid,
-                                },
-                            )
-                            updated += 1
-                        else:
-                            skipped += 1
-                        continue
-                    seen_jobs.add(key)
-                    job_dicts.append(
-                        {
-                            "title": title,
-                            "company": company,
-                            "location": location,
-                            "raw_text": (f"{title} at {company}. {desc} source:{BIGSET_SOURCE}"),
-                            "source_url": url or None,
-                            "parsed_data": {
-                                "source": BIGSET_SOURCE,
-                                "mapping_id": mid,
-                            },
-                        }
-                    )
+                    job_data = {
+                        "title": title,
+                        "company": company,
+                        "location": fields.get("location", ""),
+                        "raw_text": f"{title} at {company}. {desc} source:{BIGSET_SOURCE}",
+                        "source_url": url or None,
+                        "parsed_data": {"source": BIGSET_SOURCE, "mapping_id": mid},
+                    }
+                key = dedupe_key_for_job(job_data)
+                if key in batch_keys:
+                    skipped += 1
+                    continue
+                batch_keys.add(key)
+                job_data["dedupe_key"] = key
+                candidates.append(job_data)
+
+            existing_by_key = find_existing_jobs(self.db, candidates)
+            for job_data in candidates:
+                existing = existing_by_key.get(job_data["dedupe_key"])
+                if existing is None:
+                    job_dicts.append(job_data)
+                    continue
+                if existing.dedupe_key is None:
+                    existing.dedupe_key = job_data["dedupe_key"]
+                self._refresh_existing_job(
+                    existing,
+                    display_title=job_data["title"],
+                    location=job_data["location"],
+                    raw_text=job_data["raw_text"],
+                    parsed_data=job_data["parsed_data"],
+                )
+                refreshed.append(existing)
+                reindex.append((job_data, existing.id))
+                updated += 1
 
             self.db.commit()
         except Exception:
@@ -456,27 +517,39 @@ class BigSetImportService:
             raise
 
         inserted_ids = self.db_svc.store_scraped_jobs_batch(job_dicts, dedupe=True)
-        stored = len([i for i in inserted_ids if i is not None])
+        self._update_fit_index(refreshed, [i for i in inserted_ids if i is not None])
+        # Refreshed rows changed text and payload fields, so they are re-embedded too.
+        reindex.extend(
+            (job_data, job_id)
+            for job_data, job_id in zip(job_dicts, inserted_ids)
+            if job_id is not None
+        )
         indexed = 0
         try:
             vs = get_vector_store()
-            if vs.is_available and any(i is not None for i in inserted_ids):
-                search_svc = SearchService(vector_store=vs)
-                for job_data, job_id in zip(job_dicts, inserted_ids):
-                    if job_id is None:
-                        continue
-                    await search_svc.index_job(job_id, job_data["raw_text"][:5000])
-                    indexed += 1
+            if vs.is_available and reindex:
+                search_svc = SearchService(vector_store=vs, db_service=self.db_svc)
+                indexed = await search_svc.index_jobs(
+                    [
+                        {
+                            "job_id": job_id,
+                            "text": job_data["raw_text"][:5000],
+                            "metadata": {
+                                **job_data["parsed_data"],
+                                "company": job_data["company"],
+                                "location": job_data["location"],
+                            },
+                        }
+                        for job_data, job_id in reindex
+                    ]
+                )
         except Exception as e:
             logger.warning("BigSet vector indexing failed (non-fatal): {}", e)
 
-        return BigSetImportResult(
-            mapping_id=mid,
-            stored=stored,
-            startups_upserted=startups_upserted,
-            skipped_duplicates=skipped + updated,
-            indexed=indexed,
-        )
+        result.stored += len([i for i in inserted_ids if i is not None])
+        result.startups_upserted += startups_upserted
+        result.skipped_duplicates += skipped + updated
+        result.indexed += indexed
 
 
 def list_imported_startups(db: Session) -> list[Startup]:
@@ -636,8 +709,7 @@ async def import_changed_files_in_dir(
             db = get_db_session()
             try:
                 svc = BigSetImportService(db)
-                content = path.read_bytes()
-                result = await svc.import_file(content, path.name, mapping_id)
+                result = await svc.import_path(path, mapping_id)
                 results.append(result)
                 if result.success:
                     state[str(path)] = mtime
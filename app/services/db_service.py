@@ -4,19 +4,24 @@ Handles SQLite database operations via SQLAlchemy: setup, session management, CR
 """
 
 import os
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 from loguru import logger
 from pydantic import BaseModel
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, delete, insert, or_, select, text
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session, sessionmaker
 
+from app.core.config import settings
 from app.models.db_models import (
+    FTS_COLUMNS,
     AnalysisResultDB,
     ApplicationDB,
     CoverLetterDB,
     JobPostingDB,
+    ParsedDocumentDB,
     PipelineRun,
     ResumeDB,
     ResumeVersionDB,
@@ -26,6 +31,7 @@ from app.models.db_models import (
     TailoredResumeDB,
     User,
     create_tables,
+    fts_table,
 )
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./job_booster.db")
@@ -118,6 +124,22 @@ class ApplicationCreateData(BaseModel):
     notes: str | None = None
 
 
+class ApplicationPackageCreateData(BaseModel):
+    """Everything one apply run persists for a resume/job pair."""
+
+    resume_id: int
+    job_id: int
+    user_id: int | None = None
+    tailored_content: str = ""
+    match_score: float | None = None
+    analysis_data: dict[str, Any] | None = None
+    cover_letter_text: str = ""
+    key_highlights: list | None = None
+    company_name: str = ""
+    position_title: str = ""
+    status: str = "applied"
+
+
 # --- Database Service ---
 
 TABLE_MODEL_MAP = {
@@ -133,7 +155,79 @@ TABLE_MODEL_MAP = {
     "scanner_state": ScannerStateDB,
     "applications": ApplicationDB,
     "pipeline_runs": PipelineRun,
+    "parsed_documents": ParsedDocumentDB,
+}
+
+# bm25() column weights, in FTS_COLUMNS order: titles outrank body matches.
+_FTS_WEIGHTS = {
+    "job_postings": (4.0, 2.0, 1.0),
+    "resumes": (1.0, 1.0),
+}
+
+# Size of the newest-rowid window used to spot near-universal search terms.
+_COMMON_TERM_SAMPLE = 1000
+
+
+def _fts_match(terms: list[str]) -> str:
+    """FTS5 query matching any of ``terms``, each quoted as a literal string."""
+    return " OR ".join('"{}"'.format(t.replace('"', '""')) for t in terms)
+
+
+# Search filter fields (as in vector payloads) -> SQL expressions, per table.
+_FILTER_FIELDS = {
+    "job_postings": {
+        "job_id": "id",
+        "company": "company",
+        "location": "location",
+        "source": "json_extract(content_json, '$.source')",
+        "mapping_id": "json_extract(content_json, '$.mapping_id')",
+    },
+    "resumes": {"resume_id": "id"},
 }
+_RANGE_SQL = {"gt": ">", "gte": ">=", "lt": "<", "lte": "<="}
+
+
+class _Where(NamedTuple):
+    """Extra ``AND ...`` restriction appended to a full-text query, with its params."""
+
+    sql: str
+    params: dict[str, Any]
+
+
+_NO_FILTER = _Where("", {})
+
+
+def _filter_sql(table_name: str, filters: dict[str, Any] | None) -> tuple[str, dict[str, Any]]:
+    """WHERE condition and bind params for search ``filters`` on ``table_name``.
+
+    Values follow ``VectorStore.search``'s ``filter_by``: an exact value, a list
+    of accepted values, or a dict of range operators.
+    """
+    if not filters:
+        return "", {}
+    fields = _FILTER_FIELDS.get(table_name, {})
+    clauses: list[str] = []
+    params: dict[str, Any] = {}
+
+    def bind(value: Any) -> str:
+        name = f"f{len(params)}"
+        params[name] = value
+        return f":{name}"
+
+    for key, value in filters.items():
+        if key not in fields:
+            raise ValueError(f"Cannot filter {table_name} by {key!r}")
+        field = fields[key]
+        if isinstance(value, dict):
+            for op, bound in value.items():
+                if op not in _RANGE_SQL:
+                    raise ValueError(f"Unsupported range operator for {key}: {op!r}")
+                clauses.append(f"{field} {_RANGE_SQL[op]} {bind(bound)}")
+        elif isinstance(value, (list, tuple, set)):
+            clauses.append(f"{field} IN ({', '.join(map(bind, value)) or 'NULL'})")
+        else:
+            clauses.append(f"{field} = {bind(value)}")
+    return " AND ".join(clauses), params
 
 
 class DatabaseService:
@@ -262,8 +356,11 @@ class DatabaseService:
 
         Args:
             jobs: list of dicts with keys: title, company, location, raw_text,
-                  source_url, parsed_data (optional).
-            dedupe: skip rows that match an existing posting (by URL or company+title).
+                  source_url, parsed_data (optional). ``dedupe_key`` or
+                  ``stub_title`` override the computed dedupe key.
+            dedupe: skip rows that match an existing posting (by URL or company+title)
+                or an earlier row of the same batch. Deduped rows persist their
+                normalized ``dedupe_key``.
 
         Returns:
             List aligned with ``jobs`` containing the inserted record ID for each
@@ -272,36 +369,207 @@ class DatabaseService:
             instead of relying on positional ``zip()`` that breaks when rows are
             dropped.
         """
-        from app.services.job_dedupe import find_existing_job
+        from app.services.job_dedupe import (
+            dedupe_key_for_job,
+            find_existing_jobs,
+            find_job_ids_by_dedupe_key,
+        )
 
-        inserted_ids: list[int | None] = []
+        inserted_ids: list[int | None] = [None] * len(jobs)
         try:
-            for job_data in jobs:
+            positions: list[int] = []
+            rows: list[dict[str, Any]] = []
+            seen: set[str] = set()
+            if dedupe:
+                seen.update(find_existing_jobs(self.db, jobs))
+            for pos, job_data in enumerate(jobs):
+                key = None
+                if dedupe:
+                    key = dedupe_key_for_job(job_data)
+                    if key in seen:
+                        continue
+                    seen.add(key)
                 company = job_data.get("company") or ""
-                title = job_data.get("title", "")
                 url = job_data.get("source_url") or ""
-                if dedupe and find_existing_job(self.db, company, title, url):
-                    inserted_ids.append(None)
-                    continue
-                job_db = JobPostingDB(
-                    title=title,
-                    company=company or None,
-                    location=job_data.get("location"),
-                    content_json=job_data.get("parsed_data"),
-                    raw_text=job_data.get("raw_text"),
-                    source_url=url or None,
+                positions.append(pos)
+                rows.append(
+                    {
+                        "title": job_data.get("title", ""),
+                        "company": company or None,
+                        "location": job_data.get("location"),
+                        "content_json": job_data.get("parsed_data"),
+                        "raw_text": job_data.get("raw_text"),
+                        "source_url": url or None,
+                        "dedupe_key": key,
+                    }
                 )
-                self.db.add(job_db)
-                self.db.flush()
-                inserted_ids.append(job_db.id)
+            if rows and dedupe:
+                # Plain executemany; ids are recovered through the unique key
+                # index, which avoids SQLite's row-at-a-time ordered RETURNING.
+                self.db.execute(insert(JobPostingDB), rows)
+                id_by_key = find_job_ids_by_dedupe_key(self.db, [r["dedupe_key"] for r in rows])
+                for pos, row in zip(positions, rows):
+                    inserted_ids[pos] = id_by_key.get(row["dedupe_key"])
+            elif rows:
+                new_ids = self.db.scalars(
+                    insert(JobPostingDB).returning(JobPostingDB.id, sort_by_parameter_order=True),
+                    rows,
+                ).all()
+                for pos, job_id in zip(positions, new_ids):
+                    inserted_ids[pos] = job_id
             self.db.commit()
             stored_count = len([i for i in inserted_ids if i is not None])
             logger.info(f"Stored {stored_count} scraped jobs in batch")
         except Exception as e:
             self.db.rollback()
             logger.error(f"Error in batch job insert: {e}")
+            inserted_ids = [None] * len(jobs)
         return inserted_ids
 
+    def store_application_packages(
+        self,
+        packages: list[ApplicationPackageCreateData],
+    ) -> list[int | None]:
+        """Bulk-insert tailored resumes, analyses, cover letters and applications.
+
+        All rows for all packages are written in one transaction (one
+        executemany per table) instead of four commits per package.
+
+        Returns:
+            Application IDs aligned with ``packages``; all ``None`` if the
+            transaction failed.
+        """
+        if not packages:
+            return []
+        try:
+            self.db.execute(
+                insert(TailoredResumeDB),
+                [
+                    {
+                        "resume_id": p.resume_id,
+                        "job_id": p.job_id,
+                        "tailored_content": p.tailored_content,
+                        "match_score": p.match_score,
+                    }
+                    for p in packages
+                ],
+            )
+            self.db.execute(
+                insert(AnalysisResultDB),
+                [
+                    {"resume_id": p.resume_id, "job_id": p.job_id, "analysis_json": p.analysis_data}
+                    for p in packages
+                ],
+            )
+            self.db.execute(
+                insert(CoverLetterDB),
+                [
+                    {
+                        "resume_id": p.resume_id,
+                        "job_id": p.job_id,
+                        "cover_letter_text": p.cover_letter_text,
+                        "key_highlights_json": p.key_highlights,
+                        "company_name": p.company_name,
+                    }
+                    for p in packages
+                ],
+            )
+            app_ids: list[int | None] = list(
+                self.db.scalars(
+                    insert(ApplicationDB).returning(ApplicationDB.id, sort_by_parameter_order=True),
+                    [
+                        {
+                            "user_id": p.user_id,
+                            "job_id": p.job_id,
+                            "resume_id": p.resume_id,
+                            "company_name": p.company_name,
+                            "position_title": p.position_title,
+                            "status": p.status,
+                        }
+                        for p in packages
+                    ],
+                ).all()
+            )
+            self.db.commit()
+            logger.info(f"Stored {len(packages)} application packages in batch")
+            return app_ids
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Error storing application packages: {e}")
+            return [None] * len(packages)
+
+    def get_parsed_document(
+        self,
+        content_sha256: str,
+        file_format: str,
+        extractor_version: str,
+    ) -> ParsedDocumentDB | None:
+        """Look up a cached extraction and record the hit."""
+        try:
+            doc = self.db.scalars(
+                select(ParsedDocumentDB).where(
+                    ParsedDocumentDB.content_sha256 == content_sha256,
+                    ParsedDocumentDB.file_format == file_format,
+                    ParsedDocumentDB.extractor_version == extractor_version,
+                )
+            ).first()
+            if doc is not None:
+                doc.hits = (doc.hits or 0) + 1
+                doc.last_used_at = datetime.now(timezone.utc)
+                self.db.commit()
+            return doc
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Error reading parsed document cache: {e}")
+            return None
+
+    def store_parsed_document(
+        self,
+        content_sha256: str,
+        file_format: str,
+        extractor_version: str,
+        extracted_text: str,
+        resume_json: dict[str, Any] | None = None,
+        resume_parser_version: str | None = None,
+        max_entries: int | None = None,
+    ) -> None:
+        """Insert or update a cached extraction (and parsed resume, if given).
+
+        With ``max_entries``, the least recently used rows beyond it are dropped.
+        """
+        try:
+            doc = self.db.scalars(
+                select(ParsedDocumentDB).where(
+                    ParsedDocumentDB.content_sha256 == content_sha256,
+                    ParsedDocumentDB.file_format == file_format,
+                    ParsedDocumentDB.extractor_version == extractor_version,
+                )
+            ).first()
+            if doc is None:
+                doc = ParsedDocumentDB(
+                    content_sha256=content_sha256,
+                    file_format=file_format,
+                    extractor_version=extractor_version,
+                )
+                self.db.add(doc)
+            doc.extracted_text = extracted_text
+            if resume_json is not None:
+                doc.resume_json = resume_json
+                doc.resume_parser_version = resume_parser_version
+            doc.last_used_at = datetime.now(timezone.utc)
+            self.db.flush()
+            if max_entries is not None:
+                stale = (
+                    select(ParsedDocumentDB.id)
+                    .order_by(ParsedDocumentDB.last_used_at.desc())
+                    .offset(max_entries)
+                )
+                self.db.execute(delete(ParsedDocumentDB).where(ParsedDocumentDB.id.in_(stale)))
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Error storing parsed document cache: {e}")
+
     def get_resume_versions(self, resume_id: int) -> list[dict[str, Any]]:
         """Get all versions for a resume."""
         try:
@@ -418,3 +686,152 @@ class DatabaseService:
         except Exception as e:
             logger.error(f"Error querying {table_name} by ids: {e}")
             return []
+
+    def keyword_search(
+        self,
+        table_name: str,
+        terms: list[str],
+        limit: int = 50,
+        filters: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """BM25-ranked full-text search over a table's FTS5 index.
+
+        Rows match any of ``terms`` and come back best first, each with a
+        non-negative ``keyword_score`` (higher is better). Without an FTS index
+        (SQLite built without FTS5) rows are found by LIKE and scored by the
+        number of matching terms.
+
+        Queries matching more than ``KEYWORD_SEARCH_CANDIDATE_POOL`` rows drop
+        terms found in most recent rows (their BM25 weight is ~0 while scoring
+        them means scanning their whole posting list) and rank the remaining
+        terms over the newest pool of matches; if nothing else is left the
+        newest matches are returned with a score of 0. When no term is common
+        the full match set is ranked.
+
+        ``filters`` (see ``_FILTER_FIELDS``) restrict matches inside the query,
+        before ranking and the limit; unsupported fields raise ``ValueError``.
+        """
+        if table_name not in FTS_COLUMNS or not terms:
+            return []
+        condition, params = _filter_sql(table_name, filters)
+        where = _Where(
+            f" AND rowid IN (SELECT id FROM {table_name} WHERE {condition})" if condition else "",
+            params,
+        )
+        fts = fts_table(table_name)
+        pool = max(settings.KEYWORD_SEARCH_CANDIDATE_POOL, limit)
+        try:
+            if self._fts_count(fts, terms, cap=pool + 1, where=where) <= pool:
+                hits = self._bm25(table_name, terms, limit, where=where)
+            else:
+                common = self._common_terms(table_name, terms)
+                rare = [t for t in terms if t not in common]
+                if rare == terms:
+                    hits = self._bm25(table_name, terms, limit, where=where)
+                elif rare:
+                    hits = self._bm25(table_name, rare, limit, newest=pool, where=where)
+                else:
+                    newest = self._fts_newest(fts, terms, limit, where=where)
+                    hits = [(rowid, 0.0) for rowid in newest]
+        except OperationalError as e:
+            logger.warning(f"Full-text search on {table_name} unavailable ({e}); using LIKE")
+            return self._like_search(table_name, terms, limit, condition, params)
+
+        rank = {rowid: i for i, (rowid, _) in enumerate(hits)}
+        records = self.query_records_by_ids(table_name, list(rank))
+        for rec in records:
+            rec["keyword_score"] = hits[rank[int(rec["id"])]][1]
+        return sorted(records, key=lambda r: rank[int(r["id"])])
+
+    def _bm25(
+        self,
+        table_name: str,
+        terms: list[str],
+        limit: int,
+        newest: int | None = None,
+        where: _Where = _NO_FILTER,
+    ) -> list[tuple[int, float]]:
+        fts = fts_table(table_name)
+        weights = ", ".join(str(w) for w in _FTS_WEIGHTS[table_name])
+        candidates = (
+            f"SELECT rowid, -bm25({fts}, {weights}) AS score FROM {fts} "
+            f"WHERE {fts} MATCH :match{where.sql}"
+        )
+        if newest is not None:
+            candidates += f" ORDER BY rowid DESC LIMIT {int(newest)}"
+        rows = self.db.execute(
+            text(f"SELECT rowid, score FROM ({candidates}) ORDER BY score DESC LIMIT :limit"),
+            {"match": _fts_match(terms), "limit": limit, **where.params},
+        ).all()
+        return [(rowid, score) for rowid, score in rows]
+
+    def _fts_count(self, fts: str, terms: list[str], cap: int, where: _Where = _NO_FILTER) -> int:
+        return int(
+            self.db.execute(
+                text(
+                    f"SELECT count(*) FROM (SELECT 1 FROM {fts} "
+                    f"WHERE {fts} MATCH :match{where.sql} LIMIT :cap)"
+                ),
+                {"match": _fts_match(terms), "cap": cap, **where.params},
+            ).scalar_one()
+        )
+
+    def _fts_newest(
+        self, fts: str, terms: list[str], limit: int, where: _Where = _NO_FILTER
+    ) -> list[int]:
+        return list(
+            self.db.execute(
+                text(
+                    f"SELECT rowid FROM {fts} WHERE {fts} MATCH :match{where.sql} "
+                    "ORDER BY rowid DESC LIMIT :limit"
+                ),
+                {"match": _fts_match(terms), "limit": limit, **where.params},
+            ).scalars()
+        )
+
+    def _common_terms(self, table_name: str, terms: list[str]) -> set[str]:
+        """Terms that occur in over half of the newest rows of ``table_name``."""
+        top = self.db.execute(text(f"SELECT max(id) FROM {table_name}")).scalar_one()
+        if top is None:
+            return set()
+        floor = top - _COMMON_TERM_SAMPLE
+        sampled = self.db.execute(
+            text(f"SELECT count(*) FROM {table_name} WHERE id > :floor"), {"floor": floor}
+        ).scalar_one()
+        fts = fts_table(table_name)
+        common = set()
+        for term in terms:
+            in_sample = self.db.execute(
+                text(f"SELECT count(*) FROM {fts} WHERE {fts} MATCH :match AND rowid > :floor"),
+                {"match": _fts_match([term]), "floor": floor},
+            ).scalar_one()
+            if in_sample * 2 > sampled:
+                common.add(term)
+        return common
+
+    def _like_search(
+        self,
+        table_name: str,
+        terms: list[str],
+        limit: int,
+        condition: str = "",
+        params: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        model_class = self._get_model_by_name(table_name)
+        columns = [getattr(model_class, c) for c in FTS_COLUMNS[table_name]]
+        query = self.db.query(model_class).filter(
+            or_(*(col.ilike(f"%{t}%") for col in columns for t in terms))
+        )
+        if condition:
+            query = query.filter(text(condition)).params(**(params or {}))
+        rows = query.limit(limit).all()
+        records = []
+        for r in rows:
+            rec: dict[str, Any] = {}
+            for col in r.__table__.columns:
+                val = getattr(r, col.name)
+                rec[col.name] = str(val) if val is not None else None
+            haystack = " ".join(str(getattr(r, c) or "") for c in FTS_COLUMNS[table_name]).lower()
+            rec["keyword_score"] = float(sum(t in haystack for t in terms))
+            records.append(rec)
+        return sorted(records, key=lambda r: r["keyword_score"], reverse=True)
@@ -4,12 +4,16 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
 from loguru import logger
 from sqlalchemy.orm import Session
 
+from app.models.db_models import JobPostingDB
 from app.models.startup_model import UserProfile
+from app.services.bigset_import_service import BIGSET_SOURCE
 from app.services.db_service import DatabaseService, get_db_session
 from app.services.job_fit_service import rank_imported_jobs
+from app.services.ranking import Candidates
 from app.services.search_service import SearchService
 from app.services.user_profile_service import load_user_profile
 from app.services.vector_store import get_vector_store
@@ -22,7 +26,7 @@ async def search_imported_jobs(
     limit: int = 10,
     db: Session | None = None,
 ) -> list[dict[str, Any]]:
-    """Semantic + keyword search on jobs collection, reranked by profile fit."""
+    """Semantic + keyword search on the jobs collection, fused with profile fit."""
     profile = profile or load_user_profile()
     own_db = db is None
     if own_db:
@@ -38,76 +42,46 @@ async def search_imported_jobs(
             if own_db and db is not None:
                 db.close()
 
-    merged: dict[int, dict[str, Any]] = {}
     try:
-        vs = get_vector_store()
-        if vs.is_available and query.strip():
-            svc = SearchService(
-                vector_store=vs,
-                db_service=DatabaseService(db),
-            )
-            vector_hits = await svc.hybrid_search(query, "jobs", limit * 2)
-            for hit in vector_hits:
-                meta = hit.get("metadata") or {}
-                job_id = meta.get("job_id")
-                if job_id is None and isinstance(hit.get("id"), str):
-                    raw = hit["id"]
-                    if raw.startswith("job_"):
-                        try:
-                            job_id = int(raw.split("_", 1)[1])
-                        except ValueError:
-                            job_id = None
-                if job_id is None:
-                    continue
-                merged[int(job_id)] = {
-                    "id": int(job_id),
-                    "search_score": hit.get("score", 0.0),
-                    "snippet": (hit.get("text") or "")[:400],
-                }
-
         ranked = rank_imported_jobs(
             db,
             profile,
             limit=limit * 2,
             min_score=0.0 if profile.bigset.prefer_imported_jobs else profile.bigset.min_fit_score,
         )
-        from app.models.db_models import JobPostingDB
+        rows = {row["id"]: row for row in ranked}
+        fit = Candidates(
+            "fit",
+            [f"job_{row['id']}" for row in ranked],
+            np.asarray([row["fit_score"] for row in ranked], dtype=float),
+        )
+        # Vector, BM25 keyword and profile-fit rankings fused in one pass; the
+        # vector signal is simply empty when Qdrant is unavailable. The source
+        # filter runs inside the vector and keyword queries, like the fit ranking.
+        svc = SearchService(vector_store=get_vector_store(), db_service=DatabaseService(db))
+        hits = await svc.hybrid_search(
+            query, "jobs", limit * 2, extra=[fit], filters={"source": BIGSET_SOURCE}
+        )
 
-        for row in ranked:
-            jid = row["id"]
-            job = db.get(JobPostingDB, jid)
-            if not job:
+        results: list[dict[str, Any]] = []
+        for hit in hits:
+            job_id = _hit_job_id(hit)
+            row = rows.get(job_id) if job_id is not None else None
+            if row is None and job_id is not None:
+                row = _job_row(db, job_id)
+            if row is None:
                 continue
-            fit = row["fit_score"]
-            entry = merged.get(jid, {"id": jid})
-            entry.update(
+            results.append(
                 {
-                    "title": row.get("title"),
-                    "company": row.get("company"),
-                    "location": row.get("location"),
-                    "source_url": row.get("source_url"),
-                    "fit_score": fit,
-                    "snippet": entry.get("snippet") or row.get("snippet"),
-                    "mapping_id": row.get("mapping_id"),
+                    **row,
+                    "snippet": row.get("snippet") or (hit.get("text") or "")[:400],
+                    "signals": hit.get("signals", {}),
+                    "combined_score": round(hit["score"], 4),
                 }
             )
-            search_score = entry.get("search_score", 0.0)
-            entry["combined_score"] = round(
-                0.6 * fit + 0.4 * float(search_score),
-                3,
-            )
-            merged[jid] = entry
-
-        if not merged and query.strip():
-            for row in ranked[:limit]:
-                merged[row["id"]] = {**row, "combined_score": row["fit_score"]}
-
-        results = sorted(
-            merged.values(),
-            key=lambda x: x.get("combined_score", x.get("fit_score", 0)),
-            reverse=True,
-        )
-        return results[:limit]
+            if len(results) == limit:
+                break
+        return results
     except Exception as e:
         logger.warning("search_imported_jobs failed: {}", e)
         if db is not None:
@@ -116,3 +90,30 @@ async def search_imported_jobs(
     finally:
         if own_db and db is not None:
             db.close()
+
+
+def _hit_job_id(hit: dict[str, Any]) -> int | None:
+    job_id = (hit.get("metadata") or {}).get("job_id")
+    if job_id is None and isinstance(hit.get("id"), str) and hit["id"].startswith("job_"):
+        job_id = hit["id"].split("_", 1)[1]
+    try:
+        return int(job_id) if job_id is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _job_row(db: Session, job_id: int) -> dict[str, Any] | None:
+    """Result row for a search hit outside the profile-fit ranking."""
+    job = db.get(JobPostingDB, job_id)
+    if job is None:
+        return None
+    content = job.content_json if isinstance(job.content_json, dict) else {}
+    return {
+        "id": job.id,
+        "title": job.title,
+        "company": job.company,
+        "location": job.location,
+        "source_url": job.source_url,
+        "snippet": (job.raw_text or "")[:400],
+        "mapping_id": content.get("mapping_id"),
+    }
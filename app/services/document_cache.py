@@ -0,0 +1,123 @@
+"""Content-addressed cache of uploaded documents.
+
+The same resume file is often uploaded again and again (``/parse/resume``,
+``/analyze``, ``/tailor-to-template``, ``/pipeline/apply/file``). Rows in
+``parsed_documents`` are keyed by the sha256 of the uploaded bytes, the file
+format and ``EXTRACTOR_VERSION``, and hold the extracted text plus the parsed
+``Resume`` tagged with the parser version (prompt hash + model). A repeat
+upload therefore skips extraction and, while the parser version matches, the
+LLM call as well.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from app.core.config import settings
+from app.models.resume_model import Resume
+from app.services import db_service
+from app.services.extraction_pool import extract_text_async
+from app.services.parsing_service import EXTRACTOR_VERSION
+
+
+@dataclass(frozen=True)
+class DocumentKey:
+    content_sha256: str
+    file_format: str
+
+
+@dataclass(frozen=True)
+class CachedDocument:
+    """What one cache lookup knows about an upload (resume fields unset on a miss)."""
+
+    text: str
+    resume_json: dict[str, Any] | None = None
+    resume_parser_version: str | None = None
+
+
+def document_key(file_content: bytes, filename: str) -> DocumentKey:
+    return DocumentKey(
+        content_sha256=hashlib.sha256(file_content).hexdigest(),
+        file_format=Path(filename).suffix.lower().lstrip(".")[:10] or "unknown",
+    )
+
+
+async def load_document(
+    file_content: bytes,
+    filename: str,
+    key: DocumentKey | None = None,
+) -> CachedDocument:
+    """Extracted text for an upload plus any parsed resume cached alongside it.
+
+    Looks the row up once; on a miss the text is extracted and stored.
+    """
+    if not settings.DOCUMENT_CACHE_ENABLED:
+        return CachedDocument(text=await extract_text_async(file_content, filename))
+
+    key = key or document_key(file_content, filename)
+    db = db_service.get_db_session()
+    try:
+        svc = db_service.DatabaseService(db)
+        doc = svc.get_parsed_document(key.content_sha256, key.file_format, EXTRACTOR_VERSION)
+        if doc is not None:
+            logger.debug(f"Document cache hit for {filename}")
+            return CachedDocument(
+                text=doc.extracted_text,
+                resume_json=doc.resume_json,
+                resume_parser_version=doc.resume_parser_version,
+            )
+
+        text = await extract_text_async(file_content, filename)
+        if text.strip():
+            svc.store_parsed_document(
+                key.content_sha256,
+                key.file_format,
+                EXTRACTOR_VERSION,
+                text,
+                max_entries=settings.DOCUMENT_CACHE_MAX_ENTRIES,
+            )
+        return CachedDocument(text=text)
+    finally:
+        db.close()
+
+
+async def extract_text_cached(
+    file_content: bytes,
+    filename: str,
+    key: DocumentKey | None = None,
+) -> str:
+    """``extract_text_async`` that reuses the text extracted from identical bytes."""
+    return (await load_document(file_content, filename, key)).text
+
+
+def cached_resume(doc: CachedDocument, parser_version: str) -> Resume | None:
+    """The parsed Resume cached with ``doc`` by the same parser version, if any."""
+    if doc.resume_json is None or doc.resume_parser_version != parser_version:
+        return None
+    try:
+        return Resume.model_validate(doc.resume_json)
+    except Exception as e:
+        logger.warning(f"Discarding unreadable cached resume: {e}")
+        return None
+
+
+def store_resume(key: DocumentKey, text: str, resume: Resume, parser_version: str) -> None:
+    """Remember a successfully parsed Resume."""
+    if not settings.DOCUMENT_CACHE_ENABLED:
+        return
+    db = db_service.get_db_session()
+    try:
+        db_service.DatabaseService(db).store_parsed_document(
+            key.content_sha256,
+            key.file_format,
+            EXTRACTOR_VERSION,
+            text,
+            resume_json=resume.model_dump(mode="json"),
+            resume_parser_version=parser_version,
+            max_entries=settings.DOCUMENT_CACHE_MAX_ENTRIES,
+        )
+    finally:
+        db.close()
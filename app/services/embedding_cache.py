@@ -0,0 +1,173 @@
+"""Persistent content-addressed cache for provider embeddings.
+
+Vectors are stored as float32 blobs in a standalone SQLite file keyed by
+``(model, sha256(text))`` and evicted least-recently-used once the stored
+vector bytes exceed a size budget.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    model TEXT NOT NULL,
+    text_hash TEXT NOT NULL,
+    vector BLOB NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (model, text_hash)
+);
+CREATE INDEX IF NOT EXISTS ix_embeddings_last_used ON embeddings (last_used);
+"""
+
+# Evict down to this fraction of the budget so eviction does not run on every put.
+_EVICT_TARGET_RATIO = 0.9
+
+
+def text_hash(text: str) -> str:
+    """Content address of an embedding input."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """SQLite-backed LRU cache of embedding vectors."""
+
+    def __init__(self, path: Path, max_bytes: int):
+        self._path = path
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        row = self._conn.execute(
+            "SELECT COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings"
+        ).fetchone()
+        self._total_bytes = int(row[0])
+        self._last_tick = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _tick(self) -> float:
+        """Strictly increasing recency stamp, so same-clock-tick touches still order."""
+        self._last_tick = max(time.time(), self._last_tick + 1e-6)
+        return self._last_tick
+
+    def get_many(self, model: str, texts: list[str]) -> dict[str, list[float]]:
+        """Return cached vectors for ``texts`` (keyed by text) and refresh their recency."""
+        if not texts:
+            return {}
+        by_hash: dict[str, list[str]] = {}
+        for text in texts:
+            by_hash.setdefault(text_hash(text), []).append(text)
+        found: dict[str, list[float]] = {}
+        hashes = list(by_hash)
+        with self._lock:
+            for start in range(0, len(hashes), 500):
+                chunk = hashes[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    "SELECT text_hash, vector FROM embeddings "
+                    f"WHERE model = ? AND text_hash IN ({placeholders})",
+                    [model, *chunk],
+                ).fetchall()
+                for digest, blob in rows:
+                    vector = array("f")
+                    vector.frombytes(blob)
+                    for text in by_hash[digest]:
+                        found[text] = vector.tolist()
+            if found:
+                now = self._tick()
+                self._conn.executemany(
+                    "UPDATE embeddings SET last_used = ? WHERE model = ? AND text_hash = ?",
+                    [(now, model, text_hash(text)) for text in found],
+                )
+                self._conn.commit()
+        self.hits += sum(1 for text in texts if text in found)
+        self.misses += sum(1 for text in texts if text not in found)
+        return found
+
+    def put_many(self, model: str, vectors: dict[str, list[float]]) -> None:
+        """Store vectors keyed by their input text, evicting LRU entries over budget."""
+        if not vectors:
+            return
+        with self._lock:
+            now = self._tick()
+        rows = [
+            (model, text_hash(text), array("f", vector).tobytes(), now)
+            for text, vector in vectors.items()
+        ]
+        with self._lock:
+            existing = self._existing_bytes(model, [r[1] for r in rows])
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, text_hash, vector, last_used) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._total_bytes += sum(len(r[2]) for r in rows) - existing
+            if self._total_bytes > self._max_bytes:
+                self._evict(int(self._max_bytes * _EVICT_TARGET_RATIO))
+            self._conn.commit()
+
+    def _existing_bytes(self, model: str, hashes: list[str]) -> int:
+        total = 0
+        for start in range(0, len(hashes), 500):
+            chunk = hashes[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            row = self._conn.execute(
+                "SELECT COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings "
+                f"WHERE model = ? AND text_hash IN ({placeholders})",
+                [model, *chunk],
+            ).fetchone()
+            total += int(row[0])
+        return total
+
+    def _evict(self, target_bytes: int) -> None:
+        cursor = self._conn.execute(
+            "SELECT rowid, LENGTH(vector) FROM embeddings ORDER BY last_used ASC"
+        )
+        doomed: list[tuple[int]] = []
+        freed = 0
+        for rowid, size in cursor:
+            if self._total_bytes - freed <= target_bytes:
+                break
+            doomed.append((rowid,))
+            freed += size
+        self._conn.executemany("DELETE FROM embeddings WHERE rowid = ?", doomed)
+        self._total_bytes -= freed
+        self.evictions += len(doomed)
+        logger.debug(f"EmbeddingCache: evicted {len(doomed)} entries ({freed} bytes)")
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters for this process plus on-disk size."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "path": str(self._path),
+            "entries": entries,
+            "bytes": self._total_bytes,
+            "max_bytes": self._max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+        }
+
+    def clear(self) -> None:
+        """Drop every cached vector and reset counters."""
+        with self._lock:
+            self._conn.execute("DELETE FROM embeddings")
+            self._conn.commit()
+            self._total_bytes = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def close(self) -> None:
+        self._conn.close()
@@ -2,14 +2,98 @@
 
 import hashlib
 import os
-from typing import Optional
+from pathlib import Path
+from typing import Any, Optional, cast
 
+import numpy as np
 from loguru import logger
 
+from app.core.config import settings
 from app.core.model_registry import get_registry
+from app.services.embedding_cache import EmbeddingCache
 
 EMBEDDING_MODEL_ENV = "EMBEDDING_MODEL"
 DEFAULT_FALLBACK_DIM = 384
+FALLBACK_MODES = ("hash", "ngram")
+NGRAM_SIZES = (3, 4, 5)
+
+# Digest byte feeding each output dimension. Mirrors the original per-element
+# hex slicing, whose last pair wrapped to byte 0, so stored vectors stay valid.
+_DIGEST_BYTES = 32
+_MIX_MULT = np.uint64(0xFF51AFD7ED558CCD)
+_POLY_BASE = np.uint64(0x100000001B3)
+
+
+def _digest_index(dim: int) -> np.ndarray:
+    idx = np.arange(dim) % _DIGEST_BYTES
+    idx[idx == _DIGEST_BYTES - 1] = 0
+    return idx
+
+
+def hash_embed_batch(texts: list[str], dim: int = DEFAULT_FALLBACK_DIM) -> np.ndarray:
+    """Digest-based fallback embeddings for a batch as one float32 matrix.
+
+    Deterministic but not semantic: identical texts match, nothing else does.
+    """
+    if not texts:
+        return np.zeros((0, dim), dtype=np.float32)
+    digests = b"".join(hashlib.sha256(t.encode("utf-8")).digest() for t in texts)
+    raw = np.frombuffer(digests, dtype=np.uint8).reshape(len(texts), _DIGEST_BYTES)
+    values = raw[:, _digest_index(dim)].astype(np.float64) / 255.0 * 2.0 - 1.0
+    norms = np.linalg.norm(values, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return np.asarray(values / norms, dtype=np.float32)
+
+
+def _ngram_hashes(data: np.ndarray, n: int) -> np.ndarray:
+    """64-bit hashes of every byte ``n``-gram in ``data`` (polynomial + murmur mix)."""
+    windows = np.lib.stride_tricks.sliding_window_view(data.astype(np.uint64), n)
+    powers = _POLY_BASE ** np.arange(n - 1, -1, -1, dtype=np.uint64)
+    h = (windows * powers).sum(axis=1, dtype=np.uint64) + np.uint64(n)
+    h ^= h >> np.uint64(33)
+    h *= _MIX_MULT
+    h ^= h >> np.uint64(33)
+    return cast(np.ndarray, h)
+
+
+def ngram_embed_batch(texts: list[str], dim: int = DEFAULT_FALLBACK_DIM) -> np.ndarray:
+    """Feature-hashed character n-gram TF vectors for a batch as one float32 matrix.
+
+    Lower-cased, whitespace-normalized text is padded with spaces, every byte
+    3/4/5-gram is hashed to a signed bucket, counts are log-scaled and rows are
+    L2-normalized. Texts sharing vocabulary land close together, which keeps
+    offline semantic search meaningful without a provider. The whole batch is
+    hashed as one buffer; n-grams spanning two texts are masked out.
+    """
+    out = np.zeros((len(texts), dim), dtype=np.float64)
+    padded = [f" {' '.join(t.lower().split())} ".encode() for t in texts]
+    lengths = np.array([len(b) if len(b) > 2 else 0 for b in padded], dtype=np.int64)
+    if not lengths.any():
+        return out.astype(np.float32)
+    data = np.frombuffer(b"".join(b if len(b) > 2 else b"" for b in padded), dtype=np.uint8)
+    ends = np.cumsum(lengths)
+    flat_parts: list[np.ndarray] = []
+    sign_parts: list[np.ndarray] = []
+    for n in NGRAM_SIZES:
+        if data.size < n:
+            continue
+        h = _ngram_hashes(data, n)
+        starts = np.arange(h.size)
+        rows = np.searchsorted(ends, starts, side="right")
+        keep = starts + n <= ends[rows]
+        h, rows = h[keep], rows[keep]
+        flat_parts.append(rows * dim + (h % np.uint64(dim)).astype(np.int64))
+        sign_parts.append(np.where((h >> np.uint64(63)) == 1, -1.0, 1.0))
+    if flat_parts:
+        counts = np.bincount(
+            np.concatenate(flat_parts), weights=np.concatenate(sign_parts), minlength=out.size
+        )
+        out = counts.reshape(len(texts), dim).astype(np.float64)
+        out = np.sign(out) * np.log1p(np.abs(out))
+        norms = np.linalg.norm(out, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        out = out / norms
+    return out.astype(np.float32)
 
 
 class EmbeddingService:
@@ -18,6 +102,8 @@ class EmbeddingService:
     Uses LiteLLM aembedding() for async embedding generation across multiple
     providers (OpenAI, Google, Cohere, etc.). Falls back to a deterministic
     hash-based embedding when no provider is available (testing/dev).
+    Provider results are kept in an on-disk ``EmbeddingCache`` so re-embedding
+    identical text is free; hash fallback vectors are never cached.
     """
 
     _instance: Optional["EmbeddingService"] = None
@@ -36,8 +122,31 @@ class EmbeddingService:
         self._model = self._resolve_model()
         self._use_fallback = False
         self._fallback_dim = DEFAULT_FALLBACK_DIM
+        self._fallback_mode = self._resolve_fallback_mode()
+        self._cache = self._init_cache()
         logger.info(f"EmbeddingService: model={self._model}")
 
+    @staticmethod
+    def _resolve_fallback_mode() -> str:
+        mode = settings.EMBEDDING_FALLBACK_MODE.lower()
+        if mode not in FALLBACK_MODES:
+            logger.warning(f"Unknown EMBEDDING_FALLBACK_MODE={mode!r}, using 'hash'")
+            return "hash"
+        return mode
+
+    @staticmethod
+    def _init_cache() -> EmbeddingCache | None:
+        if not settings.EMBEDDING_CACHE_ENABLED:
+            return None
+        try:
+            return EmbeddingCache(
+                Path(settings.EMBEDDING_CACHE_PATH),
+                max_bytes=settings.EMBEDDING_CACHE_MAX_BYTES,
+            )
+        except Exception as e:
+            logger.warning(f"Embedding cache unavailable, embedding without it: {e}")
+            return None
+
     def _resolve_model(self) -> str:
         env_model = os.getenv(EMBEDDING_MODEL_ENV)
         if env_model:
@@ -53,28 +162,38 @@ class EmbeddingService:
             return [0.0] * self._fallback_dim
 
         if self._use_fallback:
-            return self._hash_embed(text)
+            return self._fallback_embed_batch([text])[0]
+
+        if self._cache is not None:
+            cached = self._cache.get_many(self._model, [text])
+            if text in cached:
+                return cached[text]
 
         try:
             import litellm
 
             response = await litellm.aembedding(model=self._model, input=[text])
             embedding: list[float] = response.data[0]["embedding"]
+            if self._cache is not None:
+                self._cache.put_many(self._model, {text: embedding})
             return embedding
         except Exception as e:
             logger.warning(f"LiteLLM embedding failed, using hash fallback: {e}")
             self._use_fallback = True
-            return self._hash_embed(text)
+            return self._fallback_embed_batch([text])[0]
 
     async def embed_batch(self, texts: list[str]) -> list[list[float]]:
-        """Generate embedding vectors for a batch of texts."""
+        """Generate embedding vectors for a batch of texts.
+
+        Only texts missing from the embedding cache are sent to the provider.
+        """
         if not texts:
             return []
 
         cleaned = [t if t and t.strip() else "" for t in texts]
 
         if self._use_fallback:
-            return [self._hash_embed(t) if t else [0.0] * self._fallback_dim for t in cleaned]
+            return self._fallback_embed_batch(cleaned)
 
         try:
             import litellm
@@ -83,36 +202,34 @@ class EmbeddingService:
             if not non_empty:
                 return [[0.0] * self._fallback_dim for _ in cleaned]
 
-            response = await litellm.aembedding(model=self._model, input=non_empty)
-            embeddings = [item["embedding"] for item in response.data]
-
-            result = []
-            idx = 0
-            for t in cleaned:
-                if t:
-                    result.append(embeddings[idx])
-                    idx += 1
-                else:
-                    result.append([0.0] * self._fallback_dim)
-            return result
+            known: dict[str, list[float]] = {}
+            if self._cache is not None:
+                known = self._cache.get_many(self._model, non_empty)
+            pending = list(dict.fromkeys(t for t in non_empty if t not in known))
+            if pending:
+                response = await litellm.aembedding(model=self._model, input=pending)
+                fresh = {t: item["embedding"] for t, item in zip(pending, response.data)}
+                if self._cache is not None:
+                    self._cache.put_many(self._model, fresh)
+                known.update(fresh)
+
+            return [known[t] if t else [0.0] * self._fallback_dim for t in cleaned]
         except Exception as e:
             logger.warning(f"LiteLLM batch embedding failed, using hash fallback: {e}")
             self._use_fallback = True
-            return [self._hash_embed(t) if t else [0.0] * self._fallback_dim for t in cleaned]
+            return self._fallback_embed_batch(cleaned)
+
+    def _fallback_embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Local embeddings for a batch; empty texts map to zero vectors."""
+        embed = ngram_embed_batch if self._fallback_mode == "ngram" else hash_embed_batch
+        matrix = embed(texts, self._fallback_dim)
+        matrix[[not t for t in texts]] = 0.0
+        return cast(list[list[float]], matrix.tolist())
 
     @staticmethod
     def _hash_embed(text: str, dim: int = DEFAULT_FALLBACK_DIM) -> list[float]:
         """Deterministic hash-based embedding for fallback/testing."""
-        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
-        values = []
-        for i in range(dim):
-            hex_pair = digest[(i * 2) % len(digest) : (i * 2 + 2) % len(digest)]
-            if len(hex_pair) < 2:
-                hex_pair = digest[:2]
-            val = (int(hex_pair, 16) / 255.0) * 2.0 - 1.0
-            values.append(val)
-        norm = (sum(v * v for v in values) ** 0.5) or 1.0
-        return [v / norm for v in values]
+        return cast(list[float], hash_embed_batch([text], dim)[0].tolist())
 
     @property
     def model(self) -> str:
@@ -122,6 +239,16 @@ class EmbeddingService:
     def is_fallback(self) -> bool:
         return self._use_fallback
 
+    @property
+    def fallback_mode(self) -> str:
+        return self._fallback_mode
+
+    def cache_stats(self) -> dict[str, Any]:
+        """Embedding cache statistics, or ``{"enabled": False}`` when disabled."""
+        if self._cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self._cache.stats()}
+
 
 def get_embedding_service() -> EmbeddingService:
     """Get the singleton EmbeddingService instance."""
@@ -0,0 +1,240 @@
+"""Off-loop document text extraction.
+
+``parsing_service.extract_text`` is CPU- and sometimes minutes-bound (LiteParse,
+GLM-OCR on scanned PDFs, python-docx, LaTeX regexes). Calling it inside an
+async handler blocks the event loop for every other request, so uploads go
+through :func:`extract_text_async` instead, which runs it in a bounded process
+pool with a per-job timeout. A job that times out has its worker process
+killed; jobs that were running next to it are retried once on a fresh pool.
+
+Per-format throughput is recorded for every extraction and exposed through
+:func:`extraction_stats`.
+"""
+
+import asyncio
+import multiprocessing
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from app.core.config import settings
+from app.services.parsing_service import extract_text
+
+# Plain-text formats are a decode away; shipping them to a worker costs more.
+_INLINE_FORMATS = frozenset({".md", ".txt"})
+
+Extractor = Callable[[bytes, str], str]
+
+
+@dataclass
+class ExtractionResult:
+    """Outcome of extracting one file."""
+
+    filename: str
+    text: str = ""
+    error: str | None = None
+    seconds: float = 0.0
+
+
+@dataclass
+class _FormatStats:
+    files: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+    failures: int = 0
+    timeouts: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "files": self.files,
+            "bytes": self.bytes,
+            "seconds": round(self.seconds, 3),
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "files_per_second": round(self.files / self.seconds, 2) if self.seconds else 0.0,
+            "mb_per_second": (
+                round(self.bytes / self.seconds / 1_048_576, 3) if self.seconds else 0.0
+            ),
+        }
+
+
+class ExtractionStats:
+    """Per-format counters (files, bytes, busy seconds, failures, timeouts)."""
+
+    def __init__(self) -> None:
+        self._formats: dict[str, _FormatStats] = {}
+
+    def record(self, filename: str, size: int, seconds: float, outcome: str = "ok") -> None:
+        entry = self._formats.setdefault(_format_of(filename), _FormatStats())
+        entry.files += 1
+        entry.bytes += size
+        entry.seconds += seconds
+        if outcome == "failure":
+            entry.failures += 1
+        elif outcome == "timeout":
+            entry.timeouts += 1
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        return {fmt: entry.as_dict() for fmt, entry in sorted(self._formats.items())}
+
+    def clear(self) -> None:
+        self._formats.clear()
+
+
+def _format_of(filename: str) -> str:
+    return Path(filename).suffix.lower().lstrip(".") or "unknown"
+
+
+class ExtractionPool:
+    """Bounded process pool running an extractor with a per-job timeout.
+
+    Jobs are only submitted once a worker is free, so the timeout measures
+    extraction time rather than time spent queued behind a bulk upload.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        timeout_seconds: float,
+        extractor: Extractor = extract_text,
+    ) -> None:
+        self._max_workers = max_workers
+        self._timeout = timeout_seconds
+        self._extractor = extractor
+        self._executor = self._new_executor()
+        self._slots: asyncio.Semaphore | None = None
+        self._slots_loop: asyncio.AbstractEventLoop | None = None
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        # spawn, not fork: the API process has live threads (loop, DB, loguru).
+        return ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self._max_workers)
+            self._slots_loop = loop
+        return self._slots
+
+    async def extract(self, file_content: bytes, filename: str) -> str:
+        """Extract text in a worker process.
+
+        Raises:
+            TimeoutError: The job exceeded the per-job timeout (its worker is killed).
+        """
+        async with self._get_slots():
+            return await self._submit(file_content, filename, retry_broken=True)
+
+    async def _submit(self, file_content: bytes, filename: str, retry_broken: bool) -> str:
+        executor = self._executor
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(executor, self._extractor, file_content, filename)
+        try:
+            return await asyncio.wait_for(future, timeout=self._timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Extraction of {filename} timed out after {self._timeout:.0f}s")
+            self._recycle(executor)
+            raise TimeoutError(f"Extraction timed out after {self._timeout:.0f}s") from None
+        except BrokenProcessPool:
+            # A neighbouring job timed out (or a worker crashed) and took the pool down.
+            self._recycle(executor)
+            if not retry_broken:
+                raise
+            return await self._submit(file_content, filename, retry_broken=False)
+
+    def _recycle(self, executor: ProcessPoolExecutor) -> None:
+        """Replace a broken or stuck pool with a fresh one (once per pool)."""
+        if executor is not self._executor:
+            return
+        self._executor = self._new_executor()
+        _kill(executor)
+
+    def shutdown(self) -> None:
+        _kill(self._executor)
+
+
+def _kill(executor: ProcessPoolExecutor) -> None:
+    # ProcessPoolExecutor cannot cancel a running job; stop its workers outright.
+    for process in list((executor._processes or {}).values()):
+        process.kill()
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+_pool: ExtractionPool | None = None
+_stats = ExtractionStats()
+
+
+def get_extraction_pool() -> ExtractionPool | None:
+    """Process-wide extraction pool, or None when disabled (EXTRACTION_POOL_WORKERS=0)."""
+    global _pool
+    if settings.EXTRACTION_POOL_WORKERS <= 0:
+        return None
+    if _pool is None:
+        _pool = ExtractionPool(
+            max_workers=settings.EXTRACTION_POOL_WORKERS,
+            timeout_seconds=settings.EXTRACTION_TIMEOUT_SECONDS,
+        )
+    return _pool
+
+
+def shutdown_extraction_pool() -> None:
+    """Stop the pool's worker processes (application shutdown)."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
+
+
+async def _extract(file_content: bytes, filename: str) -> ExtractionResult:
+    result = ExtractionResult(filename=filename)
+    outcome = "ok"
+    started = time.perf_counter()
+    try:
+        if Path(filename).suffix.lower() in _INLINE_FORMATS:
+            result.text = extract_text(file_content, filename)
+        elif (pool := get_extraction_pool()) is not None:
+            result.text = await pool.extract(file_content, filename)
+        else:
+            result.text = await asyncio.wait_for(
+                asyncio.to_thread(extract_text, file_content, filename),
+                timeout=settings.EXTRACTION_TIMEOUT_SECONDS,
+            )
+    except (TimeoutError, asyncio.TimeoutError):
+        outcome = "timeout"
+        result.error = "Extraction timed out"
+    except Exception as e:
+        logger.error(f"Extraction of {filename} failed: {e}")
+        outcome = "failure"
+        result.error = "Extraction failed"
+    result.seconds = time.perf_counter() - started
+    _stats.record(filename, len(file_content), result.seconds, outcome)
+    return result
+
+
+async def extract_text_async(file_content: bytes, filename: str) -> str:
+    """Async ``extract_text``: runs off the event loop, "" on failure or timeout."""
+    return (await _extract(file_content, filename)).text
+
+
+async def extract_texts_async(files: Sequence[tuple[bytes, str]]) -> list[ExtractionResult]:
+    """Extract many files concurrently (bounded by the pool size), in input order."""
+    return list(await asyncio.gather(*(_extract(content, name) for content, name in files)))
+
+
+def extraction_stats() -> dict[str, Any]:
+    """Per-format throughput of every extraction since startup."""
+    return {
+        "mode": "process" if settings.EXTRACTION_POOL_WORKERS > 0 else "thread",
+        "workers": settings.EXTRACTION_POOL_WORKERS,
+        "timeout_seconds": settings.EXTRACTION_TIMEOUT_SECONDS,
+        "formats": _stats.as_dict(),
+    }
@@ -0,0 +1,502 @@
+"""Flat (brute-force) vector store on memory-mapped NumPy files.
+
+A drop-in alternative to the Qdrant-backed :class:`VectorStore` that needs
+nothing beyond NumPy and SQLite, selected with ``VECTOR_STORE_BACKEND``
+(``flat``, or ``auto`` when qdrant-client is missing or fails to start).
+
+Each collection is a directory holding:
+
+- ``vectors.f32``: a float32 ``(capacity, dim)`` matrix, memory-mapped and
+  grown by doubling. Rows are L2-normalized on write, so cosine similarity is
+  a single matrix-vector product.
+- ``points.sqlite``: the sidecar mapping row -> ``doc_id`` and JSON payload,
+  with a ``deleted`` tombstone flag and expression indexes on the collection's
+  ``PAYLOAD_INDEXES`` fields, which ``filter_by`` is evaluated against.
+
+Upserting an existing ``doc_id`` tombstones its old row and appends a new
+one; deletes only tombstone. Search is exact top-k via ``argpartition`` over
+live rows. Once tombstones make up ``_COMPACT_RATIO`` of the rows (and at
+least ``_COMPACT_MIN_DEAD``), the collection is compacted: live rows are
+copied to fresh files which then replace the old ones.
+"""
+
+import asyncio
+import json
+import os
+import re
+import sqlite3
+import threading
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+from loguru import logger
+
+from app.core.config import settings
+from app.services.embedding_service import EmbeddingService, get_embedding_service
+from app.services.vector_store import (
+    COLLECTION_NAMES,
+    EMBED_BATCH_SIZE,
+    EMBED_CONCURRENCY,
+    PAYLOAD_INDEXES,
+    RANGE_OPERATORS,
+    UPSERT_BATCH_SIZE,
+    VECTOR_DIM,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS points (
+    row INTEGER PRIMARY KEY,
+    doc_id TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    deleted INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS ix_points_doc_id ON points (doc_id);
+"""
+
+_MIN_CAPACITY = 1024
+_COMPACT_RATIO = 0.3
+_COMPACT_MIN_DEAD = 1024
+
+
+def _payload_field(key: str) -> str:
+    """SQL expression for a payload field (keys are restricted to word characters)."""
+    if not re.fullmatch(r"\w+", key):
+        raise ValueError(f"Unsupported payload filter key: {key!r}")
+    return f"json_extract(payload, '$.{key}')"
+
+
+class FlatCollection:
+    """One collection: memory-mapped vectors plus the SQLite id/payload sidecar."""
+
+    def __init__(self, path: Path, dim: int = VECTOR_DIM, indexed: Sequence[str] = ()):
+        self.path = path
+        self.dim = dim
+        self.indexed = tuple(indexed)
+        self._lock = threading.Lock()
+        path.mkdir(parents=True, exist_ok=True)
+        self._conn = self._connect(path / "points.sqlite")
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._load()
+
+    def _connect(self, file: Path) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(file), check_same_thread=False)
+        conn.executescript(_SCHEMA)
+        # Expression indexes so payload filters on these fields avoid a full scan.
+        for key in self.indexed:
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS ix_points_{key} ON points ({_payload_field(key)})"
+            )
+        conn.commit()
+        return conn
+
+    def _load(self) -> None:
+        rows = self._conn.execute("SELECT row, doc_id, deleted FROM points ORDER BY row").fetchall()
+        # Rows past the sidecar's last entry are a write that never committed.
+        self._count = rows[-1][0] + 1 if rows else 0
+        self._alive = np.zeros(max(self._count, _MIN_CAPACITY), dtype=bool)
+        self._row_of: dict[str, int] = {}
+        for row, doc_id, deleted in rows:
+            if not deleted:
+                self._alive[row] = True
+                self._row_of[doc_id] = row
+        self._open_vectors(max(self._count, _MIN_CAPACITY))
+
+    def _open_vectors(self, capacity: int) -> None:
+        file = self.path / "vectors.f32"
+        needed = capacity * self.dim * 4
+        if not file.exists() or file.stat().st_size < needed:
+            with open(file, "ab") as fh:
+                fh.truncate(needed)
+        capacity = file.stat().st_size // (self.dim * 4)
+        self._vectors = np.memmap(file, dtype=np.float32, mode="r+", shape=(capacity, self.dim))
+        if len(self._alive) < capacity:
+            self._alive = np.concatenate([self._alive, np.zeros(capacity - len(self._alive), bool)])
+
+    def _reserve(self, rows: int) -> None:
+        capacity = len(self._vectors)
+        if self._count + rows <= capacity:
+            return
+        while capacity < self._count + rows:
+            capacity *= 2
+        self._vectors.flush()
+        del self._vectors
+        self._open_vectors(capacity)
+
+    @property
+    def count(self) -> int:
+        return len(self._row_of)
+
+    @property
+    def tombstones(self) -> int:
+        return self._count - len(self._row_of)
+
+    def upsert(
+        self,
+        doc_ids: Sequence[str],
+        vectors: np.ndarray,
+        payloads: Sequence[dict[str, Any]],
+    ) -> int:
+        """Append rows for ``doc_ids``, tombstoning any rows they replace."""
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(len(doc_ids), -1)
+        if vectors.shape[1] != self.dim:
+            raise ValueError(f"Expected {self.dim}-dim vectors, got {vectors.shape[1]}")
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        with self._lock:
+            # Later duplicates in one batch win, as with sequential upserts.
+            last = {doc_id: i for i, doc_id in enumerate(doc_ids)}
+            keep = sorted(last.values())
+            self._reserve(len(keep))
+            start = self._count
+            self._vectors[start : start + len(keep)] = vectors[keep] / norms[keep]
+            self._vectors.flush()
+
+            replaced = [self._row_of[doc_ids[i]] for i in keep if doc_ids[i] in self._row_of]
+            self._conn.executemany(
+                "UPDATE points SET deleted = 1 WHERE row = ?", [(r,) for r in replaced]
+            )
+            self._conn.executemany(
+                "INSERT INTO points (row, doc_id, payload) VALUES (?, ?, ?)",
+                [
+                    (start + n, doc_ids[i], json.dumps(payloads[i], default=str))
+                    for n, i in enumerate(keep)
+                ],
+            )
+            self._conn.commit()
+
+            self._alive[replaced] = False
+            for n, i in enumerate(keep):
+                self._row_of[doc_ids[i]] = start + n
+            self._alive[start : start + len(keep)] = True
+            self._count += len(keep)
+        self._maybe_compact()
+        return len(keep)
+
+    def vector(self, doc_id: str) -> list[float] | None:
+        """The stored vector of ``doc_id`` (unit length), if it is live."""
+        with self._lock:
+            row = self._row_of.get(doc_id)
+            return None if row is None else self._vectors[row].tolist()
+
+    def set_payload(self, payloads: dict[str, dict[str, Any]]) -> int:
+        """Merge fields into the payloads of live ``doc_id`` keys; returns how many existed."""
+        with self._lock:
+            updates = [
+                (json.dumps(fields, default=str), self._row_of[doc_id])
+                for doc_id, fields in payloads.items()
+                if doc_id in self._row_of
+            ]
+            if updates:
+                self._conn.executemany(
+                    "UPDATE points SET payload = json_patch(payload, ?) WHERE row = ?", updates
+                )
+                self._conn.commit()
+        return len(updates)
+
+    def delete(self, doc_ids: Sequence[str]) -> int:
+        """Tombstone ``doc_ids``; returns how many existed."""
+        with self._lock:
+            rows = [self._row_of.pop(d) for d in doc_ids if d in self._row_of]
+            if rows:
+                self._conn.executemany(
+                    "UPDATE points SET deleted = 1 WHERE row = ?", [(r,) for r in rows]
+                )
+                self._conn.commit()
+                self._alive[rows] = False
+        self._maybe_compact()
+        return len(rows)
+
+    def search(
+        self,
+        vector: Sequence[float],
+        n_results: int,
+        filter_by: dict[str, Any] | None = None,
+    ) -> list[tuple[str, float, dict[str, Any]]]:
+        """Exact cosine top-k over live rows as ``(doc_id, score, payload)``."""
+        query = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(query))
+        if norm == 0 or n_results <= 0:
+            return []
+        with self._lock:
+            mask = self._alive[: self._count]
+            if filter_by:
+                mask = mask & self._filter_mask(filter_by)
+            candidates = np.flatnonzero(mask)
+            if not len(candidates):
+                return []
+            if len(candidates) == self._count:
+                scores = self._vectors[: self._count] @ (query / norm)
+            else:
+                scores = self._vectors[candidates] @ (query / norm)
+            k = min(n_results, len(candidates))
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top], kind="stable")]
+            rows = candidates[top].tolist()
+            placeholders = ",".join("?" * len(rows))
+            found = {
+                row: (doc_id, payload)
+                for row, doc_id, payload in self._conn.execute(
+                    f"SELECT row, doc_id, payload FROM points WHERE row IN ({placeholders})", rows
+                )
+            }
+        hits = []
+        for row, score in zip(rows, scores[top].tolist(), strict=True):
+            doc_id, payload = found[row]
+            hits.append((doc_id, score, json.loads(payload)))
+        return hits
+
+    def _filter_mask(self, filter_by: dict[str, Any]) -> np.ndarray:
+        clauses: list[str] = []
+        params: list[Any] = []
+        for key, value in filter_by.items():
+            field = _payload_field(key)
+            if isinstance(value, dict):
+                for op, bound in value.items():
+                    if op not in RANGE_OPERATORS:
+                        raise ValueError(f"Unsupported range operator for {key}: {op!r}")
+                    clauses.append(f"{field} {RANGE_OPERATORS[op]} ?")
+                    params.append(bound)
+            elif isinstance(value, (list, tuple, set)):
+                clauses.append(f"{field} IN ({','.join('?' * len(value))})")
+                params += list(value)
+            else:
+                clauses.append(f"{field} = ?")
+                params.append(value)
+        where = " AND ".join(clauses)
+        rows = [
+            r
+            for (r,) in self._conn.execute(
+                f"SELECT row FROM points WHERE deleted = 0 AND {where}", params
+            )
+        ]
+        mask = np.zeros(self._count, dtype=bool)
+        mask[rows] = True
+        return mask
+
+    def _maybe_compact(self) -> None:
+        dead = self.tombstones
+        if dead >= _COMPACT_MIN_DEAD and dead >= _COMPACT_RATIO * self._count:
+            self.compact()
+
+    def compact(self) -> int:
+        """Drop tombstoned rows from both files; returns the number removed."""
+        with self._lock:
+            removed = self.tombstones
+            if not removed:
+                return 0
+            live = np.flatnonzero(self._alive[: self._count])
+            capacity = max(_MIN_CAPACITY, len(live))
+            tmp_vectors = self.path / "vectors.f32.compact"
+            out = np.memmap(tmp_vectors, dtype=np.float32, mode="w+", shape=(capacity, self.dim))
+            for start in range(0, len(live), 65536):
+                chunk = live[start : start + 65536]
+                out[start : start + len(chunk)] = self._vectors[chunk]
+            out.flush()
+            del out
+
+            tmp_points = self.path / "points.sqlite.compact"
+            tmp_points.unlink(missing_ok=True)
+            new = self._connect(tmp_points)
+            renumber = dict(zip(live.tolist(), range(len(live))))
+            cursor = self._conn.execute(
+                "SELECT row, doc_id, payload FROM points WHERE deleted = 0 ORDER BY row"
+            )
+            while batch := cursor.fetchmany(10_000):
+                new.executemany(
+                    "INSERT INTO points (row, doc_id, payload) VALUES (?, ?, ?)",
+                    [(renumber[row], doc_id, payload) for row, doc_id, payload in batch],
+                )
+            new.commit()
+            new.close()
+
+            self._conn.close()
+            del self._vectors
+            for suffix in ("-wal", "-shm"):
+                (self.path / f"points.sqlite{suffix}").unlink(missing_ok=True)
+            os.replace(tmp_points, self.path / "points.sqlite")
+            os.replace(tmp_vectors, self.path / "vectors.f32")
+            self._conn = self._connect(self.path / "points.sqlite")
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._load()
+        logger.info(f"FlatVectorStore: compacted {self.path.name}, dropped {removed} rows")
+        return removed
+
+    def close(self) -> None:
+        with self._lock:
+            self._vectors.flush()
+            self._conn.close()
+
+
+class FlatVectorStore:
+    """Vector store with the :class:`VectorStore` API on flat memory-mapped files."""
+
+    _instance: Optional["FlatVectorStore"] = None
+    _initialized: bool = False
+
+    def __new__(cls, *args, **kwargs) -> "FlatVectorStore":
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(
+        self,
+        embedding_service: EmbeddingService | None = None,
+        persist_dir: Path | None = None,
+        dim: int = VECTOR_DIM,
+    ):
+        if self._initialized:
+            return
+        self._initialized = True
+        self._embedding_service = embedding_service or get_embedding_service()
+        self._persist_dir = persist_dir or Path(settings.FLAT_VECTOR_PATH)
+        self._dim = dim
+        self._collections: dict[str, FlatCollection] = {}
+        self._collections_lock = threading.Lock()
+        for name in COLLECTION_NAMES:
+            self.collection(name)
+        logger.info(f"FlatVectorStore: initialized at {self._persist_dir}")
+
+    def collection(self, name: str) -> FlatCollection:
+        """The named collection, created on first use."""
+        with self._collections_lock:
+            if name not in self._collections:
+                self._collections[name] = FlatCollection(
+                    self._persist_dir / name,
+                    self._dim,
+                    indexed=tuple(PAYLOAD_INDEXES.get(name, {})),
+                )
+            return self._collections[name]
+
+    async def add_document(
+        self,
+        collection: str,
+        doc_id: str,
+        text: str,
+        metadata: dict[str, Any] | None = None,
+    ):
+        """Add a document to a collection."""
+        embedding = await self._embedding_service.embed_text(text)
+        payload = {"text": text, "doc_id": doc_id, **(metadata or {})}
+        self.collection(collection).upsert([doc_id], np.asarray([embedding]), [payload])
+        logger.debug(f"FlatVectorStore: upserted {doc_id} into {collection}")
+
+    async def add_documents(
+        self,
+        collection: str,
+        documents: list[dict[str, Any]],
+        *,
+        embed_batch_size: int = EMBED_BATCH_SIZE,
+        max_concurrency: int = EMBED_CONCURRENCY,
+        upsert_batch_size: int = UPSERT_BATCH_SIZE,
+    ) -> int:
+        """Embed and upsert many documents (same contract as ``VectorStore.add_documents``)."""
+        if not documents:
+            return 0
+        target = self.collection(collection)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _embed(texts: list[str]) -> list[list[float]]:
+            async with semaphore:
+                return await self._embedding_service.embed_batch(texts)
+
+        written = 0
+        for start in range(0, len(documents), upsert_batch_size):
+            window = documents[start : start + upsert_batch_size]
+            texts = [doc["text"] for doc in window]
+            embedded = await asyncio.gather(
+                *(
+                    _embed(texts[i : i + embed_batch_size])
+                    for i in range(0, len(texts), embed_batch_size)
+                )
+            )
+            vectors = np.asarray([vec for batch in embedded for vec in batch], dtype=np.float32)
+            target.upsert(
+                [doc["id"] for doc in window],
+                vectors,
+                [
+                    {"text": doc["text"], "doc_id": doc["id"], **(doc.get("metadata") or {})}
+                    for doc in window
+                ],
+            )
+            written += len(window)
+        logger.debug(f"FlatVectorStore: upserted {written} documents into {collection}")
+        return written
+
+    async def search(
+        self,
+        collection: str,
+        query_text: str,
+        n_results: int = 5,
+        filter_by: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Search a collection by query text (``filter_by`` as in ``VectorStore.search``)."""
+        if not query_text.strip():
+            return []
+        target = self.collection(collection)
+        if target.count == 0:
+            return []
+        embedding = await self._embedding_service.embed_text(query_text)
+        return self.search_by_vector(collection, embedding, n_results, filter_by)
+
+    def search_by_vector(
+        self,
+        collection: str,
+        vector: list[float],
+        n_results: int = 5,
+        filter_by: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Search a collection with an existing vector (results as in ``search``)."""
+        return [
+            {
+                "id": doc_id,
+                "text": payload.get("text", ""),
+                "metadata": {k: v for k, v in payload.items() if k not in ("text", "doc_id")},
+                "score": score,
+            }
+            for doc_id, score, payload in self.collection(collection).search(
+                vector, n_results, filter_by
+            )
+        ]
+
+    def get_vector(self, collection: str, doc_id: str) -> list[float] | None:
+        """The stored (normalized) vector of ``doc_id``, or None if not indexed."""
+        return self.collection(collection).vector(doc_id)
+
+    def set_payload(self, collection: str, payloads: dict[str, dict[str, Any]]) -> int:
+        """Merge fields into stored payloads (same contract as ``VectorStore.set_payload``)."""
+        return self.collection(collection).set_payload(payloads)
+
+    def delete_document(self, collection: str, doc_id: str):
+        """Delete a document from a collection."""
+        self.collection(collection).delete([doc_id])
+        logger.debug(f"FlatVectorStore: deleted {doc_id} from {collection}")
+
+    def compact(self, collection: str) -> int:
+        """Reclaim space held by deleted/replaced rows of a collection."""
+        return self.collection(collection).compact()
+
+    def get_collection_stats(self, collection: str) -> dict[str, Any]:
+        """Get statistics for a collection."""
+        target = self.collection(collection)
+        return {
+            "name": collection,
+            "count": target.count,
+            "available": True,
+            "tombstones": target.tombstones,
+        }
+
+    def get_all_stats(self) -> dict[str, Any]:
+        """Get stats for all collections."""
+        return {
+            "available": True,
+            "backend": "flat",
+            "persist_dir": str(self._persist_dir),
+            "collections": {name: self.get_collection_stats(name) for name in COLLECTION_NAMES},
+        }
+
+    @property
+    def is_available(self) -> bool:
+        return True
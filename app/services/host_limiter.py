@@ -0,0 +1,49 @@
+"""Per-host politeness limits for concurrent outbound scraping."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from urllib.parse import urlparse
+
+
+def host_key(url: str) -> str:
+    """Normalized host for politeness bookkeeping (``https://www.Acme.io/x`` -> ``acme.io``)."""
+    url = (url or "").strip()
+    if url and "://" not in url:
+        url = f"https://{url}"
+    host = (urlparse(url).hostname or "").lower()
+    return host.removeprefix("www.")
+
+
+class HostLimiter:
+    """Caps in-flight work per host and spaces out consecutive starts on the same host.
+
+    ``per_host`` bounds concurrent slots per host; ``min_interval`` is the minimum
+    number of seconds between two slot acquisitions for one host. Safe to share
+    across tasks on a single event loop.
+    """
+
+    def __init__(self, per_host: int = 1, min_interval: float = 0.0):
+        self.per_host = max(1, per_host)
+        self.min_interval = max(0.0, min_interval)
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._next_start: dict[str, float] = {}
+        self._lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """Hold one politeness slot for the host of ``url`` for the duration of the block."""
+        host = host_key(url)
+        semaphore = self._semaphores.setdefault(host, asyncio.Semaphore(self.per_host))
+        async with semaphore:
+            if self.min_interval:
+                async with self._lock:
+                    now = time.monotonic()
+                    start = max(now, self._next_start.get(host, 0.0))
+                    self._next_start[host] = start + self.min_interval
+                if start > now:
+                    await asyncio.sleep(start - now)
+            yield
@@ -0,0 +1,381 @@
+"""On-disk conditional-GET cache for job-board and career-page fetches.
+
+Responses are stored in a standalone SQLite file keyed by ``sha256(url)``.
+Within a per-source TTL an entry is served without touching the network;
+after that it is revalidated with ``If-None-Match`` / ``If-Modified-Since``
+and a ``304`` reuses the stored body. Scrapers can also store their parsed
+result next to the payload digest and skip re-parsing unchanged payloads.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import httpx
+from loguru import logger
+
+from app.core.config import settings
+from app.services.http_client import http_get
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url_key TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    content_type TEXT,
+    body BLOB NOT NULL,
+    digest TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_responses_fetched_at ON responses (fetched_at);
+CREATE TABLE IF NOT EXISTS parsed (
+    url_key TEXT NOT NULL,
+    variant TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (url_key, variant)
+);
+"""
+
+# Evict down to this fraction of the budget so eviction does not run on every put.
+_EVICT_TARGET_RATIO = 0.9
+
+# Lookup outcomes counted per source.
+FRESH = "fresh"  # served inside the TTL, no request sent
+REVALIDATED = "revalidated"  # 304 Not Modified, stored body reused
+UNCHANGED = "unchanged"  # full 200 whose body matches the stored digest
+FETCHED = "fetched"  # new or changed payload
+PARSE_SKIPPED = "parse_skipped"  # stored parse result reused for an unchanged payload
+
+
+def cache_key(url: str, params: Any = None) -> str:
+    """Content address of a request URL (query params included, order-normalized)."""
+    full = httpx.URL(url, params=params) if params else httpx.URL(url)
+    return hashlib.sha256(str(full).encode("utf-8")).hexdigest()
+
+
+def ttl_for(source: str) -> float:
+    """Freshness window for ``source`` (``HTTP_CACHE_SOURCE_TTLS`` or the default)."""
+    return float(settings.HTTP_CACHE_SOURCE_TTLS.get(source, settings.HTTP_CACHE_TTL_SECONDS))
+
+
+@dataclass
+class CachedEntry:
+    source: str
+    status: int
+    body: bytes
+    digest: str
+    fetched_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+    content_type: str | None = None
+
+
+class HTTPCache:
+    """SQLite-backed response cache with per-source hit counters."""
+
+    def __init__(self, path: Path, max_bytes: int):
+        self._path = path
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        row = self._conn.execute("SELECT COALESCE(SUM(LENGTH(body)), 0) FROM responses").fetchone()
+        self._total_bytes = int(row[0])
+        self.counters: dict[str, Counter[str]] = {}
+        self.evictions = 0
+
+    def get(self, url_key: str) -> CachedEntry | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT source, status, body, digest, fetched_at, etag, last_modified, "
+                "content_type FROM responses WHERE url_key = ?",
+                (url_key,),
+            ).fetchone()
+        return CachedEntry(*row) if row else None
+
+    def put(self, url_key: str, entry: CachedEntry) -> None:
+        with self._lock:
+            old = self._conn.execute(
+                "SELECT LENGTH(body) FROM responses WHERE url_key = ?", (url_key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (url_key, source, status, etag, "
+                "last_modified, content_type, body, digest, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    url_key,
+                    entry.source,
+                    entry.status,
+                    entry.etag,
+                    entry.last_modified,
+                    entry.content_type,
+                    entry.body,
+                    entry.digest,
+                    entry.fetched_at,
+                ),
+            )
+            self._total_bytes += len(entry.body) - (old[0] if old else 0)
+            if self._total_bytes > self._max_bytes:
+                self._evict(int(self._max_bytes * _EVICT_TARGET_RATIO))
+            self._conn.commit()
+
+    def touch(self, url_key: str, fetched_at: float) -> None:
+        """Mark an entry as confirmed current (after a 304)."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET fetched_at = ? WHERE url_key = ?", (fetched_at, url_key)
+            )
+            self._conn.commit()
+
+    def get_parsed(self, url_key: str, variant: str, digest: str) -> Any | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM parsed WHERE url_key = ? AND variant = ? AND digest = ?",
+                (url_key, variant, digest),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put_parsed(self, url_key: str, variant: str, digest: str, value: Any) -> None:
+        payload = json.dumps(value, default=str)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO parsed (url_key, variant, digest, payload) "
+                "VALUES (?, ?, ?, ?)",
+                (url_key, variant, digest, payload),
+            )
+            self._conn.commit()
+
+    def _evict(self, target_bytes: int) -> None:
+        cursor = self._conn.execute(
+            "SELECT url_key, LENGTH(body) FROM responses ORDER BY fetched_at ASC"
+        )
+        doomed: list[tuple[str]] = []
+        freed = 0
+        for url_key, size in cursor:
+            if self._total_bytes - freed <= target_bytes:
+                break
+            doomed.append((url_key,))
+            freed += size
+        self._conn.executemany("DELETE FROM responses WHERE url_key = ?", doomed)
+        self._conn.executemany("DELETE FROM parsed WHERE url_key = ?", doomed)
+        self._total_bytes -= freed
+        self.evictions += len(doomed)
+        logger.debug(f"HTTPCache: evicted {len(doomed)} responses ({freed} bytes)")
+
+    def record(self, source: str, outcome: str) -> None:
+        self.counters.setdefault(source, Counter())[outcome] += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Per-source outcome counters for this process plus on-disk size.
+
+        ``hit_rate`` counts lookups answered without downloading a body
+        (fresh + revalidated) over all lookups.
+        """
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        by_source: dict[str, dict[str, Any]] = {}
+        totals: Counter[str] = Counter()
+        for source, counts in sorted(self.counters.items()):
+            by_source[source] = _with_hit_rate(dict(counts))
+            totals.update(counts)
+        return {
+            "path": str(self._path),
+            "entries": entries,
+            "bytes": self._total_bytes,
+            "max_bytes": self._max_bytes,
+            "evictions": self.evictions,
+            **_with_hit_rate(dict(totals)),
+            "by_source": by_source,
+        }
+
+    def clear(self) -> None:
+        """Drop every cached response and reset counters."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.execute("DELETE FROM parsed")
+            self._conn.commit()
+            self._total_bytes = 0
+        self.counters.clear()
+        self.evictions = 0
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def _with_hit_rate(counts: dict[str, int]) -> dict[str, Any]:
+    hits = counts.get(FRESH, 0) + counts.get(REVALIDATED, 0)
+    lookups = hits + counts.get(UNCHANGED, 0) + counts.get(FETCHED, 0)
+    return {**counts, "hit_rate": round(hits / lookups, 4) if lookups else 0.0}
+
+
+_cache: HTTPCache | None = None
+_cache_failed = False
+
+
+def get_http_cache() -> HTTPCache | None:
+    """Process-wide response cache, or None when disabled or unavailable."""
+    global _cache, _cache_failed
+    if not settings.HTTP_CACHE_ENABLED or _cache_failed:
+        return None
+    if _cache is None:
+        try:
+            _cache = HTTPCache(Path(settings.HTTP_CACHE_PATH), settings.HTTP_CACHE_MAX_BYTES)
+        except Exception as e:
+            logger.warning(f"HTTP cache unavailable, fetching without it: {e}")
+            _cache_failed = True
+            return None
+    return _cache
+
+
+@dataclass
+class CachedResponse:
+    """A response served from the network or the cache (see ``state``)."""
+
+    url_key: str
+    source: str
+    status_code: int
+    content: bytes
+    digest: str
+    state: str
+    content_type: str | None = None
+    _cache: HTTPCache | None = field(default=None, repr=False)
+
+    @property
+    def from_cache(self) -> bool:
+        return self.state in (FRESH, REVALIDATED)
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def parsed(self, variant: str = "") -> Any | None:
+        """Parse result stored for this exact payload, if any."""
+        if self._cache is None or self.status_code != 200:
+            return None
+        value = self._cache.get_parsed(self.url_key, variant, self.digest)
+        if value is not None:
+            self._cache.record(self.source, PARSE_SKIPPED)
+        return value
+
+    def store_parsed(self, value: Any, variant: str = "") -> None:
+        """Remember the (JSON-serializable) parse result for this payload."""
+        if self._cache is not None and self.status_code == 200:
+            self._cache.put_parsed(self.url_key, variant, self.digest, value)
+
+
+def _digest(body: bytes) -> str:
+    return hashlib.sha256(body).hexdigest()
+
+
+async def cached_get(
+    url: str,
+    *,
+    source: str,
+    params: Any = None,
+    headers: dict[str, str] | None = None,
+    ttl: float | None = None,
+    **kwargs: Any,
+) -> CachedResponse:
+    """GET ``url`` through the response cache; only ``200`` responses are stored."""
+    cache = get_http_cache()
+    key = cache_key(url, params)
+    entry = cache.get(key) if cache is not None else None
+    now = time.time()
+    ttl = ttl_for(source) if ttl is None else ttl
+
+    def _from_entry(state: str) -> CachedResponse:
+        assert entry is not None
+        if cache is not None:
+            cache.record(source, state)
+        return CachedResponse(
+            key, source, entry.status, entry.body, entry.digest, state, entry.content_type, cache
+        )
+
+    if entry is not None and entry.status == 200 and now - entry.fetched_at < ttl:
+        return _from_entry(FRESH)
+
+    request_headers = dict(headers or {})
+    if entry is not None and entry.status == 200:
+        if entry.etag:
+            request_headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            request_headers["If-Modified-Since"] = entry.last_modified
+
+    resp = await http_get(url, params=params, headers=request_headers, **kwargs)
+    if resp.status_code == 304 and entry is not None:
+        assert cache is not None
+        cache.touch(key, now)
+        return _from_entry(REVALIDATED)
+
+    body = resp.content
+    digest = _digest(body)
+    state = UNCHANGED if entry is not None and entry.digest == digest else FETCHED
+    if cache is not None:
+        if resp.status_code == 200:
+            cache.put(
+                key,
+                CachedEntry(
+                    source=source,
+                    status=200,
+                    body=body,
+                    digest=digest,
+                    fetched_at=now,
+                    etag=resp.headers.get("etag"),
+                    last_modified=resp.headers.get("last-modified"),
+                    content_type=resp.headers.get("content-type"),
+                ),
+            )
+        cache.record(source, state)
+    return CachedResponse(
+        key, source, resp.status_code, body, digest, state, resp.headers.get("content-type"), cache
+    )
+
+
+async def cached_fetch_text(
+    source: str,
+    url: str,
+    fetch: Callable[[str], Awaitable[str | None]],
+) -> str | None:
+    """TTL-cache an opaque fetcher (SDK/browser) that has no HTTP validators.
+
+    ``fetch`` is an async callable taking ``url``. Only non-empty results are
+    stored: the fetcher reports a timeout, a 5xx and a genuine 404 all as
+    ``None``, so a miss is retried on the next call instead of being pinned for
+    the whole TTL.
+    """
+    cache = get_http_cache()
+    if cache is None:
+        return await fetch(url)
+    key = cache_key(url)
+    entry = cache.get(key)
+    now = time.time()
+    if entry is not None and entry.status == 200 and now - entry.fetched_at < ttl_for(source):
+        cache.record(source, FRESH)
+        return entry.body.decode("utf-8")
+
+    content = await fetch(url)
+    if not content:
+        return content
+    body = content.encode("utf-8")
+    digest = _digest(body)
+    same = entry is not None and entry.status == 200 and entry.digest == digest
+    cache.put(key, CachedEntry(source, 200, body, digest, now))
+    cache.record(source, UNCHANGED if same else FETCHED)
+    return content
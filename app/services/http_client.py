@@ -0,0 +1,131 @@
+"""App-wide pooled async HTTP client for scrapers and runtimes.
+
+One ``httpx.AsyncClient`` per event loop keeps connections alive across calls
+(and negotiates HTTP/2 when ``h2`` is installed). ``http_request`` adds a
+per-host concurrency cap and retries with exponential backoff on transport
+errors and retryable status codes. The FastAPI lifespan closes the client on
+shutdown; standalone scripts may call ``close_http_client`` themselves.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import httpx
+from loguru import logger
+
+from app.core.config import settings
+from app.services.host_limiter import HostLimiter
+
+try:
+    import h2  # noqa: F401
+
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# Never sleep longer than this between attempts, whatever Retry-After says.
+_MAX_BACKOFF_SECONDS = 30.0
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+_host_limiter: HostLimiter | None = None
+
+
+def _build_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        http2=settings.HTTP2_ENABLED and H2_AVAILABLE,
+        timeout=httpx.Timeout(
+            settings.HTTP_TIMEOUT_SECONDS,
+            connect=settings.HTTP_CONNECT_TIMEOUT_SECONDS,
+        ),
+        limits=httpx.Limits(
+            max_connections=settings.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+        headers={"User-Agent": "JobBooster/1.0"},
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it for the running event loop if needed.
+
+    Pooled connections belong to the loop that opened them, so a client made on
+    another (e.g. closed test) loop is replaced rather than reused.
+    """
+    global _client, _client_loop, _host_limiter
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = _build_client()
+        _client_loop = loop
+        _host_limiter = HostLimiter(per_host=settings.HTTP_MAX_CONNECTIONS_PER_HOST)
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client (FastAPI lifespan shutdown)."""
+    global _client, _client_loop, _host_limiter
+    client, _client, _client_loop, _host_limiter = _client, None, None, None
+    if client is not None and not client.is_closed:
+        try:
+            await client.aclose()
+        except RuntimeError as e:
+            # Client was opened on a loop that no longer runs.
+            logger.debug(f"Shared HTTP client close skipped: {e}")
+
+
+def _backoff_delay(attempt: int, response: httpx.Response | None) -> float:
+    delay = settings.HTTP_RETRY_BACKOFF_SECONDS * (2**attempt)
+    if response is not None:
+        retry_after = response.headers.get("retry-after", "")
+        if retry_after.isdigit():
+            delay = max(delay, float(retry_after))
+    return float(min(delay, _MAX_BACKOFF_SECONDS))
+
+
+async def http_request(
+    method: str,
+    url: str,
+    *,
+    retries: int | None = None,
+    **kwargs: Any,
+) -> httpx.Response:
+    """Send a request on the shared client with per-host limits and retry/backoff.
+
+    ``kwargs`` are passed to ``httpx.AsyncClient.request`` (``params``, ``json``,
+    ``headers``, ``timeout``, ``follow_redirects``...). Retries cover transport
+    errors and ``RETRY_STATUSES``; the last response or error is returned/raised.
+    """
+    client = get_http_client()
+    limiter = _host_limiter or HostLimiter(per_host=settings.HTTP_MAX_CONNECTIONS_PER_HOST)
+    max_retries = max(0, settings.HTTP_RETRIES if retries is None else retries)
+    attempt = 0
+    while True:
+        response: httpx.Response | None = None
+        try:
+            async with limiter.slot(url):
+                response = await client.request(method, url, **kwargs)
+        except httpx.TransportError as e:
+            if attempt >= max_retries:
+                raise
+            logger.debug(f"{method} {url} failed ({e!r}), retry {attempt + 1}/{max_retries}")
+        else:
+            if response.status_code not in RETRY_STATUSES or attempt >= max_retries:
+                return response
+            logger.debug(
+                f"{method} {url} returned {response.status_code}, retry {attempt + 1}/{max_retries}"
+            )
+            await response.aclose()
+        await asyncio.sleep(_backoff_delay(attempt, response))
+        attempt += 1
+
+
+async def http_get(url: str, **kwargs: Any) -> httpx.Response:
+    return await http_request("GET", url, **kwargs)
+
+
+async def http_post(url: str, **kwargs: Any) -> httpx.Response:
+    return await http_request("POST", url, **kwargs)
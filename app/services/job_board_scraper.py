@@ -3,14 +3,31 @@
 import asyncio
 import os
 from abc import ABC, abstractmethod
+from typing import Any
 
 from loguru import logger
 
 from app.models.job_model import ScrapedJob
+from app.services.http_cache import CachedResponse, cached_get
+
+
+def _reuse_parsed(resp: CachedResponse, limit: int) -> list[ScrapedJob] | None:
+    """Jobs parsed earlier from this exact payload (same ``limit``), if cached."""
+    cached = resp.parsed(variant=str(limit))
+    return [ScrapedJob.model_validate(job) for job in cached] if cached is not None else None
+
+
+def _remember_parsed(resp: CachedResponse, jobs: list[ScrapedJob], limit: int) -> list[ScrapedJob]:
+    resp.store_parsed([job.model_dump(mode="json") for job in jobs], variant=str(limit))
+    return jobs
 
 
 class BaseJobBoardScraper(ABC):
-    """Abstract base for job board scrapers."""
+    """Abstract base for job board scrapers.
+
+    Fetches go through the conditional-GET response cache (TTL per
+    ``source_name``); unchanged payloads reuse their previously parsed jobs.
+    """
 
     @abstractmethod
     async def search(self, query: str, location: str = "", limit: int = 20) -> list[ScrapedJob]: ...
@@ -23,6 +40,9 @@ class BaseJobBoardScraper(ABC):
     def is_available(self) -> bool:
         return True
 
+    async def _get(self, url: str, **kwargs: Any) -> CachedResponse:
+        return await cached_get(url, source=self.source_name, **kwargs)
+
 
 class RemoteOKScraper(BaseJobBoardScraper):
     """RemoteOK — free JSON API, no auth needed."""
@@ -33,35 +53,32 @@ class RemoteOKScraper(BaseJobBoardScraper):
 
     async def search(self, query: str, location: str = "", limit: int = 20) -> list[ScrapedJob]:
         try:
-            import httpx
-
             tag = query.lower().replace(" ", "-")
             url = f"https://remoteok.com/api?tag={tag}"
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                resp = await client.get(url, headers={"User-Agent": "JobBooster/1.0"})
-                if resp.status_code != 200:
-                    logger.warning(f"RemoteOK returned {resp.status_code}")
-                    return []
-                data = resp.json()
-                # First item is metadata, skip it
-                jobs = []
-                for item in data[1 : limit + 1]:
-                    if not isinstance(item, dict):
-                        continue
-                    jobs.append(
-                        ScrapedJob(
-                            title=item.get("position", ""),
-                            company=item.get("company", ""),
-                            location=item.get("location", "Remote"),
-                            url=item.get("url", ""),
-                            description=item.get("description", "")[:500],
-                            source="remoteok",
-                        )
+            resp = await self._get(url, headers={"User-Agent": "JobBooster/1.0"})
+            if resp.status_code != 200:
+                logger.warning(f"RemoteOK returned {resp.status_code}")
+                return []
+            reused = _reuse_parsed(resp, limit)
+            if reused is not None:
+                return reused
+            data = resp.json()
+            # First item is metadata, skip it
+            jobs = []
+            for item in data[1 : limit + 1]:
+                if not isinstance(item, dict):
+                    continue
+                jobs.append(
+                    ScrapedJob(
+                        title=item.get("position", ""),
+                        company=item.get("company", ""),
+                        location=item.get("location", "Remote"),
+                        url=item.get("url", ""),
+                        description=item.get("description", "")[:500],
+                        source="remoteok",
                     )
-                return jobs
-        except ImportError:
-            logger.warning("httpx not installed — RemoteOK scraper unavailable")
-            return []
+                )
+            return _remember_parsed(resp, jobs, limit)
         except Exception as e:
             logger.error(f"RemoteOK scraper error: {e}")
             return []
@@ -86,8 +103,6 @@ class AdzunaScraper(BaseJobBoardScraper):
             return []
 
         try:
-            import httpx
-
             url = "https://api.adzuna.com/v1/api/jobs/us/search/1"
             params: dict[str, str | int] = {
                 "app_id": app_id,
@@ -97,28 +112,27 @@ class AdzunaScraper(BaseJobBoardScraper):
                 "where": location or "",
                 "content-type": "application/json",
             }
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                resp = await client.get(url, params=params)
-                if resp.status_code != 200:
-                    logger.warning(f"Adzuna returned {resp.status_code}")
-                    return []
-                data = resp.json()
-                jobs = []
-                for item in data.get("results", []):
-                    jobs.append(
-                        ScrapedJob(
-                            title=item.get("title", ""),
-                            company=item.get("company", {}).get("display_name", ""),
-                            location=item.get("location", {}).get("display_name", ""),
-                            url=item.get("redirect_url", ""),
-                            description=item.get("description", "")[:500],
-                            source="adzuna",
-                        )
+            resp = await self._get(url, params=params)
+            if resp.status_code != 200:
+                logger.warning(f"Adzuna returned {resp.status_code}")
+                return []
+            reused = _reuse_parsed(resp, limit)
+            if reused is not None:
+                return reused
+            data = resp.json()
+            jobs = []
+            for item in data.get("results", []):
+                jobs.append(
+                    ScrapedJob(
+                        title=item.get("title", ""),
+                        company=item.get("company", {}).get("display_name", ""),
+                        location=item.get("location", {}).get("display_name", ""),
+                        url=item.get("redirect_url", ""),
+                        description=item.get("description", "")[:500],
+                        source="adzuna",
                     )
-                return jobs
-        except ImportError:
-            logger.warning("httpx not installed — Adzuna scraper unavailable")
-            return []
+                )
+            return _remember_parsed(resp, jobs, limit)
         except Exception as e:
             logger.error(f"Adzuna scraper error: {e}")
             return []
@@ -135,8 +149,6 @@ class LinkedInRSSScraper(BaseJobBoardScraper):
         try:
             import re
 
-            import httpx
-
             keyword = query.replace(" ", "+")
             url = f"https://www.linkedin.com/jobs/search/?keywords={keyword}"
             if location:
@@ -151,39 +163,40 @@ class LinkedInRSSScraper(BaseJobBoardScraper):
             if location:
                 rss_url += f"&location={location.replace(' ', '+')}"
 
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                resp = await client.get(rss_url, headers={"User-Agent": "Mozilla/5.0"})
-                if resp.status_code != 200:
-                    logger.warning(f"LinkedIn RSS returned {resp.status_code}")
-                    return []
-
-                html = resp.text
-                jobs = []
-                # Simple regex extraction from LinkedIn's public HTML
-                _t = r'base-search-card__title[^"]*"[^>]*>([^<]+)</h3>'
-                titles = re.findall(rf'<h3[^>]*class="[^"]*{_t}', html)
-                _s = r'base-search-card__subtitle[^"]*"[^>]*>.*?<a[^>]*>([^<]+)</a>'
-                companies = re.findall(rf'<h4[^>]*class="[^"]*{_s}', html, re.DOTALL)
-                _f = r'base-card__full-link[^"]*"[^>]*href="([^"]+)"'
-                links = re.findall(rf'<a[^>]*class="[^"]*{_f}', html)
-                _l = r'job-search-card__location[^"]*"[^>]*>([^<]+)</span>'
-                locations = re.findall(rf'<span[^>]*class="[^"]*{_l}', html)
-
-                for i in range(min(len(titles), limit)):
-                    jobs.append(
-                        ScrapedJob(
-                            title=titles[i].strip() if i < len(titles) else "",
-                            company=companies[i].strip() if i < len(companies) else "",
-                            location=locations[i].strip() if i < len(locations) else "",
-                            url=links[i].strip() if i < len(links) else "",
-                            description="",
-                            source="linkedin",
-                        )
+            resp = await self._get(
+                rss_url, headers={"User-Agent": "Mozilla/5.0"}, follow_redirects=True
+            )
+            if resp.status_code != 200:
+                logger.warning(f"LinkedIn RSS returned {resp.status_code}")
+                return []
+            reused = _reuse_parsed(resp, limit)
+            if reused is not None:
+                return reused
+
+            html = resp.text
+            jobs = []
+            # Simple regex extraction from LinkedIn's public HTML
+            _t = r'base-search-card__title[^"]*"[^>]*>([^<]+)</h3>'
+            titles = re.findall(rf'<h3[^>]*class="[^"]*{_t}', html)
+            _s = r'base-search-card__subtitle[^"]*"[^>]*>.*?<a[^>]*>([^<]+)</a>'
+            companies = re.findall(rf'<h4[^>]*class="[^"]*{_s}', html, re.DOTALL)
+            _f = r'base-card__full-link[^"]*"[^>]*href="([^"]+)"'
+            links = re.findall(rf'<a[^>]*class="[^"]*{_f}', html)
+            _l = r'job-search-card__location[^"]*"[^>]*>([^<]+)</span>'
+            locations = re.findall(rf'<span[^>]*class="[^"]*{_l}', html)
+
+            for i in range(min(len(titles), limit)):
+                jobs.append(
+                    ScrapedJob(
+                        title=titles[i].strip() if i < len(titles) else "",
+                        company=companies[i].strip() if i < len(companies) else "",
+                        location=locations[i].strip() if i < len(locations) else "",
+                        url=links[i].strip() if i < len(links) else "",
+                        description="",
+                        source="linkedin",
                     )
-                return jobs
-        except ImportError:
-            logger.warning("httpx not installed — LinkedIn scraper unavailable")
-            return []
+                )
+            return _remember_parsed(resp, jobs, limit)
         except Exception as e:
             logger.error(f"LinkedIn RSS scraper error: {e}")
             return []
@@ -200,71 +213,70 @@ class IndeedScraper(BaseJobBoardScraper):
         try:
             import re
 
-            import httpx
-
             keyword = query.replace(" ", "+")
             loc = location.replace(" ", "+") if location else ""
             url = f"https://www.indeed.com/jobs?q={keyword}"
             if loc:
                 url += f"&l={loc}"
 
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                resp = await client.get(url, headers={"User-Agent": "Mozilla/5.0"})
-                if resp.status_code != 200:
-                    logger.warning(f"Indeed returned {resp.status_code}")
-                    return []
-
-                html = resp.text
-                jobs = []
-
-                # Extract job cards from Indeed HTML
-                _card_re = r'<div[^>]*class="[^"]*job_seen_beacon[^"]*"[^>]*>'
-                cards = re.findall(
-                    rf"{_card_re}(.*?)</div>\s*</div>",
-                    html,
+            resp = await self._get(
+                url, headers={"User-Agent": "Mozilla/5.0"}, follow_redirects=True
+            )
+            if resp.status_code != 200:
+                logger.warning(f"Indeed returned {resp.status_code}")
+                return []
+            reused = _reuse_parsed(resp, limit)
+            if reused is not None:
+                return reused
+
+            html = resp.text
+            jobs = []
+
+            # Extract job cards from Indeed HTML
+            _card_re = r'<div[^>]*class="[^"]*job_seen_beacon[^"]*"[^>]*>'
+            cards = re.findall(
+                rf"{_card_re}(.*?)</div>\s*</div>",
+                html,
+                re.DOTALL,
+            )
+            for card in cards[:limit]:
+                title_m = re.search(
+                    r"<h2[^>]*>.*?<a[^>]*>(.*?)</a>",
+                    card,
                     re.DOTALL,
                 )
-                for card in cards[:limit]:
-                    title_m = re.search(
-                        r"<h2[^>]*>.*?<a[^>]*>(.*?)</a>",
-                        card,
-                        re.DOTALL,
-                    )
-                    company_m = re.search(
-                        r'<span[^>]*data-testid="company-name"[^>]*>'
-                        r"(.*?)</span>",
-                        card,
-                    )
-                    location_m = re.search(
-                        r'<div[^>]*data-testid="text-location"[^>]*>'
-                        r"(.*?)</div>",
-                        card,
-                    )
-                    link_m = re.search(r'<a[^>]*href="(/viewjob[^"]*)"', card)
-
-                    def _clean(x, m):
-                        return re.sub(r"<[^>]+>", "", m.group(1)).strip() if m else x
-
-                    title = _clean("", title_m)
-                    company = _clean("", company_m)
-                    loc_str = _clean("", location_m)
-                    link = f"https://www.indeed.com{link_m.group(1)}" if link_m else ""
-
-                    if title:
-                        jobs.append(
-                            ScrapedJob(
-                                title=title,
-                                company=company,
-                                location=loc_str,
-                                url=link,
-                                description="",
-                                source="indeed",
-                            )
+                company_m = re.search(
+                    r'<span[^>]*data-testid="company-name"[^>]*>'
+                    r"(.*?)</span>",
+                    card,
+                )
+                location_m = re.search(
+                    r'<div[^>]*data-testid="text-location"[^>]*>'
+                    r"(.*?)</div>",
+                    card,
+                )
+                link_m = re.search(r'<a[^>]*href="(/viewjob[^"]*)"', card)
+
+                def _clean(x, m):
+                    return re.sub(r"<[^>]+>", "", m.group(1)).strip() if m else x
+
+                title = _clean("", title_m)
+                company = _clean("", company_m)
+                loc_str = _clean("", location_m)
+                link = f"https://www.indeed.com{link_m.group(1)}" if link_m else ""
+
+                if title:
+                    jobs.append(
+                        ScrapedJob(
+                            title=title,
+                            company=company,
+                            location=loc_str,
+                            url=link,
+                            description="",
+                            source="indeed",
                         )
-                return jobs
-        except ImportError:
-            logger.warning("httpx not installed — Indeed scraper unavailable")
-            return []
+                    )
+            return _remember_parsed(resp, jobs, limit)
         except Exception as e:
             logger.error(f"Indeed scraper error: {e}")
             return []
@@ -281,63 +293,62 @@ class WuzzufScraper(BaseJobBoardScraper):
         try:
             import re
 
-            import httpx
-
             keyword = query.replace(" ", "+")
             url = f"https://wuzzuf.net/search/jobs/?q={keyword}"
             if location:
                 url += f"&l={location.replace(' ', '+')}"
 
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                resp = await client.get(url, headers={"User-Agent": "Mozilla/5.0"})
-                if resp.status_code != 200:
-                    logger.warning(f"Wuzzuf returned {resp.status_code}")
-                    return []
+            resp = await self._get(
+                url, headers={"User-Agent": "Mozilla/5.0"}, follow_redirects=True
+            )
+            if resp.status_code != 200:
+                logger.warning(f"Wuzzuf returned {resp.status_code}")
+                return []
+            reused = _reuse_parsed(resp, limit)
+            if reused is not None:
+                return reused
+
+            html = resp.text
+            jobs = []
+
+            _t = r'css-m604qf[^"]*"[^>]*>.*?<a[^>]*>(.*?)</a>'
+            titles = re.findall(
+                rf'<h2[^>]*class="[^"]*{_t}',
+                html,
+                re.DOTALL,
+            )
+            _c = r'css-17s97q8[^"]*"[^>]*>(.*?)</a>'
+            companies = re.findall(rf'<a[^>]*class="[^"]*{_c}', html)
+            _l = r'css-5wys0k[^"]*"[^>]*>(.*?)</span>'
+            locations = re.findall(rf'<span[^>]*class="[^"]*{_l}', html)
+            links = re.findall(
+                r'<h2[^>]*>.*?<a[^>]*href="([^"]+)"',
+                html,
+                re.DOTALL,
+            )
 
-                html = resp.text
-                jobs = []
+            for i in range(min(len(titles), limit)):
 
-                _t = r'css-m604qf[^"]*"[^>]*>.*?<a[^>]*>(.*?)</a>'
-                titles = re.findall(
-                    rf'<h2[^>]*class="[^"]*{_t}',
-                    html,
-                    re.DOTALL,
-                )
-                _c = r'css-17s97q8[^"]*"[^>]*>(.*?)</a>'
-                companies = re.findall(rf'<a[^>]*class="[^"]*{_c}', html)
-                _l = r'css-5wys0k[^"]*"[^>]*>(.*?)</span>'
-                locations = re.findall(rf'<span[^>]*class="[^"]*{_l}', html)
-                links = re.findall(
-                    r'<h2[^>]*>.*?<a[^>]*href="([^"]+)"',
-                    html,
-                    re.DOTALL,
-                )
+                def _strip(x):
+                    return re.sub(r"<[^>]+>", "", x).strip() if x else ""
+
+                title = _strip(titles[i] if i < len(titles) else "")
+                company = _strip(companies[i] if i < len(companies) else "")
+                loc_str = _strip(locations[i] if i < len(locations) else "")
+                link = f"https://wuzzuf.net{links[i]}" if i < len(links) else ""
 
-                for i in range(min(len(titles), limit)):
-
-                    def _strip(x):
-                        return re.sub(r"<[^>]+>", "", x).strip() if x else ""
-
-                    title = _strip(titles[i] if i < len(titles) else "")
-                    company = _strip(companies[i] if i < len(companies) else "")
-                    loc_str = _strip(locations[i] if i < len(locations) else "")
-                    link = f"https://wuzzuf.net{links[i]}" if i < len(links) else ""
-
-                    if title:
-                        jobs.append(
-                            ScrapedJob(
-                                title=title,
-                                company=company,
-                                location=loc_str,
-                                url=link,
-                                description="",
-                                source="wuzzuf",
-                            )
+                if title:
+                    jobs.append(
+                        ScrapedJob(
+                            title=title,
+                            company=company,
+                            location=loc_str,
+                            url=link,
+                            description="",
+                            source="wuzzuf",
                         )
-                return jobs
-        except ImportError:
-            logger.warning("httpx not installed — Wuzzuf scraper unavailable")
-            return []
+                    )
+            return _remember_parsed(resp, jobs, limit)
         except Exception as e:
             logger.error(f"Wuzzuf scraper error: {e}")
             return []
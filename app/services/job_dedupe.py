@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.models.db_models import JobPostingDB
 
+# Stay well below SQLite's bound-parameter limit for ``IN (...)`` lookups.
+_IN_CHUNK = 500
+
 
 def job_dedupe_key(
     company: str,
@@ -15,6 +22,9 @@ def job_dedupe_key(
     company_stub: bool = False,
 ) -> str:
     """Stable key for import/scrape dedupe. Company stubs use fixed stub title only."""
+    url = (url or "").strip()
+    company = (company or "").strip()
+    title = (title or "").strip()
     if url:
         return f"url:{url.lower()}"
     if company_stub:
@@ -22,6 +32,108 @@ def job_dedupe_key(
     return f"ct:{company.lower()}|{title.lower()}"
 
 
+def dedupe_key_for_job(job_data: dict[str, Any]) -> str:
+    """Dedupe key for a ``store_scraped_jobs_batch``-shaped job dict.
+
+    Honours an explicit ``dedupe_key``; a ``stub_title`` marks a company-level
+    stub row whose display title varies between imports.
+    """
+    if job_data.get("dedupe_key"):
+        return str(job_data["dedupe_key"])
+    company = job_data.get("company") or ""
+    url = job_data.get("source_url") or ""
+    stub_title = job_data.get("stub_title")
+    if stub_title:
+        return job_dedupe_key(company, stub_title, url, company_stub=True)
+    return job_dedupe_key(company, job_data.get("title") or "", url)
+
+
+def _legacy_row_keys(row: JobPostingDB) -> set[str]:
+    """Keys a row without a persisted ``dedupe_key`` can match."""
+    company = (row.company or "").strip()
+    title = (row.title or "").strip()
+    url = (row.source_url or "").strip()
+    if url:
+        return {job_dedupe_key(company, title, url)}
+    stub = title.split(" (", 1)[0]
+    return {
+        job_dedupe_key(company, title, url),
+        job_dedupe_key(company, stub, url, company_stub=True),
+    }
+
+
+def _chunks(values: list[str]) -> Iterable[list[str]]:
+    for start in range(0, len(values), _IN_CHUNK):
+        yield values[start : start + _IN_CHUNK]
+
+
+def find_job_ids_by_dedupe_key(db: Session, keys: Iterable[str]) -> dict[str, int]:
+    """Map persisted dedupe keys to posting ids using the unique key index."""
+    ids: dict[str, int] = {}
+    for chunk in _chunks(list(dict.fromkeys(keys))):
+        rows = db.query(JobPostingDB.dedupe_key, JobPostingDB.id).filter(
+            JobPostingDB.dedupe_key.in_(chunk)
+        )
+        for key, job_id in rows:
+            if key is not None:
+                ids[key] = job_id
+    return ids
+
+
+def find_existing_jobs(
+    db: Session,
+    jobs: Iterable[dict[str, Any]],
+) -> dict[str, JobPostingDB]:
+    """Resolve a whole batch of job dicts against stored postings.
+
+    Uses one indexed ``dedupe_key IN (...)`` query per chunk, then a set-based
+    fallback over rows written before the key column existed. Returns a map of
+    dedupe key -> existing row for every job that already has a posting.
+    """
+    wanted: dict[str, dict[str, Any]] = {}
+    for job_data in jobs:
+        wanted.setdefault(dedupe_key_for_job(job_data), job_data)
+    if not wanted:
+        return {}
+
+    found: dict[str, JobPostingDB] = {}
+    for chunk in _chunks(list(wanted)):
+        for row in db.query(JobPostingDB).filter(JobPostingDB.dedupe_key.in_(chunk)):
+            if row.dedupe_key:
+                found[row.dedupe_key] = row
+
+    missing = {key: job for key, job in wanted.items() if key not in found}
+    if not missing:
+        return found
+
+    urls = sorted(
+        {
+            (job.get("source_url") or "").strip().lower()
+            for key, job in missing.items()
+            if key.startswith("url:")
+        }
+    )
+    companies = sorted(
+        {
+            (job.get("company") or "").strip().lower()
+            for key, job in missing.items()
+            if not key.startswith("url:")
+        }
+    )
+    legacy = db.query(JobPostingDB).filter(JobPostingDB.dedupe_key.is_(None))
+    candidates: list[JobPostingDB] = []
+    for chunk in _chunks(urls):
+        candidates.extend(legacy.filter(func.lower(JobPostingDB.source_url).in_(chunk)))
+    for chunk in _chunks(companies):
+        candidates.extend(legacy.filter(func.lower(JobPostingDB.company).in_(chunk)))
+
+    for row in candidates:
+        for key in _legacy_row_keys(row):
+            if key in missing and key not in found:
+                found[key] = row
+    return found
+
+
 def find_existing_job(
     db: Session,
     company: str,
@@ -31,24 +143,10 @@ def find_existing_job(
     company_stub: bool = False,
 ) -> JobPostingDB | None:
     """Find an existing posting matching the dedupe key."""
-    url = (url or "").strip()
-    company = (company or "").strip()
-    title = (title or "").strip()
-    if url:
-        return db.query(JobPostingDB).filter(JobPostingDB.source_url == url).first()
+    job_data: dict[str, Any] = {"company": company, "title": title, "source_url": url}
     if company_stub:
-        stub_key = title.lower()
-        rows = db.query(JobPostingDB).filter(JobPostingDB.company == company).all()
-        for row in rows:
-            row_title = (row.title or "").strip()
-            if row_title.lower() == stub_key or row_title.lower().startswith(f"{stub_key} ("):
-                return row
-        return None
-    return (
-        db.query(JobPostingDB)
-        .filter(JobPostingDB.company == company, JobPostingDB.title == title)
-        .first()
-    )
+        job_data["stub_title"] = title
+    return next(iter(find_existing_jobs(db, [job_data]).values()), None)
 
 
 def load_dedupe_keys(
@@ -60,16 +158,14 @@ def load_dedupe_keys(
         JobPostingDB.company,
         JobPostingDB.title,
         JobPostingDB.source_url,
+        JobPostingDB.dedupe_key,
     )
     if companies:
         q = q.filter(JobPostingDB.company.in_(list(companies)))
     keys: set[str] = set()
-    for company, title, source_url in q.all():
-        url = (source_url or "").strip()
-        co = (company or "").strip()
-        ti = (title or "").strip()
-        if url:
-            keys.add(job_dedupe_key(co, ti, url))
+    for company, title, source_url, dedupe_key in q.all():
+        if dedupe_key:
+            keys.add(dedupe_key)
         else:
-            keys.add(job_dedupe_key(co, ti, url))
+            keys.add(job_dedupe_key(company or "", title or "", source_url or ""))
     return keys
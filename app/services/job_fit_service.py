@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import re
+from collections.abc import Iterable
 from typing import Any
 
+from sqlalchemy import Integer, String, case, column, delete, func, insert, select, values
 from sqlalchemy.orm import Session
 
-from app.models.db_models import JobPostingDB
+from app.models.db_models import JobFitDocDB, JobFitTermDB, JobPostingDB
 from app.models.startup_model import UserProfile
 from app.services.bigset_import_service import BIGSET_SOURCE, _score_text_for_skills
 
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.\-]*")
+_MAX_TERM_LEN = 100
+_IN_CHUNK = 500
+
 
 def _job_text_blob(job: JobPostingDB) -> str:
     parts = [
@@ -57,6 +64,138 @@ def _is_imported_job(job: JobPostingDB, source: str) -> bool:
     return parsed.get("source") == source
 
 
+def fit_tokens(text: str) -> set[str]:
+    """Normalized whole-word tokens used by the fit index (keeps c++, c#, node.js)."""
+    return {
+        tok.rstrip(".-")
+        for tok in _TOKEN_RE.findall(text.lower())
+        if len(tok) <= _MAX_TERM_LEN and tok.rstrip(".-")
+    }
+
+
+def index_jobs_for_fit(db: Session, jobs: Iterable[JobPostingDB]) -> int:
+    """(Re)build fit-index entries for postings after insert or update.
+
+    Postings without an import ``source`` are only recorded as seen. The caller
+    owns the transaction. Returns the number of postings indexed.
+    """
+    jobs = [j for j in jobs if j.id is not None]
+    if not jobs:
+        return 0
+    ids = [j.id for j in jobs]
+    for start in range(0, len(ids), _IN_CHUNK):
+        chunk = ids[start : start + _IN_CHUNK]
+        db.execute(delete(JobFitTermDB).where(JobFitTermDB.job_id.in_(chunk)))
+        db.execute(delete(JobFitDocDB).where(JobFitDocDB.job_id.in_(chunk)))
+    docs: list[dict[str, Any]] = []
+    terms: list[dict[str, Any]] = []
+    for job in jobs:
+        parsed = job.content_json if isinstance(job.content_json, dict) else {}
+        source = parsed.get("source")
+        docs.append({"job_id": job.id, "source": source})
+        if source:
+            terms.extend(
+                {"job_id": job.id, "source": source, "term": term}
+                for term in fit_tokens(_job_text_blob(job))
+            )
+    db.execute(insert(JobFitDocDB), docs)
+    if terms:
+        db.execute(insert(JobFitTermDB), terms)
+    return len(jobs)
+
+
+def sync_fit_index(db: Session) -> int:
+    """Index postings that have no fit-index entry yet (e.g. written outside the import path).
+
+    Imports index their own rows, so indexed ids are not contiguous: missing
+    postings are found with an anti-join rather than an id watermark.
+    """
+    unindexed = ~select(JobFitDocDB.job_id).where(JobFitDocDB.job_id == JobPostingDB.id).exists()
+    last_id = 0
+    indexed = 0
+    while True:
+        batch = (
+            db.query(JobPostingDB)
+            .filter(JobPostingDB.id > last_id, unindexed)
+            .order_by(JobPostingDB.id)
+            .limit(_IN_CHUNK * 10)
+            .all()
+        )
+        if not batch:
+            break
+        indexed += index_jobs_for_fit(db, batch)
+        last_id = batch[-1].id
+    if indexed:
+        db.commit()
+    return indexed
+
+
+def _profile_terms(profile: UserProfile) -> tuple[list[set[str]], list[set[str]]]:
+    keywords = [
+        k.strip()
+        for k in (
+            list(profile.skills)
+            + list(profile.target_role_keywords)
+            + list(profile.preferred_categories)
+        )
+        if k and k.strip()
+    ]
+    locations = [loc for loc in profile.preferred_locations if loc.strip()]
+    return [fit_tokens(k) for k in keywords], [fit_tokens(loc) for loc in locations]
+
+
+def _score_by_index(
+    db: Session,
+    source: str,
+    keyword_terms: list[set[str]],
+    location_terms: list[set[str]],
+    min_score: float,
+    limit: int,
+) -> list[tuple[float, int]]:
+    """Score postings inside SQLite: one pass over matching index rows, top-``limit`` out."""
+    entries = [(k, term, len(terms), 0) for k, terms in enumerate(keyword_terms) for term in terms]
+    offset = len(keyword_terms)
+    entries += [
+        (offset + k, term, len(terms), 1)
+        for k, terms in enumerate(location_terms)
+        for term in terms
+    ]
+    if not entries:
+        return []
+    wanted = (
+        values(
+            column("k", Integer),
+            column("term", String),
+            column("n", Integer),
+            column("is_loc", Integer),
+            name="wanted",
+        )
+        .data(entries)
+        .cte("wanted")
+    )  # SQLite has no ``(VALUES ...) AS t (cols)`` form
+    # One row per (posting, keyword) whose tokens are all present.
+    matched = (
+        select(JobFitTermDB.job_id, wanted.c.k, func.max(wanted.c.is_loc).label("is_loc"))
+        .join(wanted, JobFitTermDB.term == wanted.c.term)
+        .where(JobFitTermDB.source == source)
+        .group_by(JobFitTermDB.job_id, wanted.c.k)
+        .having(func.count() == func.max(wanted.c.n))
+        .subquery()
+    )
+    raw = func.sum(1 - matched.c.is_loc) * 1.0 / len(keyword_terms) + case(
+        (func.max(matched.c.is_loc) == 1, 0.15), else_=0.0
+    )
+    fit = case((raw > 1.0, 1.0), else_=raw)
+    stmt = (
+        select(matched.c.job_id, fit)
+        .group_by(matched.c.job_id)
+        .having(fit >= min_score)
+        .order_by(fit.desc(), matched.c.job_id)
+        .limit(limit)
+    )
+    return [(float(score), job_id) for job_id, score in db.execute(stmt)]
+
+
 def rank_imported_jobs(
     db: Session,
     profile: UserProfile,
@@ -65,23 +204,41 @@ def rank_imported_jobs(
     limit: int = 20,
     min_score: float | None = None,
 ) -> list[dict[str, Any]]:
-    """Rank imported postings by profile fit."""
+    """Rank every imported posting of ``source`` by profile fit via the token index.
+
+    Keyword and location matches are whole-token: a multi-word keyword matches
+    when all its tokens occur in the posting.
+    """
     if min_score is None:
         min_score = profile.bigset.min_fit_score
 
-    rows = db.query(JobPostingDB).order_by(JobPostingDB.id.desc()).limit(500).all()
-    scored: list[tuple[float, JobPostingDB]] = []
-    for job in rows:
-        if not _is_imported_job(job, source):
-            continue
-        fit = score_job_against_profile(job, profile)
-        if fit < min_score:
-            continue
-        scored.append((fit, job))
+    sync_fit_index(db)
+    keyword_terms, location_terms = _profile_terms(profile)
+    docs = db.query(JobFitDocDB.job_id).filter(JobFitDocDB.source == source)
 
-    scored.sort(key=lambda x: (-x[0], x[1].id or 0))
+    scored: list[tuple[float, int]] = []
+    if not keyword_terms:
+        if 0.5 >= min_score:
+            ids = [row[0] for row in docs.order_by(JobFitDocDB.job_id).limit(limit)]
+            scored = [(0.5, job_id) for job_id in ids]
+    else:
+        scored = _score_by_index(db, source, keyword_terms, location_terms, min_score, limit)
+        if len(scored) < limit and min_score <= 0:
+            filler = (
+                docs.filter(JobFitDocDB.job_id.notin_([job_id for _, job_id in scored]))
+                .order_by(JobFitDocDB.job_id)
+                .limit(limit - len(scored))
+            )
+            scored.extend((0.0, row[0]) for row in filler)
+
+    jobs = {
+        j.id: j for j in db.query(JobPostingDB).filter(JobPostingDB.id.in_([i for _, i in scored]))
+    }
     out: list[dict[str, Any]] = []
-    for fit, job in scored[:limit]:
+    for fit, job_id in scored:
+        job = jobs.get(job_id)
+        if job is None:
+            continue
         out.append(
             {
                 "id": job.id,
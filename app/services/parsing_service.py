@@ -3,8 +3,10 @@
 Handles text extraction (PDF, DOCX, MD, TXT, LaTeX) and LLM-based structured parsing.
 """
 
+import hashlib
 import io
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, cast
 
@@ -17,6 +19,15 @@ from app.models.resume_model import Resume
 # Resolve prompt directory relative to this file
 _PROMPTS_DIR = Path(__file__).parent.parent / "prompts"
 
+# Bump when extract_text's output changes for the same bytes (new library,
+# different cleanup) so cached extractions are not reused.
+EXTRACTOR_VERSION = "1"
+
+
+class ResumeParseError(Exception):
+    """The LLM could not turn resume text into a structured Resume."""
+
+
 _liteparse_parser: Any = None
 try:
     from liteparse import LiteParse
@@ -161,49 +172,67 @@ def extract_text(file_content: bytes, filename: str) -> str:
         return ""
 
 
+@lru_cache
+def _load_prompt(filename: str, default: str) -> str:
+    """Read a prompt file once per process (restart to pick up edits)."""
+    prompt_path = _PROMPTS_DIR / filename
+    return prompt_path.read_text(encoding="utf-8") if prompt_path.exists() else default
+
+
+@lru_cache
+def _prompt_hash(prompt: str) -> str:
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
 class ParserLLM:
     """LLM client for parsing documents into structured data using Pydantic AI."""
 
     def __init__(self):
         logger.info("ParserLLM initialized (agents created on demand)")
 
+    @staticmethod
+    def _resume_system_prompt() -> str:
+        return _load_prompt("resume_parser_prompt.md", "Extract structured resume data.")
+
+    def resume_parser_version(self) -> str:
+        """Identifies what parse_resume would produce: prompt hash plus model."""
+        from app.core.model_registry import get_model_string
+
+        try:
+            model = get_model_string()
+        except Exception:
+            model = "unknown"
+        return f"{_prompt_hash(self._resume_system_prompt())[:16]}:{model}"[:128]
+
     async def parse_resume(self, text: str) -> Resume:
-        """Parse resume text into structured Resume data using Pydantic AI."""
+        """Parse resume text into structured Resume data using Pydantic AI.
+
+        Raises:
+            ResumeParseError: If the model call or output validation fails.
+        """
         try:
             from app.core.model_registry import create_agent
 
-            prompt_path = _PROMPTS_DIR / "resume_parser_prompt.md"
-            system_prompt = (
-                prompt_path.read_text(encoding="utf-8")
-                if prompt_path.exists()
-                else "Extract structured resume data."
-            )
-
             agent = create_agent(
                 output_type=Resume,
-                system_prompt=system_prompt,
+                system_prompt=self._resume_system_prompt(),
             )
             result = await agent.run(f"Parse this resume:\n\n{text[:8000]}")
             return cast(Resume, result.output)
         except Exception as e:
             logger.error(f"Resume parsing failed: {e}")
-            return Resume(summary=f"Parsing failed: {e}", raw_text=text[:2000])
+            raise ResumeParseError(str(e)) from e
 
     async def parse_job(self, text: str) -> JobPosting:
         """Parse job description text into structured JobPosting data using Pydantic AI."""
         try:
             from app.core.model_registry import create_agent
 
-            prompt_path = _PROMPTS_DIR / "job_parser_prompt.md"
-            system_prompt = (
-                prompt_path.read_text(encoding="utf-8")
-                if prompt_path.exists()
-                else "Extract structured job posting data."
-            )
-
             agent = create_agent(
                 output_type=JobPosting,
-                system_prompt=system_prompt,
+                system_prompt=_load_prompt(
+                    "job_parser_prompt.md", "Extract structured job posting data."
+                ),
             )
             result = await agent.run(f"Parse this job description:\n\n{text[:8000]}")
             return cast(JobPosting, result.output)
@@ -226,16 +255,31 @@ class ResumeParser:
             filename: Original filename.
 
         Returns:
-            Parsed Resume object.
+            Parsed Resume object; a placeholder whose summary starts with
+            "Parsing failed" (never cached) if the LLM parse fails.
         """
-        text = extract_text(file_content, filename)
+        from app.services import document_cache
+
+        key = document_cache.document_key(file_content, filename)
+        doc = await document_cache.load_document(file_content, filename, key)
+        text = doc.text
         if not text.strip():
             logger.warning(f"No text extracted from {filename}")
             return Resume(summary=f"Failed to extract text from: {filename}")
 
+        version = self.llm_client.resume_parser_version()
+        cached = document_cache.cached_resume(doc, version)
+        if cached is not None:
+            logger.info(f"Reusing parsed resume for {filename} (content hash match)")
+            return cached
+
         logger.info(f"Extracted {len(text)} chars from {filename}, sending to LLM...")
-        resume = await self.llm_client.parse_resume(text)
+        try:
+            resume = await self.llm_client.parse_resume(text)
+        except ResumeParseError as e:
+            return Resume(summary=f"Parsing failed: {e}", raw_text=text[:2000])
         resume.raw_text = text[:5000]
+        document_cache.store_resume(key, text, resume, version)
         return resume
 
 
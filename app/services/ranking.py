@@ -0,0 +1,169 @@
+"""Rank fusion for hybrid search.
+
+Every retrieval signal (vector similarity, BM25 keyword matches, profile fit)
+yields a ranked candidate list. :class:`Candidates` holds one such list as
+arrays, and a :class:`Fusion` merges any number of them in one vectorized
+pass over the union of candidate ids:
+
+- ``rrf``: reciprocal-rank fusion, ``sum(w / (k + rank))``. It only looks at
+  positions, so raw scores from different signals never need calibrating.
+- ``weighted``: min-max normalize each list's scores to [0, 1], then take a
+  weighted sum; a candidate missing from a list contributes 0 for it.
+
+The method, RRF ``k`` and per-signal weights come from settings
+(``SEARCH_FUSION_METHOD``, ``SEARCH_RRF_K``, ``SEARCH_FUSION_WEIGHTS``).
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import Any
+
+import numpy as np
+from loguru import logger
+
+from app.core.config import settings
+
+
+@dataclass(frozen=True)
+class Candidates:
+    """One signal's candidates, best first, with scores where higher is better."""
+
+    signal: str
+    ids: Sequence[str]
+    scores: np.ndarray
+
+    def __post_init__(self) -> None:
+        scores = np.asarray(self.scores, dtype=np.float64)
+        if scores.shape != (len(self.ids),):
+            raise ValueError(f"{self.signal}: {len(self.ids)} ids but {scores.shape} scores")
+        object.__setattr__(self, "scores", scores)
+
+    @classmethod
+    def from_hits(
+        cls,
+        signal: str,
+        hits: Iterable[Mapping[str, Any]],
+        score_key: str = "score",
+    ) -> "Candidates":
+        """Build from search hits (dicts with ``id`` and ``score_key``)."""
+        hits = list(hits)
+        return cls(
+            signal,
+            [str(h["id"]) for h in hits],
+            np.fromiter((h.get(score_key) or 0.0 for h in hits), np.float64, len(hits)),
+        )
+
+
+@dataclass(frozen=True)
+class FusedHit:
+    id: str
+    score: float
+    signals: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class FusedRanking:
+    """Fused order over the union of candidate ids.
+
+    ``raw`` holds each signal's original score per candidate (NaN where the
+    candidate was not in that signal's list), column order as ``signals``.
+    """
+
+    ids: list[str]
+    scores: np.ndarray
+    raw: np.ndarray
+    signals: tuple[str, ...]
+
+    def top(self, n: int | None = None) -> list[FusedHit]:
+        hits = []
+        for row in range(len(self.ids) if n is None else min(n, len(self.ids))):
+            present = ~np.isnan(self.raw[row])
+            hits.append(
+                FusedHit(
+                    id=self.ids[row],
+                    score=float(self.scores[row]),
+                    signals={
+                        s: float(v)
+                        for s, v, p in zip(self.signals, self.raw[row], present, strict=True)
+                        if p
+                    },
+                )
+            )
+        return hits
+
+
+class Fusion(ABC):
+    """Merges ranked candidate lists into one ranking."""
+
+    name: str
+
+    def __init__(self, weights: Mapping[str, float] | None = None) -> None:
+        self.weights = dict(weights or {})
+
+    def fuse(self, lists: Sequence[Candidates]) -> FusedRanking:
+        signals = tuple(c.signal for c in lists)
+        # Union of candidate ids in order of first appearance, so ties keep input order.
+        ids = list(dict.fromkeys(chain.from_iterable(c.ids for c in lists)))
+        index = dict(zip(ids, range(len(ids))))
+
+        n = len(ids)
+        # rank[i, j]: 1-based position of candidate i in list j (inf if absent).
+        rank = np.full((n, len(lists)), np.inf)
+        raw = np.full((n, len(lists)), np.nan)
+        for j, c in enumerate(lists):
+            rows = np.fromiter(map(index.__getitem__, c.ids), np.intp, len(c.ids))
+            # Reversed so the best position wins for ids listed twice.
+            rank[rows[::-1], j] = np.arange(len(rows), 0, -1)
+            raw[rows[::-1], j] = c.scores[::-1]
+
+        weights = np.array([self.weights.get(s, 1.0) for s in signals])
+        fused = self._combine(rank, raw) @ weights if n else np.zeros(0)
+        order = np.argsort(-fused, kind="stable")
+        return FusedRanking(
+            ids=[ids[i] for i in order],
+            scores=fused[order],
+            raw=raw[order],
+            signals=signals,
+        )
+
+    @abstractmethod
+    def _combine(self, rank: np.ndarray, raw: np.ndarray) -> np.ndarray:
+        """Per-candidate, per-signal contribution (n x signals) before weighting."""
+
+
+class RRFFusion(Fusion):
+    name = "rrf"
+
+    def __init__(self, k: int = 60, weights: Mapping[str, float] | None = None) -> None:
+        super().__init__(weights)
+        self.k = k
+
+    def _combine(self, rank: np.ndarray, raw: np.ndarray) -> np.ndarray:
+        return 1.0 / (self.k + rank)
+
+
+class WeightedFusion(Fusion):
+    name = "weighted"
+
+    def _combine(self, rank: np.ndarray, raw: np.ndarray) -> np.ndarray:
+        absent = np.isnan(raw)
+        low = np.where(absent, np.inf, raw).min(axis=0, initial=np.inf)
+        high = np.where(absent, -np.inf, raw).max(axis=0, initial=-np.inf)
+        span = high - low
+        with np.errstate(invalid="ignore", divide="ignore"):
+            # A list whose scores are all equal ranks its members equally best.
+            norm = np.where(span > 0, (raw - low) / span, 1.0)
+        return np.where(absent, 0.0, norm)
+
+
+def get_fusion(method: str | None = None) -> Fusion:
+    """Fusion configured by settings (``method`` overrides SEARCH_FUSION_METHOD)."""
+    method = (method or settings.SEARCH_FUSION_METHOD).lower()
+    weights = settings.SEARCH_FUSION_WEIGHTS
+    if method == "weighted":
+        return WeightedFusion(weights)
+    if method != "rrf":
+        logger.warning(f"Unknown SEARCH_FUSION_METHOD={method!r}, using 'rrf'")
+    return RRFFusion(k=settings.SEARCH_RRF_K, weights=weights)
@@ -18,35 +18,53 @@ class RecommendationService:
         self.db_service = db_service
 
     async def recommend_jobs_for_resume(
-        self, resume_id: int, limit: int = 10
+        self, resume_id: int, limit: int = 10, filters: dict[str, Any] | None = None
     ) -> list[dict[str, Any]]:
-        resume = self._get_record("resumes", resume_id)
-        if not resume:
-            logger.warning(f"Resume {resume_id} not found")
-            return []
+        """Jobs most similar to a resume; ``filters`` as in ``SearchService.search_jobs``.
 
-        query_text = resume.get("raw_text") or self._extract_text_from_json(
-            resume.get("content_json")
+        Searches with the resume's already indexed vector; only a resume that
+        was never indexed is loaded and its text embedded.
+        """
+        results = await self.search_service.search_similar(
+            "jobs", "resumes", f"resume_{resume_id}", n_results=limit, filters=filters
         )
-        if not query_text:
-            logger.warning(f"Resume {resume_id} has no text content")
-            return []
+        if results is None:
+            resume = self._get_record("resumes", resume_id)
+            if not resume:
+                logger.warning(f"Resume {resume_id} not found")
+                return []
+
+            query_text = resume.get("raw_text") or self._extract_text_from_json(
+                resume.get("content_json")
+            )
+            if not query_text:
+                logger.warning(f"Resume {resume_id} has no text content")
+                return []
 
-        results = await self.search_service.search_jobs(query_text, n_results=limit)
+            results = await self.search_service.search_jobs(
+                query_text, n_results=limit, filters=filters
+            )
         return self._enrich_with_db_data(results, "jobs", "job_id")
 
     async def recommend_resumes_for_job(self, job_id: int, limit: int = 10) -> list[dict[str, Any]]:
-        job = self._get_record("job_postings", job_id)
-        if not job:
-            logger.warning(f"Job {job_id} not found")
-            return []
-
-        query_text = job.get("raw_text") or self._extract_text_from_json(job.get("content_json"))
-        if not query_text:
-            logger.warning(f"Job {job_id} has no text content")
-            return []
+        """Resumes most similar to a job, via its indexed vector when there is one."""
+        results = await self.search_service.search_similar(
+            "resumes", "jobs", f"job_{job_id}", n_results=limit
+        )
+        if results is None:
+            job = self._get_record("job_postings", job_id)
+            if not job:
+                logger.warning(f"Job {job_id} not found")
+                return []
+
+            query_text = job.get("raw_text") or self._extract_text_from_json(
+                job.get("content_json")
+            )
+            if not query_text:
+                logger.warning(f"Job {job_id} has no text content")
+                return []
 
-        results = await self.search_service.search_resumes(query_text, n_results=limit)
+            results = await self.search_service.search_resumes(query_text, n_results=limit)
         return self._enrich_with_db_data(results, "resumes", "resume_id")
 
     def get_skill_gap_analysis(self, resume_id: int, job_id: int) -> dict[str, Any]:
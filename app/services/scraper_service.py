@@ -1,19 +1,27 @@
 """Career Scraper Service — TinyFish primary, Kimi WebBridge / Crawl4AI fallbacks.
 
 All scrapers inherit from BaseCareerScraper which provides the template method
-scrape_careers(): normalise URL, iterate career paths, fetch content, check for
-keywords, homepage fallback. Subclasses only implement _fetch_content().
+scrape_careers(): normalise URL, try the cached path for the domain, probe career
+paths concurrently, check for keywords, homepage fallback. Subclasses only
+implement _fetch_content().
 """
 
 import asyncio
+import json
 import os
+import threading
 from abc import ABC, abstractmethod
+from pathlib import Path
 from typing import Any
 from urllib.parse import urljoin
 
 from loguru import logger
 
+from app.core.config import settings
 from app.services.career_scraper import CAREER_KEYWORDS, CAREER_PATHS
+from app.services.host_limiter import HostLimiter, host_key
+from app.services.http_cache import cached_fetch_text
+from app.services.http_client import http_post
 
 logfire: Any = None
 try:
@@ -57,21 +65,89 @@ def _normalise_url(website: str) -> str:
     return website.rstrip("/")
 
 
+def _is_career_page(content: str | None) -> bool:
+    return content is not None and any(kw in content.lower() for kw in CAREER_KEYWORDS)
+
+
+# Response-cache source (TTL bucket) for career page fetches.
+CAREER_PAGE_SOURCE = "career_page"
+
+# Cached path value meaning "the homepage itself is the career page".
+HOMEPAGE_PATH = "/"
+
+
+class CareerPathCache:
+    """Per-domain memory of the career path that last matched, persisted as JSON."""
+
+    def __init__(self, path: Path | None = None):
+        self._path = path
+        self._lock = threading.Lock()
+        self._paths: dict[str, str] = {}
+        if path is not None and path.exists():
+            try:
+                self._paths = dict(json.loads(path.read_text()))
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable career path cache {path}: {e}")
+
+    def get(self, domain: str) -> str | None:
+        return self._paths.get(domain)
+
+    def set(self, domain: str, path: str) -> None:
+        with self._lock:
+            if self._paths.get(domain) == path:
+                return
+            self._paths[domain] = path
+            self._save()
+
+    def forget(self, domain: str) -> None:
+        with self._lock:
+            if self._paths.pop(domain, None) is not None:
+                self._save()
+
+    def _save(self) -> None:
+        if self._path is None:
+            return
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._path.write_text(json.dumps(self._paths, indent=2, sort_keys=True))
+        except OSError as e:
+            logger.debug(f"Could not write career path cache {self._path}: {e}")
+
+
+_path_cache: CareerPathCache | None = None
+
+
+def get_career_path_cache() -> CareerPathCache:
+    """Process-wide career path cache at ``CAREER_PATH_CACHE_PATH``."""
+    global _path_cache
+    if _path_cache is None:
+        _path_cache = CareerPathCache(Path(settings.CAREER_PATH_CACHE_PATH))
+    return _path_cache
+
+
 class BaseCareerScraper(ABC):
     """Abstract base for career page scrapers.
 
     Subclasses implement _fetch_content() and may override _ensure_ready().
-    The template method scrape_careers() handles URL normalisation, career-path
-    iteration, keyword matching, and homepage fallback.
+    The template method scrape_careers() handles URL normalisation, the cached
+    per-domain path, concurrent career-path probing, keyword matching, and
+    homepage fallback.
     """
 
     _scraper_tag: str = "scraper"
+    # Career paths fetched at once per site; None uses SCRAPER_PROBE_CONCURRENCY.
+    probe_concurrency: int | None = None
+    path_cache: CareerPathCache | None = None
 
     @abstractmethod
     async def _fetch_content(self, url: str) -> str | None:
         """Fetch page content from a single URL. Return None on failure or empty page."""
         ...
 
+    async def _fetch_page(self, url: str) -> str | None:
+        """``_fetch_content`` behind the response cache's career-page TTL."""
+        return await cached_fetch_text(CAREER_PAGE_SOURCE, url, self._fetch_content)
+
     async def _ensure_ready(self) -> bool:
         """Override for lazy initialisation / availability check.
         Called once at the start of scrape_careers(). Return True if ready.
@@ -84,26 +160,82 @@ class BaseCareerScraper(ABC):
             return ""
 
         website = _normalise_url(website)
+        domain = host_key(website)
+        cache = self.path_cache or get_career_path_cache()
 
         with _span(f"{self._scraper_tag}_scrape_careers", website=website):
-            for path in CAREER_PATHS:
-                content = await self._fetch_content(urljoin(website, path))
-                if content and any(kw in content.lower() for kw in CAREER_KEYWORDS):
-                    _info(
-                        "career_page_found",
-                        scraper=self._scraper_tag,
-                        website=website,
-                        path=path,
-                    )
-                    return content
+            cached = cache.get(domain)
+            if cached is not None:
+                content = await self._fetch_page(urljoin(website, cached))
+                if _is_career_page(content):
+                    _info("career_page_cached", scraper=self._scraper_tag, website=website)
+                    return content or ""
+                cache.forget(domain)
+
+            paths = [p for p in CAREER_PATHS if p != cached]
+            path, content = await self._probe_paths(website, paths)
+            if path is not None:
+                _info(
+                    "career_page_found",
+                    scraper=self._scraper_tag,
+                    website=website,
+                    path=path,
+                )
+                cache.set(domain, path)
+                return content
 
             # Homepage fallback
-            content = await self._fetch_content(website)
-            if content and any(kw in content.lower() for kw in CAREER_KEYWORDS):
-                return content
+            if cached != HOMEPAGE_PATH:
+                content = await self._fetch_page(website)
+                if _is_career_page(content):
+                    cache.set(domain, HOMEPAGE_PATH)
+                    return content or ""
 
         return ""
 
+    async def _probe_paths(self, website: str, paths: list[str]) -> tuple[str | None, str]:
+        """Fetch career paths concurrently; return the best-ranked match and cancel the rest.
+
+        ``paths`` is in priority order. A match is returned only once every
+        higher-ranked path has come back empty, so a fast ``/jobs`` never beats
+        a slower ``/careers``. Probing has its own small per-site budget:
+        ``SCRAPER_PROBE_CONCURRENCY`` requests in flight, with starts spaced
+        ``SCRAPER_PROBE_MIN_INTERVAL_SECONDS`` apart.
+        """
+        if not paths:
+            return None, ""
+        limiter = HostLimiter(
+            per_host=self.probe_concurrency or settings.SCRAPER_PROBE_CONCURRENCY,
+            min_interval=settings.SCRAPER_PROBE_MIN_INTERVAL_SECONDS,
+        )
+
+        async def _probe(rank: int) -> tuple[int, str | None]:
+            async with limiter.slot(website):
+                try:
+                    return rank, await self._fetch_page(urljoin(website, paths[rank]))
+                except Exception as e:
+                    logger.debug(
+                        f"{self._scraper_tag} probe failed for {website}{paths[rank]}: {e}"
+                    )
+                    return rank, None
+
+        tasks = [asyncio.create_task(_probe(rank)) for rank in range(len(paths))]
+        results: dict[int, str | None] = {}
+        best = 0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                rank, content = await next_done
+                results[rank] = content
+                while best in results:
+                    if _is_career_page(results[best]):
+                        return paths[best], results[best] or ""
+                    best += 1
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return None, ""
+
     async def scrape_multiple(self, websites: list[str], max_concurrent: int = 5) -> dict[str, str]:
         """Scrape career pages from multiple websites concurrently."""
         if not await self._ensure_ready():
@@ -172,6 +304,8 @@ class KimiWebBridgeScraper(BaseCareerScraper):
     """
 
     _scraper_tag = "kimi"
+    # One shared browser: navigate + snapshot must not interleave across paths.
+    probe_concurrency = 1
     BASE_URL = "http://127.0.0.1:10086/command"
 
     def __init__(self):
@@ -181,14 +315,13 @@ class KimiWebBridgeScraper(BaseCareerScraper):
         if self._ready is not None:
             return self._ready
         try:
-            import httpx
-
-            async with httpx.AsyncClient(timeout=2.0) as client:
-                resp = await client.post(
-                    self.BASE_URL,
-                    json={"command": "navigate", "url": "about:blank"},
-                )
-                self._ready = resp.status_code < 500
+            resp = await http_post(
+                self.BASE_URL,
+                json={"command": "navigate", "url": "about:blank"},
+                timeout=2.0,
+                retries=0,
+            )
+            self._ready = resp.status_code < 500
         except Exception:
             self._ready = False
         if not self._ready:
@@ -196,32 +329,34 @@ class KimiWebBridgeScraper(BaseCareerScraper):
         return self._ready
 
     async def _fetch_content(self, url: str) -> str | None:
-        import httpx
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                nav_resp = await client.post(
-                    self.BASE_URL,
-                    json={"command": "navigate", "url": url},
-                )
-                if nav_resp.status_code >= 400:
-                    return None
-
-                await asyncio.sleep(2)
+        # Browser commands are stateful, so they are never retried.
+        try:
+            nav_resp = await http_post(
+                self.BASE_URL,
+                json={"command": "navigate", "url": url},
+                timeout=30.0,
+                retries=0,
+            )
+            if nav_resp.status_code >= 400:
+                return None
 
-                snap_resp = await client.post(
-                    self.BASE_URL,
-                    json={"command": "snapshot"},
-                )
-                if snap_resp.status_code >= 400:
-                    return None
+            await asyncio.sleep(2)
 
-                data = snap_resp.json()
-                return (data.get("content") or data.get("text")) or None
-            except Exception as e:
-                logger.debug(f"Kimi WebBridge failed for {url}: {e}")
+            snap_resp = await http_post(
+                self.BASE_URL,
+                json={"command": "snapshot"},
+                timeout=30.0,
+                retries=0,
+            )
+            if snap_resp.status_code >= 400:
                 return None
 
+            data = snap_resp.json()
+            return (data.get("content") or data.get("text")) or None
+        except Exception as e:
+            logger.debug(f"Kimi WebBridge failed for {url}: {e}")
+            return None
+
 
 class Crawl4AIScraper(BaseCareerScraper):
     """OPTIONAL: Local Playwright-based scraper. Free, no API key, needs Chromium."""
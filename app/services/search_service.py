@@ -1,77 +1,127 @@
-"""Hybrid search combining vector similarity + keyword matching."""
+"""Hybrid search fusing vector similarity and keyword (BM25) rankings."""
 
 import re
+from collections.abc import Sequence
 from typing import Any
 
 from loguru import logger
 
+from app.models.db_models import JobPostingDB
 from app.services.db_service import DatabaseService
-from app.services.vector_store import VectorStore, get_vector_store
+from app.services.ranking import Candidates, Fusion, get_fusion
+from app.services.vector_store import (
+    PAYLOAD_INDEXES,
+    UPSERT_BATCH_SIZE,
+    VectorBackend,
+    get_vector_store,
+)
+
+# Vector collections that have a keyword (FTS5) index, and the table behind it.
+_KEYWORD_TABLES = {"resumes": "resumes", "jobs": "job_postings"}
+# Job ids per IN (...) lookup of stored postings.
+_IN_CHUNK = 500
 
 
 class SearchService:
     """Hybrid search across resumes and jobs.
 
-    Combines Qdrant vector similarity with keyword matching from the
-    relational database, producing a merged and re-ranked result set.
+    Combines Qdrant vector similarity with BM25 keyword matching from the
+    relational database, merged by a pluggable rank fusion (``ranking``).
     """
 
     def __init__(
         self,
-        vector_store: VectorStore | None = None,
+        vector_store: VectorBackend | None = None,
         db_service: DatabaseService | None = None,
+        fusion: Fusion | None = None,
     ):
         self.vector_store = vector_store or get_vector_store()
         self.db_service = db_service
+        self.fusion = fusion or get_fusion()
 
-    async def search_resumes(self, query: str, n_results: int = 10) -> list[dict[str, Any]]:
+    async def search_resumes(
+        self, query: str, n_results: int = 10, filters: dict[str, Any] | None = None
+    ) -> list[dict[str, Any]]:
         """Search resumes by semantic similarity."""
-        return await self.vector_store.search("resumes", query, n_results)
+        return await self.vector_store.search("resumes", query, n_results, filter_by=filters)
 
-    async def search_jobs(self, query: str, n_results: int = 10) -> list[dict[str, Any]]:
-        """Search jobs by semantic similarity."""
-        return await self.vector_store.search("jobs", query, n_results)
+    async def search_jobs(
+        self, query: str, n_results: int = 10, filters: dict[str, Any] | None = None
+    ) -> list[dict[str, Any]]:
+        """Search jobs by semantic similarity.
 
-    async def hybrid_search(
+        ``filters`` are pushed down into the vector store (payload fields such
+        as ``source``, ``company``, ``location``, ``mapping_id``, ``job_id``):
+        an exact value, a list of accepted values, or a range dict like
+        ``{"gte": 100}``.
+        """
+        return await self.vector_store.search("jobs", query, n_results, filter_by=filters)
+
+    async def search_similar(
         self,
-        query: str,
         collection: str,
+        source_collection: str,
+        doc_id: str,
         n_results: int = 10,
-    ) -> list[dict[str, Any]]:
-        """Combine vector similarity with keyword matching.
+        filters: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]] | None:
+        """Search ``collection`` with the stored vector of ``doc_id`` (no embedding call).
 
-        Fetches 2x from vector store, applies keyword boost, then re-ranks.
+        Returns None when ``doc_id`` has no vector in ``source_collection``, so
+        callers can fall back to embedding its text.
         """
-        vector_results = await self.vector_store.search(collection, query, n_results * 2)
-        keyword_results = self._keyword_search(collection, query)
-
-        keyword_ids = {r["id"] for r in keyword_results}
-        keywords = self._tokenize(query)
+        vector = self.vector_store.get_vector(source_collection, doc_id)
+        if vector is None:
+            return None
+        return self.vector_store.search_by_vector(collection, vector, n_results, filter_by=filters)
 
-        seen: dict[str, dict[str, Any]] = {}
-
-        for item in vector_results:
-            doc_id = item["id"]
-            distance = item.get("distance") or 1.0
-            score = 1.0 - distance
+    async def hybrid_search(
+        self,
+        query: str,
+        collection: str,
+        n_results: int = 10,
+        extra: Sequence[Candidates] = (),
+        filters: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fuse vector similarity and BM25 keyword rankings (plus ``extra`` signals).
 
-            keyword_boost = 0.2 if doc_id in keyword_ids else 0.0
-            text_lower = (item.get("text") or "").lower()
-            term_boost = sum(0.05 for kw in keywords if kw in text_lower)
+        Fetches 2x from the vector store and the full-text index, then ranks the
+        union with ``self.fusion``. Each result's ``score`` is the fused score and
+        ``signals`` holds the raw per-signal scores it was built from. Candidates
+        that only appear in ``extra`` come back as ``{"id": ...}`` stubs.
 
-            item["score"] = min(score + keyword_boost + term_boost, 1.0)
-            seen[doc_id] = item
+        ``filters`` (as in ``search_jobs``) restrict both the vector and the
+        keyword query; ``extra`` lists are expected to be filtered already.
+        """
+        vector_results = await self.vector_store.search(
+            collection, query, n_results * 2, filter_by=filters
+        )
+        keyword_results = self._keyword_search(
+            collection, query, limit=n_results * 2, filters=filters
+        )
 
-        for item in keyword_results:
-            doc_id = item["id"]
-            if doc_id not in seen:
-                text_lower = (item.get("text") or "").lower()
-                term_boost = sum(0.05 for kw in keywords if kw in text_lower)
-                item["score"] = 0.3 + term_boost
-                seen[doc_id] = item
+        items: dict[str, dict[str, Any]] = {str(r["id"]): r for r in keyword_results}
+        for hit in vector_results:
+            doc_id = str(hit["id"])
+            if doc_id in items:
+                hit["metadata"] = {**items[doc_id]["metadata"], **(hit.get("metadata") or {})}
+            items[doc_id] = hit
 
-        ranked = sorted(seen.values(), key=lambda x: x.get("score", 0), reverse=True)
-        return ranked[:n_results]
+        ranking = self.fusion.fuse(
+            [
+                Candidates.from_hits("vector", vector_results),
+                Candidates.from_hits("keyword", keyword_results, score_key="keyword_score"),
+                *extra,
+            ]
+        )
+        results = []
+        for fused in ranking.top(n_results):
+            item = dict(items.get(fused.id, {"id": fused.id}))
+            item.pop("keyword_score", None)
+            item["score"] = fused.score
+            item["signals"] = fused.signals
+            results.append(item)
+        return results
 
     async def index_resume(self, resume_id: int, text: str, metadata: dict[str, Any] | None = None):
         """Index a resume in the vector store."""
@@ -80,41 +130,122 @@ class SearchService:
         logger.info(f"Indexed resume {resume_id}")
 
     async def index_job(self, job_id: int, text: str, metadata: dict[str, Any] | None = None):
-        """Index a job posting in the vector store."""
-        meta = {"type": "job", "job_id": job_id, **(metadata or {})}
+        """Index a job posting in the vector store (payload as in ``index_jobs``)."""
+        stored = self._stored_job_payloads([job_id]).get(job_id, {})
+        meta = {"type": "job", "job_id": job_id, **(metadata or {}), **stored}
         await self.vector_store.add_document("jobs", f"job_{job_id}", text, meta)
         logger.info(f"Indexed job {job_id}")
 
-    def _keyword_search(self, collection: str, query: str) -> list[dict[str, Any]]:
-        """Keyword search against the relational DB (if available)."""
+    async def index_jobs(self, jobs: list[dict[str, Any]]) -> int:
+        """Bulk-index job postings with batched embeddings and upserts.
+
+        Each item needs ``job_id`` and ``text``; ``metadata`` is optional. The
+        stored posting's filterable fields (:func:`job_payload`) are merged in
+        and win over ``metadata``, so vector filters agree with the keyword
+        filters that read the same columns. Returns the number of jobs indexed.
+        """
+        stored = self._stored_job_payloads([job["job_id"] for job in jobs])
+        documents = [
+            {
+                "id": f"job_{job['job_id']}",
+                "text": job["text"],
+                "metadata": {
+                    "type": "job",
+                    "job_id": job["job_id"],
+                    **(job.get("metadata") or {}),
+                    **stored.get(job["job_id"], {}),
+                },
+            }
+            for job in jobs
+        ]
+        indexed = await self.vector_store.add_documents("jobs", documents)
+        logger.info(f"Indexed {indexed} jobs")
+        return indexed
+
+    def _stored_job_payloads(self, job_ids: list[int]) -> dict[int, dict[str, Any]]:
+        """:func:`job_payload` of each stored posting in ``job_ids``."""
+        from app.services.db_service import get_db_session
+
+        if not job_ids:
+            return {}
+        db = self.db_service.db if self.db_service else get_db_session()
+        try:
+            payloads: dict[int, dict[str, Any]] = {}
+            for start in range(0, len(job_ids), _IN_CHUNK):
+                chunk = job_ids[start : start + _IN_CHUNK]
+                for job in db.query(JobPostingDB).filter(JobPostingDB.id.in_(chunk)):
+                    payloads[job.id] = job_payload(job)
+            return payloads
+        finally:
+            if not self.db_service:
+                db.close()
+
+    def backfill_job_payloads(self, batch_size: int = UPSERT_BATCH_SIZE) -> int:
+        """Copy the filterable fields of every job posting onto its indexed point.
+
+        Points written before payload filtering lack ``PAYLOAD_INDEXES["jobs"]``
+        fields and are silently dropped by filtered searches (e.g. the BigSet
+        ``source`` filter in discovery). Only payloads are updated; nothing is
+        re-embedded. Returns the number of points updated.
+        """
+        if not self.db_service or not self.vector_store.is_available:
+            return 0
+        db = self.db_service.db
+        updated = 0
+        last_id = 0
+        while True:
+            batch = (
+                db.query(JobPostingDB)
+                .filter(JobPostingDB.id > last_id)
+                .order_by(JobPostingDB.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not batch:
+                break
+            updated += self.vector_store.set_payload(
+                "jobs", {f"job_{job.id}": job_payload(job) for job in batch}
+            )
+            last_id = batch[-1].id
+        logger.info(f"Backfilled payload fields on {updated} job vectors")
+        return updated
+
+    def _keyword_search(
+        self,
+        collection: str,
+        query: str,
+        limit: int = 50,
+        filters: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """BM25 keyword search against the relational DB's full-text index (if available)."""
         if not self.db_service:
             return []
 
+        table = _KEYWORD_TABLES.get(collection)
+        keywords = self._tokenize(query)
+        if table is None or not keywords:
+            return []
+
         try:
-            table = "resumes" if collection == "resumes" else "job_postings"
-            text_col = "raw_text"
-            records = self.db_service.query_records(table, limit=50)
-
-            keywords = self._tokenize(query)
-            if not keywords:
-                return []
-
-            results = []
-            for rec in records:
-                raw = (rec.get(text_col) or "").lower()
-                if any(kw in raw for kw in keywords):
-                    results.append(
-                        {
-                            "id": f"{collection[:-1]}_{rec.get('id', '')}",
-                            "text": rec.get(text_col, ""),
-                            "metadata": {k: v for k, v in rec.items() if k != text_col},
-                        }
-                    )
-            return results
+            records = self.db_service.keyword_search(table, keywords, limit=limit, filters=filters)
         except Exception as e:
             logger.warning(f"Keyword search failed: {e}")
             return []
 
+        prefix = collection[:-1]
+        return [
+            {
+                "id": f"{prefix}_{rec['id']}",
+                "text": rec.get("raw_text") or "",
+                "keyword_score": rec["keyword_score"],
+                "metadata": {
+                    f"{prefix}_id": int(rec["id"]),
+                    **{k: v for k, v in rec.items() if k not in ("raw_text", "keyword_score")},
+                },
+            }
+            for rec in records
+        ]
+
     @staticmethod
     def _tokenize(text: str) -> list[str]:
         words = re.findall(r"\b\w{3,}\b", text.lower())
@@ -141,8 +272,15 @@ class SearchService:
         return [w for w in words if w not in stopwords]
 
 
+def job_payload(job: JobPostingDB) -> dict[str, Any]:
+    """The ``PAYLOAD_INDEXES["jobs"]`` fields of a stored posting (None values left out)."""
+    content = job.content_json if isinstance(job.content_json, dict) else {}
+    fields = {**content, "company": job.company, "location": job.location, "job_id": job.id}
+    return {key: fields[key] for key in PAYLOAD_INDEXES["jobs"] if fields.get(key) is not None}
+
+
 def get_search_service(
-    vector_store: VectorStore | None = None,
+    vector_store: VectorBackend | None = None,
     db_service: DatabaseService | None = None,
 ) -> SearchService:
     """Create a SearchService instance."""
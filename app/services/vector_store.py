@@ -1,21 +1,30 @@
 """Qdrant file-based vector storage for document embeddings."""
 
+import asyncio
 import uuid
+import warnings
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Protocol
 
 from loguru import logger
 
+from app.core.config import settings
 from app.services.embedding_service import EmbeddingService, get_embedding_service
 
 try:
     from qdrant_client import QdrantClient
     from qdrant_client.models import (
+        Condition,
         Distance,
         FieldCondition,
         Filter,
+        MatchAny,
         MatchValue,
+        PayloadSchemaType,
         PointStruct,
+        Range,
+        SetPayload,
+        SetPayloadOperation,
         VectorParams,
     )
 
@@ -24,10 +33,72 @@ except ImportError:
     QDRANT_AVAILABLE = False
     logger.warning("qdrant-client not installed — vector store will be unavailable")
 
-
 QDRANT_PATH = Path("data") / "qdrant"
 COLLECTION_NAMES = ("resumes", "jobs", "cover_letters")
 VECTOR_DIM = 384
+# Inputs per embedding request; fits the smallest common provider cap (Cohere: 96).
+EMBED_BATCH_SIZE = 96
+EMBED_CONCURRENCY = 4
+UPSERT_BATCH_SIZE = 512
+# Payload fields indexed per collection (Qdrant schema type), for filtered search.
+PAYLOAD_INDEXES: dict[str, dict[str, str]] = {
+    "jobs": {
+        "source": "keyword",
+        "company": "keyword",
+        "location": "keyword",
+        "mapping_id": "keyword",
+        "job_id": "integer",
+    },
+}
+# ``filter_by`` range operators, as {"field": {"gte": 1, "lt": 10}}.
+RANGE_OPERATORS = {"gt": ">", "gte": ">=", "lt": "<", "lte": "<="}
+
+
+class VectorBackend(Protocol):
+    """API shared by the vector store backends (:class:`VectorStore`, ``FlatVectorStore``).
+
+    Documents are ``{"id", "text", "metadata"}`` dicts and search results add a
+    ``score`` (higher is better); ``filter_by`` is described on ``search``.
+    """
+
+    async def add_document(
+        self,
+        collection: str,
+        doc_id: str,
+        text: str,
+        metadata: dict[str, Any] | None = None,
+    ) -> None: ...
+
+    async def add_documents(self, collection: str, documents: list[dict[str, Any]]) -> int: ...
+
+    async def search(
+        self,
+        collection: str,
+        query_text: str,
+        n_results: int = 5,
+        filter_by: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]: ...
+
+    def search_by_vector(
+        self,
+        collection: str,
+        vector: list[float],
+        n_results: int = 5,
+        filter_by: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]: ...
+
+    def get_vector(self, collection: str, doc_id: str) -> list[float] | None: ...
+
+    def set_payload(self, collection: str, payloads: dict[str, dict[str, Any]]) -> int: ...
+
+    def delete_document(self, collection: str, doc_id: str) -> None: ...
+
+    def get_collection_stats(self, collection: str) -> dict[str, Any]: ...
+
+    def get_all_stats(self) -> dict[str, Any]: ...
+
+    @property
+    def is_available(self) -> bool: ...
 
 
 class VectorStore:
@@ -72,6 +143,7 @@ class VectorStore:
                         collection_name=name,
                         vectors_config=VectorParams(size=VECTOR_DIM, distance=Distance.COSINE),
                     )
+                self._create_payload_indexes(name)
             logger.info(f"VectorStore: initialized at {self._persist_dir}")
         except Exception as e:
             logger.error(f"VectorStore init failed: {e}")
@@ -85,6 +157,25 @@ class VectorStore:
                 collection_name=name,
                 vectors_config=VectorParams(size=VECTOR_DIM, distance=Distance.COSINE),
             )
+            self._create_payload_indexes(name)
+
+    def _create_payload_indexes(self, name: str):
+        """Index the filterable payload fields of a collection (idempotent).
+
+        Embedded (path-based) Qdrant evaluates filters without indexes and only
+        warns here; the indexes take effect against a Qdrant server.
+        """
+        assert self._client is not None
+        indexed = self._client.get_collection(name).payload_schema or {}
+        for field, schema in PAYLOAD_INDEXES.get(name, {}).items():
+            if field not in indexed:
+                with warnings.catch_warnings():
+                    warnings.filterwarnings("ignore", "Payload indexes have no effect")
+                    self._client.create_payload_index(
+                        collection_name=name,
+                        field_name=field,
+                        field_schema=PayloadSchemaType(schema),
+                    )
 
     async def add_document(
         self,
@@ -105,14 +196,74 @@ class VectorStore:
         self._client.upsert(collection_name=collection, points=[point])
         logger.debug(f"VectorStore: upserted {doc_id} into {collection}")
 
+    async def add_documents(
+        self,
+        collection: str,
+        documents: list[dict[str, Any]],
+        *,
+        embed_batch_size: int = EMBED_BATCH_SIZE,
+        max_concurrency: int = EMBED_CONCURRENCY,
+        upsert_batch_size: int = UPSERT_BATCH_SIZE,
+    ) -> int:
+        """Embed and upsert many documents with batched provider calls.
+
+        ``documents`` items use the same shape as search results: ``id``,
+        ``text`` and optional ``metadata``. Texts are embedded via
+        ``embed_batch`` in ``embed_batch_size`` slices (at most
+        ``max_concurrency`` in flight) and upserted ``upsert_batch_size``
+        points at a time. Returns the number of points written.
+        """
+        if not documents:
+            return 0
+        self._ensure_collection(collection)
+        assert self._client is not None
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _embed(texts: list[str]) -> list[list[float]]:
+            async with semaphore:
+                return await self._embedding_service.embed_batch(texts)
+
+        written = 0
+        for start in range(0, len(documents), upsert_batch_size):
+            window = documents[start : start + upsert_batch_size]
+            texts = [doc["text"] for doc in window]
+            embedded = await asyncio.gather(
+                *(
+                    _embed(texts[i : i + embed_batch_size])
+                    for i in range(0, len(texts), embed_batch_size)
+                )
+            )
+            vectors = [vec for batch in embedded for vec in batch]
+            points = [
+                PointStruct(
+                    id=str(uuid.uuid5(uuid.NAMESPACE_URL, doc["id"])),
+                    vector=vector,
+                    payload={
+                        "text": doc["text"],
+                        "doc_id": doc["id"],
+                        **(doc.get("metadata") or {}),
+                    },
+                )
+                for doc, vector in zip(window, vectors)
+            ]
+            self._client.upsert(collection_name=collection, points=points)
+            written += len(points)
+        logger.debug(f"VectorStore: upserted {written} documents into {collection}")
+        return written
+
     async def search(
         self,
         collection: str,
         query_text: str,
         n_results: int = 5,
-        filter_by: dict[str, str] | None = None,
+        filter_by: dict[str, Any] | None = None,
     ) -> list[dict[str, Any]]:
-        """Search a collection by query text."""
+        """Search a collection by query text.
+
+        ``filter_by`` is applied inside Qdrant before the top-k cut. Each field
+        matches a value exactly, any value of a list, or a range given as a
+        dict of ``RANGE_OPERATORS`` (``{"job_id": {"gte": 100}}``).
+        """
         if not query_text.strip():
             return []
 
@@ -127,17 +278,27 @@ class VectorStore:
             return []
 
         embedding = await self._embedding_service.embed_text(query_text)
+        return self.search_by_vector(collection, embedding, n_results, filter_by)
 
-        query_filter = None
-        if filter_by:
-            must = [FieldCondition(key=k, match=MatchValue(value=v)) for k, v in filter_by.items()]
-            query_filter = Filter(must=list(must))
+    def search_by_vector(
+        self,
+        collection: str,
+        vector: list[float],
+        n_results: int = 5,
+        filter_by: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Search a collection with an existing vector (results as in ``search``)."""
+        if not self._available or self._client is None:
+            return []
+
+        if not self._client.collection_exists(collection):
+            return []
 
         results = self._client.query_points(
             collection_name=collection,
-            query=embedding,
+            query=vector,
             limit=n_results,
-            query_filter=query_filter,
+            query_filter=_qdrant_filter(filter_by),
             with_payload=True,
         )
 
@@ -154,6 +315,49 @@ class VectorStore:
             )
         return items
 
+    def get_vector(self, collection: str, doc_id: str) -> list[float] | None:
+        """The stored vector of ``doc_id``, or None if it has not been indexed."""
+        if not self._available or self._client is None:
+            return None
+        if not self._client.collection_exists(collection):
+            return None
+        points = self._client.retrieve(
+            collection_name=collection,
+            ids=[str(uuid.uuid5(uuid.NAMESPACE_URL, doc_id))],
+            with_payload=False,
+            with_vectors=True,
+        )
+        return list(points[0].vector) if points else None
+
+    def set_payload(self, collection: str, payloads: dict[str, dict[str, Any]]) -> int:
+        """Merge fields into the payloads of indexed documents, keyed by ``doc_id``.
+
+        Documents that are not in the collection are skipped; returns how many
+        were updated. Vectors are left untouched, so nothing is re-embedded.
+        """
+        if not payloads or not self._available or self._client is None:
+            return 0
+        if not self._client.collection_exists(collection):
+            return 0
+        doc_ids = {str(uuid.uuid5(uuid.NAMESPACE_URL, doc_id)): doc_id for doc_id in payloads}
+        found = self._client.retrieve(
+            collection_name=collection,
+            ids=list(doc_ids),
+            with_payload=False,
+            with_vectors=False,
+        )
+        operations = [
+            SetPayloadOperation(
+                set_payload=SetPayload(payload=payloads[doc_ids[str(p.id)]], points=[p.id])
+            )
+            for p in found
+        ]
+        if operations:
+            self._client.batch_update_points(
+                collection_name=collection, update_operations=operations
+            )
+        return len(operations)
+
     def delete_document(self, collection: str, doc_id: str):
         """Delete a document from a collection."""
         self._ensure_collection(collection)
@@ -188,6 +392,7 @@ class VectorStore:
                 stats[name] = {"name": name, "count": 0, "available": False}
         return {
             "available": self._available,
+            "backend": "qdrant",
             "persist_dir": str(self._persist_dir),
             "collections": stats,
         }
@@ -197,6 +402,39 @@ class VectorStore:
         return self._available
 
 
-def get_vector_store() -> VectorStore:
-    """Get the singleton VectorStore instance."""
-    return VectorStore()
+def _qdrant_filter(filter_by: dict[str, Any] | None) -> "Filter | None":
+    if not filter_by:
+        return None
+    must: list[Condition] = []
+    for key, value in filter_by.items():
+        if isinstance(value, dict):
+            unknown = set(value) - set(RANGE_OPERATORS)
+            if unknown:
+                raise ValueError(f"Unsupported range operators for {key}: {sorted(unknown)}")
+            must.append(FieldCondition(key=key, range=Range(**value)))
+        elif isinstance(value, (list, tuple, set)):
+            must.append(FieldCondition(key=key, match=MatchAny(any=list(value))))
+        else:
+            must.append(FieldCondition(key=key, match=MatchValue(value=value)))
+    return Filter(must=must)
+
+
+def get_vector_store() -> VectorBackend:
+    """Get the singleton vector store for the configured backend.
+
+    ``VECTOR_STORE_BACKEND`` is ``qdrant``, ``flat`` (memory-mapped NumPy
+    files, see :mod:`app.services.flat_vector_store`) or ``auto``: Qdrant,
+    unless it is not installed or fails to open.
+    """
+    backend = settings.VECTOR_STORE_BACKEND.lower()
+    if backend == "qdrant":
+        return VectorStore()
+    if backend == "auto":
+        store = VectorStore()
+        if store.is_available:
+            return store
+    elif backend != "flat":
+        logger.warning(f"Unknown VECTOR_STORE_BACKEND={backend!r}, using 'flat'")
+    from app.services.flat_vector_store import FlatVectorStore
+
+    return FlatVectorStore()
@@ -4,8 +4,10 @@ Every async function in this module calls one backend API endpoint.
 Sync Gradio wrappers live in frontend.py and call these via _run_async().
 """
 
+import json
 import os
 import tempfile
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Any, cast
 
@@ -463,6 +465,45 @@ async def pipeline_run_status(token: str, job_id: str) -> dict:
         return _handle_json_response(resp)
 
 
+async def pipeline_run_stream(
+    token: str,
+    pipeline_key: str,
+    *,
+    resume_text: str = "",
+    job_text: str = "",
+    cv_text: str = "",
+    inputs: dict | None = None,
+) -> AsyncIterator[tuple[str, dict]]:
+    """POST /api/pipeline/run/stream; yields ``(event, data)`` as SSE frames arrive."""
+    async with httpx.AsyncClient(timeout=httpx.Timeout(30.0, read=600.0)) as client:
+        async with client.stream(
+            "POST",
+            f"{API_URL}/api/pipeline/run/stream",
+            json={
+                "pipeline_key": pipeline_key,
+                "resume_text": resume_text,
+                "job_text": job_text,
+                "cv_text": cv_text,
+                "inputs": inputs or {},
+            },
+            headers=_auth_headers(token),
+        ) as resp:
+            if resp.status_code == 401:
+                yield "error", {"detail": "Login required"}
+                return
+            if resp.status_code >= 400:
+                await resp.aread()
+                yield "error", _handle_json_response(resp)
+                return
+            event = "message"
+            async for line in resp.aiter_lines():
+                if line.startswith("event:"):
+                    event = line[len("event:") :].strip()
+                elif line.startswith("data:"):
+                    yield event, json.loads(line[len("data:") :])
+                    event = "message"
+
+
 async def pipeline_apply(
     resume_file: str, job_text: str, company_name: str, hiring_manager: str, format_type: str
 ) -> dict:
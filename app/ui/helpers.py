@@ -2,6 +2,8 @@
 
 import asyncio
 import concurrent.futures
+import queue
+import threading
 
 
 def run_async(coro):
@@ -20,3 +22,35 @@ def run_async(coro):
 
     with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
         return executor.submit(asyncio.run, coro).result()
+
+
+_DONE = object()
+
+
+def iter_async(agen):
+    """Iterate an async generator from a sync context, item by item.
+
+    The generator is drained on its own event loop in a worker thread so sync
+    Gradio generator callbacks can render each item as soon as it arrives.
+    """
+    items: queue.Queue = queue.Queue()
+
+    async def drain():
+        try:
+            async for item in agen:
+                items.put((item, None))
+        except BaseException as e:
+            items.put((_DONE, e))
+        else:
+            items.put((_DONE, None))
+
+    worker = threading.Thread(target=asyncio.run, args=(drain(),), daemon=True)
+    worker.start()
+    while True:
+        item, error = items.get()
+        if item is _DONE:
+            worker.join()
+            if error is not None:
+                raise error
+            return
+        yield item
@@ -1,12 +1,18 @@
 """Gradio tab: run agent pipelines on demand."""
 
+import json
 import time
 
 import gradio as gr
 
 from app.core.config import settings
-from app.ui.api_client import pipeline_list, pipeline_run, pipeline_run_status
-from app.ui.helpers import run_async
+from app.ui.api_client import (
+    pipeline_list,
+    pipeline_run,
+    pipeline_run_status,
+    pipeline_run_stream,
+)
+from app.ui.helpers import iter_async, run_async
 
 _TEXT_PIPELINES = frozenset(
     {
@@ -25,7 +31,7 @@ def _poll_background_job(token: str, job_id: str) -> dict:
     """Poll until completed, failed, or timeout."""
     interval = settings.PIPELINE_UI_POLL_INTERVAL_SECONDS
     max_attempts = settings.PIPELINE_UI_POLL_MAX_ATTEMPTS
-    status: dict = {"status": "running", "job_id": job_id}
+    status: dict = {"status": "queued", "job_id": job_id}
     for _ in range(max_attempts):
         status = run_async(pipeline_run_status(token, job_id.strip()))
         if status.get("status") in ("completed", "failed"):
@@ -40,6 +46,37 @@ def _poll_background_job(token: str, job_id: str) -> dict:
     return status
 
 
+def _render_live(steps: list[str], outputs: dict[str, str]) -> str:
+    parts = [f"- {line}" for line in steps]
+    for agent, text in outputs.items():
+        parts.append(f"\n**{agent}**\n\n{text}")
+    return "\n".join(parts)
+
+
+def _stream_pipeline(token: str, key: str, resume: str, job: str, inputs: dict):
+    """Yield ``(result, live_markdown)`` as pipeline SSE events arrive."""
+    steps: list[str] = []
+    outputs: dict[str, str] = {}
+    result: dict = {"status": "running", "pipeline_key": key}
+    events = pipeline_run_stream(token, key, resume_text=resume, job_text=job, inputs=inputs)
+    for event, data in iter_async(events):
+        if event == "token":
+            outputs[data["agent"]] = outputs.get(data["agent"], "") + data["delta"]
+        elif event == "partial":
+            snapshot = json.dumps(data["output"], indent=2, default=str)
+            outputs[data["agent"]] = f"```json\n{snapshot}\n```"
+        elif event == "step_complete":
+            steps.append(
+                f"{data.get('step')} {data.get('source', 'executed')} "
+                f"({data.get('duration_ms', 0):.0f} ms)"
+            )
+        elif event == "result":
+            result = {"success": True, "status": "completed", "data": data}
+        elif event == "error":
+            result = {"Error": data.get("detail") or data.get("Error") or data}
+        yield result, _render_live(steps, outputs)
+
+
 def build_pipelines_tab(api_token) -> tuple:
     gr.Markdown(
         "### Agent pipelines\n"
@@ -59,9 +96,14 @@ def build_pipelines_tab(api_token) -> tuple:
         label="Run in background (long LLM pipelines)",
         value=False,
     )
+    stream_output = gr.Checkbox(
+        label="Stream live output (foreground runs)",
+        value=True,
+    )
     run_btn = gr.Button("Run pipeline", variant="primary")
     poll_btn = gr.Button("Poll background job", visible=False)
     job_id_box = gr.Textbox(label="Background job ID", visible=False, interactive=False)
+    live_output = gr.Markdown()
     result_json = gr.JSON(label="Pipeline result")
 
     def refresh_list():
@@ -81,15 +123,22 @@ def build_pipelines_tab(api_token) -> tuple:
             gr.Checkbox(value=key not in _SYNC_PIPELINES),
         )
 
-    def run_pipeline(key, resume, job, force, bg, token):
+    def run_pipeline(key, resume, job, force, bg, stream, token):
+        hidden = gr.Button(visible=False)
         if not token or not str(token).strip():
-            return {"Error": "Sign in on the Account tab first"}, "", gr.Button(visible=False)
+            yield {"Error": "Sign in on the Account tab first"}, "", hidden, ""
+            return
         if not key:
-            return {"Error": "Select a pipeline"}, "", gr.Button(visible=False)
+            yield {"Error": "Select a pipeline"}, "", hidden, ""
+            return
         inputs = {}
         if force:
             inputs["force_remote"] = True
         try:
+            if stream and not bg:
+                for result, live in _stream_pipeline(token, key, resume or "", job or "", inputs):
+                    yield result, "", hidden, live
+                return
             out = run_async(
                 pipeline_run(
                     token,
@@ -103,11 +152,12 @@ def build_pipelines_tab(api_token) -> tuple:
             if out.get("status") == "accepted" and out.get("job_id"):
                 job_id = out["job_id"]
                 status = _poll_background_job(token, job_id)
-                still_running = status.get("status") == "running"
-                return status, job_id, gr.Button(visible=still_running)
-            return out, "", gr.Button(visible=False)
+                still_running = status.get("status") in ("queued", "running")
+                yield status, job_id, gr.Button(visible=still_running), ""
+                return
+            yield out, "", hidden, ""
         except Exception as e:
-            return {"Error": str(e)}, "", gr.Button(visible=False)
+            yield {"Error": str(e)}, "", hidden, ""
 
     def poll_job(job_id, token):
         if not job_id or not token:
@@ -125,8 +175,16 @@ def build_pipelines_tab(api_token) -> tuple:
     )
     run_btn.click(
         fn=run_pipeline,
-        inputs=[pipeline_dropdown, resume_text, job_text, force_remote, run_background, api_token],
-        outputs=[result_json, job_id_box, poll_btn],
+        inputs=[
+            pipeline_dropdown,
+            resume_text,
+            job_text,
+            force_remote,
+            run_background,
+            stream_output,
+            api_token,
+        ],
+        outputs=[result_json, job_id_box, poll_btn, live_output],
     )
     poll_btn.click(fn=poll_job, inputs=[job_id_box, api_token], outputs=[result_json])
 
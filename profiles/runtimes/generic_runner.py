@@ -29,9 +29,9 @@ import os
 from pathlib import Path
 from typing import Any
 
-import httpx
 import yaml
 
+from app.services.http_client import http_post
 from profiles.runtimes.security import ProfileNotAllowedError, validate_profile_name
 
 PROFILES_DIR = Path(__file__).parent.parent
@@ -163,14 +163,14 @@ async def _call_single(
     if response_format:
         payload["response_format"] = response_format
 
-    # Make the request
-    async with httpx.AsyncClient(timeout=120) as client:
-        response = await client.post(url, json=payload, headers=headers)
+    # Make the request; a completion is not idempotent, so a timed-out or
+    # rate-limited call is surfaced instead of being re-sent and billed again.
+    response = await http_post(url, json=payload, headers=headers, timeout=120, retries=0)
 
-        if response.status_code != 200:
-            raise Exception(f"HTTP {response.status_code}: {response.text[:500]}")
+    if response.status_code != 200:
+        raise Exception(f"HTTP {response.status_code}: {response.text[:500]}")
 
-        data = response.json()
+    data = response.json()
 
     # Extract response text
     choices = data.get("choices", [])
@@ -15,10 +15,14 @@ import ipaddress
 import os
 import socket
 import sys
+from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
-import httpx
+# Add parent dirs to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from app.services.http_client import close_http_client, http_get
 
 # ──────────────────────────────────────────────
 # Security helpers
@@ -127,46 +131,44 @@ async def _tinyfish_search(query: str, max_results: int, api_key: str) -> dict[s
 
 async def _serpapi_search(query: str, max_results: int, api_key: str) -> dict[str, Any]:
     """Search via SerpAPI."""
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(
-            "https://serpapi.com/search",
-            params={"q": query, "num": max_results, "api_key": api_key, "engine": "google"},
+    resp = await http_get(
+        "https://serpapi.com/search",
+        params={"q": query, "num": max_results, "api_key": api_key, "engine": "google"},
+    )
+    data = resp.json()
+    results = []
+    for r in data.get("organic_results", [])[:max_results]:
+        results.append(
+            {
+                "title": r.get("title", ""),
+                "url": r.get("link", ""),
+                "snippet": r.get("snippet", ""),
+            }
         )
-        data = resp.json()
-        results = []
-        for r in data.get("organic_results", [])[:max_results]:
-            results.append(
-                {
-                    "title": r.get("title", ""),
-                    "url": r.get("link", ""),
-                    "snippet": r.get("snippet", ""),
-                }
-            )
-        return {"results": results}
+    return {"results": results}
 
 
 async def _ddg_search(query: str, max_results: int) -> dict[str, Any]:
     """Search via DuckDuckGo (HTML scraping fallback)."""
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(
-            "https://html.duckduckgo.com/html/",
-            params={"q": query},
-            headers={"User-Agent": "Mozilla/5.0"},
-            follow_redirects=True,
-        )
-        # Basic HTML parsing (no bs4 dependency)
-        text = resp.text
-        results = []
-        import re
-
-        for match in re.finditer(r'class="result__a"[^>]*href="([^"]*)"[^>]*>(.*?)</a>', text):
-            url = match.group(1)
-            title = re.sub(r"<[^>]+>", "", match.group(2)).strip()
-            if url and title:
-                results.append({"title": title, "url": url, "snippet": ""})
-            if len(results) >= max_results:
-                break
-        return {"results": results}
+    resp = await http_get(
+        "https://html.duckduckgo.com/html/",
+        params={"q": query},
+        headers={"User-Agent": "Mozilla/5.0"},
+        follow_redirects=True,
+    )
+    # Basic HTML parsing (no bs4 dependency)
+    text = resp.text
+    results = []
+    import re
+
+    for match in re.finditer(r'class="result__a"[^>]*href="([^"]*)"[^>]*>(.*?)</a>', text):
+        url = match.group(1)
+        title = re.sub(r"<[^>]+>", "", match.group(2)).strip()
+        if url and title:
+            results.append({"title": title, "url": url, "snippet": ""})
+        if len(results) >= max_results:
+            break
+    return {"results": results}
 
 
 async def web_fetch_impl(url: str) -> dict[str, Any]:
@@ -199,21 +201,21 @@ async def web_fetch_impl(url: str) -> dict[str, Any]:
     # Fallback: basic HTTP fetch — do NOT follow cross-host redirects, which
     # could be used to bypass the SSRF check above.
     parsed = urlparse(url)
-    async with httpx.AsyncClient(follow_redirects=False) as client:
-        resp = await client.get(url, headers={"User-Agent": "Mozilla/5.0"})
-        # Only follow redirects that stay on the same safe host.
-        if resp.is_redirect:
-            loc = resp.headers.get("location", "")
-            loc_parsed = urlparse(loc)
-            redirect_url = loc if loc_parsed.netloc else f"{parsed.scheme}://{parsed.netloc}{loc}"
-            assert_url_safe(redirect_url)
-            resp = await client.get(redirect_url, headers={"User-Agent": "Mozilla/5.0"})
-        return {
-            "title": "",
-            "description": "",
-            "text": resp.text[:50000],
-            "format": "html",
-        }
+    headers = {"User-Agent": "Mozilla/5.0"}
+    resp = await http_get(url, headers=headers, follow_redirects=False)
+    # Only follow redirects that stay on the same safe host.
+    if resp.is_redirect:
+        loc = resp.headers.get("location", "")
+        loc_parsed = urlparse(loc)
+        redirect_url = loc if loc_parsed.netloc else f"{parsed.scheme}://{parsed.netloc}{loc}"
+        assert_url_safe(redirect_url)
+        resp = await http_get(redirect_url, headers=headers, follow_redirects=False)
+    return {
+        "title": "",
+        "description": "",
+        "text": resp.text[:50000],
+        "format": "html",
+    }
 
 
 # ──────────────────────────────────────────────
@@ -258,7 +260,11 @@ async def run_server(host: str = "127.0.0.1", port: int = 8052) -> None:
             }
         )
 
+    async def close_client(_app: web.Application) -> None:
+        await close_http_client()
+
     app = web.Application()
+    app.on_cleanup.append(close_client)
     app.router.add_post("/api/tools/web-search", handle_search)
     app.router.add_post("/api/tools/web-fetch", handle_fetch)
     app.router.add_get("/api/tools/health", handle_health)
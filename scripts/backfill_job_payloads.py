@@ -0,0 +1,42 @@
+"""
+Backfill filterable payload fields onto job vectors indexed before payload filtering.
+
+Older ``jobs`` points were written without ``source``/``company``/``location``/
+``mapping_id``/``job_id`` payload fields, so filtered searches (the BigSet
+``source`` filter in discovery, among others) skip them. This copies those
+fields from ``job_postings`` onto every existing point of the configured
+vector backend. Only payloads change; nothing is re-embedded, and points of
+postings that were never indexed are left alone. Safe to re-run.
+
+Usage:
+    python -m scripts.backfill_job_payloads [--batch-size 512]
+"""
+
+import argparse
+
+from app.services.db_service import DatabaseService, get_db_session, initialize_database_tables
+from app.services.search_service import SearchService
+from app.services.vector_store import UPSERT_BATCH_SIZE, get_vector_store
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch-size", type=int, default=UPSERT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    initialize_database_tables()
+    store = get_vector_store()
+    if not store.is_available:
+        print("Vector store unavailable, nothing to backfill")
+        return
+    db = get_db_session()
+    try:
+        search = SearchService(vector_store=store, db_service=DatabaseService(db))
+        updated = search.backfill_job_payloads(batch_size=args.batch_size)
+    finally:
+        db.close()
+    print(f"Updated payload fields on {updated} job vectors")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark the per-request cost of building pydantic-ai agents.
+
+Every ParserLLM / agent call used to read its prompt file and construct a new
+``Agent`` (model resolution, output schema, tool registration). This measures
+that cost against the memoized ``create_agent`` path. The registry is pointed
+at pydantic-ai's offline ``test`` model so no provider SDK or network is
+involved; the numbers are pure Python overhead per request.
+
+Usage:
+    python -m scripts.bench_agent_factory [--iterations 2000]
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+
+from app.agents.cover_letter import CoverLetterOutput
+from app.core.model_registry import ModelRegistry, ModelSettings
+from app.models.resume_model import Resume
+from app.services.parsing_service import _PROMPTS_DIR, _load_prompt
+
+_PROMPT_FILE = "resume_parser_prompt.md"
+
+
+def _registry() -> ModelRegistry:
+    registry = ModelRegistry()
+    registry.settings = ModelSettings(default_model="test", fallback_model=None)
+    registry.providers = []
+    registry._chain = None
+    return registry
+
+
+def _read_prompt() -> str:
+    path = _PROMPTS_DIR / _PROMPT_FILE
+    return path.read_text(encoding="utf-8") if path.exists() else "Extract structured resume data."
+
+
+def _per_call_us(fn: Callable[[], object], iterations: int) -> float:
+    fn()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    registry = _registry()
+    cases: list[tuple[str, Callable[[], object], Callable[[], object]]] = [
+        (
+            "resume parser agent",
+            lambda: registry.create_agent(Resume, _read_prompt(), cache=False),
+            lambda: registry.create_agent(Resume, _load_prompt(_PROMPT_FILE, ""), cache=True),
+        ),
+        (
+            "cover letter agent",
+            lambda: registry.create_agent(CoverLetterOutput, "Write a letter.", cache=False),
+            lambda: registry.create_agent(CoverLetterOutput, "Write a letter.", cache=True),
+        ),
+        (
+            "text agent",
+            lambda: registry.create_agent(None, "Answer briefly.", cache=False),
+            lambda: registry.create_agent(None, "Answer briefly.", cache=True),
+        ),
+    ]
+
+    print(f"iterations: {args.iterations}")
+    print(f"{'case':<22}{'uncached us':>14}{'cached us':>12}{'speedup':>10}")
+    for label, uncached, cached in cases:
+        cold = _per_call_us(uncached, args.iterations)
+        warm = _per_call_us(cached, args.iterations)
+        print(f"{label:<22}{cold:>14.1f}{warm:>12.2f}{cold / warm:>9.0f}x")
+    print(f"agent cache: {registry.agent_cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark sequential vs concurrent LLM calls in one apply package.
+
+The tailor, cover-letter and job-parse agents are replaced by stubs that sleep
+for a configurable latency, so the numbers isolate orchestration overhead from
+model speed. Concurrent mode should approach the slowest call; sequential mode
+pays the sum.
+
+Usage:
+    python -m scripts.bench_apply_concurrency [--latency-ms 400 250 300] [--runs 5]
+"""
+
+import argparse
+import asyncio
+import statistics
+
+from app.agents.cover_letter import CoverLetterOutput
+from app.agents.resume_tailor import TailoredResumeOutput
+from app.models.job_model import JobPosting
+from app.services import apply_service
+
+
+def _install_stubs(tailor_s: float, cover_s: float, parse_s: float) -> None:
+    async def tailor(resume_text, job_text, format_type="text"):
+        await asyncio.sleep(tailor_s)
+        return TailoredResumeOutput(tailored_content=resume_text)
+
+    async def cover(resume_text, job_text, company_name=None, hiring_manager=None):
+        await asyncio.sleep(cover_s)
+        return CoverLetterOutput(cover_letter="Dear team")
+
+    async def parse(self, job_text):
+        await asyncio.sleep(parse_s)
+        return JobPosting(title="Engineer", required_skills=["python", "sql"])
+
+    apply_service.tailor_resume = tailor
+    apply_service.generate_cover_letter = cover
+    apply_service.JobParser.parse_job_text = parse
+
+
+async def _measure(concurrent: bool, runs: int) -> list[float]:
+    totals = []
+    for _ in range(runs):
+        package = await apply_service._build_package(
+            "Python engineer", {"python"}, "Engineer, Python + SQL", concurrent=concurrent
+        )
+        totals.append(package.timings_ms["total"])
+    return totals
+
+
+async def _main(latency_ms: list[int], runs: int) -> None:
+    tailor_ms, cover_ms, parse_ms = latency_ms
+    _install_stubs(tailor_ms / 1000, cover_ms / 1000, parse_ms / 1000)
+    print(f"stub latency ms: tailor={tailor_ms} cover_letter={cover_ms} parse_job={parse_ms}")
+    results = {}
+    for label, concurrent in (("sequential", False), ("concurrent", True)):
+        totals = await _measure(concurrent, runs)
+        results[label] = statistics.median(totals)
+        print(
+            f"{label:<11} median {results[label]:8.1f} ms  "
+            f"min {min(totals):8.1f} ms  max {max(totals):8.1f} ms"
+        )
+    print(f"speedup     {results['sequential'] / results['concurrent']:.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--latency-ms",
+        type=int,
+        nargs=3,
+        default=[400, 250, 300],
+        metavar=("TAILOR", "COVER", "PARSE"),
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(_main(args.latency_ms, args.runs))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark local fallback embeddings against the original pure-Python loop.
+
+Usage:
+    python -m scripts.bench_hash_embed [--texts 2000] [--repeat 3]
+"""
+
+import argparse
+import hashlib
+import time
+
+from app.services.embedding_service import hash_embed_batch, ngram_embed_batch
+
+
+def _legacy_hash_embed(text: str, dim: int = 384) -> list[float]:
+    """Original per-element hex slicing implementation, kept as the baseline."""
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    values = []
+    for i in range(dim):
+        hex_pair = digest[(i * 2) % len(digest) : (i * 2 + 2) % len(digest)]
+        if len(hex_pair) < 2:
+            hex_pair = digest[:2]
+        values.append((int(hex_pair, 16) / 255.0) * 2.0 - 1.0)
+    norm = (sum(v * v for v in values) ** 0.5) or 1.0
+    return [v / norm for v in values]
+
+
+def _make_texts(n: int) -> list[str]:
+    return [
+        f"Senior Engineer {i} at Company {i % 311}. Python, FastAPI, PostgreSQL, "
+        f"Kubernetes and machine learning platform work. Remote, Berlin or Cairo."
+        for i in range(n)
+    ]
+
+
+def _time(label: str, fn, texts: list[str], repeat: int) -> None:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(texts)
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<22} {best * 1000:9.1f} ms  {len(texts) / best:>12,.0f} texts/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--texts", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    texts = _make_texts(args.texts)
+    _time("legacy loop", lambda ts: [_legacy_hash_embed(t) for t in ts], texts, args.repeat)
+    _time("hash (vectorized)", hash_embed_batch, texts, args.repeat)
+    _time("ngram (vectorized)", ngram_embed_batch, texts, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
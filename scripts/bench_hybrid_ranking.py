@@ -0,0 +1,170 @@
+"""
+Offline evaluation and latency benchmark for hybrid-search rank fusion.
+
+Loads the labelled corpus in ``tests/fixtures/ranking_eval.json`` into an
+in-memory SQLite database (so the real FTS5/BM25 keyword path runs), embeds
+it with the offline n-gram embedder as the vector signal and scores profile
+fit with ``score_job_against_profile``. Every fusion method is evaluated on
+the same candidate lists (nDCG@10, MRR, recall@10), next to each single
+signal and the previous additive-boost ranker. The latency section times one
+fusion pass over synthetic candidate lists of increasing size.
+
+Usage:
+    python -m scripts.bench_hybrid_ranking [--fixture PATH] [--depth 20] [--runs 200]
+"""
+
+import argparse
+import json
+import math
+import time
+from pathlib import Path
+
+import numpy as np
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models.db_models import JobPostingDB, create_tables
+from app.models.startup_model import UserProfile
+from app.services.db_service import DatabaseService
+from app.services.embedding_service import ngram_embed_batch
+from app.services.job_fit_service import score_job_against_profile
+from app.services.ranking import Candidates, RRFFusion, WeightedFusion
+from app.services.search_service import SearchService
+
+_FIXTURE = Path(__file__).parent.parent / "tests" / "fixtures" / "ranking_eval.json"
+_K = 10
+
+
+def _ndcg(ranked: list[str], relevant: dict[str, int], k: int = _K) -> float:
+    dcg = sum(relevant.get(d, 0) / math.log2(i + 2) for i, d in enumerate(ranked[:k]))
+    ideal = sorted(relevant.values(), reverse=True)[:k]
+    idcg = sum(g / math.log2(i + 2) for i, g in enumerate(ideal))
+    return dcg / idcg if idcg else 0.0
+
+
+def _mrr(ranked: list[str], relevant: dict[str, int]) -> float:
+    return next((1 / (i + 1) for i, d in enumerate(ranked) if relevant.get(d)), 0.0)
+
+
+def _recall(ranked: list[str], relevant: dict[str, int], k: int = _K) -> float:
+    return len(set(ranked[:k]) & set(relevant)) / len(relevant)
+
+
+def _additive_boost(vector: Candidates, keyword: Candidates, query: str) -> list[str]:
+    """The pre-fusion hybrid_search scoring (vector score + flat keyword boosts)."""
+    keyword_ids = set(keyword.ids)
+    terms = SearchService._tokenize(query)
+    scores: dict[str, float] = {}
+    for doc_id, score in zip(vector.ids, vector.scores, strict=True):
+        scores[doc_id] = min(score + (0.2 if doc_id in keyword_ids else 0.0), 1.0)
+    for doc_id in keyword.ids:
+        scores.setdefault(doc_id, 0.3 + 0.05 * len(terms))
+    return sorted(scores, key=scores.__getitem__, reverse=True)
+
+
+def _load(fixture: Path):
+    corpus = json.loads(fixture.read_text(encoding="utf-8"))
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    create_tables(engine)
+    session = sessionmaker(bind=engine)()
+    jobs = [
+        JobPostingDB(
+            id=job["id"],
+            title=job["title"],
+            company=job["company"],
+            location=job["location"],
+            raw_text=job["text"],
+        )
+        for job in corpus["jobs"]
+    ]
+    session.add_all(jobs)
+    session.commit()
+    return corpus, session, jobs
+
+
+def _signals(query: dict, db: DatabaseService, jobs, doc_ids, doc_vectors, depth: int):
+    qvec = ngram_embed_batch([query["query"]])[0]
+    sims = doc_vectors @ qvec
+    top = np.argsort(-sims, kind="stable")[:depth]
+    vector = Candidates("vector", [doc_ids[i] for i in top], sims[top])
+
+    hits = db.keyword_search("job_postings", SearchService._tokenize(query["query"]), depth)
+    keyword = Candidates("keyword", [h["id"] for h in hits], [h["keyword_score"] for h in hits])
+
+    profile = UserProfile(**query.get("profile", {}))
+    fit_scores = np.array([score_job_against_profile(job, profile) for job in jobs])
+    top = np.argsort(-fit_scores, kind="stable")[:depth]
+    fit = Candidates("fit", [doc_ids[i] for i in top], fit_scores[top])
+    return vector, keyword, fit
+
+
+def _evaluate(fixture: Path, depth: int) -> None:
+    corpus, session, jobs = _load(fixture)
+    db = DatabaseService(session)
+    doc_ids = [str(job.id) for job in jobs]
+    doc_vectors = ngram_embed_batch([f"{job.title}. {job.raw_text}" for job in jobs])
+
+    rankers = {
+        "vector only": lambda v, k, f, q: list(v.ids),
+        "keyword (bm25) only": lambda v, k, f, q: list(k.ids),
+        "fit only": lambda v, k, f, q: list(f.ids),
+        "additive boost (old)": lambda v, k, f, q: _additive_boost(v, k, q),
+        "rrf vector+keyword": lambda v, k, f, q: RRFFusion().fuse([v, k]).ids,
+        "weighted vector+keyword": lambda v, k, f, q: WeightedFusion().fuse([v, k]).ids,
+        "rrf all signals": lambda v, k, f, q: RRFFusion().fuse([v, k, f]).ids,
+        "weighted all signals": lambda v, k, f, q: WeightedFusion().fuse([v, k, f]).ids,
+    }
+    totals = {name: np.zeros(3) for name in rankers}
+    for query in corpus["queries"]:
+        relevant = {str(d): g for d, g in query["relevant"].items()}
+        vector, keyword, fit = _signals(query, db, jobs, doc_ids, doc_vectors, depth)
+        for name, rank in rankers.items():
+            ranked = rank(vector, keyword, fit, query["query"])
+            totals[name] += [
+                _ndcg(ranked, relevant),
+                _mrr(ranked, relevant),
+                _recall(ranked, relevant),
+            ]
+    session.close()
+
+    n = len(corpus["queries"])
+    print(f"corpus: {len(jobs)} jobs, {n} queries, candidate depth {depth}")
+    print(f"{'ranker':<26}{'nDCG@10':>9}{'MRR':>8}{'R@10':>8}")
+    for name, total in totals.items():
+        ndcg, mrr, recall = total / n
+        print(f"{name:<26}{ndcg:>9.3f}{mrr:>8.3f}{recall:>8.3f}")
+
+
+def _latency(runs: int) -> None:
+    rng = np.random.default_rng(0)
+    print(f"\nfusion latency, 3 signals ({runs} runs)")
+    print(f"{'candidates/list':<18}{'rrf us':>10}{'weighted us':>13}")
+    for size in (20, 100, 1000, 5000):
+        universe = np.array([f"job_{i}" for i in range(size * 2)])
+        lists = [
+            Candidates(s, rng.choice(universe, size, replace=False).tolist(), rng.random(size))
+            for s in ("vector", "keyword", "fit")
+        ]
+        row = [f"{size:<18}"]
+        for fusion in (RRFFusion(), WeightedFusion()):
+            fusion.fuse(lists)
+            started = time.perf_counter()
+            for _ in range(runs):
+                fusion.fuse(lists)
+            row.append(f"{(time.perf_counter() - started) / runs * 1e6:>10.0f}")
+        print(row[0] + row[1] + "   " + row[2])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fixture", type=Path, default=_FIXTURE)
+    parser.add_argument("--depth", type=int, default=20)
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+    _evaluate(args.fixture, args.depth)
+    _latency(args.runs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark bulk job dedupe + insert throughput of ``store_scraped_jobs_batch``.
+
+Each batch size is measured twice against a fresh SQLite file: a cold insert of
+unique rows and a full re-import where every row is a duplicate.
+
+Usage:
+    python -m scripts.bench_job_dedupe [--sizes 10000 100000]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models.db_models import create_tables
+from app.services.db_service import DatabaseService
+
+
+def _make_jobs(n: int) -> list[dict]:
+    jobs = []
+    for i in range(n):
+        jobs.append(
+            {
+                "title": f"Engineer {i % 97}",
+                "company": f"Company {i // 97}",
+                "location": "Remote",
+                "raw_text": f"Engineer {i % 97} at Company {i // 97}. Python, SQL.",
+                # Half the rows dedupe by URL, half by company+title.
+                "source_url": f"https://jobs.example/{i}" if i % 2 else None,
+                "parsed_data": {"source": "bench"},
+            }
+        )
+    return jobs
+
+
+def _run(size: int) -> None:
+    jobs = _make_jobs(size)
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        create_tables(engine)
+        session = sessionmaker(bind=engine)()
+        svc = DatabaseService(session)
+        try:
+            for label in ("insert", "re-import"):
+                start = time.perf_counter()
+                ids = svc.store_scraped_jobs_batch(jobs, dedupe=True)
+                elapsed = time.perf_counter() - start
+                stored = sum(1 for i in ids if i is not None)
+                print(
+                    f"{size:>8} rows  {label:<10} {elapsed:8.2f}s  "
+                    f"{size / elapsed:>10,.0f} rows/s  stored={stored}"
+                )
+        finally:
+            session.close()
+            engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+    for size in args.sizes:
+        _run(size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark BM25 keyword queries against the job_postings FTS5 index.
+
+Builds a throwaway SQLite file with synthetic postings (inserted through the
+normal tables, so the sync triggers populate the index), then times
+``DatabaseService.keyword_search`` for a mix of rare, common and multi-term
+queries. The target is sub-10 ms at 500k postings.
+
+Usage:
+    python -m scripts.bench_keyword_search [--postings 500000] [--queries 200] [--limit 20]
+        [--db PATH]   # keep the generated database and reuse it on later runs
+"""
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.models.db_models import JobPostingDB, create_tables
+from app.services.db_service import DatabaseService
+
+_TITLES = ["engineer", "developer", "analyst", "manager", "designer", "scientist", "architect"]
+_SKILLS = [
+    "python", "java", "rust", "golang", "kubernetes", "terraform", "react", "django",
+    "postgres", "kafka", "spark", "airflow", "pytorch", "tableau", "figma", "salesforce",
+]  # fmt: skip
+_FILLER = "team product customers growth remote hybrid benefits mission ownership".split()
+_COMPANIES = [f"company{i}" for i in range(2000)]
+_QUERIES = [
+    ["kubernetes"],
+    ["python", "django"],
+    ["rust", "engineer"],
+    ["tableau", "analyst", "sql"],
+    ["company1234"],
+    ["remote"],
+]
+
+
+def _posting(rng: random.Random) -> dict:
+    skills = rng.sample(_SKILLS, 4)
+    words = skills + rng.choices(_FILLER, k=60)
+    rng.shuffle(words)
+    return {
+        "title": f"{rng.choice(skills).title()} {rng.choice(_TITLES)}",
+        "company": rng.choice(_COMPANIES),
+        "raw_text": " ".join(words),
+    }
+
+
+def _populate(engine, postings: int, batch: int = 10_000) -> float:
+    rng = random.Random(7)
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        for offset in range(0, postings, batch):
+            rows = [_posting(rng) for _ in range(min(batch, postings - offset))]
+            conn.execute(insert(JobPostingDB), rows)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--postings", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--db", type=Path, default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = args.db or Path(tmp) / "bench.db"
+        reuse = db_path.exists()
+        engine = create_engine(f"sqlite:///{db_path}")
+        create_tables(engine)
+        if reuse:
+            print(f"reusing {db_path}")
+        else:
+            load_s = _populate(engine, args.postings)
+            print(f"postings: {args.postings}  load+index: {load_s:.1f}s")
+
+        session = sessionmaker(bind=engine)()
+        svc = DatabaseService(session)
+        print(f"{'query':<28}{'hits':>6}{'p50 ms':>9}{'p95 ms':>9}")
+        try:
+            for terms in _QUERIES:
+                timings = []
+                for _ in range(args.queries):
+                    started = time.perf_counter()
+                    hits = svc.keyword_search("job_postings", terms, limit=args.limit)
+                    timings.append((time.perf_counter() - started) * 1000)
+                timings.sort()
+                p95 = timings[int(len(timings) * 0.95) - 1]
+                print(
+                    f"{' '.join(terms):<28}{len(hits):>6}"
+                    f"{statistics.median(timings):>9.2f}{p95:>9.2f}"
+                )
+        finally:
+            session.close()
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+Benchmark the flat memory-mapped vector backend against embedded Qdrant.
+
+Both backends get the same random unit vectors (``VECTOR_DIM`` wide) with a
+small payload, written in ``UPSERT_BATCH_SIZE`` batches into a temporary
+directory. Reported per size: insert throughput, top-k query latency
+(p50/p95), p50 of the same queries filtered to the 10% of points with
+``source=bigset`` (pushed down into the store), on-disk size, and recall@k
+of each backend against an exact NumPy brute-force reference. Embedding is
+left out; both stores are fed vectors directly.
+
+The 1M point run needs ~1.5 GB of disk per backend and takes a long time on
+embedded Qdrant, hence it is opt-in.
+
+Usage:
+    python -m scripts.bench_vector_store [--sizes 10000 100000 1000000] [--queries 50]
+        [--k 10] [--skip-qdrant]
+"""
+
+import argparse
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+import numpy as np
+
+from app.services.flat_vector_store import FlatCollection
+from app.services.vector_store import (
+    PAYLOAD_INDEXES,
+    QDRANT_AVAILABLE,
+    UPSERT_BATCH_SIZE,
+    VECTOR_DIM,
+    _qdrant_filter,
+)
+
+_FILTER = {"source": "bigset"}
+
+
+def _dir_size(path: Path) -> int:
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+
+def _vectors(n: int, seed: int) -> np.ndarray:
+    vectors = np.random.default_rng(seed).standard_normal((n, VECTOR_DIM)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _payload(i: int) -> dict:
+    return {"doc_id": f"doc_{i}", "source": "bigset" if i % 10 == 0 else "manual"}
+
+
+def _report(name, n, insert_s, latencies, filtered, size, recall):
+    p50, p95 = np.percentile(np.array(latencies) * 1000, [50, 95])
+    filtered_p50 = np.percentile(np.array(filtered) * 1000, 50)
+    print(
+        f"{name:<8}{n:>10}{n / insert_s:>12.0f}{p50:>10.2f}{p95:>10.2f}{filtered_p50:>12.2f}"
+        f"{size / 2**20:>10.1f}{recall:>9.3f}"
+    )
+
+
+def _bench_flat(root: Path, vectors, queries, truth, k: int) -> None:
+    col = FlatCollection(root / "flat", dim=VECTOR_DIM, indexed=PAYLOAD_INDEXES["jobs"])
+    started = time.perf_counter()
+    for start in range(0, len(vectors), UPSERT_BATCH_SIZE):
+        stop = min(start + UPSERT_BATCH_SIZE, len(vectors))
+        col.upsert(
+            [f"doc_{i}" for i in range(start, stop)],
+            vectors[start:stop],
+            [_payload(i) for i in range(start, stop)],
+        )
+    insert_s = time.perf_counter() - started
+
+    latencies, hits = [], 0
+    for query, expected in zip(queries, truth, strict=True):
+        started = time.perf_counter()
+        found = col.search(query, k)
+        latencies.append(time.perf_counter() - started)
+        hits += len({doc_id for doc_id, _, _ in found} & expected)
+    filtered = []
+    for query in queries:
+        started = time.perf_counter()
+        col.search(query, k, _FILTER)
+        filtered.append(time.perf_counter() - started)
+    col.close()
+    recall = hits / (len(truth) * k)
+    size = _dir_size(root / "flat")
+    _report("flat", len(vectors), insert_s, latencies, filtered, size, recall)
+
+
+def _bench_qdrant(root: Path, vectors, queries, truth, k: int) -> None:
+    from qdrant_client import QdrantClient
+    from qdrant_client.models import Distance, PointStruct, VectorParams
+
+    client = QdrantClient(path=str(root / "qdrant"))
+    client.create_collection(
+        collection_name="bench",
+        vectors_config=VectorParams(size=VECTOR_DIM, distance=Distance.COSINE),
+    )
+    started = time.perf_counter()
+    for start in range(0, len(vectors), UPSERT_BATCH_SIZE):
+        stop = min(start + UPSERT_BATCH_SIZE, len(vectors))
+        client.upsert(
+            collection_name="bench",
+            points=[
+                PointStruct(
+                    id=str(uuid.uuid5(uuid.NAMESPACE_URL, f"doc_{i}")),
+                    vector=vectors[i].tolist(),
+                    payload=_payload(i),
+                )
+                for i in range(start, stop)
+            ],
+        )
+    insert_s = time.perf_counter() - started
+
+    latencies, hits = [], 0
+    for query, expected in zip(queries, truth, strict=True):
+        started = time.perf_counter()
+        found = client.query_points(
+            collection_name="bench", query=query.tolist(), limit=k, with_payload=True
+        )
+        latencies.append(time.perf_counter() - started)
+        hits += len({p.payload["doc_id"] for p in found.points} & expected)
+    filtered = []
+    for query in queries:
+        started = time.perf_counter()
+        client.query_points(
+            collection_name="bench",
+            query=query.tolist(),
+            limit=k,
+            query_filter=_qdrant_filter(_FILTER),
+            with_payload=True,
+        )
+        filtered.append(time.perf_counter() - started)
+    client.close()
+    recall = hits / (len(truth) * k)
+    size = _dir_size(root / "qdrant")
+    _report("qdrant", len(vectors), insert_s, latencies, filtered, size, recall)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--skip-qdrant", action="store_true")
+    args = parser.parse_args()
+
+    run_qdrant = QDRANT_AVAILABLE and not args.skip_qdrant
+    if not run_qdrant and not args.skip_qdrant:
+        print("qdrant-client not installed, benchmarking the flat backend only")
+    print(f"dim {VECTOR_DIM}, top-{args.k}, {args.queries} queries")
+    print(
+        f"{'backend':<8}{'points':>10}{'insert/s':>12}{'p50 ms':>10}{'p95 ms':>10}"
+        f"{'filt p50 ms':>12}{'disk MB':>10}{'recall':>9}"
+    )
+    for n in args.sizes:
+        vectors = _vectors(n, seed=n)
+        queries = _vectors(args.queries, seed=0)
+        top = np.argpartition(-(queries @ vectors.T), args.k - 1, axis=1)[:, : args.k]
+        truth = [{f"doc_{i}" for i in row} for row in top]
+        with tempfile.TemporaryDirectory() as tmp:
+            _bench_flat(Path(tmp), vectors, queries, truth, args.k)
+            if run_qdrant:
+                _bench_qdrant(Path(tmp), vectors, queries, truth, args.k)
+
+
+if __name__ == "__main__":
+    main()
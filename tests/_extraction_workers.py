@@ -0,0 +1,17 @@
+"""Extractors for ExtractionPool tests.
+
+Spawned worker processes import these by reference; keeping them out of the
+test module spares each worker from importing the whole FastAPI app.
+"""
+
+import time
+
+
+def shout(file_content: bytes, filename: str) -> str:
+    return file_content.decode().upper()
+
+
+def hang_on_slow(file_content: bytes, filename: str) -> str:
+    if filename.startswith("slow"):
+        time.sleep(60)
+    return file_content.decode()
@@ -8,6 +8,12 @@ os.environ.setdefault(
     "JWT_SECRET_KEY",
     "pytest-jwt-secret-do-not-use-in-production-0123456789abcdef",
 )
+# Keep provider embeddings from persisting across tests; cache tests opt in.
+os.environ.setdefault("EMBEDDING_CACHE_ENABLED", "false")
+os.environ.setdefault("HTTP_CACHE_ENABLED", "false")
+os.environ.setdefault("PIPELINE_ARTIFACT_CACHE_ENABLED", "false")
+# Extract in a thread; pool tests build their own ExtractionPool.
+os.environ.setdefault("EXTRACTION_POOL_WORKERS", "0")
 
 import pytest
 import sqlalchemy.orm as orm
@@ -0,0 +1,214 @@
+"""Tests for the apply pipeline: concurrent LLM calls and batch apply."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.agents.cover_letter import CoverLetterOutput
+from app.agents.resume_tailor import TailoredResumeOutput
+from app.core.config import settings
+from app.models.db_models import ApplicationDB, CoverLetterDB, JobPostingDB, ResumeDB
+from app.models.job_model import JobPosting
+from app.services import apply_service, db_service
+from app.services.apply_service import ApplyService
+from app.services.db_service import DatabaseService
+from app.services.flat_vector_store import FlatVectorStore
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    """Stub the per-job LLM calls and record peak concurrency."""
+    stats = {"active": 0, "peak": 0, "parsed": 0}
+
+    async def tailor(resume_text, job_text, format_type="text"):
+        stats["active"] += 1
+        stats["peak"] = max(stats["peak"], stats["active"])
+        await asyncio.sleep(0.01)
+        stats["active"] -= 1
+        return TailoredResumeOutput(tailored_content=f"tailored for {job_text}")
+
+    async def cover(resume_text, job_text, company_name=None, hiring_manager=None):
+        return CoverLetterOutput(cover_letter=f"dear {company_name}")
+
+    async def parse(self, job_text):
+        stats["parsed"] += 1
+        return JobPosting(title="Parsed", required_skills=["python"])
+
+    monkeypatch.setattr(apply_service, "tailor_resume", tailor)
+    monkeypatch.setattr(apply_service, "generate_cover_letter", cover)
+    monkeypatch.setattr(apply_service.JobParser, "parse_job_text", parse)
+    monkeypatch.setattr(apply_service, "_apply_slots", None)
+    return stats
+
+
+@pytest.fixture
+def seeded():
+    db = db_service.get_db_session()
+    resume = ResumeDB(filename="cv.pdf", raw_text="Python engineer")
+    db.add(resume)
+    jobs = [
+        JobPostingDB(title=f"Role {i}", company=f"Co{i}", raw_text=f"job {i}") for i in range(5)
+    ]
+    jobs[0].content_json = {"required_skills": ["python"], "preferred_skills": []}
+    db.add_all(jobs)
+    db.commit()
+    yield db, resume.id, [j.id for j in jobs]
+    db.close()
+
+
+async def test_single_apply_runs_llm_calls_concurrently(seeded, fake_llm, monkeypatch):
+    db, resume_id, _ = seeded
+
+    async def slow_parse(self, job_text):
+        await asyncio.sleep(0.05)
+        return JobPosting(title="Parsed", required_skills=["python"])
+
+    monkeypatch.setattr(apply_service.JobParser, "parse_job_text", slow_parse)
+    monkeypatch.setattr(apply_service, "_auto_index_job", AsyncMock())
+    result = await ApplyService(DatabaseService(db)).run(resume_id, "jd", company_name="Acme")
+
+    timings = result["timings_ms"]
+    assert set(timings) == {"tailor_resume", "cover_letter", "parse_job", "total"}
+    # Total tracks the slowest call rather than the sum of all three.
+    assert timings["total"] < timings["parse_job"] + timings["tailor_resume"]
+    assert result["application_id"] is not None
+
+
+async def test_failed_call_cancels_its_siblings(monkeypatch):
+    cancelled = asyncio.Event()
+
+    async def slow_tailor(resume_text, job_text, format_type="text"):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def cover(*args):
+        return CoverLetterOutput(cover_letter="x")
+
+    async def broken_parse(self, job_text):
+        raise RuntimeError("parser down")
+
+    monkeypatch.setattr(apply_service, "tailor_resume", slow_tailor)
+    monkeypatch.setattr(apply_service, "generate_cover_letter", cover)
+    monkeypatch.setattr(apply_service.JobParser, "parse_job_text", broken_parse)
+
+    with pytest.raises(RuntimeError, match="parser down"):
+        await apply_service._build_package("cv", set(), "jd", concurrent=True)
+    assert cancelled.is_set()
+
+
+async def test_auto_indexed_job_matches_payload_filters(seeded, monkeypatch, tmp_path):
+    _, _, job_ids = seeded
+
+    class _Embedder:
+        async def embed_batch(self, texts):
+            return [[1.0] * 8 for _ in texts]
+
+    FlatVectorStore._instance = None
+    store = FlatVectorStore(embedding_service=_Embedder(), persist_dir=tmp_path, dim=8)
+    monkeypatch.setattr(apply_service, "get_vector_store", lambda: store)
+    try:
+        await apply_service._auto_index_job(job_ids[1], "job 1")
+
+        hits = store.search_by_vector("jobs", [1.0] * 8, 5, {"company": "Co1"})
+    finally:
+        FlatVectorStore._instance = None
+
+    assert [h["id"] for h in hits] == [f"job_{job_ids[1]}"]
+    assert hits[0]["metadata"]["company"] == "Co1"
+
+
+async def _collect(events):
+    return [event async for event in events]
+
+
+async def test_batch_streams_progress_and_persists_in_bulk(seeded, fake_llm, monkeypatch):
+    db, resume_id, job_ids = seeded
+    monkeypatch.setattr(settings, "APPLY_BATCH_CONCURRENCY", 2)
+    monkeypatch.setattr(settings, "APPLY_BATCH_FLUSH_SIZE", 3)
+
+    events = await _collect(ApplyService(DatabaseService(db)).run_batch(resume_id, job_ids))
+
+    kinds = [e["event"] for e in events]
+    assert kinds[0] == "started" and kinds[-1] == "done"
+    assert kinds.count("job") == 5 and kinds.count("saved") == 2
+    assert events[-1]["completed"] == 5 and events[-1]["failed"] == 0
+    assert fake_llm["peak"] == 2
+    # The first job's stored parse is reused instead of calling the parser.
+    assert fake_llm["parsed"] == 4
+
+    saved = {k: v for e in events if e["event"] == "saved" for k, v in e["applications"].items()}
+    assert set(saved) == {str(j) for j in job_ids} and all(saved.values())
+    assert db.query(ApplicationDB).count() == 5
+    assert db.query(CoverLetterDB).filter_by(company_name="Co1").one().cover_letter_text == (
+        "dear Co1"
+    )
+
+
+async def test_missing_jobs_fail_without_stopping_the_batch(seeded, fake_llm):
+    db, resume_id, job_ids = seeded
+
+    events = await _collect(
+        ApplyService(DatabaseService(db)).run_batch(resume_id, [job_ids[0], 9999, job_ids[0]])
+    )
+
+    failed = [e for e in events if e["event"] == "job" and e["status"] == "failed"]
+    assert [e["job_id"] for e in failed] == [9999]
+    assert events[-1]["total"] == 2 and events[-1]["completed"] == 1
+
+
+async def test_closing_the_stream_unwinds_running_jobs(seeded, fake_llm, monkeypatch):
+    db, resume_id, job_ids = seeded
+    entered, unwound = [], []
+
+    async def stuck_tailor(resume_text, job_text, format_type="text"):
+        if job_text == "job 0":
+            return TailoredResumeOutput(tailored_content="done")
+        entered.append(job_text)
+        try:
+            await asyncio.sleep(10)
+        finally:
+            unwound.append(job_text)
+
+    monkeypatch.setattr(apply_service, "tailor_resume", stuck_tailor)
+    events = ApplyService(DatabaseService(db)).run_batch(resume_id, job_ids)
+    assert (await events.__anext__())["event"] == "started"
+    assert (await events.__anext__())["job_id"] == job_ids[0]
+
+    await events.aclose()
+
+    # Stuck jobs have finished unwinding by the time the stream is closed.
+    assert entered and sorted(unwound) == sorted(entered)
+
+
+async def test_unknown_resume_raises_before_streaming(fake_llm):
+    db = db_service.get_db_session()
+    try:
+        with pytest.raises(ValueError):
+            await _collect(ApplyService(DatabaseService(db)).run_batch(404, [1]))
+    finally:
+        db.close()
+
+
+def test_batch_endpoint_streams_ndjson(seeded, fake_llm, monkeypatch):
+    from app.main import app
+
+    _, resume_id, job_ids = seeded
+    monkeypatch.setattr("app.api.pipeline_routes.get_db_session", db_service.get_db_session)
+    client = TestClient(app)
+
+    resp = client.post(
+        "/api/pipeline/apply/batch", json={"resume_id": resume_id, "job_ids": job_ids[:2]}
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    events = [json.loads(line) for line in resp.text.splitlines()]
+    assert events[-1]["event"] == "done" and events[-1]["completed"] == 2
+
+    missing = client.post("/api/pipeline/apply/batch", json={"resume_id": 404, "job_ids": [1]})
+    assert missing.status_code == 404
@@ -8,9 +8,11 @@ from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
 from app.models.db_models import Base, JobPostingDB, StartupDB
+from app.services import bigset_import_service
 from app.services.bigset_import_service import (
     BIGSET_CATEGORY,
     BigSetImportService,
+    iter_tabular_rows,
     load_mappings,
     mark_startup_scanned,
     normalize_url,
@@ -96,6 +98,94 @@ class TestBigSetImport:
         assert len(jobs) == 1
         assert "99 listings" in jobs[0].title
 
+    @pytest.mark.asyncio
+    async def test_reimport_reindexes_refreshed_rows(self, db_session, fixture_csv, monkeypatch):
+        class _RecordingStore:
+            is_available = True
+
+            def __init__(self):
+                self.batches = []
+
+            async def add_documents(self, collection, documents):
+                self.batches.append(documents)
+                return len(documents)
+
+        store = _RecordingStore()
+        monkeypatch.setattr(bigset_import_service, "get_vector_store", lambda: store)
+        svc = BigSetImportService(db_session)
+        await svc.import_file(fixture_csv, "yc-w26-hiring.csv", mapping_id="yc-w26-hiring")
+        updated_csv = fixture_csv.replace(
+            b"TestCorp Alpha,AI widgets,Series A,12,",
+            b"TestCorp Alpha,AI widgets,Series A,99,",
+        )
+
+        second = await svc.import_file(updated_csv, "yc-w26-hiring.csv", mapping_id="yc-w26-hiring")
+
+        assert second.stored == 0 and second.indexed == 2
+        alpha = next(d for d in store.batches[-1] if d["metadata"]["company"] == "TestCorp Alpha")
+        assert "99 listings" in alpha["text"]
+        assert alpha["metadata"]["source"] == "bigset"
+
+    @pytest.mark.asyncio
+    async def test_reimport_without_website_matches_stub_key(self, db_session, fixture_csv):
+        no_site = fixture_csv.replace(b",testcorp-alpha.com", b",")
+        svc = BigSetImportService(db_session)
+        await svc.import_file(no_site, "yc-w26-hiring.csv", mapping_id="yc-w26-hiring")
+        second = await svc.import_file(
+            no_site.replace(b"Series A,12,", b"Series A,13,"),
+            "yc-w26-hiring.csv",
+            mapping_id="yc-w26-hiring",
+        )
+        assert second.stored == 0
+        jobs = db_session.query(JobPostingDB).filter(JobPostingDB.company == "TestCorp Alpha").all()
+        assert len(jobs) == 1
+        assert jobs[0].dedupe_key == "stub:testcorp alpha|open roles"
+        assert "13 listings" in jobs[0].title
+
+
+class TestBigSetStreamingImport:
+    def test_iter_rows_from_path_matches_bytes(self, tmp_path, fixture_csv):
+        path = tmp_path / "export.csv"
+        path.write_bytes(fixture_csv)
+        assert list(iter_tabular_rows(path, path.name)) == parse_tabular_file(
+            fixture_csv, "export.csv"
+        )
+
+    @pytest.mark.asyncio
+    async def test_import_path_commits_each_chunk(self, db_session, tmp_path):
+        lines = ["Title,Company,URL"] + [f"Role {i},Co {i},jobs.example/{i}" for i in range(7)]
+        path = tmp_path / "jobs.csv"
+        path.write_text("\n".join(lines), encoding="utf-8")
+        progress = []
+
+        def on_progress(snapshot):
+            progress.append(snapshot)
+            assert db_session.query(JobPostingDB).count() == snapshot.stored
+
+        svc = BigSetImportService(db_session)
+        result = await svc.import_path(
+            path,
+            mapping_id="generic_job_listing",
+            chunk_size=3,
+            on_progress=on_progress,
+        )
+        assert result.success
+        assert result.stored == 7
+        assert result.rows_read == 7
+        assert [p.rows_read for p in progress] == [3, 6, 7]
+        assert result.chunks == 3
+
+    @pytest.mark.asyncio
+    async def test_duplicates_across_chunks_are_not_reinserted(self, db_session, fixture_csv):
+        doubled = fixture_csv + b"\n" + fixture_csv.split(b"\n", 1)[1]
+        svc = BigSetImportService(db_session)
+        result = await svc.import_file(
+            doubled, "yc-w26-hiring.csv", mapping_id="yc-w26-hiring", chunk_size=2
+        )
+        assert result.stored == 2
+        assert result.skipped_duplicates == 2
+        assert db_session.query(JobPostingDB).count() == 2
+
 
 class TestBigSetScanHelpers:
     def test_mark_startup_scanned_upserts_missing_row(self, db_session):
@@ -0,0 +1,140 @@
+"""Tests for the content-addressed extracted-text / parsed-resume cache."""
+
+import pytest
+
+from app.models.db_models import ParsedDocumentDB
+from app.models.resume_model import ContactInfo, Resume
+from app.services import db_service, document_cache
+from app.services.db_service import DatabaseService
+from app.services.document_cache import document_key, extract_text_cached
+from app.services.parsing_service import EXTRACTOR_VERSION, ResumeParseError, ResumeParser
+
+
+class _FakeLLM:
+    def __init__(self, version: str = "v1", fail: bool = False):
+        self.version = version
+        self.fail = fail
+        self.calls = 0
+
+    def resume_parser_version(self) -> str:
+        return self.version
+
+    async def parse_resume(self, text: str) -> Resume:
+        self.calls += 1
+        if self.fail:
+            raise ResumeParseError("rate limited")
+        return Resume(contact_info=ContactInfo(name="Ada Lovelace"), summary="Engineer")
+
+
+@pytest.fixture
+def extractions(monkeypatch):
+    calls: list[str] = []
+
+    async def fake_extract(content: bytes, filename: str) -> str:
+        calls.append(filename)
+        return content.decode()
+
+    monkeypatch.setattr(document_cache, "extract_text_async", fake_extract)
+    return calls
+
+
+class TestExtractTextCached:
+    async def test_identical_bytes_skip_extraction(self, extractions):
+        assert await extract_text_cached(b"Python engineer", "cv.pdf") == "Python engineer"
+        assert await extract_text_cached(b"Python engineer", "renamed.pdf") == "Python engineer"
+        assert extractions == ["cv.pdf"]
+
+    async def test_different_bytes_or_format_miss(self, extractions):
+        await extract_text_cached(b"Python engineer", "cv.pdf")
+        await extract_text_cached(b"Python engineer!", "cv.pdf")
+        await extract_text_cached(b"Python engineer", "cv.docx")
+        assert extractions == ["cv.pdf", "cv.pdf", "cv.docx"]
+
+    async def test_empty_extraction_is_not_cached(self, monkeypatch):
+        calls = []
+
+        async def empty(content: bytes, filename: str) -> str:
+            calls.append(filename)
+            return ""
+
+        monkeypatch.setattr(document_cache, "extract_text_async", empty)
+        await extract_text_cached(b"%PDF scanned", "scan.pdf")
+        await extract_text_cached(b"%PDF scanned", "scan.pdf")
+        assert len(calls) == 2
+
+    async def test_disabled(self, extractions, monkeypatch):
+        monkeypatch.setattr(document_cache.settings, "DOCUMENT_CACHE_ENABLED", False)
+        await extract_text_cached(b"cv", "cv.pdf")
+        await extract_text_cached(b"cv", "cv.pdf")
+        assert extractions == ["cv.pdf", "cv.pdf"]
+
+
+class TestParsedResumeCache:
+    async def test_repeat_upload_costs_no_llm_call(self, extractions):
+        llm = _FakeLLM()
+        parser = ResumeParser(llm)
+
+        first = await parser.parse_resume_file_content(b"Ada, Python", "cv.pdf")
+        second = await parser.parse_resume_file_content(b"Ada, Python", "cv.pdf")
+
+        assert llm.calls == 1
+        assert extractions == ["cv.pdf"]
+        assert second == first
+        assert second.raw_text == "Ada, Python"
+
+    async def test_upload_reads_the_cache_row_once(self, extractions):
+        parser = ResumeParser(_FakeLLM())
+        await parser.parse_resume_file_content(b"Ada, Python", "cv.pdf")
+        await parser.parse_resume_file_content(b"Ada, Python", "cv.pdf")
+
+        db = db_service.get_db_session()
+        try:
+            hits = db.query(ParsedDocumentDB.hits).scalar()
+        finally:
+            db.close()
+        # The first upload misses; the second is one hit, not one per lookup.
+        assert hits == 1
+
+    async def test_parser_version_change_reparses(self, extractions):
+        await ResumeParser(_FakeLLM("v1")).parse_resume_file_content(b"Ada", "cv.pdf")
+        llm = _FakeLLM("v2")
+        await ResumeParser(llm).parse_resume_file_content(b"Ada", "cv.pdf")
+        await ResumeParser(llm).parse_resume_file_content(b"Ada", "cv.pdf")
+
+        assert llm.calls == 1
+        assert extractions == ["cv.pdf"]
+
+    async def test_failed_parse_is_not_cached(self, extractions):
+        failing = _FakeLLM(fail=True)
+        placeholder = await ResumeParser(failing).parse_resume_file_content(b"Ada", "cv.pdf")
+        assert placeholder.summary == "Parsing failed: rate limited"
+        llm = _FakeLLM()
+        resume = await ResumeParser(llm).parse_resume_file_content(b"Ada", "cv.pdf")
+
+        assert llm.calls == 1
+        assert resume.contact_info.name == "Ada Lovelace"
+
+
+class TestParsedDocumentStorage:
+    def test_prunes_least_recently_used(self):
+        db = db_service.get_db_session()
+        try:
+            svc = DatabaseService(db)
+            for i in range(4):
+                svc.store_parsed_document(f"{i:064d}", "pdf", EXTRACTOR_VERSION, f"text {i}")
+            svc.get_parsed_document(f"{0:064d}", "pdf", EXTRACTOR_VERSION)
+            svc.store_parsed_document("f" * 64, "pdf", EXTRACTOR_VERSION, "new", max_entries=3)
+
+            kept = {
+                row["content_sha256"][-1] for row in svc.query_records("parsed_documents", limit=10)
+            }
+            assert kept == {"0", "3", "f"}
+        finally:
+            db.close()
+
+    def test_document_key(self):
+        key = document_key(b"abc", "Resume.PDF")
+        assert key.file_format == "pdf"
+        assert key.content_sha256 == (
+            "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"
+        )
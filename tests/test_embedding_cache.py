@@ -0,0 +1,111 @@
+"""Tests for the persistent embedding cache and its use by EmbeddingService."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.embedding_cache import EmbeddingCache
+from app.services.embedding_service import EmbeddingService
+
+
+@pytest.fixture(autouse=True)
+def reset_singleton():
+    EmbeddingService._instance = None
+    yield
+    EmbeddingService._instance = None
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = EmbeddingCache(tmp_path / "emb.sqlite", max_bytes=1_000_000)
+    yield c
+    c.close()
+
+
+def _approx(a, b):
+    return all(abs(x - y) < 1e-6 for x, y in zip(a, b, strict=True))
+
+
+class TestEmbeddingCache:
+    def test_roundtrip_and_stats(self, cache):
+        cache.put_many("m", {"hello": [0.25, -0.5, 1.0]})
+        found = cache.get_many("m", ["hello", "missing"])
+        assert found == {"hello": [0.25, -0.5, 1.0]}
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+        assert stats["bytes"] == 12
+
+    def test_keyed_by_model(self, cache):
+        cache.put_many("a", {"x": [1.0]})
+        assert cache.get_many("b", ["x"]) == {}
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "emb.sqlite"
+        first = EmbeddingCache(path, max_bytes=1_000_000)
+        first.put_many("m", {"t": [0.5, 0.5]})
+        first.close()
+        second = EmbeddingCache(path, max_bytes=1_000_000)
+        assert second.get_many("m", ["t"]) == {"t": [0.5, 0.5]}
+        assert second.stats()["bytes"] == 8
+        second.close()
+
+    def test_lru_eviction_keeps_recently_used(self, tmp_path):
+        cache = EmbeddingCache(tmp_path / "emb.sqlite", max_bytes=40)
+        cache.put_many("m", {"old": [0.0] * 4})
+        cache.put_many("m", {"used": [1.0] * 4})
+        cache.get_many("m", ["old"])
+        cache.put_many("m", {"new": [2.0] * 4})
+        assert set(cache.get_many("m", ["old", "used", "new"])) == {"old", "new"}
+        assert cache.stats()["evictions"] == 1
+        cache.close()
+
+
+class TestEmbeddingServiceCache:
+    @pytest.fixture
+    def svc(self, cache):
+        svc = EmbeddingService()
+        svc._use_fallback = False
+        svc._cache = cache
+        return svc
+
+    @pytest.mark.asyncio
+    async def test_embed_text_hits_cache_second_time(self, svc):
+        response = AsyncMock()
+        response.data = [{"embedding": [0.1, 0.2]}]
+        mock_litellm = AsyncMock()
+        mock_litellm.aembedding = AsyncMock(return_value=response)
+        with patch.dict("sys.modules", {"litellm": mock_litellm}):
+            first = await svc.embed_text("resume")
+            second = await svc.embed_text("resume")
+        assert mock_litellm.aembedding.await_count == 1
+        assert _approx(first, second)
+        assert svc.cache_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_embed_batch_only_sends_misses(self, svc, cache):
+        cache.put_many(svc.model, {"a": [0.5, 0.5]})
+        response = AsyncMock()
+        response.data = [{"embedding": [0.3, 0.4]}]
+        mock_litellm = AsyncMock()
+        mock_litellm.aembedding = AsyncMock(return_value=response)
+        with patch.dict("sys.modules", {"litellm": mock_litellm}):
+            result = await svc.embed_batch(["a", "b", "", "b"])
+        assert mock_litellm.aembedding.await_args.kwargs["input"] == ["b"]
+        assert result[0] == [0.5, 0.5]
+        assert _approx(result[1], [0.3, 0.4])
+        assert result[2] == [0.0] * 384
+        assert _approx(result[3], [0.3, 0.4])
+        assert set(cache.get_many(svc.model, ["b"])) == {"b"}
+
+    @pytest.mark.asyncio
+    async def test_fallback_vectors_are_not_cached(self, svc, cache):
+        with patch.dict("sys.modules", {"litellm": None}):
+            await svc.embed_batch(["offline"])
+        assert cache.stats()["entries"] == 0
+
+    def test_disabled_cache_stats(self):
+        svc = EmbeddingService()
+        svc._cache = None
+        assert svc.cache_stats() == {"enabled": False}
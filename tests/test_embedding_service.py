@@ -1,10 +1,17 @@
 """Tests for EmbeddingService — mock-based, no actual API calls."""
 
+import hashlib
 from unittest.mock import AsyncMock, patch
 
+import numpy as np
 import pytest
 
-from app.services.embedding_service import EmbeddingService, get_embedding_service
+from app.services.embedding_service import (
+    EmbeddingService,
+    get_embedding_service,
+    hash_embed_batch,
+    ngram_embed_batch,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -40,6 +47,57 @@ class TestHashEmbed:
         assert len(vec) == 384
 
 
+def _legacy_hash_embed(text: str, dim: int = 384) -> list[float]:
+    """Pre-vectorization implementation; indexed vectors depend on its output."""
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    values = []
+    for i in range(dim):
+        hex_pair = digest[(i * 2) % len(digest) : (i * 2 + 2) % len(digest)]
+        if len(hex_pair) < 2:
+            hex_pair = digest[:2]
+        values.append((int(hex_pair, 16) / 255.0) * 2.0 - 1.0)
+    norm = (sum(v * v for v in values) ** 0.5) or 1.0
+    return [v / norm for v in values]
+
+
+class TestVectorizedFallback:
+    def test_hash_batch_matches_legacy_values(self):
+        texts = ["hello", "", "ünïcode text", "x" * 5000]
+        matrix = hash_embed_batch(texts)
+        assert matrix.shape == (4, 384)
+        assert matrix.dtype == np.float32
+        for row, text in zip(matrix, texts):
+            assert np.allclose(row, _legacy_hash_embed(text), atol=1e-6)
+
+    def test_ngram_similar_texts_score_higher(self):
+        m = ngram_embed_batch(
+            ["senior python backend engineer", "python backend developer", "pastry chef"]
+        )
+        sims = m @ m.T
+        assert sims[0, 1] > 0.3
+        assert sims[0, 1] > 3 * sims[0, 2]
+
+    def test_ngram_rows_normalized_and_empty_is_zero(self):
+        m = ngram_embed_batch(["Data Scientist", "  ", "ab"])
+        assert m.dtype == np.float32
+        assert abs(np.linalg.norm(m[0]) - 1.0) < 1e-5
+        assert not m[1].any()
+        assert abs(np.linalg.norm(m[2]) - 1.0) < 1e-5
+
+    def test_ngram_is_case_and_whitespace_insensitive(self):
+        m = ngram_embed_batch(["Machine  Learning", "machine learning"])
+        assert np.allclose(m[0], m[1])
+
+    @pytest.mark.asyncio
+    async def test_service_uses_ngram_mode(self):
+        svc = EmbeddingService()
+        svc._use_fallback = True
+        svc._fallback_mode = "ngram"
+        result = await svc.embed_batch(["python engineer", ""])
+        assert np.allclose(result[0], ngram_embed_batch(["python engineer"])[0])
+        assert result[1] == [0.0] * 384
+
+
 class TestEmbeddingServiceSingleton:
     def test_singleton(self):
         svc1 = EmbeddingService()
@@ -0,0 +1,120 @@
+"""Tests for off-loop document extraction (process pool, batch, stats)."""
+
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services import extraction_pool
+from app.services.extraction_pool import (
+    ExtractionPool,
+    ExtractionStats,
+    extract_text_async,
+    extract_texts_async,
+    extraction_stats,
+)
+from tests._extraction_workers import hang_on_slow, shout
+
+
+@pytest.fixture(autouse=True)
+def fresh_stats(monkeypatch):
+    monkeypatch.setattr(extraction_pool, "_stats", ExtractionStats())
+
+
+class TestExtractionPool:
+    async def test_extracts_in_worker_process(self):
+        pool = ExtractionPool(max_workers=1, timeout_seconds=30, extractor=shout)
+        try:
+            assert await pool.extract(b"resume", "cv.pdf") == "RESUME"
+        finally:
+            pool.shutdown()
+
+    async def test_timeout_kills_worker_and_pool_recovers(self):
+        pool = ExtractionPool(max_workers=1, timeout_seconds=30, extractor=hang_on_slow)
+        try:
+            # Warm the worker so spawn start-up does not count against the short timeout.
+            assert await pool.extract(b"ok", "fast.pdf") == "ok"
+            pool._timeout = 0.5
+            started = time.perf_counter()
+            with pytest.raises(TimeoutError):
+                await pool.extract(b"scan", "slow.pdf")
+            assert time.perf_counter() - started < 5
+
+            pool._timeout = 30
+            assert await pool.extract(b"after", "fast.pdf") == "after"
+        finally:
+            pool.shutdown()
+
+
+class TestExtractTextAsync:
+    async def test_plain_text_and_latex(self):
+        assert await extract_text_async(b"hello", "cv.txt") == "hello"
+        latex = rb"\section{Experience}\textbf{Engineer}"
+        assert "Engineer" in await extract_text_async(latex, "cv.tex")
+
+    async def test_batch_preserves_order_and_reports_errors(self, monkeypatch):
+        def fake_extract(content: bytes, filename: str) -> str:
+            if filename == "broken.pdf":
+                raise ValueError("corrupt xref table")
+            return filename
+
+        monkeypatch.setattr(extraction_pool, "extract_text", fake_extract)
+        results = await extract_texts_async(
+            [(b"a", "a.pdf"), (b"b", "broken.pdf"), (b"c", "c.docx")]
+        )
+
+        assert [r.text for r in results] == ["a.pdf", "", "c.docx"]
+        assert [r.error for r in results] == [None, "Extraction failed", None]
+
+    async def test_thread_mode_timeout(self, monkeypatch):
+        monkeypatch.setattr(extraction_pool.settings, "EXTRACTION_TIMEOUT_SECONDS", 0.05)
+        monkeypatch.setattr(extraction_pool, "extract_text", lambda c, f: time.sleep(0.3) or "x")
+
+        (result,) = await extract_texts_async([(b"scan", "scan.pdf")])
+        assert result.error == "Extraction timed out"
+        assert extraction_stats()["formats"]["pdf"]["timeouts"] == 1
+
+    async def test_stats_are_per_format(self):
+        await extract_text_async(b"one", "a.txt")
+        await extract_text_async(b"three", "b.txt")
+        await extract_text_async(b"# title", "c.md")
+
+        stats = extraction_stats()
+        assert stats["mode"] == "thread"
+        assert stats["formats"]["txt"]["files"] == 2
+        assert stats["formats"]["txt"]["bytes"] == 8
+        assert stats["formats"]["md"]["files"] == 1
+
+
+class TestExtractRoutes:
+    @pytest.fixture
+    def client(self):
+        return TestClient(app)
+
+    def test_batch_endpoint(self, client):
+        resp = client.post(
+            "/api/extract/batch",
+            files=[
+                ("files", ("one.txt", b"Python engineer", "text/plain")),
+                ("files", ("two.md", b"# SQL analyst", "text/markdown")),
+            ],
+        )
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["success"] is True
+        assert [r["text"] for r in body["results"]] == ["Python engineer", "# SQL analyst"]
+
+        stats = client.get("/api/extract/stats").json()["stats"]
+        assert stats["formats"]["txt"]["files"] == 1
+
+    def test_batch_endpoint_limits_file_count(self, client, monkeypatch):
+        monkeypatch.setattr(extraction_pool.settings, "EXTRACTION_BATCH_MAX_FILES", 1)
+        resp = client.post(
+            "/api/extract/batch",
+            files=[
+                ("files", ("one.txt", b"a", "text/plain")),
+                ("files", ("two.txt", b"b", "text/plain")),
+            ],
+        )
+        assert resp.status_code == 422
@@ -0,0 +1,266 @@
+"""Tests for the flat memory-mapped vector store and backend selection.
+
+The ``store`` fixture runs the shared contract tests against both the
+embedded Qdrant backend and :class:`FlatVectorStore`.
+"""
+
+import numpy as np
+import pytest
+
+from app.services import db_service, flat_vector_store, vector_store
+from app.services.db_service import DatabaseService
+from app.services.embedding_service import EmbeddingService
+from app.services.flat_vector_store import FlatCollection, FlatVectorStore
+from app.services.search_service import SearchService
+from app.services.vector_store import VectorStore, get_vector_store
+
+DOCS = [
+    {"id": "job_1", "text": "python backend engineer", "metadata": {"company": "Ledgerly"}},
+    {"id": "job_2", "text": "react frontend developer", "metadata": {"company": "Pixelpush"}},
+    {"id": "job_3", "text": "rust systems engineer", "metadata": {"company": "Ferrous"}},
+    {"id": "job_4", "text": "python data engineer", "metadata": {"company": "Streamline"}},
+]
+
+
+@pytest.fixture(autouse=True)
+def reset_singletons():
+    EmbeddingService._instance = None
+    VectorStore._instance = None
+    FlatVectorStore._instance = None
+    yield
+    for store in (VectorStore._instance, FlatVectorStore._instance):
+        client = getattr(store, "_client", None)
+        if client is not None:
+            client.close()
+    EmbeddingService._instance = None
+    VectorStore._instance = None
+    FlatVectorStore._instance = None
+
+
+@pytest.fixture
+def embedder():
+    svc = EmbeddingService()
+    svc._use_fallback = True
+    return svc
+
+
+@pytest.fixture(params=["qdrant", "flat"])
+def store(request, embedder, tmp_path):
+    if request.param == "qdrant":
+        if not vector_store.QDRANT_AVAILABLE:
+            pytest.skip("qdrant-client not installed")
+        return VectorStore(embedding_service=embedder, persist_dir=tmp_path / "qdrant")
+    return FlatVectorStore(embedding_service=embedder, persist_dir=tmp_path / "vectors")
+
+
+class TestBackendContract:
+    async def test_add_and_search(self, store):
+        assert await store.add_documents("jobs", DOCS) == 4
+
+        results = await store.search("jobs", "python backend engineer", n_results=2)
+
+        assert [r["id"] for r in results][0] == "job_1"
+        assert len(results) == 2
+        assert results[0]["text"] == "python backend engineer"
+        assert results[0]["metadata"] == {"company": "Ledgerly"}
+        assert results[0]["score"] >= results[1]["score"]
+
+    async def test_filter_upsert_and_delete(self, store):
+        await store.add_documents("jobs", DOCS)
+        await store.add_document("jobs", "job_2", "python platform engineer", {"company": "X"})
+        store.delete_document("jobs", "job_1")
+
+        results = await store.search("jobs", "python engineer", n_results=10)
+        filtered = await store.search("jobs", "python", filter_by={"company": "X"})
+
+        assert {r["id"] for r in results} == {"job_2", "job_3", "job_4"}
+        assert [(r["id"], r["text"]) for r in filtered] == [("job_2", "python platform engineer")]
+        assert store.get_collection_stats("jobs")["count"] == 3
+
+    async def test_any_of_and_range_filters(self, store):
+        docs = [
+            {**doc, "metadata": {**doc["metadata"], "job_id": i, "source": "bigset"}}
+            for i, doc in enumerate(DOCS, start=1)
+        ]
+        await store.add_documents("jobs", docs)
+
+        any_of = await store.search("jobs", "engineer", 10, {"company": ["Ferrous", "Ledgerly"]})
+        ranged = await store.search("jobs", "engineer", 10, {"job_id": {"gte": 2, "lt": 4}})
+        both = await store.search("jobs", "engineer", 10, {"source": "bigset", "job_id": [4]})
+
+        assert {r["id"] for r in any_of} == {"job_1", "job_3"}
+        assert {r["id"] for r in ranged} == {"job_2", "job_3"}
+        assert [r["id"] for r in both] == ["job_4"]
+
+    async def test_search_by_stored_vector(self, store, embedder, monkeypatch):
+        await store.add_documents("jobs", DOCS)
+        await store.add_document("resumes", "resume_1", "rust systems engineer")
+        calls = []
+        monkeypatch.setattr(embedder, "embed_text", lambda text: calls.append(text))
+
+        vector = store.get_vector("resumes", "resume_1")
+        results = store.search_by_vector("jobs", vector, 2, {"company": ["Ferrous", "Ledgerly"]})
+
+        assert [r["id"] for r in results][0] == "job_3"
+        assert {r["id"] for r in results} == {"job_1", "job_3"}
+        assert store.get_vector("resumes", "resume_2") is None
+        assert calls == []
+
+    async def test_set_payload_merges_fields(self, store):
+        await store.add_documents("jobs", DOCS)
+
+        updated = store.set_payload(
+            "jobs", {"job_1": {"source": "bigset"}, "job_9": {"source": "bigset"}}
+        )
+        results = await store.search("jobs", "engineer", 10, {"source": "bigset"})
+
+        assert updated == 1
+        assert [(r["id"], r["metadata"]) for r in results] == [
+            ("job_1", {"company": "Ledgerly", "source": "bigset"})
+        ]
+        assert results[0]["text"] == "python backend engineer"
+
+    async def test_backfill_job_payloads_from_postings(self, store):
+        db = db_service.get_db_session()
+        try:
+            svc = DatabaseService(db)
+            imported, manual = svc.store_scraped_jobs_batch(
+                [
+                    {
+                        "title": "Rust engineer",
+                        "company": "Ferrous",
+                        "location": "Berlin",
+                        "raw_text": "rust",
+                        "parsed_data": {"source": "bigset", "mapping_id": "m1"},
+                    },
+                    {"title": "Rust developer", "company": "Acme", "raw_text": "rust"},
+                ]
+            )
+            await store.add_documents(
+                "jobs",
+                [{"id": f"job_{job_id}", "text": "rust engineer"} for job_id in (imported, manual)],
+            )
+            search = SearchService(vector_store=store, db_service=svc)
+
+            assert await search.search_jobs("rust", filters={"source": "bigset"}) == []
+            assert search.backfill_job_payloads(batch_size=1) == 2
+            hits = await search.search_jobs("rust", filters={"source": "bigset"})
+        finally:
+            db.close()
+
+        assert [h["id"] for h in hits] == [f"job_{imported}"]
+        assert hits[0]["metadata"] == {
+            "source": "bigset",
+            "mapping_id": "m1",
+            "company": "Ferrous",
+            "location": "Berlin",
+            "job_id": imported,
+        }
+
+    async def test_empty_query_and_collection(self, store):
+        assert await store.search("jobs", "   ") == []
+        assert await store.search("resumes", "python") == []
+        assert store.get_all_stats()["collections"]["resumes"]["count"] == 0
+
+
+class TestFlatCollection:
+    def _vectors(self, n, dim=8, seed=0):
+        return np.random.default_rng(seed).standard_normal((n, dim)).astype(np.float32)
+
+    def test_exact_top_k_matches_brute_force(self, tmp_path):
+        col = FlatCollection(tmp_path / "c", dim=8)
+        vectors = self._vectors(3000)
+        col.upsert([f"d{i}" for i in range(3000)], vectors, [{"i": i} for i in range(3000)])
+        query = self._vectors(1, seed=1)[0]
+
+        hits = col.search(query, 10)
+
+        normed = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        expected = np.argsort(-(normed @ (query / np.linalg.norm(query))))[:10]
+        assert [h[0] for h in hits] == [f"d{i}" for i in expected]
+        assert hits[0][2] == {"i": int(expected[0])}
+
+    def test_persists_across_reopen(self, tmp_path):
+        col = FlatCollection(tmp_path / "c", dim=8)
+        vectors = self._vectors(5)
+        col.upsert(list("abcde"), vectors, [{} for _ in range(5)])
+        col.delete(["b"])
+        col.close()
+
+        reopened = FlatCollection(tmp_path / "c", dim=8)
+
+        assert reopened.count == 4 and reopened.tombstones == 1
+        assert reopened.search(vectors[2], 1)[0][0] == "c"
+        assert "b" not in {h[0] for h in reopened.search(vectors[1], 5)}
+
+    def test_compaction_drops_tombstones(self, tmp_path):
+        col = FlatCollection(tmp_path / "c", dim=8)
+        vectors = self._vectors(10)
+        ids = [f"d{i}" for i in range(10)]
+        col.upsert(ids, vectors, [{"i": i} for i in range(10)])
+        col.delete(ids[:6])
+
+        assert col.compact() == 6
+
+        assert col.count == 4 and col.tombstones == 0
+        assert col.search(vectors[7], 1)[0][:1] == ("d7",)
+        assert col.search(vectors[7], 1)[0][2] == {"i": 7}
+        assert FlatCollection(tmp_path / "c", dim=8).count == 4
+
+    def test_auto_compacts_past_dead_ratio(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(flat_vector_store, "_COMPACT_MIN_DEAD", 4)
+        col = FlatCollection(tmp_path / "c", dim=8)
+        ids = [f"d{i}" for i in range(10)]
+        col.upsert(ids, self._vectors(10), [{} for _ in ids])
+
+        col.delete(ids[:2])
+        assert col.tombstones == 2
+        col.delete(ids[2:4])
+        assert col.tombstones == 0 and col.count == 6
+
+    def test_grows_past_initial_capacity(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(flat_vector_store, "_MIN_CAPACITY", 4)
+        col = FlatCollection(tmp_path / "c", dim=8)
+        vectors = self._vectors(9)
+        for i in range(9):
+            col.upsert([f"d{i}"], vectors[i : i + 1], [{}])
+
+        assert col.count == 9
+        assert col.search(vectors[8], 1)[0][0] == "d8"
+
+    def test_payload_fields_are_indexed(self, tmp_path):
+        col = FlatCollection(tmp_path / "c", dim=8, indexed=["source"])
+        col.upsert(["a"], self._vectors(1), [{"source": "bigset"}])
+
+        plan = col._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT row FROM points "
+            "WHERE deleted = 0 AND json_extract(payload, '$.source') = 'bigset'"
+        ).fetchall()
+
+        assert "ix_points_source" in str(plan)
+        assert [h[0] for h in col.search(np.ones(8), 5, {"source": "bigset"})] == ["a"]
+        with pytest.raises(ValueError):
+            col.search(np.ones(8), 5, {"bad key": 1})
+
+    def test_rejects_wrong_dimension(self, tmp_path):
+        col = FlatCollection(tmp_path / "c", dim=8)
+        with pytest.raises(ValueError):
+            col.upsert(["a"], np.ones((1, 4)), [{}])
+
+
+class TestBackendSelection:
+    def test_flat_backend(self, monkeypatch, embedder, tmp_path):
+        monkeypatch.setattr(vector_store.settings, "VECTOR_STORE_BACKEND", "flat")
+        monkeypatch.setattr(vector_store.settings, "FLAT_VECTOR_PATH", str(tmp_path))
+
+        store = get_vector_store()
+
+        assert isinstance(store, FlatVectorStore)
+        assert store.get_all_stats()["backend"] == "flat"
+
+    def test_auto_falls_back_when_qdrant_unavailable(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(vector_store.settings, "VECTOR_STORE_BACKEND", "auto")
+        monkeypatch.setattr(vector_store.settings, "FLAT_VECTOR_PATH", str(tmp_path))
+        monkeypatch.setattr(vector_store, "QDRANT_AVAILABLE", False)
+
+        assert isinstance(get_vector_store(), FlatVectorStore)
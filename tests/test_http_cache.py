@@ -0,0 +1,115 @@
+"""Tests for the conditional-GET response cache."""
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.services import http_cache, http_client
+from app.services.http_cache import CachedEntry, HTTPCache, cached_fetch_text, cached_get
+from app.services.job_board_scraper import RemoteOKScraper
+
+REMOTEOK_PAYLOAD = [
+    {"legal": "metadata"},
+    {"position": "ML Engineer", "company": "Acme", "url": "https://remoteok.com/1"},
+]
+
+
+@pytest.fixture
+def server(monkeypatch, tmp_path):
+    """Shared client routed to a fake server that honours If-None-Match."""
+    calls: list[httpx.Request] = []
+    state = {"etag": '"v1"', "json": REMOTEOK_PAYLOAD}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.headers.get("if-none-match") == state["etag"]:
+            return httpx.Response(304)
+        return httpx.Response(200, json=state["json"], headers={"ETag": state["etag"]})
+
+    monkeypatch.setattr(
+        http_client,
+        "_build_client",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    cache = HTTPCache(tmp_path / "http_cache.sqlite", max_bytes=1_000_000)
+    monkeypatch.setattr(settings, "HTTP_CACHE_ENABLED", True)
+    monkeypatch.setattr(http_cache, "_cache", cache)
+    yield calls, state, cache
+    cache.close()
+    http_client._client = None
+
+
+async def test_fresh_entry_skips_network(server):
+    calls, _, cache = server
+    first = await cached_get("https://api.example/jobs", source="remoteok", ttl=60)
+    second = await cached_get("https://api.example/jobs", source="remoteok", ttl=60)
+
+    assert first.state == http_cache.FETCHED
+    assert second.state == http_cache.FRESH and second.from_cache
+    assert second.json() == REMOTEOK_PAYLOAD
+    assert len(calls) == 1
+    assert cache.stats()["by_source"]["remoteok"]["hit_rate"] == 0.5
+
+
+async def test_expired_entry_revalidates_with_etag(server):
+    calls, state, _ = server
+    await cached_get("https://api.example/jobs", source="remoteok", ttl=0)
+    again = await cached_get("https://api.example/jobs", source="remoteok", ttl=0)
+
+    assert calls[-1].headers["if-none-match"] == '"v1"'
+    assert again.state == http_cache.REVALIDATED
+    assert again.json() == REMOTEOK_PAYLOAD
+
+    state.update(etag='"v2"', json=[{"legal": "metadata"}])
+    changed = await cached_get("https://api.example/jobs", source="remoteok", ttl=0)
+    assert changed.state == http_cache.FETCHED
+    assert changed.json() == [{"legal": "metadata"}]
+
+
+async def test_scraper_reuses_parse_for_unchanged_payload(server, monkeypatch):
+    calls, _, cache = server
+    monkeypatch.setattr(settings, "HTTP_CACHE_SOURCE_TTLS", {"remoteok": 0})
+    scraper = RemoteOKScraper()
+
+    first = await scraper.search("ml", limit=5)
+    second = await scraper.search("ml", limit=5)
+
+    assert [j.title for j in first] == [j.title for j in second] == ["ML Engineer"]
+    assert len(calls) == 2
+    counts = cache.stats()["by_source"]["remoteok"]
+    assert counts[http_cache.REVALIDATED] == 1
+    assert counts[http_cache.PARSE_SKIPPED] == 1
+
+
+async def test_opaque_fetches_cache_hits_within_ttl(server):
+    fetched: list[str] = []
+
+    async def fetch(url: str) -> str | None:
+        fetched.append(url)
+        return "We are hiring"
+
+    assert await cached_fetch_text("career_page", "https://acme.io/jobs", fetch) == "We are hiring"
+    assert await cached_fetch_text("career_page", "https://acme.io/jobs", fetch) == "We are hiring"
+    assert fetched == ["https://acme.io/jobs"]
+
+
+async def test_opaque_fetch_failures_are_not_cached(server):
+    fetched: list[str] = []
+
+    async def fetch(url: str) -> str | None:
+        fetched.append(url)
+        return None
+
+    assert await cached_fetch_text("career_page", "https://acme.io/jobs", fetch) is None
+    assert await cached_fetch_text("career_page", "https://acme.io/jobs", fetch) is None
+    assert fetched == ["https://acme.io/jobs", "https://acme.io/jobs"]
+
+
+def test_eviction_keeps_cache_under_budget(tmp_path):
+    cache = HTTPCache(tmp_path / "c.sqlite", max_bytes=250)
+    for i in range(5):
+        cache.put(f"k{i}", CachedEntry("remoteok", 200, b"x" * 100, f"d{i}", float(i)))
+    stats = cache.stats()
+    assert stats["bytes"] <= 250
+    assert cache.get("k0") is None and cache.get("k4") is not None
+    cache.close()
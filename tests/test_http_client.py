@@ -0,0 +1,73 @@
+"""Tests for the shared pooled HTTP client."""
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.services import http_client
+
+
+@pytest.fixture
+def mock_transport(monkeypatch):
+    """Route the shared client through a scripted MockTransport."""
+    calls: list[httpx.Request] = []
+    responses: list = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        item = responses.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    monkeypatch.setattr(
+        http_client,
+        "_build_client",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    monkeypatch.setattr(settings, "HTTP_RETRY_BACKOFF_SECONDS", 0.0)
+    yield calls, responses
+    http_client._client = None
+
+
+async def test_client_is_reused_within_a_loop(mock_transport):
+    assert http_client.get_http_client() is http_client.get_http_client()
+    await http_client.close_http_client()
+    assert http_client._client is None
+
+
+async def test_retries_retryable_status_then_succeeds(mock_transport):
+    calls, responses = mock_transport
+    responses.extend([httpx.Response(503), httpx.Response(200, json={"ok": True})])
+
+    resp = await http_client.http_get("https://api.example/jobs", retries=2)
+
+    assert resp.status_code == 200
+    assert resp.json() == {"ok": True}
+    assert len(calls) == 2
+
+
+async def test_retries_transport_errors_and_reraises_when_exhausted(mock_transport):
+    calls, responses = mock_transport
+    responses.extend([httpx.ConnectError("down"), httpx.ConnectError("still down")])
+
+    with pytest.raises(httpx.ConnectError):
+        await http_client.http_get("https://api.example/jobs", retries=1)
+    assert len(calls) == 2
+
+
+async def test_non_retryable_status_is_returned_immediately(mock_transport):
+    calls, responses = mock_transport
+    responses.append(httpx.Response(404))
+
+    resp = await http_client.http_post("https://api.example/jobs", json={}, retries=3)
+
+    assert resp.status_code == 404
+    assert len(calls) == 1
+
+
+def test_backoff_honours_retry_after_with_cap():
+    resp = httpx.Response(429, headers={"Retry-After": "7"})
+    assert http_client._backoff_delay(0, resp) == 7.0
+    resp = httpx.Response(429, headers={"Retry-After": "9999"})
+    assert http_client._backoff_delay(0, resp) == http_client._MAX_BACKOFF_SECONDS
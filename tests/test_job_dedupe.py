@@ -0,0 +1,123 @@
+"""Tests for set-based job dedupe and bulk batch inserts."""
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import sessionmaker
+
+from app.models.db_models import Base, JobPostingDB, create_tables
+from app.services.db_service import DatabaseService
+from app.services.job_dedupe import (
+    dedupe_key_for_job,
+    find_existing_job,
+    find_existing_jobs,
+    job_dedupe_key,
+    load_dedupe_keys,
+)
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    yield session
+    session.close()
+
+
+def _job(title: str, company: str = "Acme", url: str | None = None, **extra):
+    return {
+        "title": title,
+        "company": company,
+        "location": "Berlin",
+        "raw_text": f"{title} at {company}",
+        "source_url": url,
+        **extra,
+    }
+
+
+class TestDedupeKeys:
+    def test_key_is_normalized(self):
+        assert job_dedupe_key(" Acme ", "ML Eng ", "") == "ct:acme|ml eng"
+        assert job_dedupe_key("Acme", "x", " HTTPS://Acme.io/Jobs ") == "url:https://acme.io/jobs"
+
+    def test_stub_title_marks_company_stub(self):
+        job = _job("Open roles (12 listings)", stub_title="Open roles")
+        assert dedupe_key_for_job(job) == "stub:acme|open roles"
+
+
+class TestBatchInsert:
+    def test_batch_returns_aligned_ids_and_persists_keys(self, db_session):
+        svc = DatabaseService(db_session)
+        jobs = [_job("A"), _job("B", url="https://acme.io/b"), _job("a")]
+        ids = svc.store_scraped_jobs_batch(jobs, dedupe=True)
+        assert ids[0] is not None and ids[1] is not None
+        assert ids[2] is None
+        rows = {r.id: r for r in db_session.query(JobPostingDB).all()}
+        assert rows[ids[0]].dedupe_key == "ct:acme|a"
+        assert rows[ids[1]].dedupe_key == "url:https://acme.io/b"
+
+    def test_reinsert_skips_existing(self, db_session):
+        svc = DatabaseService(db_session)
+        svc.store_scraped_jobs_batch([_job("A"), _job("B")], dedupe=True)
+        ids = svc.store_scraped_jobs_batch([_job("B"), _job("C")], dedupe=True)
+        assert ids[0] is None
+        assert ids[1] is not None
+        assert db_session.query(JobPostingDB).count() == 3
+
+    def test_without_dedupe_leaves_key_null(self, db_session):
+        svc = DatabaseService(db_session)
+        ids = svc.store_scraped_jobs_batch([_job("A"), _job("A")])
+        assert all(i is not None for i in ids)
+        assert {r.dedupe_key for r in db_session.query(JobPostingDB).all()} == {None}
+
+
+class TestLegacyFallback:
+    def test_rows_without_key_still_match(self, db_session):
+        db_session.add_all(
+            [
+                JobPostingDB(title="Data Eng", company="Acme"),
+                JobPostingDB(title="Other", company="Beta", source_url="https://Beta.io/x"),
+                JobPostingDB(title="Open roles (4 listings)", company="Gamma"),
+            ]
+        )
+        db_session.commit()
+        found = find_existing_jobs(
+            db_session,
+            [
+                _job("data eng"),
+                _job("Whatever", company="Beta", url="https://beta.io/x"),
+                _job("Open roles (9 listings)", company="Gamma", stub_title="Open roles"),
+                _job("Missing"),
+            ],
+        )
+        assert set(found) == {"ct:acme|data eng", "url:https://beta.io/x", "stub:gamma|open roles"}
+        assert find_existing_job(db_session, "Acme", "Missing", "") is None
+
+    def test_load_dedupe_keys_prefers_persisted_key(self, db_session):
+        db_session.add(JobPostingDB(title="Open roles (2 listings)", company="Acme"))
+        db_session.add(
+            JobPostingDB(title="Open roles (3 listings)", company="Beta", dedupe_key="stub:beta|x")
+        )
+        db_session.commit()
+        keys = load_dedupe_keys(db_session)
+        assert keys == {"ct:acme|open roles (2 listings)", "stub:beta|x"}
+
+
+def test_create_tables_adds_missing_dedupe_column():
+    engine = create_engine("sqlite:///:memory:")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE job_postings (id INTEGER PRIMARY KEY, title VARCHAR(255), "
+                "company VARCHAR(255), location VARCHAR(255), content_json JSON, "
+                "raw_text TEXT, source_url VARCHAR(512), created_at DATETIME)"
+            )
+        )
+    create_tables(engine)
+    inspector = inspect(engine)
+    assert "dedupe_key" in {c["name"] for c in inspector.get_columns("job_postings")}
+    unique = [
+        i for i in inspector.get_indexes("job_postings") if i["column_names"] == ["dedupe_key"]
+    ]
+    assert unique and unique[0]["unique"]
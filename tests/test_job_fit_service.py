@@ -7,7 +7,13 @@ from sqlalchemy.orm import sessionmaker
 from app.models.db_models import Base, JobPostingDB
 from app.models.startup_model import BigSetPreferences, UserProfile
 from app.services.bigset_import_service import BIGSET_SOURCE
-from app.services.job_fit_service import rank_imported_jobs, score_job_against_profile
+from app.services.job_fit_service import (
+    fit_tokens,
+    index_jobs_for_fit,
+    rank_imported_jobs,
+    score_job_against_profile,
+    sync_fit_index,
+)
 
 
 @pytest.fixture
@@ -57,3 +63,97 @@ class TestJobFitService:
         ranked = rank_imported_jobs(db_session, profile, min_score=0.0)
         assert len(ranked) == 1
         assert ranked[0]["company"] == "Co"
+
+
+class TestFitIndex:
+    def test_rank_scores_full_corpus_beyond_newest_500(self, db_session):
+        db_session.add(
+            JobPostingDB(
+                title="Rust Engineer",
+                company="Old",
+                raw_text="rust tokio",
+                content_json={"source": BIGSET_SOURCE},
+            )
+        )
+        db_session.add_all(
+            JobPostingDB(
+                title=f"Filler {i}",
+                company="New",
+                raw_text="sales",
+                content_json={"source": BIGSET_SOURCE},
+            )
+            for i in range(600)
+        )
+        db_session.commit()
+        ranked = rank_imported_jobs(db_session, UserProfile(skills=["Rust"]), min_score=0.1)
+        assert [r["company"] for r in ranked] == ["Old"]
+
+    def test_multiword_keywords_and_location_bonus(self, db_session):
+        db_session.add_all(
+            [
+                JobPostingDB(
+                    title="ML Engineer",
+                    company="A",
+                    location="Berlin",
+                    raw_text="Machine learning with PyTorch.",
+                    content_json={"source": BIGSET_SOURCE},
+                ),
+                JobPostingDB(
+                    title="Learning designer",
+                    company="B",
+                    raw_text="Course design",
+                    content_json={"source": BIGSET_SOURCE},
+                ),
+            ]
+        )
+        db_session.commit()
+        profile = UserProfile(
+            skills=["machine learning", "pytorch"], preferred_locations=["Berlin"]
+        )
+        ranked = rank_imported_jobs(db_session, profile, min_score=0.0)
+        assert ranked[0]["company"] == "A"
+        assert ranked[0]["fit_score"] == 1.0
+        assert ranked[1] == {**ranked[1], "company": "B", "fit_score": 0.0}
+
+    def test_index_refreshed_on_update(self, db_session):
+        job = JobPostingDB(
+            title="Engineer",
+            company="Acme",
+            raw_text="java",
+            content_json={"source": BIGSET_SOURCE},
+        )
+        db_session.add(job)
+        db_session.commit()
+        profile = UserProfile(skills=["golang"])
+        assert rank_imported_jobs(db_session, profile, min_score=0.1) == []
+
+        job.raw_text = "golang services"
+        index_jobs_for_fit(db_session, [job])
+        db_session.commit()
+        assert len(rank_imported_jobs(db_session, profile, min_score=0.1)) == 1
+
+    def test_older_unindexed_postings_are_indexed_after_newer_ones(self, db_session):
+        legacy = JobPostingDB(
+            title="Python Engineer",
+            company="Legacy",
+            raw_text="python django",
+            content_json={"source": BIGSET_SOURCE},
+        )
+        imported = JobPostingDB(
+            title="Sales lead",
+            company="Imported",
+            raw_text="sales",
+            content_json={"source": BIGSET_SOURCE},
+        )
+        db_session.add_all([legacy, imported])
+        db_session.commit()
+        index_jobs_for_fit(db_session, [imported])
+        db_session.commit()
+
+        ranked = rank_imported_jobs(db_session, UserProfile(skills=["Python"]), min_score=0.1)
+
+        assert [r["company"] for r in ranked] == ["Legacy"]
+        assert sync_fit_index(db_session) == 0
+
+    def test_fit_tokens_keep_symbols(self):
+        assert fit_tokens("C++, C# and Node.js.") == {"c++", "c#", "and", "node.js"}
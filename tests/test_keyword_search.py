@@ -0,0 +1,173 @@
+"""Tests for the FTS5/BM25 keyword index behind SearchService._keyword_search."""
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models.db_models import JobPostingDB, create_tables
+from app.services import db_service
+from app.services.db_service import DatabaseService, JobPostingCreateData
+from app.services.search_service import SearchService
+
+
+class _FakeVectorStore:
+    def __init__(self, results):
+        self.results = results
+
+    async def search(self, collection, query, n_results, filter_by=None):
+        return [dict(r) for r in self.results[:n_results]]
+
+
+@pytest.fixture
+def svc():
+    db = db_service.get_db_session()
+    try:
+        yield DatabaseService(db)
+    finally:
+        db.close()
+
+
+def _store(svc: DatabaseService, title: str, raw_text: str, company: str = "Acme") -> int:
+    return svc.store_job_posting(
+        JobPostingCreateData(title=title, company=company, raw_text=raw_text)
+    )
+
+
+class TestKeywordIndex:
+    def test_bm25_ranks_title_matches_first(self, svc):
+        body = _store(svc, "Office manager", "Some kubernetes exposure is a plus.")
+        title = _store(svc, "Kubernetes engineer", "Operate clusters.")
+        _store(svc, "Accountant", "Ledgers and spreadsheets.")
+
+        hits = svc.keyword_search("job_postings", ["kubernetes"])
+
+        assert [int(h["id"]) for h in hits] == [title, body]
+        assert hits[0]["keyword_score"] > hits[1]["keyword_score"] > 0
+
+    def test_stemming_and_any_term_matches(self, svc):
+        job = _store(svc, "Engineer", "Builds data pipelines")
+        assert [int(h["id"]) for h in svc.keyword_search("job_postings", ["pipeline"])] == [job]
+        assert len(svc.keyword_search("job_postings", ["pipeline", "nothing"])) == 1
+
+    def test_bulk_inserts_updates_and_deletes_stay_indexed(self, svc):
+        (job,) = svc.store_scraped_jobs_batch(
+            [{"title": "Rust developer", "company": "Ferris", "raw_text": "systems"}]
+        )
+        assert svc.keyword_search("job_postings", ["rust"])
+
+        row = svc.db.get(JobPostingDB, job)
+        row.title = "Go developer"
+        svc.db.commit()
+        assert not svc.keyword_search("job_postings", ["rust"])
+        assert svc.keyword_search("job_postings", ["go"])
+
+        svc.db.delete(row)
+        svc.db.commit()
+        assert not svc.keyword_search("job_postings", ["go"])
+
+    def test_create_tables_backfills_existing_rows(self):
+        engine = create_engine("sqlite://", poolclass=StaticPool)
+        JobPostingDB.__table__.create(engine)
+        with engine.begin() as conn:
+            conn.execute(JobPostingDB.__table__.insert(), [{"title": "Legacy SRE role"}])
+
+        create_tables(engine)
+
+        session = sessionmaker(bind=engine)()
+        try:
+            assert DatabaseService(session).keyword_search("job_postings", ["sre"])
+        finally:
+            session.close()
+
+    def test_large_match_sets_drop_common_terms(self, svc, monkeypatch):
+        monkeypatch.setattr(db_service.settings, "KEYWORD_SEARCH_CANDIDATE_POOL", 2)
+        for i in range(5):
+            _store(svc, f"Role {i}", "remote friendly")
+        rust = _store(svc, "Rust engineer", "remote friendly")
+        legacy = _store(svc, "Rust maintainer", "on site")
+
+        hits = svc.keyword_search("job_postings", ["remote", "rust"], limit=2)
+        assert {int(h["id"]) for h in hits} == {rust, legacy}
+
+        newest = svc.keyword_search("job_postings", ["remote"], limit=2)
+        assert [int(h["id"]) for h in newest] == [rust, rust - 1]
+        assert {h["keyword_score"] for h in newest} == {0.0}
+
+    def test_large_match_sets_without_common_terms_rank_all_matches(self, svc, monkeypatch):
+        monkeypatch.setattr(db_service.settings, "KEYWORD_SEARCH_CANDIDATE_POOL", 2)
+        best = _store(svc, "Kubernetes engineer", "kubernetes kubernetes")
+        for i in range(3):
+            _store(svc, f"Platform role {i}", "some kubernetes")
+        for i in range(10):
+            _store(svc, f"Accountant {i}", "ledgers")
+
+        hits = svc.keyword_search("job_postings", ["kubernetes"], limit=1)
+
+        assert [int(h["id"]) for h in hits] == [best]
+        assert hits[0]["keyword_score"] > 0
+
+    def test_filters_apply_inside_the_query(self, svc, monkeypatch):
+        monkeypatch.setattr(db_service.settings, "KEYWORD_SEARCH_CANDIDATE_POOL", 2)
+        imported = svc.store_scraped_jobs_batch(
+            [
+                {
+                    "title": f"Go engineer {i}",
+                    "company": "Shipfast",
+                    "raw_text": "go",
+                    "parsed_data": {"source": "bigset", "mapping_id": "m1"},
+                }
+                for i in range(2)
+            ]
+        )
+        manual = [_store(svc, f"Go developer {i}", "go", company="Acme") for i in range(3)]
+
+        bigset = svc.keyword_search("job_postings", ["go"], filters={"source": "bigset"})
+        companies = svc.keyword_search(
+            "job_postings", ["go"], filters={"company": ["Shipfast", "Nobody"]}
+        )
+        newer = svc.keyword_search("job_postings", ["go"], filters={"job_id": {"gt": imported[1]}})
+
+        assert {int(h["id"]) for h in bigset} == set(imported)
+        assert {int(h["id"]) for h in companies} == set(imported)
+        assert {int(h["id"]) for h in newer} == set(manual)
+        with pytest.raises(ValueError):
+            svc.keyword_search("job_postings", ["go"], filters={"salary": 1})
+
+    def test_falls_back_to_like_without_fts(self, svc):
+        job = _store(svc, "Data analyst", "SQL and dashboards")
+        svc.db.execute(text("DROP TABLE job_postings_fts"))
+
+        hits = svc.keyword_search("job_postings", ["sql", "dashboards"])
+
+        assert [int(h["id"]) for h in hits] == [job]
+        assert hits[0]["keyword_score"] == 2.0
+
+
+class TestHybridSearch:
+    async def test_fuses_vector_and_keyword_rankings(self, svc):
+        python = _store(svc, "Python engineer", "Django and Postgres")
+        keyword_only = _store(svc, "Python developer", "Flask services")
+        vectors = _FakeVectorStore(
+            [
+                {"id": "job_999", "text": "Ruby", "metadata": {}, "score": 0.7},
+                {"id": f"job_{python}", "text": "Django", "metadata": {}, "score": 0.65},
+            ]
+        )
+        search = SearchService(vector_store=vectors, db_service=svc)
+
+        results = await search.hybrid_search("python engineer", "jobs", n_results=5)
+
+        ids = [r["id"] for r in results]
+        assert ids[0] == f"job_{python}"
+        assert f"job_{keyword_only}" in ids
+        assert set(results[0]["signals"]) == {"vector", "keyword"}
+        assert results[0]["signals"]["vector"] == 0.65
+        keyword_hit = next(r for r in results if r["id"] == f"job_{keyword_only}")
+        assert keyword_hit["metadata"]["job_id"] == keyword_only
+        assert set(keyword_hit["signals"]) == {"keyword"}
+
+    async def test_collections_without_index_are_vector_only(self, svc):
+        _store(svc, "Python engineer", "Django")
+        search = SearchService(vector_store=_FakeVectorStore([]), db_service=svc)
+        assert await search.hybrid_search("python", "cover_letters") == []
@@ -0,0 +1,93 @@
+"""Tests for memoized agent creation in the ModelRegistry."""
+
+import pytest
+from pydantic import BaseModel
+
+from app.core import model_registry
+from app.core.model_registry import ModelRegistry, ModelSettings, Provider, ProviderInfo
+
+
+class _Output(BaseModel):
+    answer: str
+
+
+def _lookup(query: str) -> str:
+    return query
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    # litellm configuration is irrelevant here and slow to import.
+    monkeypatch.setattr(ModelRegistry, "_configure_litellm", lambda self: None)
+    reg = ModelRegistry()
+    reg.settings = ModelSettings(default_model="test", fallback_model=None, prefer_local=False)
+    reg.providers = []
+    reg._chain = None
+    return reg
+
+
+class TestAgentCache:
+    def test_identical_requests_share_one_agent(self, registry):
+        first = registry.create_agent(output_type=_Output, system_prompt="Be brief", name="a")
+        second = registry.create_agent(output_type=_Output, system_prompt="Be brief", name="a")
+
+        assert first is second
+        assert registry.agent_cache_info()["hits"] == 1
+        assert registry.agent_cache_info()["misses"] == 1
+
+    def test_key_covers_output_prompt_name_and_tools(self, registry):
+        base = registry.create_agent(_Output, "p", name="a")
+        variants = [
+            registry.create_agent(None, "p", name="a"),
+            registry.create_agent(_Output, "q", name="a"),
+            registry.create_agent(_Output, "p", name="b"),
+            registry.create_agent(_Output, "p", name="a", retries=5),
+            registry.create_agent(_Output, "p", name="a", tools=[_lookup]),
+        ]
+        assert len({id(agent) for agent in [base, *variants]}) == 6
+
+    def test_opt_out_and_unhashable_kwargs_build_fresh(self, registry):
+        assert registry.create_agent(system_prompt="p") is not registry.create_agent(
+            system_prompt="p", cache=False
+        )
+        metadata = {"tags": {"a", "b"}}
+        first = registry.create_agent(system_prompt="p", metadata=metadata)
+        assert registry.create_agent(system_prompt="p", metadata=metadata) is not first
+
+    def test_cache_is_bounded(self, registry, monkeypatch):
+        monkeypatch.setattr(model_registry, "_AGENT_CACHE_SIZE", 2)
+        oldest = registry.create_agent(system_prompt="1")
+        registry.create_agent(system_prompt="2")
+        registry.create_agent(system_prompt="3")
+
+        assert registry.agent_cache_info()["size"] == 2
+        assert registry.create_agent(system_prompt="1") is not oldest
+
+
+class TestInvalidation:
+    async def test_probe_that_changes_chain_drops_agents(self, registry, monkeypatch):
+        ollama = ProviderInfo(Provider.OLLAMA, available=True, model_string="ollama:llama3.2")
+
+        async def detect():
+            return [ollama]
+
+        monkeypatch.setattr(model_registry, "_detect_local_providers_async", detect)
+        registry.create_agent(system_prompt="p")
+
+        await registry.probe_local_providers()
+
+        assert registry.chain_version == 1
+        assert registry.resolve_chain().fallback_model_strings == ["ollama:llama3.2"]
+        assert registry.agent_cache_info()["size"] == 0
+
+    async def test_probe_without_changes_keeps_agents(self, registry, monkeypatch):
+        async def detect():
+            return []
+
+        monkeypatch.setattr(model_registry, "_detect_local_providers_async", detect)
+        before = registry.create_agent(system_prompt="p")
+
+        await registry.probe_local_providers()
+
+        assert registry.chain_version == 0
+        assert registry.create_agent(system_prompt="p") is before
@@ -0,0 +1,141 @@
+"""Tests for the step artifact cache and resumable pipeline runs."""
+
+import pytest
+from pydantic import BaseModel
+
+from app.agents.base_agent import BaseAgent
+from app.core.config import settings
+from app.pipelines import artifact_cache, job_queue
+from app.pipelines.artifact_cache import ArtifactCache, artifact_cache_key
+from app.pipelines.engine import PipelineEngine
+from app.pipelines.events import EventBus
+from app.services import db_service
+
+
+class FakeOutput(BaseModel):
+    text: str
+
+
+class FakeAgent(BaseAgent):
+    """Cacheable agent that counts its LLM calls."""
+
+    output_type = FakeOutput
+
+    def __init__(self, key: str, reply: str = "ok"):
+        self.key, self.reply, self.calls = key, reply, 0
+        self.system_prompt, self.skill_content = f"prompt for {key}", ""
+
+    async def execute(self, state):
+        self.calls += 1
+        state.artifacts[self.key] = FakeOutput(text=f"{self.reply}:{state.job_text}")
+
+    def cache_inputs(self, state):
+        return {"resume_text": state.get_resume_text(), "job_text": state.job_text}
+
+
+@pytest.fixture
+def agents(monkeypatch, tmp_path):
+    registry = {
+        "cv_extractor": FakeAgent("cv_extractor"),
+        "resume_reviewer": FakeAgent("resume_reviewer"),
+    }
+    monkeypatch.setattr("app.agents.get_agent", registry.get)
+    monkeypatch.setattr("app.agents.load_agents", lambda: registry)
+    monkeypatch.setattr("app.core.model_registry.get_model_string", lambda: "test:model")
+    cache = ArtifactCache(tmp_path / "artifacts.sqlite", max_bytes=1_000_000, ttl_seconds=60)
+    monkeypatch.setattr(settings, "PIPELINE_ARTIFACT_CACHE_ENABLED", True)
+    monkeypatch.setattr(artifact_cache, "_cache", cache)
+    yield registry
+    cache.close()
+
+
+@pytest.fixture
+def step_events():
+    events = []
+    EventBus.on("step_complete", events.append)
+    yield events
+    EventBus._handlers["step_complete"].remove(events.append)
+
+
+async def test_identical_run_is_served_from_cache(agents, step_events):
+    engine = PipelineEngine()
+    await engine.run("resume_only", resume_text="cv", job_text="jd")
+    state = await engine.run("resume_only", resume_text="cv", job_text="jd")
+
+    assert [a.calls for a in agents.values()] == [1, 1]
+    assert state.artifacts["resume_reviewer"] == FakeOutput(text="ok:jd")
+    assert [e.data["cache_hit"] for e in step_events] == [False, False, True, True]
+    assert step_events[-1].data["cache_hit_rate"] == 1.0
+
+
+async def test_changed_input_or_error_fallback_misses(agents):
+    engine = PipelineEngine()
+    agents["cv_extractor"].reply = "Error generating"
+    await engine.run("resume_only", resume_text="cv", job_text="jd")
+    await engine.run("resume_only", resume_text="cv", job_text="jd")
+    await engine.run("resume_only", resume_text="cv", job_text="other jd")
+
+    assert agents["cv_extractor"].calls == 3
+    assert agents["resume_reviewer"].calls == 2
+
+
+async def test_resume_artifacts_skip_finished_steps(agents, step_events):
+    previous = {"cv_extractor": {"text": "earlier"}}
+    state = await PipelineEngine().run(
+        "resume_only", resume_text="cv", job_text="jd", resume_artifacts=previous
+    )
+
+    assert agents["cv_extractor"].calls == 0
+    assert agents["resume_reviewer"].calls == 1
+    assert state.artifacts["cv_extractor"] == FakeOutput(text="earlier")
+    assert step_events[0].data["source"] == "resumed"
+
+
+async def test_resume_run_requeues_with_persisted_artifacts(monkeypatch):
+    seen = {}
+
+    async def fake_run_pipeline(**kwargs):
+        seen.update(kwargs)
+        from app.pipelines.state import PipelineState
+
+        return PipelineState(pipeline_name="Resume Only")
+
+    monkeypatch.setattr("app.pipelines.engine.run_pipeline", fake_run_pipeline)
+    db = db_service.get_db_session()
+    try:
+        first = job_queue.enqueue_run(db, "resume_only", "Resume Only", job_text="jd")
+        run = job_queue.claim_next_run(db, "w")
+        job_queue.complete_run(
+            db, run.id, "w", {"artifacts": {"cv_extractor": {"text": "x"}}, "errors": ["boom"]}
+        )
+        db.expire_all()
+
+        second = job_queue.resume_run(db, job_queue.get_run(db, first))
+        assert await job_queue.PipelineWorkerPool(workers=1).run_once("w")
+    finally:
+        db.close()
+
+    assert second != first
+    assert seen["job_text"] == "jd"
+    assert seen["resume_artifacts"] == {"cv_extractor": {"text": "x"}}
+
+
+def test_cache_key_covers_prompt_model_and_inputs():
+    base = artifact_cache_key("a", "p", "m", {"x": 1})
+    assert base == artifact_cache_key("a", "p", "m", {"x": 1})
+    assert base != artifact_cache_key("a", "p2", "m", {"x": 1})
+    assert base != artifact_cache_key("a", "p", "m2", {"x": 1})
+    assert base != artifact_cache_key("a", "p", "m", {"x": 2})
+
+
+def test_entries_expire_and_evict(tmp_path):
+    cache = ArtifactCache(tmp_path / "c.sqlite", max_bytes=120, ttl_seconds=60)
+    for i in range(4):
+        cache.put(f"k{i}", "a", {"text": "x" * 30})
+    assert cache.get("k0") is None and cache.get("k3") == {"text": "x" * 30}
+    assert cache.stats()["bytes"] <= 120
+    cache.close()
+
+    expired = ArtifactCache(tmp_path / "c.sqlite", max_bytes=1000, ttl_seconds=-1)
+    assert expired.get("k3") is None
+    expired.close()
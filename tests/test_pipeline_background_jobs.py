@@ -1,34 +1,172 @@
-"""Tests for in-memory background pipeline job bookkeeping."""
-
-import time
-
-from app.api import pipeline_routes as routes
-
-
-class TestBackgroundJobStore:
-    def setup_method(self):
-        routes._background_jobs.clear()
-
-    def test_prune_expires_old_jobs(self, monkeypatch):
-        monkeypatch.setattr(routes.settings, "PIPELINE_BACKGROUND_JOB_TTL_SECONDS", 1)
-        monkeypatch.setattr(routes.settings, "PIPELINE_BACKGROUND_JOB_MAX_ENTRIES", 10)
-        routes._set_background_job("old", {"status": "completed", "pipeline_key": "x"})
-        routes._background_jobs["old"]["_updated_at"] = time.time() - 10
-        routes._prune_background_jobs()
-        assert "old" not in routes._background_jobs
-
-    def test_prune_caps_max_entries(self, monkeypatch):
-        monkeypatch.setattr(routes.settings, "PIPELINE_BACKGROUND_JOB_TTL_SECONDS", 86_400)
-        monkeypatch.setattr(routes.settings, "PIPELINE_BACKGROUND_JOB_MAX_ENTRIES", 2)
-        for i in range(3):
-            routes._set_background_job(f"job-{i}", {"status": "running", "pipeline_key": "x"})
-            time.sleep(0.01)
-        routes._prune_background_jobs()
-        assert len(routes._background_jobs) == 2
-        assert "job-0" not in routes._background_jobs
-
-    def test_status_hides_internal_timestamps(self):
-        routes._set_background_job("j1", {"status": "running", "pipeline_key": "daily_scanner"})
-        job = routes._background_jobs["j1"]
-        assert "_created_at" in job
-        assert "_updated_at" in job
+"""Tests for the durable DB-backed background pipeline queue."""
+
+from datetime import timedelta
+
+import pytest
+
+from app.models.db_models import PipelineRun
+from app.pipelines import job_queue as jq
+from app.pipelines.state import PipelineState
+from app.services import db_service
+
+
+@pytest.fixture
+def db():
+    session = db_service.get_db_session()
+    yield session
+    session.close()
+
+
+def _enqueue(db, key="resume_only", **kwargs):
+    return jq.enqueue_run(db, key, key.replace("_", " ").title(), **kwargs)
+
+
+class TestClaiming:
+    def test_claim_leases_oldest_run_once(self, db):
+        first = _enqueue(db)
+        second = _enqueue(db)
+
+        run_a = jq.claim_next_run(db, "worker-a")
+        run_b = jq.claim_next_run(db, "worker-b")
+
+        assert run_a.job_id == first and run_a.lease_owner == "worker-a"
+        assert run_b.job_id == second
+        assert run_a.attempts == 1
+        assert jq.claim_next_run(db, "worker-c") is None
+
+    def test_expired_lease_is_reclaimed_after_restart(self, db):
+        job_id = _enqueue(db)
+        run = jq.claim_next_run(db, "crashed-worker")
+        run.lease_expires_at = jq._now() - timedelta(seconds=1)
+        db.commit()
+
+        again = jq.claim_next_run(db, "new-worker")
+
+        assert again.job_id == job_id
+        assert again.lease_owner == "new-worker"
+        assert again.attempts == 2
+        assert not jq.renew_lease(db, run.id, "crashed-worker")
+        assert jq.renew_lease(db, run.id, "new-worker")
+
+    def test_expired_lease_on_last_attempt_fails_run(self, db):
+        job_id = _enqueue(db, max_attempts=1)
+        run = jq.claim_next_run(db, "crashed-worker")
+        run.lease_expires_at = jq._now() - timedelta(seconds=1)
+        db.commit()
+
+        assert jq.claim_next_run(db, "new-worker") is None
+
+        db.expire_all()
+        run = jq.get_run(db, job_id)
+        assert run.status == jq.FAILED and run.attempts == 1
+        assert run.lease_owner is None and run.completed_at is not None
+
+    def test_stale_worker_cannot_complete_reclaimed_run(self, db):
+        _enqueue(db)
+        run = jq.claim_next_run(db, "old")
+        run.lease_expires_at = jq._now() - timedelta(seconds=1)
+        db.commit()
+        jq.claim_next_run(db, "new")
+
+        assert not jq.complete_run(db, run.id, "old", {"artifacts": {}})
+        assert jq.complete_run(db, run.id, "new", {"artifacts": {"a": 1}, "steps_completed": 2})
+
+
+class TestRetries:
+    def test_failure_requeues_with_backoff_then_fails(self, db, monkeypatch):
+        monkeypatch.setattr(jq.settings, "PIPELINE_QUEUE_RETRY_BACKOFF_SECONDS", 0)
+        job_id = _enqueue(db, max_attempts=2)
+
+        run = jq.claim_next_run(db, "w")
+        assert jq.fail_run(db, run, "w", "boom") == jq.QUEUED
+        run = jq.claim_next_run(db, "w")
+        assert run is not None and run.attempts == 2
+        assert jq.fail_run(db, run, "w", "boom") == jq.FAILED
+
+        payload = jq.run_status_payload(jq.get_run(db, job_id))
+        assert payload["status"] == jq.FAILED and payload["error"] == "boom"
+
+    def test_backoff_delays_next_claim(self, db, monkeypatch):
+        monkeypatch.setattr(jq.settings, "PIPELINE_QUEUE_RETRY_BACKOFF_SECONDS", 60)
+        _enqueue(db)
+        run = jq.claim_next_run(db, "w")
+        jq.fail_run(db, run, "w", "boom")
+        assert jq.claim_next_run(db, "w") is None
+
+
+class TestWorkerPool:
+    async def test_run_once_executes_and_stores_result(self, db, monkeypatch):
+        async def fake_run_pipeline(**kwargs):
+            state = PipelineState(pipeline_name="Resume Only", resume_text=kwargs["resume_text"])
+            state.artifacts["resume_tailor"] = {"tailored_content": "done"}
+            state.current_step = 1
+            return state
+
+        monkeypatch.setattr("app.pipelines.engine.run_pipeline", fake_run_pipeline)
+        job_id = _enqueue(db, resume_text="cv", inputs={"role_type": "ml"})
+
+        pool = jq.PipelineWorkerPool(workers=1)
+        assert await pool.run_once("w1")
+        assert not await pool.run_once("w1")
+
+        db.expire_all()
+        payload = jq.run_status_payload(jq.get_run(db, job_id))
+        assert payload["status"] == jq.COMPLETED
+        assert payload["result"]["artifacts"]["resume_tailor"]["tailored_content"] == "done"
+        assert payload["result"]["steps_completed"] == 2
+
+    async def test_step_errors_retry_from_partial_artifacts(self, db, monkeypatch):
+        monkeypatch.setattr(jq.settings, "PIPELINE_QUEUE_RETRY_BACKOFF_SECONDS", 0)
+        resumed_from = []
+
+        async def flaky_run_pipeline(**kwargs):
+            resumed_from.append(kwargs["resume_artifacts"])
+            state = PipelineState(pipeline_name="Resume Only")
+            state.artifacts["resume_tailor"] = {"tailored_content": "done"}
+            state.errors.append("Step 'cover_letter' failed: timeout")
+            state.current_step = 1
+            return state
+
+        monkeypatch.setattr("app.pipelines.engine.run_pipeline", flaky_run_pipeline)
+        job_id = _enqueue(db, max_attempts=2)
+        pool = jq.PipelineWorkerPool(workers=1)
+
+        assert await pool.run_once("w1")
+        db.expire_all()
+        run = jq.get_run(db, job_id)
+        assert run.status == jq.QUEUED
+        assert run.artifacts_json == {"resume_tailor": {"tailored_content": "done"}}
+
+        assert await pool.run_once("w1")
+        db.expire_all()
+        payload = jq.run_status_payload(jq.get_run(db, job_id))
+        assert resumed_from == [None, {"resume_tailor": {"tailored_content": "done"}}]
+        assert payload["status"] == jq.FAILED and payload["attempts"] == 2
+        assert payload["errors"] == ["Step 'cover_letter' failed: timeout"]
+
+    async def test_unknown_pipeline_fails_without_retry(self, db):
+        job_id = _enqueue(db, key="no_such_pipeline")
+        assert await jq.PipelineWorkerPool(workers=1).run_once("w1")
+        db.expire_all()
+        run = jq.get_run(db, job_id)
+        assert run.status == jq.FAILED and run.attempts == 1
+
+
+def test_prune_caps_finished_runs(db, monkeypatch):
+    monkeypatch.setattr(jq.settings, "PIPELINE_BACKGROUND_JOB_MAX_ENTRIES", 2)
+    for i in range(3):
+        db.add(
+            PipelineRun(
+                job_id=f"done-{i}",
+                pipeline_key="x",
+                pipeline_name="x",
+                status=jq.COMPLETED,
+                completed_at=jq._now() - timedelta(minutes=10 - i),
+            )
+        )
+    db.add(PipelineRun(job_id="live", pipeline_key="x", pipeline_name="x", status=jq.QUEUED))
+    db.commit()
+
+    assert jq.prune_finished_runs(db) == 1
+    assert jq.get_run(db, "done-0") is None
+    assert jq.get_run(db, "live") is not None
@@ -0,0 +1,108 @@
+"""Tests for dependency-aware (DAG-parallel) pipeline execution."""
+
+import asyncio
+import time
+
+import pytest
+
+from app.core.config import settings
+from app.pipelines.engine import (
+    PipelineEngine,
+    PipelineStep,
+    execution_waves,
+    get_pipeline_config,
+    resolve_dependencies,
+)
+
+
+class SleepyAgent:
+    """Fake agent that records start/end times and writes an artifact."""
+
+    def __init__(self, key, log, delay=0.05, fail=False):
+        self.key, self.log, self.delay, self.fail = key, log, delay, fail
+
+    async def execute(self, state):
+        start = time.perf_counter()
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("boom")
+        state.artifacts[self.key] = {"done": True}
+        self.log[self.key] = (start, time.perf_counter())
+
+
+@pytest.fixture
+def fake_agents(monkeypatch):
+    log: dict[str, tuple[float, float]] = {}
+    agents: dict[str, SleepyAgent] = {}
+
+    def get_agent(key):
+        return agents.setdefault(key, SleepyAgent(key, log))
+
+    monkeypatch.setattr("app.agents.get_agent", get_agent)
+    monkeypatch.setattr("app.agents.load_agents", lambda: agents)
+    return agents, log
+
+
+class TestDependencies:
+    def test_full_application_is_inferred_as_a_dag(self):
+        waves = execution_waves(get_pipeline_config("full_application").steps)
+        assert waves == [
+            ["cv_extractor", "discovery_sync"],
+            ["resume_reviewer"],
+            ["cover_letter_generator", "job_finder"],
+        ]
+
+    def test_explicit_depends_on_overrides_inference(self):
+        steps = [
+            PipelineStep("cv_extractor"),
+            PipelineStep("resume_reviewer", depends_on=[]),
+        ]
+        assert resolve_dependencies(steps)["resume_reviewer"] == ()
+
+    def test_unknown_agents_depend_on_all_earlier_steps(self):
+        steps = [PipelineStep("cv_extractor"), PipelineStep("custom_agent")]
+        assert resolve_dependencies(steps)["custom_agent"] == ("cv_extractor",)
+
+    def test_forward_dependency_is_rejected(self):
+        steps = [
+            PipelineStep("cv_extractor", depends_on=["resume_reviewer"]),
+            PipelineStep("resume_reviewer"),
+        ]
+        with pytest.raises(ValueError):
+            resolve_dependencies(steps)
+
+
+class TestParallelRun:
+    async def test_run_takes_roughly_the_critical_path(self, fake_agents):
+        _, log = fake_agents
+        started = time.perf_counter()
+        state = await PipelineEngine().run("full_application", resume_text="cv", job_text="jd")
+        elapsed = time.perf_counter() - started
+
+        assert state.errors == []
+        assert state.current_step == 4
+        assert len(state.artifacts) == 5
+        # Three dependent levels of 50ms each, not five sequential steps.
+        assert elapsed < 0.22
+        assert log["resume_reviewer"][0] >= log["cv_extractor"][1]
+        assert log["job_finder"][0] >= log["discovery_sync"][1]
+
+    async def test_failure_stops_dependents(self, fake_agents):
+        agents, _ = fake_agents
+        agents["cv_extractor"] = SleepyAgent("cv_extractor", {}, fail=True)
+
+        state = await PipelineEngine().run("full_application", resume_text="cv")
+
+        assert state.errors == ["Step 'cv_extractor' failed: boom"]
+        # discovery_sync was already running alongside and finished.
+        assert set(state.artifacts) == {"discovery_sync"}
+        assert state.current_step == 1
+
+    async def test_parallelism_can_be_disabled(self, fake_agents, monkeypatch):
+        _, log = fake_agents
+        monkeypatch.setattr(settings, "PIPELINE_PARALLEL_STEPS", False)
+
+        await PipelineEngine().run("full_application", resume_text="cv")
+
+        spans = sorted(log.values())
+        assert all(prev[1] <= nxt[0] for prev, nxt in zip(spans, spans[1:], strict=False))
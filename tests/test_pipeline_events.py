@@ -0,0 +1,148 @@
+"""Tests for the pipeline EventBus: handlers, subscriptions, history."""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.core.config import settings
+from app.pipelines.events import EventBus
+
+
+@pytest.fixture
+def bus():
+    """EventBus with whatever a test registers removed again afterwards."""
+    handlers = {key: list(value) for key, value in EventBus._handlers.items()}
+    workers = list(EventBus._async_handlers)
+    yield EventBus
+    for worker in EventBus._async_handlers:
+        if worker not in workers:
+            worker.stop()
+    for sub in list(EventBus._subscriptions):
+        sub.close()
+    EventBus._handlers.clear()
+    EventBus._handlers.update(handlers)
+    EventBus._async_handlers[:] = workers
+
+
+class TestHistory:
+    def test_ring_buffer_keeps_latest_events(self, bus):
+        bus._history.clear()
+        for i in range(settings.EVENT_BUS_HISTORY_SIZE + 5):
+            bus.emit("tick", {"i": i})
+
+        assert len(bus._history) == settings.EVENT_BUS_HISTORY_SIZE
+        recent = bus.history(3)
+        assert [e.data["i"] for e in recent] == [
+            settings.EVENT_BUS_HISTORY_SIZE + 2,
+            settings.EVENT_BUS_HISTORY_SIZE + 3,
+            settings.EVENT_BUS_HISTORY_SIZE + 4,
+        ]
+
+
+class TestHandlers:
+    def test_sync_handlers_run_inline(self, bus):
+        seen = []
+        bus.on("step_complete", seen.append)
+        bus.on("*", lambda event: seen.append(event.event_type))
+
+        bus.emit("step_complete", {"step": "a"})
+
+        assert seen[0].data == {"step": "a"}
+        assert seen[1] == "step_complete"
+
+    async def test_async_handler_does_not_block_emit(self, bus):
+        release = asyncio.Event()
+        handled = []
+
+        async def slow_handler(event):
+            await release.wait()
+            handled.append(event.data["n"])
+
+        bus.on("tick", slow_handler)
+        for n in range(3):
+            bus.emit("tick", {"n": n})
+        assert handled == []
+
+        release.set()
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert handled == [0, 1, 2]
+
+    async def test_async_handler_queue_is_bounded(self, bus, monkeypatch):
+        monkeypatch.setattr(settings, "EVENT_BUS_SUBSCRIBER_QUEUE_SIZE", 2)
+        handled = []
+
+        async def handler(event):
+            handled.append(event.data["n"])
+
+        bus.on("tick", handler)
+        for n in range(5):
+            bus.emit("tick", {"n": n})
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        # The consumer had not started yet; only the newest two survived.
+        assert handled == [3, 4]
+
+    async def test_async_handler_errors_are_contained(self, bus):
+        handled = []
+
+        async def flaky(event):
+            if event.data["n"] == 0:
+                raise RuntimeError("webhook down")
+            handled.append(event.data["n"])
+
+        bus.on("tick", flaky)
+        bus.emit("tick", {"n": 0})
+        bus.emit("tick", {"n": 1})
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert handled == [1]
+
+
+class TestSubscriptions:
+    async def test_subscription_filters_and_iterates(self, bus):
+        async with bus.subscribe(["step_complete"]) as sub:
+            bus.emit("pipeline_started", {})
+            bus.emit("step_complete", {"step": "a"})
+            bus.emit("step_complete", {"step": "b"})
+            sub.close()
+            steps = [event.data["step"] async for event in sub]
+
+        assert steps == ["a", "b"]
+        assert sub not in bus._subscriptions
+
+    @pytest.mark.parametrize(
+        ("policy", "expected"),
+        [("drop_oldest", [2, 3]), ("drop_newest", [0, 1])],
+    )
+    async def test_overflow_policies(self, bus, policy, expected):
+        sub = bus.subscribe(maxsize=2, policy=policy)
+        for n in range(4):
+            bus.emit("tick", {"n": n})
+        sub.close()
+
+        assert [event.data["n"] async for event in sub] == expected
+        assert sub.dropped == 2
+
+    async def test_block_policy_applies_backpressure_to_emit_async(self, bus):
+        sub = bus.subscribe(maxsize=1, policy="block")
+        await bus.emit_async("tick", {"n": 0})
+        producer = asyncio.create_task(bus.emit_async("tick", {"n": 1}))
+        await asyncio.sleep(0.01)
+        assert not producer.done()
+
+        assert (await sub.__anext__()).data == {"n": 0}
+        await asyncio.wait_for(producer, timeout=1)
+        assert (await sub.__anext__()).data == {"n": 1}
+        assert sub.dropped == 0
+
+    async def test_emit_from_another_thread(self, bus):
+        sub = bus.subscribe()
+        thread = threading.Thread(target=bus.emit, args=("tick", {"n": 7}))
+        thread.start()
+        thread.join()
+
+        event = await asyncio.wait_for(sub.__anext__(), timeout=1)
+        assert event.data == {"n": 7}
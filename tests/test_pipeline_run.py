@@ -48,3 +48,20 @@ class TestPipelineRunAPI:
         assert body["status"] == "completed"
         assert "discovery_sync" in body["data"]["artifacts"]
         mock_run.assert_awaited_once()
+
+    def test_resume_requires_finished_run(self, client, auth_token, monkeypatch):
+        from app.services import db_service
+
+        monkeypatch.setattr("app.api.pipeline_routes.get_db_session", db_service.get_db_session)
+        headers = {"Authorization": f"Bearer {auth_token}"}
+        missing = client.post("/api/pipeline/run/nope/resume", headers=headers)
+        assert missing.status_code == 404
+
+        queued = client.post(
+            "/api/pipeline/run?background=true",
+            json={"pipeline_key": "resume_only", "resume_text": "cv", "job_text": "jd"},
+            headers=headers,
+        )
+        job_id = queued.json()["job_id"]
+        resp = client.post(f"/api/pipeline/run/{job_id}/resume", headers=headers)
+        assert resp.status_code == 409
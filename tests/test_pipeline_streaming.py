@@ -0,0 +1,125 @@
+"""Tests for SSE streaming of pipeline events and partial LLM output."""
+
+import asyncio
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from pydantic_ai import Agent
+from pydantic_ai.models.test import TestModel
+
+from app.main import app
+from app.pipelines.events import EventBus
+from app.pipelines.state import PipelineState
+from app.pipelines.streaming import publish, run_agent, stream_session
+
+
+class _Summary(BaseModel):
+    headline: str
+    skills: list[str]
+
+
+def _drain(queue: asyncio.Queue) -> list[tuple[str, dict]]:
+    events = []
+    while not queue.empty():
+        events.append(queue.get_nowait())
+    return events
+
+
+def _parse_sse(body: str) -> list[tuple[str, dict]]:
+    frames = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        frames.append((lines["event"], json.loads(lines["data"])))
+    return frames
+
+
+class TestRunAgent:
+    async def test_plain_run_outside_session(self):
+        agent = Agent(TestModel(custom_output_text="hello world"))
+        result = await run_agent(agent, "hi", label="writer")
+        assert result.output == "hello world"
+
+    async def test_text_output_streams_token_deltas(self):
+        agent = Agent(TestModel(custom_output_text="dear hiring team"))
+        queue: asyncio.Queue = asyncio.Queue()
+        with stream_session(queue):
+            result = await run_agent(agent, "hi", label="writer")
+
+        assert result.output == "dear hiring team"
+        events = _drain(queue)
+        assert events and all(name == "token" for name, _ in events)
+        assert "".join(data["delta"] for _, data in events) == "dear hiring team"
+        assert {data["agent"] for _, data in events} == {"writer"}
+
+    async def test_structured_output_streams_partials(self):
+        agent = Agent(TestModel(), output_type=_Summary)
+        queue: asyncio.Queue = asyncio.Queue()
+        with stream_session(queue):
+            result = await run_agent(agent, "hi", label="reviewer")
+
+        assert isinstance(result.output, _Summary)
+        events = _drain(queue)
+        assert events and all(name == "partial" for name, _ in events)
+        assert events[-1][1]["output"] == result.output.model_dump()
+
+    async def test_session_forwards_bus_events_and_is_scoped(self):
+        queue: asyncio.Queue = asyncio.Queue()
+        with stream_session(queue):
+            EventBus.emit("step_complete", {"step": "resume_reviewer"})
+        EventBus.emit("step_complete", {"step": "outside"})
+        publish("token", {"agent": "x", "delta": "ignored"})
+
+        assert _drain(queue) == [("step_complete", {"step": "resume_reviewer"})]
+
+
+class TestStreamRoutes:
+    @pytest.fixture
+    def client(self):
+        return TestClient(app)
+
+    def test_run_stream_relays_events_then_result(self, client, auth_token, monkeypatch):
+        async def fake_run_pipeline(**kwargs):
+            EventBus.emit("pipeline_started", {"pipeline": "Resume Only"})
+            publish("token", {"agent": "resume_reviewer", "delta": "Strong "})
+            publish("token", {"agent": "resume_reviewer", "delta": "profile"})
+            state = PipelineState(pipeline_name="Resume Only")
+            state.artifacts["resume_reviewer"] = {"overall_score": 80}
+            return state
+
+        monkeypatch.setattr("app.api.pipeline_routes.run_pipeline", fake_run_pipeline)
+        resp = client.post(
+            "/api/pipeline/run/stream",
+            json={"pipeline_key": "resume_only", "resume_text": "cv"},
+            headers={"Authorization": f"Bearer {auth_token}"},
+        )
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        frames = _parse_sse(resp.text)
+        assert [name for name, _ in frames] == ["pipeline_started", "token", "token", "result"]
+        assert frames[-1][1]["artifacts"]["resume_reviewer"] == {"overall_score": 80}
+
+    def test_run_stream_reports_failure_as_error_event(self, client, auth_token, monkeypatch):
+        async def failing_run_pipeline(**kwargs):
+            raise RuntimeError("model unavailable")
+
+        monkeypatch.setattr("app.api.pipeline_routes.run_pipeline", failing_run_pipeline)
+        resp = client.post(
+            "/api/pipeline/run/stream",
+            json={"pipeline_key": "resume_only"},
+            headers={"Authorization": f"Bearer {auth_token}"},
+        )
+
+        assert _parse_sse(resp.text) == [
+            ("error", {"status_code": 500, "detail": "Internal server error"})
+        ]
+
+    def test_run_stream_unknown_pipeline_is_404(self, client, auth_token):
+        resp = client.post(
+            "/api/pipeline/run/stream",
+            json={"pipeline_key": "nope"},
+            headers={"Authorization": f"Bearer {auth_token}"},
+        )
+        assert resp.status_code == 404
@@ -0,0 +1,97 @@
+"""Tests for hybrid-search rank fusion."""
+
+import numpy as np
+import pytest
+
+from app.models.db_models import JobPostingDB
+from app.models.startup_model import BigSetPreferences, UserProfile
+from app.services import db_service, discovery_query_service
+from app.services.bigset_import_service import BIGSET_SOURCE
+from app.services.discovery_query_service import search_imported_jobs
+from app.services.ranking import Candidates, RRFFusion, WeightedFusion, get_fusion
+
+
+def _lists():
+    return [
+        Candidates("vector", ["a", "b", "c"], [0.9, 0.8, 0.1]),
+        Candidates("keyword", ["c", "a"], [5.0, 1.0]),
+    ]
+
+
+class TestFusion:
+    def test_rrf_sums_reciprocal_ranks(self):
+        ranking = RRFFusion(k=60).fuse(_lists())
+
+        assert ranking.ids == ["a", "c", "b"]
+        np.testing.assert_allclose(ranking.scores, [1 / 61 + 1 / 62, 1 / 63 + 1 / 61, 1 / 62])
+
+    def test_weighted_min_max_normalizes_each_signal(self):
+        ranking = WeightedFusion({"vector": 1.0, "keyword": 2.0}).fuse(_lists())
+
+        assert ranking.ids == ["c", "a", "b"]
+        np.testing.assert_allclose(ranking.scores, [2.0, 1.0, 0.875])
+
+    def test_top_reports_raw_scores_of_present_signals(self):
+        hits = RRFFusion().fuse(_lists()).top()
+
+        assert hits[0].signals == {"vector": 0.9, "keyword": 1.0}
+        assert hits[-1].signals == {"vector": 0.8}
+
+    def test_weights_apply_to_rrf(self):
+        ranking = RRFFusion(weights={"keyword": 0.0}).fuse(_lists())
+        assert ranking.ids == ["a", "b", "c"]
+
+    def test_duplicates_empty_lists_and_ties(self):
+        lists = [
+            Candidates("vector", ["x", "y", "x"], [1.0, 0.5, 0.2]),
+            Candidates("fit", [], []),
+            Candidates("keyword", ["z"], [3.0]),
+        ]
+        ranking = RRFFusion().fuse(lists)
+
+        assert ranking.ids == ["x", "z", "y"]
+        assert ranking.top(1)[0].signals == {"vector": 1.0}
+        assert RRFFusion().fuse([]).top() == []
+        tied = WeightedFusion().fuse([Candidates("vector", ["p", "q"], [1.0, 1.0])])
+        assert tied.scores.tolist() == [1.0, 1.0]
+
+    def test_mismatched_lengths_rejected(self):
+        with pytest.raises(ValueError):
+            Candidates("vector", ["a"], [1.0, 2.0])
+
+    def test_get_fusion_reads_settings(self, monkeypatch):
+        assert isinstance(get_fusion("weighted"), WeightedFusion)
+        monkeypatch.setattr("app.services.ranking.settings.SEARCH_RRF_K", 10)
+        fusion = get_fusion("bogus")
+        assert isinstance(fusion, RRFFusion) and fusion.k == 10
+
+
+class _NoVectors:
+    async def search(self, collection, query, n_results, filter_by=None):
+        return []
+
+
+class TestSearchImportedJobs:
+    async def test_fuses_keyword_and_fit_signals(self, monkeypatch):
+        monkeypatch.setattr(discovery_query_service, "get_vector_store", lambda: _NoVectors())
+        db = db_service.get_db_session()
+        try:
+            for title, text, source in [
+                ("Rust engineer", "systems programming", BIGSET_SOURCE),
+                ("Python engineer", "django postgres", BIGSET_SOURCE),
+                ("Rust contractor", "embedded work", "manual"),
+            ]:
+                db.add(JobPostingDB(title=title, raw_text=text, content_json={"source": source}))
+            db.commit()
+            profile = UserProfile(skills=["python"], bigset=BigSetPreferences(min_fit_score=0.0))
+
+            results = await search_imported_jobs("rust", profile, limit=3, db=db)
+        finally:
+            db.close()
+
+        titles = [r["title"] for r in results]
+        assert titles[0] == "Rust engineer"
+        # The non-imported posting is filtered out inside the keyword query.
+        assert set(titles) == {"Rust engineer", "Python engineer"}
+        assert set(results[0]["signals"]) == {"keyword", "fit"}
+        assert results[0]["combined_score"] > results[-1]["combined_score"]
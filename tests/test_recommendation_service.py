@@ -10,6 +10,8 @@ from app.services.recommendation_service import RecommendationService
 @pytest.fixture
 def mock_search_service():
     svc = MagicMock()
+    # Nothing indexed yet: recommendations fall back to embedding the record's text.
+    svc.search_similar = AsyncMock(return_value=None)
     svc.search_jobs = AsyncMock(
         return_value=[
             {
@@ -105,6 +107,22 @@ class TestRecommendJobsForResume:
         query = call_args[0][0]
         assert "Python" in query
 
+    @pytest.mark.asyncio
+    async def test_reuses_indexed_resume_vector(
+        self, service, mock_search_service, mock_db_service
+    ):
+        stored = [{"id": "job_7", "text": "Go role", "metadata": {"job_id": 7}, "score": 0.7}]
+        mock_search_service.search_similar = AsyncMock(return_value=stored)
+
+        results = await service.recommend_jobs_for_resume(resume_id=1, limit=3)
+
+        assert [r["id"] for r in results] == ["job_7"]
+        mock_search_service.search_similar.assert_awaited_once_with(
+            "jobs", "resumes", "resume_1", n_results=3, filters=None
+        )
+        mock_search_service.search_jobs.assert_not_called()
+        mock_db_service.query_records.assert_not_called()
+
 
 class TestRecommendResumesForJob:
     @pytest.mark.asyncio
@@ -113,6 +131,16 @@ class TestRecommendResumesForJob:
         assert len(results) == 1
         mock_search_service.search_resumes.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_reuses_indexed_job_vector(self, service, mock_search_service):
+        mock_search_service.search_similar = AsyncMock(return_value=[])
+
+        assert await service.recommend_resumes_for_job(job_id=1) == []
+        mock_search_service.search_similar.assert_awaited_once_with(
+            "resumes", "jobs", "job_1", n_results=10
+        )
+        mock_search_service.search_resumes.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_returns_empty_for_missing_job(self, service, mock_db_service):
         mock_db_service.query_records = MagicMock(return_value=[])
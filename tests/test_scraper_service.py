@@ -0,0 +1,117 @@
+"""Tests for career-path probing and the per-domain path cache."""
+
+import asyncio
+
+from app.core.config import settings
+from app.services.scraper_service import (
+    HOMEPAGE_PATH,
+    BaseCareerScraper,
+    CareerPathCache,
+)
+
+CAREERS_HTML = "We are hiring! Open positions below."
+
+
+class FakeScraper(BaseCareerScraper):
+    _scraper_tag = "fake"
+
+    def __init__(self, pages: dict[str, str], delays: dict[str, float] | None = None):
+        self.pages = pages
+        self.delays = delays or {}
+        self.fetched: list[str] = []
+        self.cancelled: list[str] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def _fetch_content(self, url: str) -> str | None:
+        self.fetched.append(url)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(url, 0.01))
+            return self.pages.get(url)
+        except asyncio.CancelledError:
+            self.cancelled.append(url)
+            raise
+        finally:
+            self.in_flight -= 1
+
+
+async def test_probe_prefers_higher_ranked_path(tmp_path, monkeypatch):
+    scraper = FakeScraper(
+        {"https://acme.io/careers": CAREERS_HTML, "https://acme.io/jobs": CAREERS_HTML},
+        delays={"https://acme.io/careers": 0.2, "https://acme.io/jobs": 0.0},
+    )
+    scraper.probe_concurrency = 3
+    monkeypatch.setattr(settings, "SCRAPER_PROBE_MIN_INTERVAL_SECONDS", 0.0)
+    scraper.path_cache = CareerPathCache(tmp_path / "paths.json")
+
+    content = await scraper.scrape_careers("acme.io")
+
+    assert content == CAREERS_HTML
+    assert scraper.peak == 3
+    assert scraper.path_cache.get("acme.io") == "/careers"
+
+
+async def test_probe_cancels_lower_ranked_paths_on_match(tmp_path, monkeypatch):
+    scraper = FakeScraper(
+        {"https://acme.io/jobs": CAREERS_HTML},
+        delays={"https://acme.io/careers": 0.05, "https://acme.io/join-us": 0.5},
+    )
+    scraper.probe_concurrency = 3
+    monkeypatch.setattr(settings, "SCRAPER_PROBE_MIN_INTERVAL_SECONDS", 0.0)
+    scraper.path_cache = CareerPathCache(tmp_path / "paths.json")
+
+    assert await scraper.scrape_careers("acme.io") == CAREERS_HTML
+    assert "https://acme.io/join-us" in scraper.cancelled
+    assert scraper.path_cache.get("acme.io") == "/jobs"
+
+
+async def test_probe_overlaps_requests_at_default_settings(tmp_path):
+    slow = 0.5
+    scraper = FakeScraper(
+        {"https://acme.io/join-us": CAREERS_HTML},
+        delays={
+            "https://acme.io/careers": slow,
+            "https://acme.io/jobs": slow,
+            "https://acme.io/join-us": slow,
+        },
+    )
+    scraper.path_cache = CareerPathCache(tmp_path / "paths.json")
+
+    assert await scraper.scrape_careers("acme.io") == CAREERS_HTML
+    # Starts are staggered by the probe interval but still run side by side.
+    assert 1 < scraper.peak <= settings.SCRAPER_PROBE_CONCURRENCY
+    assert scraper.fetched[:3] == [
+        "https://acme.io/careers",
+        "https://acme.io/jobs",
+        "https://acme.io/join-us",
+    ]
+
+
+async def test_cached_path_is_fetched_first(tmp_path):
+    cache_file = tmp_path / "paths.json"
+    CareerPathCache(cache_file).set("acme.io", "/hiring")
+    scraper = FakeScraper({"https://www.acme.io/hiring": CAREERS_HTML})
+    scraper.path_cache = CareerPathCache(cache_file)
+
+    assert await scraper.scrape_careers("https://www.acme.io/") == CAREERS_HTML
+    assert scraper.fetched == ["https://www.acme.io/hiring"]
+
+
+async def test_stale_cache_falls_back_to_homepage(tmp_path):
+    scraper = FakeScraper({"https://acme.io": "Apply to join us"})
+    scraper.path_cache = CareerPathCache(tmp_path / "paths.json")
+    scraper.path_cache.set("acme.io", "/careers")
+
+    assert await scraper.scrape_careers("acme.io") == "Apply to join us"
+    assert scraper.fetched.count("https://acme.io/careers") == 1
+    assert scraper.path_cache.get("acme.io") == HOMEPAGE_PATH
+
+
+async def test_no_career_page_returns_empty(tmp_path):
+    scraper = FakeScraper({})
+    scraper.path_cache = CareerPathCache(tmp_path / "paths.json")
+
+    assert await scraper.scrape_careers("acme.io") == ""
+    assert scraper.path_cache.get("acme.io") is None
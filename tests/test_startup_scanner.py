@@ -163,3 +163,109 @@ class TestLLMConfig:
         assert "fallbacks" in status
         assert "providers" in status
         assert isinstance(status["providers"], dict)
+
+
+class TestConcurrentBatch:
+    """process_batch scans startups concurrently and records each as it finishes."""
+
+    def _agent(self, tmp_path):
+        import threading
+
+        from app.agents.startup_scanner import StartupScannerAgent
+        from app.services.host_limiter import HostLimiter
+
+        agent = StartupScannerAgent.__new__(StartupScannerAgent)
+        agent.state = ScannerState()
+        agent.state_file = tmp_path / "scanner_state.json"
+        agent._state_lock = threading.Lock()
+        agent._host_limiter = HostLimiter()
+        agent._merged_startups_cache = None
+        agent._city_map_cache = None
+        return agent
+
+    async def test_scans_overlap_and_persist_per_startup(self, tmp_path):
+        import asyncio
+
+        agent = self._agent(tmp_path)
+        in_flight = 0
+        peak = 0
+        persisted: list[list[str]] = []
+
+        async def fake_scan(startup):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            agent.state.add_processed(startup.name)
+            return [
+                JobOpening(startup_name=startup.name, title="Eng", link="x", relevance_score=0.5)
+            ]
+
+        async def fake_persist(jobs):
+            persisted.append([j.startup_name for j in jobs])
+
+        agent.scan_startup = fake_scan
+        agent._persist_jobs = fake_persist
+        batch = [Startup(name=f"S{i}", city="Cairo", category="AI") for i in range(6)]
+
+        jobs = await agent.process_batch(batch_size=6, startups=batch, concurrency=3)
+
+        assert [j.startup_name for j in jobs] == [s.name for s in batch]
+        assert peak == 3
+        assert sorted(persisted) == [[f"S{i}"] for i in range(6)]
+        assert agent.state.batch_number == 1
+        assert len(agent.state.promising_roles) == 6
+        saved = ScannerState.model_validate_json(agent.state_file.read_text())
+        assert len(saved.processed_startups) == 6
+
+    async def test_failed_scan_does_not_abort_batch(self, tmp_path):
+        agent = self._agent(tmp_path)
+
+        async def fake_scan(startup):
+            if startup.name == "Bad":
+                raise RuntimeError("boom")
+            agent.state.add_processed(startup.name)
+            return [
+                JobOpening(startup_name=startup.name, title="Eng", link="x", relevance_score=0.5)
+            ]
+
+        async def fake_persist(jobs):
+            return None
+
+        agent.scan_startup = fake_scan
+        agent._persist_jobs = fake_persist
+        batch = [Startup(name=n, city="Cairo", category="AI") for n in ("Good", "Bad")]
+
+        jobs = await agent.process_batch(startups=batch, concurrency=2)
+
+        assert [j.startup_name for j in jobs] == ["Good"]
+        assert agent.state.processed_startups == ["Good"]
+
+
+class TestHostLimiter:
+    def test_host_key_normalizes(self):
+        from app.services.host_limiter import host_key
+
+        assert host_key("https://www.Acme.io/careers") == host_key("acme.io") == "acme.io"
+
+    async def test_same_host_is_serialized_and_spaced(self):
+        import asyncio
+        import time
+
+        from app.services.host_limiter import HostLimiter
+
+        limiter = HostLimiter(per_host=1, min_interval=0.05)
+        starts: dict[str, list[float]] = {"a": [], "b": []}
+
+        async def hit(url, key):
+            async with limiter.slot(url):
+                starts[key].append(time.monotonic())
+
+        await asyncio.gather(
+            hit("https://a.io/1", "a"),
+            hit("https://a.io/2", "a"),
+            hit("https://b.io/1", "b"),
+        )
+        assert starts["a"][1] - starts["a"][0] >= 0.045
+        assert abs(starts["b"][0] - starts["a"][0]) < 0.04
@@ -89,6 +89,58 @@ class TestAddDocument:
         assert "doc_id" in point.payload
 
 
+class TestAddDocuments:
+    @pytest.mark.asyncio
+    async def test_batches_embeddings_and_upserts(self, mock_vector_store, monkeypatch):
+        vs, mock_client = mock_vector_store
+        batch_sizes = []
+        original = vs._embedding_service.embed_batch
+
+        async def tracking_embed_batch(texts):
+            batch_sizes.append(len(texts))
+            return await original(texts)
+
+        monkeypatch.setattr(vs._embedding_service, "embed_batch", tracking_embed_batch)
+        docs = [
+            {"id": f"job_{i}", "text": f"job {i}", "metadata": {"job_id": i}} for i in range(10)
+        ]
+
+        written = await vs.add_documents("jobs", docs, embed_batch_size=3, upsert_batch_size=4)
+
+        assert written == 10
+        assert batch_sizes == [3, 1, 3, 1, 2]
+        upserted = [c.kwargs["points"] for c in mock_client.upsert.call_args_list]
+        assert [len(p) for p in upserted] == [4, 4, 2]
+        assert upserted[0][1].payload == {"text": "job 1", "doc_id": "job_1", "job_id": 1}
+
+    @pytest.mark.asyncio
+    async def test_bounds_concurrent_embed_calls(self, mock_vector_store, monkeypatch):
+        import asyncio
+
+        vs, _ = mock_vector_store
+        in_flight = 0
+        peak = 0
+
+        async def slow_embed_batch(texts):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [[0.1] * 384 for _ in texts]
+
+        monkeypatch.setattr(vs._embedding_service, "embed_batch", slow_embed_batch)
+        docs = [{"id": f"d{i}", "text": "t"} for i in range(20)]
+        await vs.add_documents("jobs", docs, embed_batch_size=1, max_concurrency=3)
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_empty_is_noop(self, mock_vector_store):
+        vs, mock_client = mock_vector_store
+        assert await vs.add_documents("jobs", []) == 0
+        mock_client.upsert.assert_not_called()
+
+
 class TestSearch:
     @pytest.mark.asyncio
     async def test_search_empty_query(self, mock_vector_store):